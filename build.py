@@ -54,6 +54,26 @@ def check_pyinstaller() -> bool:
         return False
 
 
+def generate_model_catalog() -> bool:
+    """Generate the provider/model catalogue snapshot bundled with the CLI."""
+    print("📋 Generating the model catalogue...")
+    try:
+        subprocess.run(
+            ["uv", "run", "python", "scripts/generate_model_catalog.py"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Model catalogue generation failed: {e}")
+        if e.stderr:
+            print("STDERR:", e.stderr)
+        return False
+
+    print("✅ Model catalogue generated!")
+    return True
+
+
 def build_executable(
     spec_file: str = "openhands-cli.spec",
     clean: bool = True,
@@ -66,6 +86,9 @@ def build_executable(
     if not check_pyinstaller():
         return False
 
+    if not generate_model_catalog():
+        return False
+
     print(f"🔨 Building executable using {spec_file}...")
 
     try:
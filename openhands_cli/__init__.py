@@ -1,9 +1,32 @@
 """OpenHands package."""
 
-from importlib.metadata import PackageNotFoundError, version
+import os
+import sys
 
 
-try:
-    __version__ = version("openhands")
-except PackageNotFoundError:
-    __version__ = "0.0.0"
+_DIST_INFO_PREFIX = "openhands-"
+_DIST_INFO_SUFFIX = ".dist-info"
+
+
+def _read_version() -> str:
+    """Get the installed version from the name of the package metadata directory.
+
+    importlib.metadata is not used: importing it and scanning the installed
+    distributions takes longer than the whole startup of light commands such
+    as ``openhands --version``.
+    """
+    for entry in sys.path:
+        try:
+            names = os.listdir(entry or os.curdir)
+        except OSError:
+            continue
+        for name in names:
+            if name.startswith(_DIST_INFO_PREFIX) and name.endswith(_DIST_INFO_SUFFIX):
+                version = name[len(_DIST_INFO_PREFIX) : -len(_DIST_INFO_SUFFIX)]
+                # Other distributions named openhands-* have a dash left
+                if version and "-" not in version:
+                    return version
+    return "0.0.0"
+
+
+__version__ = _read_version()
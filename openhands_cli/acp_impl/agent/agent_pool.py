@@ -0,0 +1,204 @@
+"""New ACP sessions configured ahead of time.
+
+Configuring the agent of a session reads the agent settings, resolves tools,
+loads the project skills, the MCP configuration and the hooks, which makes
+the first prompt of a new session wait. The pool keeps a few sessions per
+working directory configured in the background, each with the session ID it
+was configured for, so that ``new_session`` only has to take one.
+
+A prepared session is used only while the files it was configured from are
+unchanged: the pool fingerprints the modification times of the settings,
+MCP, hooks and skill files, and discards prepared sessions when they change.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+from openhands.sdk import Agent
+from openhands.sdk.hooks import HookConfig
+from openhands_cli.locations import (
+    AGENT_SETTINGS_PATH,
+    MCP_CONFIG_FILE,
+    get_persistence_dir,
+    get_work_dir,
+)
+from openhands_cli.stores.cli_settings import CliSettings
+
+
+logger = logging.getLogger(__name__)
+
+# Sessions kept prepared per working directory
+AGENT_POOL_SIZE = 2
+
+# Number of working directories the pool keeps prepared sessions for
+AGENT_POOL_MAX_DIRS = 4
+
+# Project files read as skills besides those under `.openhands`
+_PROJECT_SKILL_SUFFIXES = (".md", ".cursorrules")
+
+Fingerprint = tuple[tuple[str, int, int], ...]
+
+
+class PreparedSession(NamedTuple):
+    """Agent and hooks configured for a session that doesn't exist yet."""
+
+    session_id: str
+    agent: Agent
+    hook_config: HookConfig
+
+
+def _config_paths(working_dir: str) -> Iterable[Path]:
+    """Files and directories a prepared agent is built from."""
+    persistence_dir = Path(get_persistence_dir())
+    yield persistence_dir / AGENT_SETTINGS_PATH
+    yield persistence_dir / MCP_CONFIG_FILE
+    yield persistence_dir / "hooks.json"
+    yield persistence_dir / "skills"
+    yield persistence_dir / "microagents"
+    yield CliSettings.get_config_path()
+    yield Path.home() / ".openhands" / "hooks.json"
+    yield Path.home() / ".openhands" / "skills"
+    for project_dir in dict.fromkeys([get_work_dir(), working_dir]):
+        yield Path(project_dir) / ".openhands" / "hooks.json"
+        yield Path(project_dir) / ".openhands" / "skills"
+        yield Path(project_dir) / ".openhands" / "microagents"
+        try:
+            with os.scandir(project_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(_PROJECT_SKILL_SUFFIXES):
+                        yield Path(entry.path)
+        except OSError:
+            pass
+
+
+def config_fingerprint(working_dir: str) -> Fingerprint:
+    """Modification times of the configuration of sessions in ``working_dir``.
+
+    Directories are walked, so adding, removing or editing a skill changes the
+    fingerprint. Missing paths are skipped.
+    """
+    stats: list[tuple[str, int, int]] = []
+    for path in _config_paths(working_dir):
+        if path.is_dir():
+            for root, _dirs, files in os.walk(path):
+                stats.extend(_stat(os.path.join(root, name)) for name in files)
+                stats.append(_stat(root))
+        elif path.exists():
+            stats.append(_stat(str(path)))
+    return tuple(s for s in stats if s[1] >= 0)
+
+
+def _stat(path: str) -> tuple[str, int, int]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (path, -1, -1)
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+class AgentPool:
+    """Sessions prepared ahead of time, per working directory.
+
+    Taking a session starts preparing the next one in a worker thread, and
+    taking from a directory that isn't prepared starts preparing it for the
+    next session created there. The least recently used directories are
+    dropped beyond ``max_dirs``.
+    """
+
+    def __init__(
+        self,
+        prepare: Callable[[str, str], PreparedSession],
+        fingerprint: Callable[[str], Fingerprint] = config_fingerprint,
+        size: int = AGENT_POOL_SIZE,
+        max_dirs: int = AGENT_POOL_MAX_DIRS,
+    ) -> None:
+        """
+        Args:
+            prepare: Configures a session, given a working directory and the
+                session ID. Blocking: called in a worker thread.
+            fingerprint: Fingerprints the configuration of a working directory
+            size: Sessions kept prepared per working directory
+            max_dirs: Working directories kept prepared
+        """
+        self._prepare = prepare
+        self._fingerprint = fingerprint
+        self._size = size
+        self._max_dirs = max_dirs
+        self._pools: OrderedDict[str, tuple[Fingerprint, list[PreparedSession]]] = (
+            OrderedDict()
+        )
+        self._filling: dict[str, asyncio.Task[None]] = {}
+
+    async def take(self, working_dir: str) -> PreparedSession | None:
+        """Take a prepared session for a working directory, if there is one.
+
+        Waits for the session being prepared, if any, rather than letting the
+        caller configure another one at the same time. The configuration is
+        fingerprinted in a worker thread, as it walks the skill directories.
+        """
+        key = os.path.abspath(working_dir)
+        task = self._filling.get(key)
+        if task is not None and not self._available(key):
+            await asyncio.shield(task)
+
+        pool = self._pools.get(key)
+        if pool is None:
+            self.fill(key)
+            return None
+
+        prepared = None
+        fingerprint, sessions = pool
+        if sessions:
+            current = await asyncio.to_thread(self._fingerprint, key)
+            if fingerprint != current:
+                logger.info(f"Configuration changed, discarding sessions for {key}")
+                sessions.clear()
+            elif sessions:
+                prepared = sessions.pop(0)
+        if key in self._pools:
+            self._pools.move_to_end(key)
+        self.fill(key)
+        return prepared
+
+    def fill(self, working_dir: str) -> None:
+        """Prepare sessions for a working directory in the background."""
+        key = os.path.abspath(working_dir)
+        if key not in self._filling and self._available(key) < self._size:
+            self._filling[key] = asyncio.create_task(self._prepare_next(key))
+
+    def _available(self, key: str) -> int:
+        pool = self._pools.get(key)
+        return len(pool[1]) if pool else 0
+
+    async def _prepare_next(self, key: str) -> None:
+        try:
+            fingerprint, prepared = await asyncio.to_thread(self._prepare_one, key)
+        except Exception as e:
+            # Sessions report configuration errors when they are created
+            logger.debug(f"Could not prepare a session for {key}: {e}")
+            return
+        finally:
+            self._filling.pop(key, None)
+
+        pool = self._pools.get(key)
+        if pool is None or pool[0] != fingerprint:
+            pool = (fingerprint, [])
+        pool[1].append(prepared)
+        self._pools[key] = pool
+        self._pools.move_to_end(key)
+        while len(self._pools) > self._max_dirs:
+            self._pools.popitem(last=False)
+        self.fill(key)
+
+    def _prepare_one(self, key: str) -> tuple[Fingerprint, PreparedSession]:
+        # Fingerprint first, so that changes made while preparing are noticed
+        fingerprint = self._fingerprint(key)
+        return fingerprint, self._prepare(key, str(uuid.uuid4()))
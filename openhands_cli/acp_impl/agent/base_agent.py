@@ -46,10 +46,26 @@ from openhands.sdk import (
     Message,
 )
 from openhands_cli import __version__
+from openhands_cli.acp_impl.agent.session_cache import (
+    SessionCache,
+    SessionCacheLimits,
+)
 from openhands_cli.acp_impl.agent.util import AgentType, get_session_mode_state
 from openhands_cli.acp_impl.confirmation import ConfirmationMode
-from openhands_cli.acp_impl.events.event import EventSubscriber
+from openhands_cli.acp_impl.events.history_replay import (
+    HISTORY_REPLAY_META_KEY,
+    HISTORY_REPLAY_METHOD,
+    get_recent_turns,
+    omitted_events_meta,
+    recent_turns_start,
+    replay_history,
+)
+from openhands_cli.acp_impl.events.utils import (
+    TOOL_CALL_DELTA_META_KEY,
+    client_supports_tool_call_deltas,
+)
 from openhands_cli.acp_impl.runner import run_conversation_with_confirmation
+from openhands_cli.acp_impl.scheduler import SCHEDULER_STATS_METHOD, SessionScheduler
 from openhands_cli.acp_impl.slash_commands import (
     VALID_CONFIRMATION_MODE,
     apply_confirmation_mode_to_conversation,
@@ -63,8 +79,9 @@ from openhands_cli.acp_impl.slash_commands import (
 )
 from openhands_cli.acp_impl.utils import (
     convert_acp_mcp_servers_to_agent_format,
-    convert_acp_prompt_to_message_content,
+    convert_acp_prompt_to_message_content_async,
 )
+from openhands_cli.acp_impl.utils.images import ImageReport
 from openhands_cli.auth.token_storage import TokenStorage
 from openhands_cli.setup import MissingAgentSpec
 from openhands_cli.utils import extract_text_from_message_content
@@ -81,7 +98,7 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
     - Initialization and protocol handling
     - Slash command processing
     - Prompt handling with confirmation mode
-    - Session management
+    - Session management, keeping a bounded cache of sessions in memory
 
     Subclasses must implement:
     - agent_type property: Return "local" or "remote"
@@ -107,10 +124,20 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
             cloud_api_url: OpenHands Cloud API URL for authentication
         """
         self._conn = conn
-        self._active_sessions: dict[str, BaseConversation] = {}
         self._running_tasks: dict[str, asyncio.Task] = {}
+        # Runs conversations on per-session threads
+        self._scheduler = SessionScheduler()
+        self._active_sessions = SessionCache(
+            SessionCacheLimits.from_env(),
+            on_evict=self._on_session_evicted,
+            is_busy=self._is_session_busy,
+        )
+        # Confirmation modes of evicted sessions, restored when they are reloaded
+        self._evicted_sessions: dict[str, ConfirmationMode] = {}
         self._initial_confirmation_mode: ConfirmationMode = initial_confirmation_mode
         self._resume_conversation_id: str | None = resume_conversation_id
+        # Whether the client opted into tool call argument deltas
+        self._tool_call_deltas = False
 
         # Auth-related state
         self._store = TokenStorage()
@@ -131,6 +158,38 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
         """Return the active sessions mapping."""
         return self._active_sessions
 
+    def _is_session_busy(self, session_id: str) -> bool:
+        """Whether a session is running a prompt and must stay in memory."""
+        task = self._running_tasks.get(session_id)
+        return task is not None and not task.done()
+
+    def _on_session_evicted(
+        self, session_id: str, conversation: BaseConversation
+    ) -> None:
+        """Close a session evicted from the session cache.
+
+        The conversation is persisted, so it is loaded again on next use.
+        """
+        try:
+            self._evicted_sessions[session_id] = (
+                get_confirmation_mode_from_conversation(conversation)
+            )
+        except Exception:
+            self._evicted_sessions[session_id] = self._initial_confirmation_mode
+        try:
+            conversation.close()
+        except Exception as e:
+            logger.warning(f"Error closing conversation for {session_id}: {e}")
+        self._scheduler.close_session(session_id)
+        self._cleanup_session(session_id)
+
+    def _session_confirmation_mode(self, session_id: str) -> ConfirmationMode:
+        """Confirmation mode for a session being set up.
+
+        Sessions reloaded after eviction keep the mode they had.
+        """
+        return self._evicted_sessions.pop(session_id, self._initial_confirmation_mode)
+
     @abstractmethod
     async def _get_or_create_conversation(
         self,
@@ -152,6 +211,14 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
         """
         ...
 
+    async def _new_session_id(self, working_dir: str | None) -> str:  # noqa: ARG002
+        """Allocate the ID of a new session.
+
+        Args:
+            working_dir: Working directory of the session (local only)
+        """
+        return str(uuid.uuid4())
+
     @abstractmethod
     def _cleanup_session(self, session_id: str) -> None:
         """Clean up resources for a session.
@@ -192,6 +259,9 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
             conversation = self._active_sessions[session_id]
             apply_confirmation_mode_to_conversation(conversation, mode, session_id)
             logger.debug(f"Confirmation mode for session {session_id}: {mode}")
+        elif session_id in self._evicted_sessions:
+            # Applied when the session is loaded again
+            self._evicted_sessions[session_id] = mode
         else:
             logger.warning(
                 f"Cannot set confirmation mode for session {session_id}: "
@@ -224,12 +294,13 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
     async def initialize(
         self,
         protocol_version: int,
-        client_capabilities: Any | None = None,  # noqa: ARG002
+        client_capabilities: Any | None = None,
         client_info: Any | None = None,  # noqa: ARG002
         **_kwargs: Any,
     ) -> InitializeResponse:
         """Initialize the ACP protocol."""
         logger.info(f"Initializing ACP with protocol version: {protocol_version}")
+        self._tool_call_deltas = client_supports_tool_call_deltas(client_capabilities)
 
         # Always configure auth method
         auth_methods = [
@@ -245,6 +316,10 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
             protocol_version=protocol_version,
             auth_methods=auth_methods,
             agent_capabilities=AgentCapabilities(
+                field_meta={
+                    TOOL_CALL_DELTA_META_KEY: True,
+                    HISTORY_REPLAY_META_KEY: True,
+                },
                 load_session=True,
                 mcp_capabilities=McpCapabilities(http=True, sse=True),
                 prompt_capabilities=PromptCapabilities(
@@ -369,10 +444,84 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
         raise RequestError.method_not_found("session/resume")
 
     async def ext_method(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
-        """Extension method (not supported)."""
+        """Extension methods: loading older history and scheduler stats."""
         logger.info(f"Extension method '{method}' requested with params: {params}")
+        if method == HISTORY_REPLAY_METHOD:
+            return await self._load_older_history(params)
+        if method == SCHEDULER_STATS_METHOD:
+            return self._scheduler.stats().to_dict()
         return {"error": "ext_method not supported"}
 
+    async def _replay_session_history(
+        self,
+        session_id: str,
+        conversation: BaseConversation,
+        request_kwargs: Mapping[str, Any],
+    ) -> dict[str, Any] | None:
+        """Replay the history of a loaded session to the client.
+
+        Only the most recent turns are replayed if the client asked for it.
+
+        Returns:
+            The `_meta` of the load response, advertising omitted events
+        """
+        events = conversation.state.events
+        start = 0
+        recent_turns = get_recent_turns(request_kwargs)
+        if recent_turns is not None:
+            start = await asyncio.to_thread(recent_turns_start, events, recent_turns)
+
+        logger.info(
+            f"Streaming {len(events) - start} of {len(events)} events from "
+            f"conversation history"
+        )
+        await replay_history(self._conn, session_id, events, start=start)
+        return omitted_events_meta(len(events), start)
+
+    async def _load_older_history(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Replay events omitted when a session was loaded."""
+        session_id = params.get("sessionId")
+        if not isinstance(session_id, str) or (
+            session_id not in self._active_sessions
+            and session_id not in self._evicted_sessions
+        ):
+            raise RequestError.invalid_params(
+                {"reason": "Session not found", "sessionId": session_id}
+            )
+
+        conversation = self._active_sessions.get(session_id)
+        if conversation is None:
+            # Reload a session evicted from memory
+            conversation = await self._get_or_create_conversation(session_id=session_id)
+        events = conversation.state.events
+        end = params.get("end")
+        if (
+            not isinstance(end, int)
+            or isinstance(end, bool)
+            or not (0 <= end <= len(events))
+        ):
+            raise RequestError.invalid_params(
+                {"reason": "Invalid history range", "end": end}
+            )
+
+        start = 0
+        recent_turns = get_recent_turns({HISTORY_REPLAY_META_KEY: params})
+        if recent_turns is not None:
+            start = await asyncio.to_thread(
+                recent_turns_start, events, recent_turns, end
+            )
+
+        await replay_history(
+            self._conn,
+            session_id,
+            events,
+            start=start,
+            end=end,
+            field_meta={HISTORY_REPLAY_META_KEY: {"start": start, "end": end}},
+        )
+        meta = omitted_events_meta(len(events), start)
+        return meta[HISTORY_REPLAY_META_KEY] if meta else {}
+
     async def ext_notification(self, method: str, params: dict[str, Any]) -> None:
         """Extension notification (no-op for now)."""
         logger.info(f"Extension notification '{method}' received with params: {params}")
@@ -456,7 +605,7 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
             is_resuming = True
             logger.info(f"Resuming conversation: {session_id}")
         else:
-            session_id = str(uuid.uuid4())
+            session_id = await self._new_session_id(working_dir)
 
         try:
             conversation = await self._get_or_create_conversation(
@@ -480,9 +629,7 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
                     f"Replaying {len(conversation.state.events)} historic events "
                     f"for resumed session {session_id}"
                 )
-                subscriber = EventSubscriber(session_id, self._conn)
-                for event in conversation.state.events:
-                    await subscriber(event)
+                await replay_history(self._conn, session_id, conversation.state.events)
 
             # Schedule available commands notification to be sent after the response.
             # This ensures the client receives the NewSessionResponse (with sessionId)
@@ -528,7 +675,14 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
             conversation = await self._get_or_create_conversation(session_id=session_id)
 
             # Convert ACP prompt format to OpenHands message content
-            message_content = convert_acp_prompt_to_message_content(prompt)
+            image_report = ImageReport()
+            message_content = await convert_acp_prompt_to_message_content_async(
+                prompt, image_report
+            )
+            if image_report.images:
+                logger.info(
+                    f"Prompt images for session {session_id}: {image_report.summary()}"
+                )
 
             if not message_content:
                 return PromptResponse(stop_reason="end_turn")
@@ -571,6 +725,7 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
                     conversation=conversation,
                     conn=self._conn,
                     session_id=session_id,
+                    scheduler=self._scheduler,
                 )
             )
 
@@ -633,13 +788,9 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
                 return LoadSessionResponse(modes=get_session_mode_state(current_mode))
 
             # Stream conversation history to client
-            logger.info(
-                f"Streaming {len(conversation.state.events)} events from "
-                f"conversation history"
+            response_meta = await self._replay_session_history(
+                session_id, conversation, _kwargs
             )
-            subscriber = EventSubscriber(session_id, self._conn)
-            for event in conversation.state.events:
-                await subscriber(event)
 
             logger.info(f"Successfully loaded session {session_id}")
 
@@ -649,7 +800,9 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
             # Get current confirmation mode for this session
             current_mode = get_confirmation_mode_from_conversation(conversation)
 
-            return LoadSessionResponse(modes=get_session_mode_state(current_mode))
+            return LoadSessionResponse(
+                modes=get_session_mode_state(current_mode), field_meta=response_meta
+            )
 
         except RequestError:
             raise
@@ -4,9 +4,10 @@ import asyncio
 import logging
 from pathlib import Path
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from acp import Client, NewSessionResponse, RequestError
+from acp import Client, InitializeResponse, NewSessionResponse, RequestError
+from acp.schema import ForkSessionResponse, ListSessionsResponse, SessionInfo
 
 from openhands.sdk import (
     BaseConversation,
@@ -17,22 +18,38 @@ from openhands.sdk import (
 )
 from openhands.sdk.hooks import HookConfig
 from openhands.tools.preset.default import register_builtins_agents
+from openhands_cli.acp_impl.agent.agent_pool import AgentPool, PreparedSession
 from openhands_cli.acp_impl.agent.base_agent import BaseOpenHandsACPAgent
-from openhands_cli.acp_impl.agent.util import AgentType
+from openhands_cli.acp_impl.agent.util import AgentType, get_session_mode_state
 from openhands_cli.acp_impl.confirmation import ConfirmationMode
 from openhands_cli.acp_impl.events.event import EventSubscriber
 from openhands_cli.acp_impl.events.token_streamer import TokenBasedEventSubscriber
 from openhands_cli.acp_impl.slash_commands import (
     apply_confirmation_mode_to_conversation,
+    get_confirmation_mode_from_conversation,
 )
-from openhands_cli.acp_impl.utils import RESOURCE_SKILL
+from openhands_cli.acp_impl.utils import (
+    RESOURCE_SKILL,
+    convert_acp_mcp_servers_to_agent_format,
+)
+from openhands_cli.conversations.models import ConversationMetadata
+from openhands_cli.conversations.store.fork import fork_conversation
+from openhands_cli.conversations.store.local import LocalFileStore
+from openhands_cli.conversations.store.packed import unpack_conversation
 from openhands_cli.locations import MCP_CONFIG_FILE, get_conversations_dir, get_work_dir
 from openhands_cli.mcp.mcp_utils import MCPConfigurationError
-from openhands_cli.setup import MissingAgentSpec, load_agent_specs
+from openhands_cli.setup import MissingAgentSpec, augment_agent, load_agent_specs
 
 
 logger = logging.getLogger(__name__)
 
+# Number of sessions returned per session/list page
+SESSION_LIST_PAGE_SIZE = 50
+
+# `_meta` key of session/fork requests to fork before the end of the parent:
+# `{FORK_META_KEY: {"eventCount": n}}` starts the fork with the first n events.
+FORK_META_KEY = "openhands.dev/fork"
+
 
 class LocalOpenHandsACPAgent(BaseOpenHandsACPAgent):
     """OpenHands Local ACP Agent that uses local workspace."""
@@ -54,6 +71,11 @@ class LocalOpenHandsACPAgent(BaseOpenHandsACPAgent):
         """
         super().__init__(conn, initial_confirmation_mode, resume_conversation_id)
         self._streaming_enabled: bool = streaming_enabled
+        # Created on first use: setting up the store registers the default tools
+        self._conversation_store: LocalFileStore | None = None
+        # Sessions configured ahead of time, taken by new_session
+        self._agent_pool = AgentPool(self._prepare_session)
+        self._prepared_sessions: dict[str, PreparedSession] = {}
 
         logger.info(
             f"OpenHands Local ACP Agent initialized with confirmation mode: "
@@ -76,9 +98,134 @@ class LocalOpenHandsACPAgent(BaseOpenHandsACPAgent):
         except MissingAgentSpec:
             return False
 
+    async def initialize(
+        self,
+        protocol_version: int,
+        client_capabilities: Any | None = None,
+        client_info: Any | None = None,
+        **_kwargs: Any,
+    ) -> InitializeResponse:
+        """Initialize the ACP protocol and start preparing new sessions."""
+        response = await super().initialize(
+            protocol_version, client_capabilities, client_info, **_kwargs
+        )
+        self._agent_pool.fill(get_work_dir())
+        return response
+
+    async def list_sessions(
+        self,
+        cursor: str | None = None,
+        cwd: str | None = None,
+        **_kwargs: Any,
+    ) -> ListSessionsResponse:
+        """List stored conversations, newest first, from the metadata index."""
+        logger.info(f"List sessions requested (cursor: {cursor}, cwd: {cwd})")
+
+        if self._conversation_store is None:
+            self._conversation_store = await asyncio.to_thread(LocalFileStore)
+        try:
+            conversations, next_cursor = await asyncio.to_thread(
+                self._conversation_store.list_conversations_page,
+                SESSION_LIST_PAGE_SIZE,
+                cursor,
+                cwd,
+            )
+        except ValueError:
+            raise RequestError.invalid_params(
+                {"reason": "Invalid cursor", "cursor": cursor}
+            )
+
+        return ListSessionsResponse(
+            sessions=[
+                session
+                for conversation in conversations
+                if (session := _to_session_info(conversation)) is not None
+            ],
+            next_cursor=next_cursor,
+        )
+
+    async def fork_session(
+        self,
+        cwd: str,
+        session_id: str,
+        mcp_servers: list[Any] | None = None,
+        **_kwargs: Any,
+    ) -> ForkSessionResponse:
+        """Fork a stored session into a new one sharing its events on disk."""
+        logger.info(f"Fork session requested: {session_id}")
+
+        try:
+            parent_id = UUID(session_id)
+        except ValueError:
+            raise RequestError.invalid_params(
+                {"reason": "Invalid session ID format", "sessionId": session_id}
+            )
+
+        fork_point = None
+        options = _kwargs.get(FORK_META_KEY)
+        if isinstance(options, dict) and options.get("eventCount") is not None:
+            fork_point = options["eventCount"]
+            if not isinstance(fork_point, int) or isinstance(fork_point, bool):
+                raise RequestError.invalid_params(
+                    {"reason": "Invalid fork point", "eventCount": fork_point}
+                )
+
+        fork_id = str(uuid4())
+        conversations_dir = Path(get_conversations_dir())
+        try:
+            await asyncio.to_thread(
+                fork_conversation,
+                conversations_dir / parent_id.hex,
+                conversations_dir / UUID(fork_id).hex,
+                fork_point,
+            )
+        except FileNotFoundError:
+            raise RequestError.invalid_params(
+                {"reason": "Session not found", "sessionId": session_id}
+            )
+        except ValueError as e:
+            raise RequestError.invalid_params(
+                {"reason": "Invalid fork point", "details": str(e)}
+            )
+
+        mcp_servers_dict = None
+        if mcp_servers:
+            mcp_servers_dict = convert_acp_mcp_servers_to_agent_format(mcp_servers)
+        conversation = await self._get_or_create_conversation(
+            session_id=fork_id,
+            working_dir=cwd or None,
+            mcp_servers=mcp_servers_dict,
+            is_resuming=True,
+        )
+        logger.info(f"Forked session {session_id} into {fork_id}")
+
+        asyncio.create_task(self.send_available_commands(fork_id))
+
+        current_mode = get_confirmation_mode_from_conversation(conversation)
+        return ForkSessionResponse(
+            session_id=fork_id, modes=get_session_mode_state(current_mode)
+        )
+
     def _cleanup_session(self, session_id: str) -> None:
-        """Clean up resources for a session (no-op for local agent)."""
-        pass
+        """Clean up resources for a session."""
+        self._prepared_sessions.pop(session_id, None)
+
+    async def _new_session_id(self, working_dir: str | None) -> str:
+        """Allocate a new session, taking a prepared one if possible."""
+        prepared = await self._agent_pool.take(working_dir or get_work_dir())
+        if prepared is None:
+            return await super()._new_session_id(working_dir)
+        self._prepared_sessions[prepared.session_id] = prepared
+        return prepared.session_id
+
+    def _prepare_session(self, working_dir: str, session_id: str) -> PreparedSession:
+        """Configure the agent and hooks of a future session (blocking)."""
+        agent = load_agent_specs(conversation_id=session_id, skills=[RESOURCE_SKILL])
+        return PreparedSession(
+            session_id=session_id,
+            agent=agent,
+            hook_config=HookConfig.load(working_dir=working_dir),
+        )
 
     async def _get_or_create_conversation(
         self,
@@ -100,7 +247,7 @@ class LocalOpenHandsACPAgent(BaseOpenHandsACPAgent):
         )
 
         apply_confirmation_mode_to_conversation(
-            conversation, self._initial_confirmation_mode, session_id
+            conversation, self._session_confirmation_mode(session_id), session_id
         )
 
         self._active_sessions[session_id] = conversation
@@ -118,12 +265,20 @@ class LocalOpenHandsACPAgent(BaseOpenHandsACPAgent):
         # enable_browser=False because CLI mode doesn't provide browser tools.
         register_builtins_agents(enable_browser=False)
 
+        # The SDK only reads per-file events, so restore compacted conversations
+        # before resuming them.
+        unpack_conversation(Path(get_conversations_dir()) / UUID(session_id).hex)
+
+        prepared = self._prepared_sessions.pop(session_id, None)
         try:
-            agent = load_agent_specs(
-                conversation_id=session_id,
-                mcp_servers=mcp_servers,
-                skills=[RESOURCE_SKILL],
-            )
+            if prepared is not None:
+                agent = augment_agent(prepared.agent, mcp_servers=mcp_servers)
+            else:
+                agent = load_agent_specs(
+                    conversation_id=session_id,
+                    mcp_servers=mcp_servers,
+                    skills=[RESOURCE_SKILL],
+                )
             streaming_enabled = (
                 self._streaming_enabled and not agent.llm.uses_responses_api()
             )
@@ -166,7 +321,10 @@ class LocalOpenHandsACPAgent(BaseOpenHandsACPAgent):
 
         subscriber = EventSubscriber(session_id, self._conn)
         token_subscriber = TokenBasedEventSubscriber(
-            session_id=session_id, conn=self._conn, loop=loop
+            session_id=session_id,
+            conn=self._conn,
+            loop=loop,
+            tool_call_deltas=self._tool_call_deltas,
         )
 
         def sync_callback(event: Event) -> None:
@@ -178,7 +336,10 @@ class LocalOpenHandsACPAgent(BaseOpenHandsACPAgent):
                 asyncio.run_coroutine_threadsafe(subscriber(event), loop)
 
         # Load hooks from ~/.openhands/hooks.json or {working_dir}/.openhands/hooks.json
-        hook_config = HookConfig.load(working_dir=str(working_path))
+        if prepared is not None:
+            hook_config = prepared.hook_config
+        else:
+            hook_config = HookConfig.load(working_dir=str(working_path))
         if not hook_config.is_empty():
             logger.info("Hooks loaded from hooks.json")
 
@@ -222,3 +383,24 @@ class LocalOpenHandsACPAgent(BaseOpenHandsACPAgent):
             working_dir=effective_working_dir,
             **_kwargs,
         )
+
+
+def _to_session_info(conversation: ConversationMetadata) -> SessionInfo | None:
+    """Describe a stored conversation as an ACP session.
+
+    Returns None for directories that can't be loaded as an ACP session.
+    """
+    if conversation.cwd is None:
+        return None
+    try:
+        session_id = str(UUID(conversation.id))
+    except ValueError:
+        return None
+
+    updated_at = conversation.last_modified or conversation.created_at
+    return SessionInfo(
+        session_id=session_id,
+        cwd=conversation.cwd,
+        title=conversation.title,
+        updated_at=updated_at.isoformat(),
+    )
@@ -154,6 +154,9 @@ class OpenHandsCloudACPAgent(BaseOpenHandsACPAgent):
         is_resuming: bool = False,
     ) -> BaseConversation:
         """Get an active conversation from cache or create it with cloud workspace."""
+        # Sessions evicted from memory still exist in the cloud
+        is_resuming = is_resuming or session_id in self._evicted_sessions
+
         # Skip cache check when resuming to recreate workspace
         if session_id in self._active_sessions and not is_resuming:
             logger.debug(f"Using cached cloud conversation for session {session_id}")
@@ -175,7 +178,7 @@ class OpenHandsCloudACPAgent(BaseOpenHandsACPAgent):
         )
 
         apply_confirmation_mode_to_conversation(
-            conversation, self._initial_confirmation_mode, session_id
+            conversation, self._session_confirmation_mode(session_id), session_id
         )
 
         self._active_sessions[session_id] = conversation
@@ -284,6 +287,10 @@ class OpenHandsCloudACPAgent(BaseOpenHandsACPAgent):
 
         Overrides base class to handle workspace resuming when workspace is not alive.
         """
+        # Reload sessions evicted from memory
+        if session_id in self._evicted_sessions:
+            await self._get_or_create_conversation(session_id=session_id)
+
         # Check if workspace needs to be resumed
         workspace = self._active_workspaces.get(session_id)
         if not workspace:
@@ -321,20 +328,26 @@ class OpenHandsCloudACPAgent(BaseOpenHandsACPAgent):
                 )
 
             # For cloud mode, we can only load sessions that are already in memory
-            if session_id in self._active_sessions:
-                conversation = self._active_sessions[session_id]
+            # or were evicted from it
+            if (
+                session_id in self._active_sessions
+                or session_id in self._evicted_sessions
+            ):
+                conversation = await self._get_or_create_conversation(
+                    session_id=session_id
+                )
 
+                response_meta = None
                 if conversation.state.events:
-                    logger.info(
-                        f"Streaming {len(conversation.state.events)} events from "
-                        f"conversation history"
+                    response_meta = await self._replay_session_history(
+                        session_id, conversation, _kwargs
                     )
-                    subscriber = EventSubscriber(session_id, self._conn)
-                    for event in conversation.state.events:
-                        await subscriber(event)
 
                 current_mode = get_confirmation_mode_from_conversation(conversation)
-                return LoadSessionResponse(modes=get_session_mode_state(current_mode))
+                return LoadSessionResponse(
+                    modes=get_session_mode_state(current_mode),
+                    field_meta=response_meta,
+                )
 
             raise RequestError.invalid_params(
                 {
@@ -358,6 +371,7 @@ class OpenHandsCloudACPAgent(BaseOpenHandsACPAgent):
     async def close_session(self, session_id: str, **_kwargs: Any) -> None:
         """Close a session and clean up resources."""
         logger.info(f"Closing cloud session: {session_id}")
+        self._scheduler.close_session(session_id)
         self._cleanup_session(session_id)
 
     def __del__(self) -> None:
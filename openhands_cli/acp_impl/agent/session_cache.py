@@ -0,0 +1,195 @@
+"""Bounded cache of the conversations an ACP agent keeps in memory.
+
+An ACP agent serving an editor sees many sessions over its lifetime, and
+every conversation it keeps open holds its events, agent, LLM clients and MCP
+connections. The cache keeps the most recently used sessions only, bounded
+by:
+
+- a maximum number of sessions,
+- an approximate memory budget, estimated from the number of events,
+- an idle time after which sessions are dropped.
+
+Evicted conversations are handed to a callback to be closed. They are
+persisted, so the agent transparently loads them again when they are used.
+Sessions that are busy (e.g. running a prompt) are never evicted.
+
+The limits can be set with the OPENHANDS_ACP_MAX_SESSIONS,
+OPENHANDS_ACP_SESSION_MEMORY_MB and OPENHANDS_ACP_SESSION_IDLE_TTL (seconds)
+environment variables; a value of 0 disables the limit.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, MutableMapping
+from dataclasses import dataclass
+
+from openhands.sdk import BaseConversation
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SESSIONS = 32
+DEFAULT_MEMORY_BUDGET_MB = 512
+DEFAULT_IDLE_TTL_SECONDS = 30 * 60
+
+# Rough in-memory footprint of an event, used to estimate conversation sizes
+APPROX_EVENT_BYTES = 4 * 1024
+
+
+def estimate_conversation_size(conversation: BaseConversation) -> int:
+    """Approximate memory held by a conversation, in bytes."""
+    try:
+        return len(conversation.state.events) * APPROX_EVENT_BYTES
+    except Exception:
+        return 0
+
+
+def _env_number(name: str, default: float) -> float:
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={value!r}, using {default}")
+        return default
+
+
+@dataclass(frozen=True)
+class SessionCacheLimits:
+    """Limits of a SessionCache; 0 disables a limit."""
+
+    max_sessions: int = DEFAULT_MAX_SESSIONS
+    memory_budget: int = DEFAULT_MEMORY_BUDGET_MB * 1024 * 1024
+    idle_ttl: float = DEFAULT_IDLE_TTL_SECONDS
+
+    @classmethod
+    def from_env(cls) -> SessionCacheLimits:
+        """Read the limits from the environment, with defaults."""
+        memory_mb = _env_number(
+            "OPENHANDS_ACP_SESSION_MEMORY_MB", DEFAULT_MEMORY_BUDGET_MB
+        )
+        return cls(
+            max_sessions=int(
+                _env_number("OPENHANDS_ACP_MAX_SESSIONS", DEFAULT_MAX_SESSIONS)
+            ),
+            memory_budget=int(memory_mb * 1024 * 1024),
+            idle_ttl=_env_number(
+                "OPENHANDS_ACP_SESSION_IDLE_TTL", DEFAULT_IDLE_TTL_SECONDS
+            ),
+        )
+
+
+class _Entry:
+    __slots__ = ("conversation", "last_used", "size")
+
+    def __init__(self, conversation: BaseConversation, size: int, now: float):
+        self.conversation = conversation
+        self.size = size
+        self.last_used = now
+
+
+class SessionCache(MutableMapping[str, BaseConversation]):
+    """LRU mapping of session IDs to conversations with idle eviction.
+
+    Reading a session marks it as used. Limits are enforced whenever a
+    session is read or added; the session being accessed is never evicted,
+    even if it alone exceeds the memory budget. Removing a session with
+    ``del`` or ``pop`` does not call the eviction callback.
+    """
+
+    def __init__(
+        self,
+        limits: SessionCacheLimits | None = None,
+        on_evict: Callable[[str, BaseConversation], None] | None = None,
+        is_busy: Callable[[str], bool] | None = None,
+        size_of: Callable[[BaseConversation], int] = estimate_conversation_size,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.limits = limits or SessionCacheLimits()
+        self._on_evict = on_evict
+        self._is_busy = is_busy
+        self._size_of = size_of
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+
+    def __getitem__(self, session_id: str) -> BaseConversation:
+        entry = self._entries[session_id]
+        self._touch(session_id, entry)
+        self._enforce_limits(keep=session_id)
+        return entry.conversation
+
+    def __setitem__(self, session_id: str, conversation: BaseConversation) -> None:
+        entry = _Entry(conversation, 0, self._clock())
+        self._entries[session_id] = entry
+        self._touch(session_id, entry)
+        self._enforce_limits(keep=session_id)
+
+    def __delitem__(self, session_id: str) -> None:
+        del self._entries[session_id]
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def memory_usage(self) -> int:
+        """Estimated memory held by the cached conversations, in bytes."""
+        return sum(entry.size for entry in self._entries.values())
+
+    def evict_idle(self) -> list[str]:
+        """Evict the sessions idle for longer than the TTL.
+
+        Returns:
+            The IDs of the evicted sessions
+        """
+        if not self.limits.idle_ttl:
+            return []
+        deadline = self._clock() - self.limits.idle_ttl
+        expired = [
+            session_id
+            for session_id, entry in self._entries.items()
+            if entry.last_used < deadline
+        ]
+        return [sid for sid in expired if self._evict(sid, "idle")]
+
+    def _touch(self, session_id: str, entry: _Entry) -> None:
+        entry.last_used = self._clock()
+        # Events are added while a session is used, so refresh its size
+        entry.size = self._size_of(entry.conversation)
+        self._entries.move_to_end(session_id)
+
+    def _enforce_limits(self, keep: str) -> None:
+        self.evict_idle()
+        limits = self.limits
+        # Least recently used first
+        for session_id in list(self._entries):
+            over_count = limits.max_sessions and len(self) > limits.max_sessions
+            over_budget = (
+                limits.memory_budget and self.memory_usage > limits.memory_budget
+            )
+            if not (over_count or over_budget):
+                break
+            if session_id != keep:
+                self._evict(session_id, "capacity")
+
+    def _evict(self, session_id: str, reason: str) -> bool:
+        if self._is_busy is not None and self._is_busy(session_id):
+            return False
+        entry = self._entries.pop(session_id)
+        logger.info(f"Evicting {reason} session {session_id} from memory")
+        if self._on_evict is not None:
+            try:
+                self._on_evict(session_id, entry.conversation)
+            except Exception as e:
+                logger.warning(f"Error evicting session {session_id}: {e}")
+        return True
@@ -0,0 +1,176 @@
+"""Replay of conversation history to ACP clients.
+
+Reopening a long session used to send every event of the conversation one by
+one from the agent loop, which made loading take tens of seconds and blocked
+the agent meanwhile. The replay here:
+
+- renders events into ACP updates in a worker thread, one page at a time, and
+  only one page ahead of what has been sent, so a slow client holds back
+  rendering instead of letting updates pile up in memory,
+- coalesces the updates of a page with StreamBuffer (a tool call and its
+  result become a single notification) and yields to the agent loop between
+  pages,
+- can replay only the most recent turns, leaving older events to be loaded
+  on demand.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from openhands.sdk.event import Event, MessageEvent
+from openhands_cli.acp_impl.events.event import EventSubscriber
+from openhands_cli.acp_impl.events.stream_buffer import ACPUpdate, StreamBuffer
+
+
+# `_meta` key for partial history replay. Clients opt in by passing
+# `{HISTORY_REPLAY_META_KEY: {"recentTurns": N}}` in the `_meta` of
+# `session/load`. If older events were left out, the response `_meta` carries
+# `{HISTORY_REPLAY_META_KEY: {"totalEvents": n, "omittedEvents":
+# {"start": 0, "end": k}}}`, and the client loads them with the
+# HISTORY_REPLAY_METHOD extension method. Updates replayed on demand carry
+# `{HISTORY_REPLAY_META_KEY: {"start": i, "end": j}}` in their `_meta`.
+HISTORY_REPLAY_META_KEY = "openhands.dev/historyReplay"
+
+# Extension method replaying older events, with params `sessionId`, `end` (the
+# exclusive end of the omitted range) and optionally `recentTurns`. Returns
+# the range still omitted, if any, as `{"omittedEvents": {...}}`.
+HISTORY_REPLAY_METHOD = "openhands.dev/loadHistory"
+
+# Events rendered by the worker thread at a time
+REPLAY_PAGE_SIZE = 50
+
+
+class _RecordingClient:
+    """Stands in for the ACP connection, collecting updates instead of sending."""
+
+    def __init__(self) -> None:
+        self.buffer = StreamBuffer()
+
+    async def session_update(
+        self,
+        session_id: str,  # noqa: ARG002
+        update: ACPUpdate,
+        **_kwargs: Any,
+    ) -> None:
+        self.buffer.add(update)
+
+
+def render_events(
+    session_id: str, events: Sequence[Event], start: int, end: int
+) -> list[ACPUpdate]:
+    """Render ``events[start:end]`` into coalesced ACP updates.
+
+    Blocking: meant to run in a worker thread, where reading persisted events
+    and visualizing them does not hold up the agent loop.
+    """
+    client = _RecordingClient()
+    subscriber = EventSubscriber(session_id, client)  # type: ignore[arg-type]
+
+    async def render() -> None:
+        for index in range(start, end):
+            await subscriber(events[index])
+
+    asyncio.run(render())
+    return client.buffer.drain()
+
+
+def recent_turns_start(
+    events: Sequence[Event], turns: int, end: int | None = None
+) -> int:
+    """Index of the first event of the last ``turns`` turns before ``end``.
+
+    A turn starts with a user message. Returns 0 if there are fewer turns.
+    """
+    index = len(events) if end is None else end
+    while index > 0:
+        index -= 1
+        event = events[index]
+        if isinstance(event, MessageEvent) and event.source == "user":
+            turns -= 1
+            if turns <= 0:
+                return index
+    return 0
+
+
+async def replay_history(
+    conn: Any,
+    session_id: str,
+    events: Sequence[Event],
+    start: int = 0,
+    end: int | None = None,
+    field_meta: dict[str, Any] | None = None,
+    page_size: int = REPLAY_PAGE_SIZE,
+) -> int:
+    """Send ``events[start:end]`` to the client as session updates.
+
+    Args:
+        conn: The ACP connection
+        session_id: The ACP session ID
+        events: The conversation events
+        start: Index of the first event to replay
+        end: Index after the last event to replay, defaults to all events
+        field_meta: `_meta` to attach to every update
+        page_size: Number of events rendered at a time
+
+    Returns:
+        The number of updates sent
+    """
+    end = len(events) if end is None else end
+    pages = [(i, min(i + page_size, end)) for i in range(start, end, page_size)]
+    if not pages:
+        return 0
+
+    def render(page: tuple[int, int]) -> asyncio.Task[list[ACPUpdate]]:
+        return asyncio.create_task(
+            asyncio.to_thread(render_events, session_id, events, *page)
+        )
+
+    sent = 0
+    pending = render(pages[0])
+    try:
+        for next_page in [*pages[1:], None]:
+            updates = await pending
+            # Render the next page while this one is being sent
+            if next_page is not None:
+                pending = render(next_page)
+            for update in updates:
+                await conn.session_update(
+                    session_id=session_id, update=update, field_meta=field_meta
+                )
+            sent += len(updates)
+            # Let other requests (e.g. a prompt or cancel) run between pages
+            await asyncio.sleep(0)
+    finally:
+        if not pending.done():
+            pending.cancel()
+    return sent
+
+
+def get_recent_turns(request_kwargs: Mapping[str, Any]) -> int | None:
+    """Number of recent turns a client asked to replay, if it opted in.
+
+    The ACP router passes the `_meta` entries of a request as keyword
+    arguments.
+    """
+    options = request_kwargs.get(HISTORY_REPLAY_META_KEY)
+    if not isinstance(options, Mapping):
+        return None
+    turns = options.get("recentTurns")
+    if isinstance(turns, int) and not isinstance(turns, bool) and turns > 0:
+        return turns
+    return None
+
+
+def omitted_events_meta(total: int, start: int) -> dict[str, Any] | None:
+    """Response `_meta` advertising that events before ``start`` were omitted."""
+    if start <= 0:
+        return None
+    return {
+        HISTORY_REPLAY_META_KEY: {
+            "totalEvents": total,
+            "omittedEvents": {"start": 0, "end": start},
+        }
+    }
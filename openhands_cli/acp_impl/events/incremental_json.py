@@ -0,0 +1,320 @@
+"""Incremental parser for the top-level fields of a streamed JSON object.
+
+Tool call arguments arrive as many small chunks of a single JSON object.
+Re-parsing the accumulated arguments after every chunk is quadratic in their
+length, which hurts for large `file_editor` writes or long `think` thoughts.
+``IncrementalJSONObject`` keeps its parser state between chunks, so every
+character is only looked at once, and exposes string fields both as their
+current (partial) value and as the text appended since it was last read.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+from streamingjson import Lexer
+
+
+_STRING_SPECIAL = re.compile(r'["\\]')
+_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+# Parser states
+_BEFORE_OBJECT = 0
+_BEFORE_KEY = 1
+_IN_KEY = 2
+_AFTER_KEY = 3
+_BEFORE_VALUE = 4
+_IN_STRING = 5
+_IN_RAW = 6
+_AFTER_VALUE = 7
+_DONE = 8
+_FAILED = 9
+
+
+class _Field:
+    """A top-level field: decoded string pieces, or raw JSON text otherwise."""
+
+    __slots__ = ("is_string", "chunks", "complete", "read_index", "_cache")
+
+    def __init__(self, is_string: bool) -> None:
+        self.is_string = is_string
+        self.chunks: list[str] = []
+        self.complete = False
+        # Chunks already returned by IncrementalJSONObject.string_delta
+        self.read_index = 0
+        # (number of chunks, value) of the last computed value
+        self._cache: tuple[int, Any] | None = None
+
+    def value(self) -> Any:
+        if self._cache is not None and self._cache[0] == len(self.chunks):
+            return self._cache[1]
+
+        text = "".join(self.chunks)
+        if self.is_string:
+            value: Any = text
+        else:
+            value = _parse_raw(text, self.complete)
+        self._cache = (len(self.chunks), value)
+        return value
+
+    def has_content(self) -> bool:
+        """Whether the value is non-null and, for strings, not empty."""
+        if self.is_string:
+            return any(self.chunks)
+        raw = "".join(self.chunks).strip()
+        return bool(raw) and not "null".startswith(raw)
+
+
+def _parse_raw(text: str, complete: bool) -> Any:
+    """Parse a non-string value, completing it on a best-effort basis."""
+    if not complete:
+        lexer = Lexer()
+        lexer.append_string(text)
+        text = lexer.complete_json()
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+class IncrementalJSONObject:
+    """Parses a JSON object fed in chunks, keeping state between chunks.
+
+    Only the top level is parsed incrementally. String fields are decoded as
+    they stream in; other values (numbers, lists, nested objects) are kept as
+    raw text and parsed when read. Parsing stops at the first syntax error,
+    keeping the fields read so far.
+    """
+
+    def __init__(self) -> None:
+        self._state = _BEFORE_OBJECT
+        self._fields: dict[str, _Field] = {}
+        self._key: list[str] = []
+        self._field: _Field | None = None
+        # Escape sequence split across chunks, e.g. "\\" or "\\u00"
+        self._escape = ""
+        self._high_surrogate: int | None = None
+        # Nesting state of the raw value being read
+        self._depth = 0
+        self._raw_in_string = False
+        self._raw_escape = False
+
+    @property
+    def complete(self) -> bool:
+        """Whether the closing brace of the object was read."""
+        return self._state == _DONE
+
+    @property
+    def failed(self) -> bool:
+        """Whether the input stopped being valid JSON."""
+        return self._state == _FAILED
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._fields
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Current value of a field, partial if it is still streaming."""
+        field = self._fields.get(key)
+        if field is None:
+            return default
+        return field.value()
+
+    def string_delta(self, key: str) -> str:
+        """Text appended to a string field since the last call for that field.
+
+        Returns an empty string if the field is missing or not a string.
+        """
+        field = self._fields.get(key)
+        if field is None or not field.is_string:
+            return ""
+        delta = "".join(field.chunks[field.read_index :])
+        field.read_index = len(field.chunks)
+        return delta
+
+    def has_content(self) -> bool:
+        """Whether any field has a non-null, non-empty value."""
+        return any(field.has_content() for field in self._fields.values())
+
+    def feed(self, text: str) -> None:
+        """Parse the next chunk of the object."""
+        pos = 0
+        end = len(text)
+        while pos < end:
+            state = self._state
+            if state == _IN_STRING:
+                assert self._field is not None
+                pos, closed = self._read_string(text, pos, self._field.chunks)
+                if closed:
+                    self._field.complete = True
+                    self._state = _AFTER_VALUE
+            elif state == _IN_RAW:
+                pos = self._read_raw(text, pos)
+            elif state == _IN_KEY:
+                pos, closed = self._read_string(text, pos, self._key)
+                if closed:
+                    self._state = _AFTER_KEY
+            elif state in (_DONE, _FAILED):
+                if state == _DONE and not text[pos:].strip():
+                    return
+                self._state = _FAILED
+                return
+            else:
+                char = text[pos]
+                pos += 1
+                if not char.isspace():
+                    self._read_structural(char)
+
+    def _read_structural(self, char: str) -> None:
+        """Handle a non-whitespace character outside of keys and values."""
+        state = self._state
+        if state == _BEFORE_OBJECT and char == "{":
+            self._state = _BEFORE_KEY
+        elif state == _BEFORE_KEY and char == '"':
+            self._key = []
+            self._state = _IN_KEY
+        elif state == _BEFORE_KEY and char == "}" and not self._fields:
+            self._state = _DONE
+        elif state == _AFTER_KEY and char == ":":
+            self._state = _BEFORE_VALUE
+        elif state == _BEFORE_VALUE:
+            field = _Field(is_string=char == '"')
+            self._fields["".join(self._key)] = field
+            self._field = field
+            if field.is_string:
+                self._state = _IN_STRING
+            else:
+                field.chunks.append(char)
+                self._depth = 1 if char in "[{" else 0
+                self._raw_in_string = self._raw_escape = False
+                self._state = _IN_RAW
+                if self._depth == 0 and char in "]},":
+                    self._state = _FAILED
+        elif state == _AFTER_VALUE and char == ",":
+            self._state = _BEFORE_KEY
+        elif state == _AFTER_VALUE and char == "}":
+            self._state = _DONE
+        else:
+            self._state = _FAILED
+
+    def _read_string(self, text: str, pos: int, out: list[str]) -> tuple[int, bool]:
+        """Decode string characters into ``out`` until the closing quote.
+
+        Returns:
+            The position after what was read, and whether the string closed.
+        """
+        end = len(text)
+        while pos < end:
+            if self._escape:
+                pos = self._read_escape(text, pos, out)
+                continue
+
+            match = _STRING_SPECIAL.search(text, pos)
+            stop = match.start() if match else end
+            if stop > pos:
+                self._flush_surrogate(out)
+                out.append(text[pos:stop])
+            if match is None:
+                return end, False
+            pos = match.end()
+            if match.group() == '"':
+                self._flush_surrogate(out)
+                return pos, True
+            self._escape = "\\"
+        return pos, False
+
+    def _read_escape(self, text: str, pos: int, out: list[str]) -> int:
+        """Continue reading an escape sequence, possibly split across chunks."""
+        if len(self._escape) == 1:
+            char = text[pos]
+            pos += 1
+            if char == "u":
+                self._escape = "\\u"
+                return pos
+            self._escape = ""
+            if char not in _ESCAPES:
+                self._state = _FAILED
+                return len(text)
+            self._flush_surrogate(out)
+            out.append(_ESCAPES[char])
+            return pos
+
+        needed = 6 - len(self._escape)
+        self._escape += text[pos : pos + needed]
+        pos += min(needed, len(text) - pos)
+        if len(self._escape) < 6:
+            return pos
+
+        try:
+            code = int(self._escape[2:], 16)
+        except ValueError:
+            self._state = _FAILED
+            return len(text)
+        self._escape = ""
+
+        if 0xDC00 <= code < 0xE000 and self._high_surrogate is not None:
+            high, self._high_surrogate = self._high_surrogate, None
+            out.append(chr(0x10000 + ((high - 0xD800) << 10) + (code - 0xDC00)))
+        else:
+            self._flush_surrogate(out)
+            if 0xD800 <= code < 0xDC00:
+                self._high_surrogate = code
+            else:
+                out.append(chr(code))
+        return pos
+
+    def _flush_surrogate(self, out: list[str]) -> None:
+        """Emit a high surrogate that was not followed by a low surrogate."""
+        if self._high_surrogate is not None:
+            out.append(chr(self._high_surrogate))
+            self._high_surrogate = None
+
+    def _read_raw(self, text: str, pos: int) -> int:
+        """Read the raw text of a non-string value until it ends."""
+        assert self._field is not None
+        start = pos
+        end = len(text)
+        while pos < end:
+            char = text[pos]
+            if self._raw_in_string:
+                if self._raw_escape:
+                    self._raw_escape = False
+                elif char == "\\":
+                    self._raw_escape = True
+                elif char == '"':
+                    self._raw_in_string = False
+            elif char == '"':
+                self._raw_in_string = True
+            elif char in "[{":
+                self._depth += 1
+            elif char in "]}" and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    pos += 1
+                    self._finish_raw(text[start:pos])
+                    return pos
+            elif self._depth == 0 and (char in ",}" or char.isspace()):
+                self._finish_raw(text[start:pos])
+                return pos
+            pos += 1
+
+        if pos > start:
+            self._field.chunks.append(text[start:pos])
+        return pos
+
+    def _finish_raw(self, tail: str) -> None:
+        assert self._field is not None
+        if tail:
+            self._field.chunks.append(tail)
+        self._field.complete = True
+        self._state = _AFTER_VALUE
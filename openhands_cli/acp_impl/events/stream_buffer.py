@@ -0,0 +1,136 @@
+"""Coalescing buffer for streamed ACP session updates.
+
+Fast models emit thousands of deltas per second. Sending each one as its own
+``session_update`` notification floods the stdio pipe and makes editor clients
+lag. ``StreamBuffer`` merges consecutive updates of the same kind so they can
+be flushed together on an interval or once enough text has accumulated.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from acp import update_agent_message_text, update_agent_thought_text
+from acp.schema import (
+    AgentMessageChunk,
+    AgentPlanUpdate,
+    AgentThoughtChunk,
+    TextContentBlock,
+    ToolCallProgress,
+    ToolCallStart,
+)
+
+from openhands_cli.acp_impl.events.utils import (
+    TOOL_CALL_DELTA_META_KEY,
+    get_tool_call_delta,
+)
+
+
+ACPUpdate = (
+    AgentMessageChunk
+    | AgentThoughtChunk
+    | ToolCallStart
+    | ToolCallProgress
+    | AgentPlanUpdate
+)
+
+
+class StreamBuffer:
+    """Thread-safe buffer merging consecutive streamed updates.
+
+    Only an update directly following one it can be merged with is merged, so
+    the relative order of all updates is preserved:
+
+    - message and thought chunks are concatenated,
+    - tool call updates for the same tool call replace the fields they set.
+      The merged update is a snapshot of the latest state of the tool call,
+      except that argument deltas (see TOOL_CALL_DELTA_META_KEY) are joined.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._updates: list[ACPUpdate] = []
+        self._text_size = 0
+
+    def __len__(self) -> int:
+        return len(self._updates)
+
+    @property
+    def text_size(self) -> int:
+        """Characters of message and thought text buffered since the last drain."""
+        return self._text_size
+
+    def add(self, update: ACPUpdate) -> int:
+        """Buffer an update, merging it into the previous one if possible.
+
+        Returns:
+            The number of buffered message and thought characters.
+        """
+        with self._lock:
+            text = _chunk_text(update)
+            if text is not None:
+                self._text_size += len(text)
+
+            if self._updates:
+                merged = _merge(self._updates[-1], update)
+                if merged is not None:
+                    self._updates[-1] = merged
+                    return self._text_size
+
+            self._updates.append(update)
+            return self._text_size
+
+    def drain(self) -> list[ACPUpdate]:
+        """Remove and return all buffered updates."""
+        with self._lock:
+            updates, self._updates = self._updates, []
+            self._text_size = 0
+            return updates
+
+
+def _chunk_text(update: ACPUpdate) -> str | None:
+    """Text of a message or thought chunk, or None for other updates."""
+    if isinstance(update, AgentMessageChunk | AgentThoughtChunk) and isinstance(
+        update.content, TextContentBlock
+    ):
+        return update.content.text
+    return None
+
+
+def _merge(previous: ACPUpdate, update: ACPUpdate) -> ACPUpdate | None:
+    """Merge ``update`` into ``previous``, or return None if they can't merge."""
+    if type(previous) is type(update) and isinstance(
+        update, AgentMessageChunk | AgentThoughtChunk
+    ):
+        previous_text = _chunk_text(previous)
+        text = _chunk_text(update)
+        if previous_text is None or text is None:
+            return None
+        if isinstance(update, AgentMessageChunk):
+            return update_agent_message_text(previous_text + text)
+        return update_agent_thought_text(previous_text + text)
+
+    if (
+        isinstance(update, ToolCallProgress)
+        and isinstance(previous, ToolCallStart | ToolCallProgress)
+        and previous.tool_call_id == update.tool_call_id
+    ):
+        # Deltas only merge with deltas, snapshots only with snapshots
+        previous_delta = get_tool_call_delta(previous)
+        delta = get_tool_call_delta(update)
+        if (previous_delta is None) != (delta is None):
+            return None
+
+        fields = {
+            name: value
+            for name in update.model_fields_set
+            if name not in ("session_update", "tool_call_id")
+            and (value := getattr(update, name)) is not None
+        }
+        if previous_delta is not None and delta is not None:
+            fields["field_meta"] = {
+                TOOL_CALL_DELTA_META_KEY: {"append": previous_delta + delta}
+            }
+        return previous.model_copy(update=fields)
+
+    return None
@@ -11,6 +11,7 @@ Refactor: split token streaming into a dedicated class.
 from __future__ import annotations
 
 import asyncio
+import time
 
 from acp import (
     Client,
@@ -19,13 +20,6 @@ from acp import (
     update_agent_thought_text,
     update_tool_call,
 )
-from acp.schema import (
-    AgentMessageChunk,
-    AgentPlanUpdate,
-    AgentThoughtChunk,
-    ToolCallProgress,
-    ToolCallStart,
-)
 
 from openhands.sdk import BaseConversation, Event, get_logger
 from openhands.sdk.event import (
@@ -44,27 +38,40 @@ from openhands_cli.acp_impl.events.shared_event_handler import (
     REASONING_HEADER,
     SharedEventHandler,
 )
+from openhands_cli.acp_impl.events.stream_buffer import ACPUpdate, StreamBuffer
 from openhands_cli.acp_impl.events.tool_state import ToolCallState
 from openhands_cli.acp_impl.events.utils import (
+    TOOL_CALL_DELTA_META_KEY,
     format_content_blocks,
     get_metadata,
 )
 
 
-ACPUpdate = (
-    AgentMessageChunk
-    | AgentThoughtChunk
-    | ToolCallStart
-    | ToolCallProgress
-    | AgentPlanUpdate
-)
+logger = get_logger(__name__)
 
+# Seconds streamed updates are buffered before being sent together.
+STREAM_FLUSH_INTERVAL = 0.05
 
-logger = get_logger(__name__)
+# Buffered message/thought characters that trigger a flush before the interval.
+STREAM_FLUSH_MAX_CHARS = 4096
+
+# Minimum seconds between full argument snapshots of a streaming tool call,
+# for clients that did not opt into argument deltas.
+TOOL_CALL_SNAPSHOT_INTERVAL = 0.25
 
 
 class TokenBasedEventSubscriber:
-    """Owns all token streaming logic + state (tool-call streaming included)."""
+    """Owns all token streaming logic + state (tool-call streaming included).
+
+    Streamed updates are coalesced in a StreamBuffer and sent together every
+    ``flush_interval`` seconds, or as soon as ``flush_max_chars`` characters
+    of message/thought text are buffered. The buffer is always flushed before
+    an event is handled, so updates keep their order.
+
+    Streamed tool call arguments are sent as deltas in the update `_meta` if
+    the client opted in (``tool_call_deltas``), and otherwise as full
+    snapshots at most every ``snapshot_interval`` seconds.
+    """
 
     def __init__(
         self,
@@ -73,11 +80,24 @@ class TokenBasedEventSubscriber:
         conn: Client,
         loop: asyncio.AbstractEventLoop,
         conversation: BaseConversation | None = None,
+        flush_interval: float = STREAM_FLUSH_INTERVAL,
+        flush_max_chars: int = STREAM_FLUSH_MAX_CHARS,
+        tool_call_deltas: bool = False,
+        snapshot_interval: float = TOOL_CALL_SNAPSHOT_INTERVAL,
     ) -> None:
         self.session_id = session_id
         self.conn = conn
         self.loop = loop
         self.conversation = conversation
+        self.flush_interval = flush_interval
+        self.flush_max_chars = flush_max_chars
+        self.tool_call_deltas = tool_call_deltas
+        self.snapshot_interval = snapshot_interval
+
+        self._stream_buffer = StreamBuffer()
+        self._flush_scheduled = False
+        # Serializes sending buffered updates and handling events
+        self._send_lock = asyncio.Lock()
 
         # index -> ToolCallState
         self._streaming_tool_calls: dict[int, ToolCallState] = {}
@@ -143,6 +163,18 @@ class TokenBasedEventSubscriber:
         )
 
     async def unstreamed_event_handler(self, event: Event) -> None:
+        # Send tokens streamed before this event first, and keep new flushes
+        # from overtaking the updates sent for it.
+        async with self._send_lock:
+            await self._send_buffered()
+            await self._handle_unstreamed_event(event)
+
+    async def flush(self) -> None:
+        """Send all buffered streaming updates."""
+        async with self._send_lock:
+            await self._send_buffered()
+
+    async def _handle_unstreamed_event(self, event: Event) -> None:
         # Skip ConversationStateUpdateEvent (internal state management)
         if isinstance(event, ConversationStateUpdateEvent):
             return
@@ -224,20 +256,39 @@ class TokenBasedEventSubscriber:
     # -----------------------
 
     def _schedule_update(self, update: ACPUpdate) -> None:
-        """Schedule a session_update for an ACP update, thread-safe."""
+        """Buffer an ACP update and schedule sending it, thread-safe."""
+        if not self.loop.is_running():
+            self._stream_buffer.add(update)
+            self.loop.run_until_complete(self.flush())
+            return
+
+        text_size = self._stream_buffer.add(update)
+        if self.flush_interval <= 0 or text_size >= self.flush_max_chars:
+            asyncio.run_coroutine_threadsafe(self.flush(), self.loop)
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.run_coroutine_threadsafe(self._flush_later(), self.loop)
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    async def _send_buffered(self) -> None:
+        """Send buffered updates (the send lock must be held)."""
+        self._flush_scheduled = False
+        updates = self._stream_buffer.drain()
+        if not updates:
+            return
 
-        async def _send() -> None:
+        # Metrics only change between LLM calls, compute them once per batch
+        field_meta = get_metadata(self.conversation)
+        for update in updates:
             await self.conn.session_update(
                 session_id=self.session_id,
                 update=update,
-                field_meta=get_metadata(self.conversation),
+                field_meta=field_meta,
             )
 
-        if self.loop.is_running():
-            asyncio.run_coroutine_threadsafe(_send(), self.loop)
-        else:
-            self.loop.run_until_complete(_send())
-
     def _handle_tool_call_streaming(self, tool_call) -> None:
         if not tool_call:
             return
@@ -288,22 +339,53 @@ class TokenBasedEventSubscriber:
 
         if not state.started:
             state.started = True
+            state.sent_title = state.title
             tool_call_start = start_tool_call(
                 tool_call_id=state.tool_call_id,
-                title=state.title,
+                title=state.sent_title,
                 kind=state.kind,
                 status="in_progress",
                 content=format_content_blocks(state.args),
             )
             self._schedule_update(tool_call_start)
+            if self.tool_call_deltas:
+                # The start already carries the arguments received so far
+                return
+
+        if arguments_chunk:
+            self._send_tool_call_arguments(state, arguments_chunk)
 
-        if state.started and arguments_chunk:
-            self._schedule_update(
-                update_tool_call(
-                    tool_call_id=state.tool_call_id,
-                    title=state.title,
-                    kind=state.kind,
-                    status="in_progress",
-                    content=format_content_blocks(state.args),
-                ),
+    def _send_tool_call_arguments(
+        self, state: ToolCallState, arguments_chunk: str
+    ) -> None:
+        """Send newly streamed tool call arguments to the client."""
+        if self.tool_call_deltas:
+            title = state.title
+            update = update_tool_call(
+                tool_call_id=state.tool_call_id,
+                title=title if title != state.sent_title else None,
+                status="in_progress",
             )
+            state.sent_title = title
+            meta = {TOOL_CALL_DELTA_META_KEY: {"append": arguments_chunk}}
+            self._schedule_update(update.model_copy(update={"field_meta": meta}))
+            return
+
+        # Full snapshots grow with the arguments, so send them sparingly. The
+        # final arguments are sent with the ActionEvent.
+        now = time.monotonic()
+        if (
+            state.last_snapshot_at is not None
+            and now - state.last_snapshot_at < self.snapshot_interval
+        ):
+            return
+        state.last_snapshot_at = now
+        self._schedule_update(
+            update_tool_call(
+                tool_call_id=state.tool_call_id,
+                title=state.title,
+                kind=state.kind,
+                status="in_progress",
+                content=format_content_blocks(state.args),
+            ),
+        )
@@ -1,8 +1,6 @@
-import json
-
 from acp.schema import ToolKind
-from streamingjson import Lexer
 
+from openhands_cli.acp_impl.events.incremental_json import IncrementalJSONObject
 from openhands_cli.acp_impl.events.shared_event_handler import THOUGHT_HEADER
 from openhands_cli.acp_impl.events.utils import TOOL_KIND_MAPPING
 from openhands_cli.shared.delegate_formatter import format_delegate_title
@@ -11,8 +9,9 @@ from openhands_cli.shared.delegate_formatter import format_delegate_title
 class ToolCallState:
     """Manages the state of a single streaming tool call.
 
-    Uses Lexer to incrementally parse JSON arguments
-    and extract key arguments for dynamic titles.
+    Uses IncrementalJSONObject to parse JSON arguments as they stream in
+    and extract key arguments for dynamic titles. Arguments are kept as a
+    list of chunks, so streaming long arguments stays linear in their length.
 
     The `kind` and `title` properties are only valid after `has_valid_skeleton`
     returns True. Accessing them before raises ValueError.
@@ -22,10 +21,13 @@ class ToolCallState:
         self.tool_call_id = tool_call_id
         self.tool_name = tool_name
         self.is_think = tool_name == "think"
-        self.args = ""
-        self.lexer = Lexer()
-        self.prev_emitted_thought_chunk = ""
+        self.arg_chunks: list[str] = []
+        self.parsed_args = IncrementalJSONObject()
         self.started = False
+        # Last title sent to the client, and when arguments were last sent in
+        # full (see TokenBasedEventSubscriber)
+        self.sent_title: str | None = None
+        self.last_snapshot_at: float | None = None
         self.thought_header_emitted = False
         self._valid_skeleton_cached = False
         # Kind is cached once skeleton is valid (depends only on command, not path)
@@ -33,37 +35,32 @@ class ToolCallState:
         # Incrementally streamed summary (from assistant content prior to tool call)
         self.summary: str = ""
 
+    @property
+    def args(self) -> str:
+        """The arguments accumulated so far."""
+        if len(self.arg_chunks) > 1:
+            self.arg_chunks[:] = ["".join(self.arg_chunks)]
+        return self.arg_chunks[0] if self.arg_chunks else ""
+
     def append_args(self, args_part: str) -> None:
-        """Append new arguments part to the accumulated args and lexer."""
-        self.args += args_part
-        self.lexer.append_string(args_part)
+        """Append new arguments part to the accumulated args and parser."""
+        self.arg_chunks.append(args_part)
+        self.parsed_args.feed(args_part)
 
     def extract_thought_piece(self) -> str | None:
         """Incrementally emit new text from the Think tool's `thought` argument.
 
-        Reparses the best-effort JSON args and diffs against the previously
-        emitted prefix. Prepends THOUGHT_HEADER on the first non-empty delta
-        for consistent formatting with non-streaming mode.
+        Returns the text streamed into `thought` since the previous call.
+        Prepends THOUGHT_HEADER on the first non-empty delta for consistent
+        formatting with non-streaming mode.
         """
         if not self.is_think:
             return None
 
-        try:
-            args = json.loads(self.lexer.complete_json())
-        except Exception:
-            return None
-
-        thought = args.get("thought", "")
-        if not thought:
-            return None
-
-        prev = self.prev_emitted_thought_chunk
-        delta = thought[len(prev) :]
+        delta = self.parsed_args.string_delta("thought")
         if not delta:
             return None
 
-        self.prev_emitted_thought_chunk = thought
-
         # Prepend header on first thought piece for consistency
         # with non-streaming mode (EventSubscriber)
         if not self.thought_header_emitted:
@@ -101,8 +98,7 @@ class ToolCallState:
             return "fetch"
 
         if self.tool_name == "file_editor":
-            args = self._parse_args()
-            command = args.get("command", "") if args else ""
+            command = self.parsed_args.get("command", "")
             # Prefix match: streaming may yield "v", "vi", etc. before full "view"
             if isinstance(command, str) and command and "view".startswith(command):
                 return "read"
@@ -135,11 +131,11 @@ class ToolCallState:
         if self.tool_name == "task_tracker":
             return "Plan updated"
 
-        args = self._parse_args()
+        args = self.parsed_args
         clean_summary = self.summary.strip().replace("\n", " ") if self.summary else ""
 
         # If no args yet, fall back to summary or tool name
-        if not args:
+        if not args.has_content():
             return clean_summary or self.tool_name
 
         if self.tool_name == "file_editor":
@@ -177,14 +173,6 @@ class ToolCallState:
         # Other tools: prefer summary if present
         return clean_summary or self.tool_name
 
-    def _parse_args(self) -> dict | None:
-        """Parse current args using lexer's best-effort completion."""
-        try:
-            args = json.loads(self.lexer.complete_json())
-            return args if isinstance(args, dict) else None
-        except Exception:
-            return None
-
     @property
     def has_valid_skeleton(self) -> bool:
         """Check if we have enough args to consider this a valid tool call.
@@ -202,18 +190,10 @@ class ToolCallState:
         if self._valid_skeleton_cached:
             return True
 
-        if not self.args:
-            return False
-
-        parsed = self._parse_args()
-        if not parsed:
-            return False
+        parsed = self.parsed_args
 
         # Valid if any key has a non-null value with actual content
-        has_any_content = any(
-            v is not None and (not isinstance(v, str) or v) for v in parsed.values()
-        )
-        if not has_any_content:
+        if not parsed.has_content():
             return False
 
         # For file_editor, require 'command' to be present to determine kind correctly
@@ -1,3 +1,6 @@
+import weakref
+from typing import Any
+
 from acp import text_block, tool_content
 from acp.schema import (
     ContentToolCallContent,
@@ -8,6 +11,7 @@ from acp.schema import (
 )
 
 from openhands.sdk import Action, BaseConversation
+from openhands.sdk.conversation.conversation_stats import ConversationStats
 from openhands.sdk.llm.utils.metrics import TokenUsage
 from openhands.tools.delegate.definition import DelegateAction
 from openhands.tools.file_editor.definition import (
@@ -25,6 +29,13 @@ TOOL_KIND_MAPPING: dict[str, ToolKind] = {
     "browser": "fetch",
 }
 
+# `_meta` key for streaming tool call arguments as deltas. Clients opt in by
+# setting it to true in the `_meta` of their capabilities during `initialize`.
+# Tool call updates then carry `{TOOL_CALL_DELTA_META_KEY: {"append": text}}`
+# in their `_meta`, to be appended to the text content of the tool call,
+# instead of the full content.
+TOOL_CALL_DELTA_META_KEY = "openhands.dev/toolCallArgsDelta"
+
 
 def _format_status_line(usage: TokenUsage, cost: float) -> str:
     """Format metrics as a status line string.
@@ -61,14 +72,40 @@ def _format_status_line(usage: TokenUsage, cost: float) -> str:
     return " • ".join(parts)
 
 
+MetricsMeta = dict[str, dict[str, int | float | str]]
+
+# Last metadata built for each ConversationStats, with the usage version
+# (see _usage_version) it was built at. Keyed by id() since pydantic models
+# aren't hashable; entries are dropped when the stats are garbage collected.
+_metadata_cache: dict[int, tuple[int, MetricsMeta | None]] = {}
+
+
+def _usage_version(stats: ConversationStats) -> int | None:
+    """Count the usage and cost records of all LLMs in the conversation.
+
+    Every completion appends to these, so the count changes exactly when the
+    metrics do. Returns None if the stats don't expose them.
+    """
+    try:
+        return sum(
+            len(metrics.token_usages) + len(metrics.costs)
+            for metrics in stats.usage_to_metrics.values()
+        )
+    except (AttributeError, TypeError):
+        return None
+
+
 def get_metadata(
     conversation: BaseConversation | None,
-) -> dict[str, dict[str, int | float | str]] | None:
+) -> MetricsMeta | None:
     """Get metrics data to include in the _meta field.
 
     Returns metrics data similar to how SDK's _format_metrics_subtitle works,
     extracting token usage and cost from conversation stats.
 
+    The result is cached per conversation until the LLM reports new usage, so
+    it is cheap to call for every session update. Callers must not modify it.
+
     Returns:
         Dictionary with metrics data or None if stats unavailable
     """
@@ -79,6 +116,22 @@ def get_metadata(
     if not stats:
         return None
 
+    version = _usage_version(stats)
+    if version is not None:
+        cached = _metadata_cache.get(id(stats))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+    metadata = _build_metadata(stats)
+    if version is not None:
+        key = id(stats)
+        if key not in _metadata_cache:
+            weakref.finalize(stats, _metadata_cache.pop, key, None)
+        _metadata_cache[key] = (version, metadata)
+    return metadata
+
+
+def _build_metadata(stats: ConversationStats) -> MetricsMeta | None:
     combined_metrics = stats.get_combined_metrics()
     if not combined_metrics or not combined_metrics.accumulated_token_usage:
         return None
@@ -114,6 +167,26 @@ def format_content_blocks(text: str | None) -> list[ToolCallContent] | None:
     ]
 
 
+def client_supports_tool_call_deltas(client_capabilities: Any | None) -> bool:
+    """Check whether the client opted into tool call argument deltas."""
+    meta = getattr(client_capabilities, "field_meta", None)
+    if meta is None and isinstance(client_capabilities, dict):
+        meta = client_capabilities.get("_meta")
+    return isinstance(meta, dict) and meta.get(TOOL_CALL_DELTA_META_KEY) is True
+
+
+def get_tool_call_delta(update: Any) -> str | None:
+    """Get the appended argument text of a delta tool call update, if any."""
+    meta = getattr(update, "field_meta", None)
+    if not isinstance(meta, dict):
+        return None
+    delta = meta.get(TOOL_CALL_DELTA_META_KEY)
+    if not isinstance(delta, dict):
+        return None
+    text = delta.get("append")
+    return text if isinstance(text, str) else None
+
+
 def extract_action_locations(action: Action) -> list[ToolCallLocation] | None:
     """Extract file locations from an action if available.
 
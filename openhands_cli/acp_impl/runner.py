@@ -13,6 +13,7 @@ from openhands.sdk.security.confirmation_policy import (
     NeverConfirm,
 )
 from openhands_cli.acp_impl.confirmation import ask_user_confirmation_acp
+from openhands_cli.acp_impl.scheduler import SessionScheduler
 from openhands_cli.user_actions.types import UserConfirmation
 
 
@@ -27,6 +28,7 @@ async def run_conversation_with_confirmation(
     conversation: BaseConversation,
     conn: "Client",
     session_id: str,
+    scheduler: SessionScheduler | None = None,
 ) -> None:
     """Run the conversation with confirmation mode enabled.
 
@@ -37,6 +39,8 @@ async def run_conversation_with_confirmation(
         conversation: The conversation to run
         conn: ACP connection for permission requests
         session_id: The session ID
+        scheduler: Runs the conversation on the session's thread; without it
+            the default executor is used
     """
     # If agent was paused at WAITING_FOR_CONFIRMATION, handle it first
     if (
@@ -51,7 +55,10 @@ async def run_conversation_with_confirmation(
 
     while True:
         # Run conversation in a thread (SDK's run() is synchronous)
-        await asyncio.to_thread(conversation.run)
+        if scheduler is not None:
+            await scheduler.run(session_id, conversation.run)
+        else:
+            await asyncio.to_thread(conversation.run)
 
         # Check execution status
         if conversation.state.execution_status == ConversationExecutionStatus.FINISHED:
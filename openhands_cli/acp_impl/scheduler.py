@@ -0,0 +1,185 @@
+"""Scheduling of blocking conversation runs for ACP sessions.
+
+The SDK's ``conversation.run()`` is blocking. Running it with
+``asyncio.to_thread`` shares the default executor with every other blocking
+call of the process, so concurrent sessions and short calls (reading
+conversations, rendering history) wait for each other's threads.
+
+The scheduler instead gives each session a dedicated worker thread, so a
+session always runs on the same thread and never waits for another session's
+thread, and limits how many sessions run at the same time across the agent.
+Runs waiting for a slot are counted, and their wait times recorded, in
+SchedulerStats.
+
+The limit can be set with the OPENHANDS_ACP_MAX_CONCURRENT_RUNS environment
+variable; a value of 0 disables it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENT_RUNS = 4
+
+# Extension method returning the scheduler stats as a dict of SchedulerStats
+SCHEDULER_STATS_METHOD = "openhands.dev/schedulerStats"
+
+
+def _max_concurrent_runs_from_env() -> int:
+    value = os.environ.get("OPENHANDS_ACP_MAX_CONCURRENT_RUNS")
+    if not value:
+        return DEFAULT_MAX_CONCURRENT_RUNS
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        logger.warning(
+            f"Ignoring invalid OPENHANDS_ACP_MAX_CONCURRENT_RUNS={value!r}, "
+            f"using {DEFAULT_MAX_CONCURRENT_RUNS}"
+        )
+        return DEFAULT_MAX_CONCURRENT_RUNS
+
+
+@dataclass
+class SchedulerStats:
+    """Snapshot of the scheduler's activity. Times are in seconds."""
+
+    max_concurrent_runs: int
+    sessions: int
+    running: int
+    queued: int
+    total_runs: int
+    total_wait_time: float
+    max_wait_time: float
+
+    @property
+    def average_wait_time(self) -> float:
+        return self.total_wait_time / self.total_runs if self.total_runs else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Stats in the camelCase form of ACP responses."""
+        return {
+            "maxConcurrentRuns": self.max_concurrent_runs,
+            "sessions": self.sessions,
+            "running": self.running,
+            "queued": self.queued,
+            "totalRuns": self.total_runs,
+            "totalWaitTime": self.total_wait_time,
+            "maxWaitTime": self.max_wait_time,
+            "averageWaitTime": self.average_wait_time,
+        }
+
+
+class SessionScheduler:
+    """Runs blocking work on per-session threads, with a concurrency limit.
+
+    Must be used from a single event loop.
+    """
+
+    def __init__(self, max_concurrent_runs: int | None = None) -> None:
+        """
+        Args:
+            max_concurrent_runs: Sessions allowed to run at the same time, 0
+                for no limit. Defaults to OPENHANDS_ACP_MAX_CONCURRENT_RUNS.
+        """
+        if max_concurrent_runs is None:
+            max_concurrent_runs = _max_concurrent_runs_from_env()
+        self.max_concurrent_runs = max_concurrent_runs
+        self._slots = (
+            asyncio.Semaphore(max_concurrent_runs) if max_concurrent_runs else None
+        )
+        self._executors: dict[str, ThreadPoolExecutor] = {}
+        self._running = 0
+        self._queued = 0
+        self._total_runs = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    async def run(self, session_id: str, func: Callable[[], T]) -> T:
+        """Run ``func`` on the session's thread once a slot is free.
+
+        The slot is held until ``func`` returns, even if the caller is
+        cancelled meanwhile, since the thread can't be interrupted.
+        """
+        enqueued_at = time.monotonic()
+        if self._slots is not None:
+            self._queued += 1
+            try:
+                await self._slots.acquire()
+            finally:
+                self._queued -= 1
+        self._record_wait(time.monotonic() - enqueued_at)
+
+        try:
+            future = self._executor(session_id).submit(func)
+        except BaseException:
+            self._release()
+            raise
+        self._running += 1
+
+        loop = asyncio.get_running_loop()
+
+        def on_done(_future: Future[T]) -> None:
+            try:
+                loop.call_soon_threadsafe(self._finish)
+            except RuntimeError:
+                # The event loop is closed
+                pass
+
+        future.add_done_callback(on_done)
+        return await asyncio.wrap_future(future)
+
+    def close_session(self, session_id: str) -> None:
+        """Stop the thread of a session once its current run, if any, ends."""
+        executor = self._executors.pop(session_id, None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def stats(self) -> SchedulerStats:
+        return SchedulerStats(
+            max_concurrent_runs=self.max_concurrent_runs,
+            sessions=len(self._executors),
+            running=self._running,
+            queued=self._queued,
+            total_runs=self._total_runs,
+            total_wait_time=self._total_wait_time,
+            max_wait_time=self._max_wait_time,
+        )
+
+    def _executor(self, session_id: str) -> ThreadPoolExecutor:
+        executor = self._executors.get(session_id)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"acp-session-{session_id[:8]}"
+            )
+            self._executors[session_id] = executor
+        return executor
+
+    def _record_wait(self, wait_time: float) -> None:
+        self._total_runs += 1
+        self._total_wait_time += wait_time
+        self._max_wait_time = max(self._max_wait_time, wait_time)
+        if self._slots is not None and wait_time > 1:
+            logger.info(
+                f"Conversation run waited {wait_time:.1f}s for a free slot "
+                f"({self._running} running, {self._queued} queued)"
+            )
+
+    def _finish(self) -> None:
+        self._running -= 1
+        self._release()
+
+    def _release(self) -> None:
+        if self._slots is not None:
+            self._slots.release()
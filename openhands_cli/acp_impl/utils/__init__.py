@@ -1,5 +1,6 @@
 from openhands_cli.acp_impl.utils.convert import (
     convert_acp_prompt_to_message_content,
+    convert_acp_prompt_to_message_content_async,
 )
 from openhands_cli.acp_impl.utils.mcp import (
     ACPMCPServerType,
@@ -12,5 +13,6 @@ __all__ = [
     "convert_acp_mcp_servers_to_agent_format",
     "ACPMCPServerType",
     "convert_acp_prompt_to_message_content",
+    "convert_acp_prompt_to_message_content_async",
     "RESOURCE_SKILL",
 ]
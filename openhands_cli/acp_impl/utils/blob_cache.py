@@ -0,0 +1,143 @@
+"""Content-addressed cache of the files ACP prompts carry.
+
+Editors resend the same attachments (screenshots, files) on every turn.
+Files are stored under the SHA-256 of their content, so a blob is written,
+or an image converted, once however often it is sent; converted images are
+stored under the hash of the source blob.
+
+The cache directory is bounded: when it grows over its budget, the least
+recently used files are removed. The budget can be set with the
+OPENHANDS_ACP_CACHE_MB environment variable; a value of 0 disables it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from uuid import uuid4
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE_MB = 256
+
+
+def blob_digest(data: bytes) -> str:
+    """Key of a blob in the cache."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _cache_size_from_env() -> int:
+    value = os.environ.get("OPENHANDS_ACP_CACHE_MB")
+    if not value:
+        return DEFAULT_CACHE_SIZE_MB * 1024 * 1024
+    try:
+        return int(max(float(value), 0) * 1024 * 1024)
+    except ValueError:
+        logger.warning(
+            f"Ignoring invalid OPENHANDS_ACP_CACHE_MB={value!r}, "
+            f"using {DEFAULT_CACHE_SIZE_MB}"
+        )
+        return DEFAULT_CACHE_SIZE_MB * 1024 * 1024
+
+
+class BlobCache:
+    """Files stored by name in a directory kept under a size budget.
+
+    Thread-safe, and safe to share between processes: files are written
+    atomically, and the directory is rescanned before evicting.
+    """
+
+    def __init__(
+        self, directory: Callable[[], Path], max_bytes: int | None = None
+    ) -> None:
+        """
+        Args:
+            directory: Returns the cache directory, which must exist
+            max_bytes: Size budget of the directory, 0 for no limit. Defaults
+                to OPENHANDS_ACP_CACHE_MB.
+        """
+        self._directory = directory
+        self.max_bytes = _cache_size_from_env() if max_bytes is None else max_bytes
+        self._lock = threading.Lock()
+        self._usage: int | None = None
+
+    def store(self, data: bytes, suffix: str = "") -> Path:
+        """Store a blob under its content hash and return its path."""
+        return self.put(f"{blob_digest(data)}{suffix}", data)
+
+    def put(self, name: str, data: bytes) -> Path:
+        """Store a file, unless it is already cached, and return its path."""
+        path = self._directory() / name
+        if self._touch(path):
+            return path
+
+        tmp = path.with_name(f".{name}.{uuid4().hex}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+        with self._lock:
+            if self._usage is None:
+                self._usage = self._scan_usage()
+            else:
+                self._usage += len(data)
+            if self.max_bytes and self._usage > self.max_bytes:
+                self._evict(keep=path)
+        return path
+
+    def get(self, name: str) -> bytes | None:
+        """Content of a cached file, or None if it isn't cached."""
+        path = self._directory() / name
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        self._touch(path)
+        return data
+
+    def _touch(self, path: Path) -> bool:
+        """Mark a file as recently used. Returns whether it exists."""
+        try:
+            os.utime(path)
+        except OSError:
+            return False
+        return True
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        with os.scandir(self._directory()) as it:
+            for entry in it:
+                # Files being written by another thread or process
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    if entry.is_file():
+                        st = entry.stat()
+                        entries.append((st.st_mtime, st.st_size, Path(entry.path)))
+                except OSError:
+                    continue
+        return entries
+
+    def _scan_usage(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self, keep: Path) -> None:
+        """Remove least recently used files until the budget is met."""
+        entries = sorted(self._entries(), key=lambda e: e[0])
+        usage = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if usage <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            usage -= size
+            logger.debug(f"Evicted {path.name} from the ACP cache")
+        self._usage = usage
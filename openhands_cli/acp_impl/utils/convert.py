@@ -1,10 +1,14 @@
 """Utility functions for ACP implementation."""
 
+import asyncio
 import base64
-from uuid import uuid4
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from acp.schema import (
     AudioContentBlock as ACPAudioContentBlock,
+    BlobResourceContents as ACPBlobResourceContents,
     EmbeddedResourceContentBlock as ACPEmbeddedResourceContentBlock,
     ImageContentBlock as ACPImageContentBlock,
     ResourceContentBlock as ACPResourceContentBlock,
@@ -12,45 +16,61 @@ from acp.schema import (
 )
 
 from openhands.sdk import ImageContent, TextContent
+from openhands_cli.acp_impl.utils.images import ImageReport
 from openhands_cli.acp_impl.utils.resources import (
     SUPPORTED_IMAGE_MIME_TYPES,
-    _convert_image_to_supported_format,
+    _image_to_content,
+    _save_blob,
     convert_resources_to_content,
-    get_acp_cache_dir,
 )
 
 
-def _convert_image_block(block: ACPImageContentBlock) -> TextContent | ImageContent:
+ACPPromptBlock = (
+    ACPTextContentBlock
+    | ACPImageContentBlock
+    | ACPAudioContentBlock
+    | ACPResourceContentBlock
+    | ACPEmbeddedResourceContentBlock
+)
+
+# Worker threads decoding and converting prompt attachments
+MAX_CONVERT_WORKERS = 4
+
+
+def _convert_image_block(
+    block: ACPImageContentBlock, report: ImageReport | None = None
+) -> TextContent | ImageContent:
     """
     Convert an ACP image content block to SDK format.
 
     Handles:
-    1. Supported image formats -> ImageContent
+    1. Supported image formats -> ImageContent, downscaled and re-encoded if
+       over the image limits
     2. Unsupported but convertible formats -> ImageContent with converted data
     3. Unsupported and non-convertible formats -> TextContent with file path
 
     Args:
         block: ACP image content block
+        report: Records the sizes of the image before and after preprocessing
 
     Returns:
         ImageContent if format is supported or convertible, TextContent otherwise
     """
-    # Handle supported formats directly
-    if block.mimeType in SUPPORTED_IMAGE_MIME_TYPES:
-        return ImageContent(image_urls=[f"data:{block.mimeType};base64,{block.data}"])
-
-    # Try to convert unsupported formats
-    data = base64.b64decode(block.data)
-    converted = _convert_image_to_supported_format(data, block.mimeType)
-
-    if converted is not None:
-        target_mime, converted_data = converted
-        return ImageContent(image_urls=[f"data:{target_mime};base64,{converted_data}"])
+    try:
+        data = base64.b64decode(block.data, validate=True)
+    except ValueError:
+        if block.mimeType in SUPPORTED_IMAGE_MIME_TYPES:
+            # Not base64 (e.g. a URL): can't be preprocessed, pass it through
+            return ImageContent(
+                image_urls=[f"data:{block.mimeType};base64,{block.data}"]
+            )
+        data = base64.b64decode(block.data)
+    image = _image_to_content(data, block.mimeType, report)
+    if image is not None:
+        return image
 
     # Conversion failed - save to disk and return explanatory text
-    filename = f"image_{uuid4().hex}"
-    target = get_acp_cache_dir() / filename
-    target.write_bytes(data)
+    target = _save_blob(data, block.mimeType)
     supported = ", ".join(sorted(SUPPORTED_IMAGE_MIME_TYPES))
 
     return TextContent(
@@ -65,14 +85,41 @@ def _convert_image_block(block: ACPImageContentBlock) -> TextContent | ImageCont
     )
 
 
+def _convert_block(
+    block: ACPPromptBlock, report: ImageReport | None = None
+) -> TextContent | ImageContent | None:
+    """Convert an ACP content block, or return None if it isn't supported."""
+    if isinstance(block, ACPTextContentBlock):
+        return TextContent(text=block.text)
+    elif isinstance(block, ACPImageContentBlock):
+        return _convert_image_block(block, report)
+    elif isinstance(block, ACPResourceContentBlock | ACPEmbeddedResourceContentBlock):
+        # https://agentclientprotocol.com/protocol/content#resource-link
+        # https://agentclientprotocol.com/protocol/content#embedded-resource
+        return convert_resources_to_content(block, report)
+    return None
+
+
+def _needs_decoding(block: ACPPromptBlock) -> bool:
+    """Whether converting a block decodes, preprocesses or saves its data."""
+    if isinstance(block, ACPImageContentBlock):
+        return True
+    if isinstance(block, ACPEmbeddedResourceContentBlock):
+        return isinstance(block.resource, ACPBlobResourceContents)
+    return False
+
+
+@lru_cache(maxsize=1)
+def _get_convert_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=min(MAX_CONVERT_WORKERS, os.cpu_count() or 1),
+        thread_name_prefix="acp-convert",
+    )
+
+
 def convert_acp_prompt_to_message_content(
-    acp_prompt: list[
-        ACPTextContentBlock
-        | ACPImageContentBlock
-        | ACPAudioContentBlock
-        | ACPResourceContentBlock
-        | ACPEmbeddedResourceContentBlock,
-    ],
+    acp_prompt: list[ACPPromptBlock],
+    report: ImageReport | None = None,
 ) -> list[TextContent | ImageContent]:
     """
     Convert ACP prompt to OpenHands message content format.
@@ -84,20 +131,41 @@ def convert_acp_prompt_to_message_content(
 
     Args:
         prompt: ACP prompt in various formats (string, list, or ContentBlock)
+        report: Records the sizes of the images before and after preprocessing
 
     Returns:
         List of TextContent and ImageContent objects supported by SDK
     """
     message_content: list[TextContent | ImageContent] = []
     for block in acp_prompt:
-        if isinstance(block, ACPTextContentBlock):
-            message_content.append(TextContent(text=block.text))
-        elif isinstance(block, ACPImageContentBlock):
-            message_content.append(_convert_image_block(block))
-        elif isinstance(
-            block, ACPResourceContentBlock | ACPEmbeddedResourceContentBlock
-        ):
-            # https://agentclientprotocol.com/protocol/content#resource-link
-            # https://agentclientprotocol.com/protocol/content#embedded-resource
-            message_content.append(convert_resources_to_content(block))
+        content = _convert_block(block, report)
+        if content is not None:
+            message_content.append(content)
+    return message_content
+
+
+async def convert_acp_prompt_to_message_content_async(
+    acp_prompt: list[ACPPromptBlock],
+    report: ImageReport | None = None,
+) -> list[TextContent | ImageContent]:
+    """
+    Convert ACP prompt to OpenHands message content format without blocking.
+
+    Same as convert_acp_prompt_to_message_content, except that blocks whose
+    data must be decoded, preprocessed or saved are converted concurrently in
+    worker threads rather than on the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    pending = [
+        loop.run_in_executor(_get_convert_executor(), _convert_block, block, report)
+        if _needs_decoding(block)
+        else None
+        for block in acp_prompt
+    ]
+
+    message_content: list[TextContent | ImageContent] = []
+    for block, future in zip(acp_prompt, pending):
+        content = await future if future is not None else _convert_block(block, report)
+        if content is not None:
+            message_content.append(content)
     return message_content
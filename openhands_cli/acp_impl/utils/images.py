@@ -0,0 +1,218 @@
+"""Preprocessing of the images attached to ACP prompts.
+
+Editors attach full-resolution screenshots, which are sent to the LLM as
+base64 data URIs: they inflate requests, slow uploads and cost tokens while
+providers downscale them anyway. Images larger than the configured limits
+are downscaled and re-encoded as WebP or JPEG, dropping their metadata.
+Smaller images in a supported format are sent as they are, unless they
+carry metadata (EXIF, XMP), which is stripped by re-encoding them.
+
+The limits can be set with environment variables:
+
+- OPENHANDS_ACP_IMAGE_MAX_DIMENSION: longest side in pixels (default 1568)
+- OPENHANDS_ACP_IMAGE_MAX_KB: encoded size in KiB (default 3750)
+- OPENHANDS_ACP_IMAGE_FORMAT: ``webp`` (default) or ``jpeg``
+- OPENHANDS_ACP_IMAGE_QUALITY: encoding quality, 1-100 (default 85)
+
+A value of 0 disables a limit.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+
+from PIL import Image, ImageOps
+
+
+logger = logging.getLogger(__name__)
+
+# LLM API supported image MIME types (Anthropic/Claude compatible)
+SUPPORTED_IMAGE_MIME_TYPES = {
+    "image/jpeg",
+    "image/png",
+    "image/gif",
+    "image/webp",
+}
+
+DEFAULT_MAX_DIMENSION = 1568
+DEFAULT_MAX_KB = 3750
+DEFAULT_QUALITY = 85
+
+_FORMATS = {"webp": ("WEBP", "image/webp"), "jpeg": ("JPEG", "image/jpeg")}
+
+# Bounds of the search for an encoding that fits the size limit
+_MIN_QUALITY = 40
+_MIN_DIMENSION = 64
+_QUALITY_STEP = 15
+_SCALE_STEP = 0.75
+
+# Metadata keys Pillow reports in Image.info
+_METADATA_KEYS = ("exif", "xmp", "XML:com.adobe.xmp", "comment")
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={value!r}, using {default}")
+        return default
+
+
+@dataclass(frozen=True)
+class ImageLimits:
+    """Limits of the images sent to the LLM; 0 disables a limit."""
+
+    max_dimension: int = DEFAULT_MAX_DIMENSION
+    max_bytes: int = DEFAULT_MAX_KB * 1024
+    format: str = "webp"
+    quality: int = DEFAULT_QUALITY
+
+    @classmethod
+    def from_env(cls) -> ImageLimits:
+        """Read the limits from the environment, with defaults."""
+        image_format = os.environ.get("OPENHANDS_ACP_IMAGE_FORMAT", "webp").lower()
+        if image_format == "jpg":
+            image_format = "jpeg"
+        if image_format not in _FORMATS:
+            logger.warning(
+                f"Ignoring invalid OPENHANDS_ACP_IMAGE_FORMAT={image_format!r}, "
+                "using webp"
+            )
+            image_format = "webp"
+        quality = _env_int("OPENHANDS_ACP_IMAGE_QUALITY", DEFAULT_QUALITY)
+        return cls(
+            max_dimension=_env_int(
+                "OPENHANDS_ACP_IMAGE_MAX_DIMENSION", DEFAULT_MAX_DIMENSION
+            ),
+            max_bytes=_env_int("OPENHANDS_ACP_IMAGE_MAX_KB", DEFAULT_MAX_KB) * 1024,
+            format=image_format,
+            quality=min(quality, 100) or DEFAULT_QUALITY,
+        )
+
+    @property
+    def mime_type(self) -> str:
+        return _FORMATS[self.format][1]
+
+    @property
+    def cache_tag(self) -> str:
+        """Identifies the limits in the names of cached images."""
+        return f"{self.max_dimension}px-{self.max_bytes}b-{self.format}{self.quality}"
+
+    def exceeded_by(self, img: Image.Image, size: int) -> bool:
+        """Whether an image of ``size`` encoded bytes is over the limits."""
+        return bool(
+            (self.max_dimension and max(img.size) > self.max_dimension)
+            or (self.max_bytes and size > self.max_bytes)
+        )
+
+
+@dataclass
+class ImageReport:
+    """Sizes of the images of a prompt before and after preprocessing."""
+
+    images: int = 0
+    processed: int = 0
+    original_bytes: int = 0
+    sent_bytes: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.original_bytes - self.sent_bytes
+
+    def add(self, original_size: int, sent_size: int) -> None:
+        """Record an image. Thread-safe."""
+        with self._lock:
+            self.images += 1
+            self.processed += sent_size != original_size
+            self.original_bytes += original_size
+            self.sent_bytes += sent_size
+
+    def summary(self) -> str:
+        return (
+            f"{self.images} image(s), {self.processed} preprocessed: "
+            f"{self.original_bytes} -> {self.sent_bytes} bytes "
+            f"({self.bytes_saved} saved)"
+        )
+
+
+def preprocess_image(
+    data: bytes, mime_type: str, limits: ImageLimits
+) -> tuple[str, bytes] | None:
+    """Image to send to the LLM, as (mime_type, data).
+
+    Returns the image unchanged when it is within the limits, in a supported
+    format and without metadata. Images over the limits or with metadata are
+    downscaled and re-encoded in the configured format; images in other
+    formats are converted losslessly to PNG. Returns None if the data can't
+    be read as an image.
+    """
+    try:
+        img = Image.open(io.BytesIO(data))
+        too_large = limits.exceeded_by(img, len(data))
+        supported = mime_type in SUPPORTED_IMAGE_MIME_TYPES
+        # Animations would lose their frames
+        if supported and getattr(img, "is_animated", False):
+            return mime_type, data
+        if supported and not too_large and not _has_metadata(img):
+            return mime_type, data
+
+        img = ImageOps.exif_transpose(img)
+        if too_large or supported:
+            return limits.mime_type, _encode_within_limits(img, limits)
+        output = io.BytesIO()
+        img.save(output, format="PNG")
+        return "image/png", output.getvalue()
+    except Exception as e:
+        logger.debug(f"Could not preprocess {mime_type} image: {e}")
+        return None
+
+
+def _has_metadata(img: Image.Image) -> bool:
+    return any(img.info.get(key) for key in _METADATA_KEYS)
+
+
+def _encode_within_limits(img: Image.Image, limits: ImageLimits) -> bytes:
+    """Downscale and encode an image, lowering the quality, then the
+    resolution, until it fits the size limit."""
+    pil_format = _FORMATS[limits.format][0]
+    has_alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+    if pil_format == "JPEG" and has_alpha:
+        # JPEG has no transparency: flatten onto white
+        background = Image.new("RGB", img.size, "white")
+        background.paste(img.convert("RGBA"), mask=img.convert("RGBA"))
+        img = background
+    elif img.mode not in ("RGB", "L") or has_alpha:
+        img = img.convert("RGBA" if has_alpha else "RGB")
+
+    if limits.max_dimension:
+        img.thumbnail(
+            (limits.max_dimension, limits.max_dimension), Image.Resampling.LANCZOS
+        )
+
+    quality = limits.quality
+    while True:
+        output = io.BytesIO()
+        img.save(output, format=pil_format, quality=quality)
+        encoded = output.getvalue()
+        if not limits.max_bytes or len(encoded) <= limits.max_bytes:
+            return encoded
+        if quality > _MIN_QUALITY:
+            quality = max(quality - _QUALITY_STEP, _MIN_QUALITY)
+        elif min(img.size) > _MIN_DIMENSION:
+            width, height = img.size
+            img = img.resize(
+                (max(int(width * _SCALE_STEP), 1), max(int(height * _SCALE_STEP), 1)),
+                Image.Resampling.LANCZOS,
+            )
+        else:
+            return encoded
@@ -1,11 +1,9 @@
 """Utility functions for ACP implementation."""
 
 import base64
-import io
 import mimetypes
 from functools import lru_cache
 from pathlib import Path
-from uuid import uuid4
 
 from acp.schema import (
     BlobResourceContents as ACPBlobResourceContents,
@@ -13,10 +11,16 @@ from acp.schema import (
     ResourceContentBlock as ACPResourceContentBlock,
     TextResourceContents as ACPTextResourceContents,
 )
-from PIL import Image
 
 from openhands.sdk import ImageContent, TextContent
 from openhands.sdk.context import Skill
+from openhands_cli.acp_impl.utils.blob_cache import BlobCache, blob_digest
+from openhands_cli.acp_impl.utils.images import (
+    SUPPORTED_IMAGE_MIME_TYPES,
+    ImageLimits,
+    ImageReport,
+    preprocess_image,
+)
 
 
 RESOURCE_SKILL = Skill(
@@ -45,68 +49,72 @@ def get_acp_cache_dir() -> Path:
     return cache_dir
 
 
-# LLM API supported image MIME types (Anthropic/Claude compatible)
-SUPPORTED_IMAGE_MIME_TYPES = {
-    "image/jpeg",
-    "image/png",
-    "image/gif",
-    "image/webp",
-}
+# Attachments saved to disk and preprocessed images, by content hash
+_blob_cache = BlobCache(get_acp_cache_dir)
 
+# Limits of the images sent to the LLM
+_image_limits = ImageLimits.from_env()
 
-def _convert_image_to_supported_format(
-    image_data: bytes,
-    source_mime_type: str,  # noqa: ARG001
-) -> tuple[str, str] | None:
-    """
-    Try to convert an unsupported image format to PNG.
+_IMAGE_EXTENSIONS = {"image/png": ".png", "image/jpeg": ".jpg", "image/webp": ".webp"}
+
+
+def _prepare_image(
+    image_data: bytes, mime_type: str, report: ImageReport | None = None
+) -> tuple[str, bytes] | None:
+    """Preprocess an image to send to the LLM, reusing earlier results.
 
-    Args:
-        image_data: The raw image bytes
-        source_mime_type: The original MIME type (currently unused but kept for API)
+    Images in a supported format that can't be read are sent as they are.
 
     Returns:
-        A tuple of (mime_type, base64_data) if conversion succeeds, None otherwise
+        A tuple of (mime_type, data), or None if the image can't be used
     """
-    try:
-        # Open the image with Pillow
-        img = Image.open(io.BytesIO(image_data))
-
-        # Convert to RGB if necessary (some formats like RGBA need this for JPEG)
-        # PNG supports transparency, so we'll use PNG as target format
-        if img.mode in ("RGBA", "LA", "P"):
-            # Keep transparency by converting to PNG
-            output_format = "PNG"
-            target_mime = "image/png"
-        else:
-            # For non-transparent images, we can use PNG or JPEG
-            # PNG is lossless, so prefer it
-            output_format = "PNG"
-            target_mime = "image/png"
-
-        # Convert the image to the target format
-        output_buffer = io.BytesIO()
-        img.save(output_buffer, format=output_format)
-        output_buffer.seek(0)
+    name = f"{blob_digest(image_data)}-{_image_limits.cache_tag}"
+    prepared = None
+    for cached_mime in (_image_limits.mime_type, "image/png"):
+        cached = _blob_cache.get(name + _IMAGE_EXTENSIONS[cached_mime])
+        if cached is not None:
+            prepared = cached_mime, cached
+            break
+    else:
+        prepared = preprocess_image(image_data, mime_type, _image_limits)
+        if prepared is not None and prepared[1] is not image_data:
+            target_mime, target_data = prepared
+            _blob_cache.put(name + _IMAGE_EXTENSIONS[target_mime], target_data)
+
+    if prepared is None and mime_type in SUPPORTED_IMAGE_MIME_TYPES:
+        prepared = mime_type, image_data
+    if prepared is not None and report is not None:
+        report.add(len(image_data), len(prepared[1]))
+    return prepared
+
+
+def _image_to_content(
+    image_data: bytes, mime_type: str, report: ImageReport | None = None
+) -> ImageContent | None:
+    """ImageContent of a preprocessed image, or None if it can't be used."""
+    prepared = _prepare_image(image_data, mime_type, report)
+    if prepared is None:
+        return None
+    target_mime, target_data = prepared
+    encoded = base64.b64encode(target_data).decode("utf-8")
+    return ImageContent(image_urls=[f"data:{target_mime};base64,{encoded}"])
 
-        # Encode to base64
-        converted_data = base64.b64encode(output_buffer.read()).decode("utf-8")
 
-        return target_mime, converted_data
-
-    except Exception:
-        # If conversion fails for any reason, return None
-        # This could happen for corrupted images, unsupported formats, etc.
-        return None
+def _save_blob(data: bytes, mime_type: str) -> Path:
+    """Save a blob in the ACP cache directory, once per distinct content."""
+    ext = (mimetypes.guess_extension(mime_type) or "") if mime_type else ""
+    return _blob_cache.store(data, ext)
 
 
 def _materialize_embedded_resource(
     block: ACPEmbeddedResourceContentBlock,
+    report: ImageReport | None = None,
 ) -> TextContent | ImageContent:
     """
     For:
     - text resources: return TextContent containing the text.
-    - image blobs: return ImageContent directly (no disk write).
+    - image blobs: return ImageContent directly (no disk write), downscaled or
+      converted if needed.
     - other binary blobs: write to disk and return TextContent explaining the path.
     """
     res: ACPTextResourceContents | ACPBlobResourceContents = block.resource
@@ -125,35 +133,19 @@ def _materialize_embedded_resource(
 
     elif isinstance(res, ACPBlobResourceContents):
         mime_type = res.mimeType or ""
+        data = base64.b64decode(res.blob)
 
-        # 1. If it's a supported image type, directly return ImageContent
-        if mime_type in SUPPORTED_IMAGE_MIME_TYPES:
-            data_uri = f"data:{mime_type};base64,{res.blob}"
-            return ImageContent(image_urls=[data_uri])
-
-        # 2. If it's an unsupported image type, try to convert it
+        # 1. If it's an image, return ImageContent, preprocessed or converted
+        # to a supported format if needed
         if mime_type.startswith("image/"):
-            data = base64.b64decode(res.blob)
-            converted = _convert_image_to_supported_format(data, mime_type)
-
-            if converted is not None:
-                # Conversion succeeded, return as ImageContent
-                target_mime, converted_data = converted
-                data_uri = f"data:{target_mime};base64,{converted_data}"
-                return ImageContent(image_urls=[data_uri])
+            image = _image_to_content(data, mime_type, report)
+            if image is not None:
+                return image
 
             # Conversion failed, fall through to disk storage
 
-        # 3. For non-images or failed conversions, save to disk
-        data = base64.b64decode(res.blob)
-
-        ext = ""
-        if mime_type:
-            ext = mimetypes.guess_extension(mime_type) or ""
-
-        filename = f"embedded_resource_{uuid4().hex}{ext}"
-        target = get_acp_cache_dir() / filename
-        target.write_bytes(data)
+        # 2. For non-images or failed conversions, save to disk
+        target = _save_blob(data, mime_type)
 
         # Provide appropriate message based on content type
         if mime_type.startswith("image/"):
@@ -177,6 +169,7 @@ def _materialize_embedded_resource(
 
 def convert_resources_to_content(
     resource: ACPResourceContentBlock | ACPEmbeddedResourceContentBlock,
+    report: ImageReport | None = None,
 ) -> TextContent | ImageContent:
     if isinstance(resource, ACPResourceContentBlock):
         return TextContent(
@@ -191,6 +184,6 @@ def convert_resources_to_content(
             )
         )
     elif isinstance(resource, ACPEmbeddedResourceContentBlock):
-        return _materialize_embedded_resource(resource)
+        return _materialize_embedded_resource(resource, report)
 
     raise ValueError(f"Unexpected resource type: {type(resource)}")
@@ -0,0 +1,43 @@
+"""Compact command argument parser for OpenHands CLI."""
+
+import argparse
+
+
+def add_compact_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the compact subcommand parser.
+
+    Args:
+        subparsers: The subparsers action to add the compact parser to
+    """
+    compact_parser = subparsers.add_parser(
+        "compact",
+        help="Pack stored conversations into segmented event logs",
+        description=(
+            "Convert the per-file event storage of conversations into packed "
+            "JSONL segments with an offset index, in place. Packed "
+            "conversations are much faster to list, count and view, and are "
+            "restored automatically when resumed."
+        ),
+    )
+
+    compact_parser.add_argument(
+        "conversation_ids",
+        nargs="*",
+        metavar="conversation_id",
+        help="Conversation IDs to compact",
+    )
+
+    compact_parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Compact every stored conversation",
+    )
+
+    compact_parser.add_argument(
+        "--force",
+        action="store_true",
+        help=(
+            "Also compact conversations that were modified recently and may "
+            "still be in use by another session"
+        ),
+    )
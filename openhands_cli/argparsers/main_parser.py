@@ -6,6 +6,7 @@ from openhands_cli import __version__
 from openhands_cli.argparsers.acp_parser import add_acp_parser
 from openhands_cli.argparsers.auth_parser import add_login_parser, add_logout_parser
 from openhands_cli.argparsers.cloud_parser import add_cloud_parser
+from openhands_cli.argparsers.compact_parser import add_compact_parser
 from openhands_cli.argparsers.mcp_parser import add_mcp_parser
 from openhands_cli.argparsers.serve_parser import add_serve_parser
 from openhands_cli.argparsers.util import (
@@ -49,6 +50,7 @@ def create_main_parser() -> argparse.ArgumentParser:
                                                       server (e.g., Toad CLI, Zed IDE)
                 openhands login                     # Authenticate with OpenHands Cloud
                 openhands logout                    # Log out from OpenHands Cloud
+                openhands compact --all             # Pack stored conversations
         """,
     )
 
@@ -107,6 +109,16 @@ def create_main_parser() -> argparse.ArgumentParser:
     # Environment variable override option
     add_env_override_args(parser)
 
+    # Handled by the entrypoint before parsing, to record the imports
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help=(
+            "Print the time spent importing modules and setting up the CLI "
+            "to stderr on exit"
+        ),
+    )
+
     # Subcommands
     subparsers = parser.add_subparsers(dest="command", help="Additional commands")
 
@@ -132,4 +144,7 @@ def create_main_parser() -> argparse.ArgumentParser:
     # Add view subcommand
     add_view_parser(subparsers)
 
+    # Add compact subcommand
+    add_compact_parser(subparsers)
+
     return parser
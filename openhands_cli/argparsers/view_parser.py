@@ -28,3 +28,33 @@ def add_view_parser(subparsers: argparse._SubParsersAction) -> None:
         default=20,
         help="Maximum number of events to display (default: 20)",
     )
+
+    view_parser.add_argument(
+        "--tail",
+        "-n",
+        type=int,
+        default=None,
+        help="Display only the last N events (overrides --limit)",
+    )
+
+    view_parser.add_argument(
+        "--from",
+        dest="from_index",
+        type=int,
+        default=None,
+        help=(
+            "Position of the first event to display; negative values count "
+            "from the end (overrides --limit)"
+        ),
+    )
+
+    view_parser.add_argument(
+        "--to",
+        dest="to_index",
+        type=int,
+        default=None,
+        help=(
+            "Position after the last event to display; negative values count "
+            "from the end (overrides --limit)"
+        ),
+    )
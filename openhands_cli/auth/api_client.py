@@ -12,7 +12,7 @@ from openhands_cli.auth.http_client import AuthHttpError, BaseHttpClient
 from openhands_cli.auth.utils import console_print
 from openhands_cli.locations import AGENT_SETTINGS_PATH, get_persistence_dir
 from openhands_cli.stores import AgentStore
-from openhands_cli.theme import OPENHANDS_THEME
+from openhands_cli.theme import OPENHANDS_COLORS
 
 
 class ApiClientError(Exception):
@@ -159,26 +159,26 @@ class OpenHandsApiClient(BaseHttpClient):
 
 
 def _print_settings_summary(settings: dict[str, Any]) -> None:
-    console_print("  ✓ User settings retrieved", style=OPENHANDS_THEME.success)
+    console_print("  ✓ User settings retrieved", style=OPENHANDS_COLORS.success)
 
     llm_model = settings.get("llm_model", "Not set")
     agent_name = settings.get("agent", "Not set")
     language = settings.get("language", "Not set")
     llm_api_key_set = settings.get("llm_api_key_set", False)
 
-    console_print(f"    LLM Model: {llm_model}", style=OPENHANDS_THEME.secondary)
-    console_print(f"    Agent: {agent_name}", style=OPENHANDS_THEME.secondary)
-    console_print(f"    Language: {language}", style=OPENHANDS_THEME.secondary)
+    console_print(f"    LLM Model: {llm_model}", style=OPENHANDS_COLORS.secondary)
+    console_print(f"    Agent: {agent_name}", style=OPENHANDS_COLORS.secondary)
+    console_print(f"    Language: {language}", style=OPENHANDS_COLORS.secondary)
 
     if llm_api_key_set:
         console_print(
             "    ✓ LLM API key is configured in settings",
-            style=OPENHANDS_THEME.success,
+            style=OPENHANDS_COLORS.success,
         )
     else:
         console_print(
             "    ! No LLM API key configured in settings",
-            style=OPENHANDS_THEME.warning,
+            style=OPENHANDS_COLORS.warning,
         )
 
 
@@ -199,12 +199,12 @@ def _ask_user_consent_for_overwrite(
         True if user consents to overwrite, False otherwise
     """
     console_print(
-        "\n⚠️  Existing agent configuration found!", style=OPENHANDS_THEME.warning
+        "\n⚠️  Existing agent configuration found!", style=OPENHANDS_COLORS.warning
     )
     console_print(
         "This will overwrite your current settings with "
         "the ones from OpenHands Cloud.\n",
-        style=OPENHANDS_THEME.secondary,
+        style=OPENHANDS_COLORS.secondary,
     )
 
     # Show current vs new settings comparison
@@ -212,24 +212,24 @@ def _ask_user_consent_for_overwrite(
     new_model = new_settings.get("llm_model", default_model)
     base_url = new_settings.get("llm_base_url", None)
 
-    console_print("Current configuration:", style=OPENHANDS_THEME.secondary)
+    console_print("Current configuration:", style=OPENHANDS_COLORS.secondary)
     console_print(
-        f"  • Model: {html.escape(current_model)}", style=OPENHANDS_THEME.accent
+        f"  • Model: {html.escape(current_model)}", style=OPENHANDS_COLORS.accent
     )
 
     if existing_agent.llm.base_url:
         console_print(
             f"  • Base URL: {html.escape(existing_agent.llm.base_url)}",
-            style=OPENHANDS_THEME.accent,
+            style=OPENHANDS_COLORS.accent,
         )
 
-    console_print("\nNew configuration from cloud:", style=OPENHANDS_THEME.secondary)
-    console_print(f"  • Model: {html.escape(new_model)}", style=OPENHANDS_THEME.accent)
+    console_print("\nNew configuration from cloud:", style=OPENHANDS_COLORS.secondary)
+    console_print(f"  • Model: {html.escape(new_model)}", style=OPENHANDS_COLORS.accent)
 
     if base_url:
         console_print(
             f"  • Base URL: {html.escape(base_url)}",
-            style=OPENHANDS_THEME.accent,
+            style=OPENHANDS_COLORS.accent,
         )
 
     try:
@@ -276,20 +276,20 @@ def create_and_save_agent_configuration(
     )
 
     console_print(
-        "✓ Agent configuration created and saved!", style=OPENHANDS_THEME.success
+        "✓ Agent configuration created and saved!", style=OPENHANDS_COLORS.success
     )
-    console_print("Configuration details:", style=OPENHANDS_THEME.secondary)
+    console_print("Configuration details:", style=OPENHANDS_COLORS.secondary)
 
     llm = agent.llm
 
-    console_print(f"  • Model: {llm.model}", style=OPENHANDS_THEME.accent)
-    console_print(f"  • Base URL: {llm.base_url}", style=OPENHANDS_THEME.accent)
-    console_print(f"  • Usage ID: {llm.usage_id}", style=OPENHANDS_THEME.accent)
-    console_print("  • API Key: ✓ Set", style=OPENHANDS_THEME.accent)
+    console_print(f"  • Model: {llm.model}", style=OPENHANDS_COLORS.accent)
+    console_print(f"  • Base URL: {llm.base_url}", style=OPENHANDS_COLORS.accent)
+    console_print(f"  • Usage ID: {llm.usage_id}", style=OPENHANDS_COLORS.accent)
+    console_print("  • API Key: ✓ Set", style=OPENHANDS_COLORS.accent)
 
     tools_count = len(agent.tools)
     console_print(
-        f"  • Tools: {tools_count} default tools loaded", style=OPENHANDS_THEME.accent
+        f"  • Tools: {tools_count} default tools loaded", style=OPENHANDS_COLORS.accent
     )
 
     condenser = agent.condenser
@@ -298,10 +298,10 @@ def create_and_save_agent_configuration(
             f"  • Condenser: LLM Summarizing "
             f"(max_size: {condenser.max_size}, "
             f"keep_first: {condenser.keep_first})",
-            style=OPENHANDS_THEME.accent,
+            style=OPENHANDS_COLORS.accent,
         )
 
-    console_print(f"  • Saved to: {get_settings_path()}", style=OPENHANDS_THEME.accent)
+    console_print(f"  • Saved to: {get_settings_path()}", style=OPENHANDS_COLORS.accent)
 
 
 async def fetch_user_data_after_oauth(
@@ -311,29 +311,31 @@ async def fetch_user_data_after_oauth(
     """Fetch user data after OAuth and optionally create & save an Agent."""
     client = OpenHandsApiClient(server_url, api_key)
 
-    console_print("Fetching user data...", style=OPENHANDS_THEME.accent)
+    console_print("Fetching user data...", style=OPENHANDS_COLORS.accent)
 
     try:
         # Fetch LLM API key
-        console_print("• Getting LLM API key...", style=OPENHANDS_THEME.secondary)
+        console_print("• Getting LLM API key...", style=OPENHANDS_COLORS.secondary)
         llm_api_key = await client.get_llm_api_key()
         if llm_api_key:
             console_print(
                 f"  ✓ LLM API key retrieved: {llm_api_key[:3]}...",
-                style=OPENHANDS_THEME.success,
+                style=OPENHANDS_COLORS.success,
             )
         else:
-            console_print("  ! No LLM API key available", style=OPENHANDS_THEME.warning)
+            console_print(
+                "  ! No LLM API key available", style=OPENHANDS_COLORS.warning
+            )
 
         # Fetch user settings
-        console_print("• Getting user settings...", style=OPENHANDS_THEME.secondary)
+        console_print("• Getting user settings...", style=OPENHANDS_COLORS.secondary)
         settings = await client.get_user_settings()
 
         if settings:
             _print_settings_summary(settings)
         else:
             console_print(
-                "  ! No user settings available", style=OPENHANDS_THEME.warning
+                "  ! No user settings available", style=OPENHANDS_COLORS.warning
             )
 
         user_data = {
@@ -348,27 +350,27 @@ async def fetch_user_data_after_oauth(
             except ValueError as e:
                 # User declined to overwrite existing configuration
                 console_print("\n")
-                console_print(str(e), style=OPENHANDS_THEME.warning)
+                console_print(str(e), style=OPENHANDS_COLORS.warning)
                 console_print(
                     "Keeping existing agent configuration.",
-                    style=OPENHANDS_THEME.secondary,
+                    style=OPENHANDS_COLORS.secondary,
                 )
             except Exception as e:
                 console_print(
                     f"Warning: Could not create agent configuration: {e}",
-                    style=OPENHANDS_THEME.warning,
+                    style=OPENHANDS_COLORS.warning,
                 )
         else:
             console_print(
                 "Skipping agent configuration; missing key or settings.",
-                style=OPENHANDS_THEME.warning,
+                style=OPENHANDS_COLORS.warning,
             )
 
         console_print(
-            "✓ User data fetched successfully!", style=OPENHANDS_THEME.success
+            "✓ User data fetched successfully!", style=OPENHANDS_COLORS.success
         )
         return user_data
 
     except ApiClientError as e:
-        console_print(f"Error fetching user data: {e}", style=OPENHANDS_THEME.error)
+        console_print(f"Error fetching user data: {e}", style=OPENHANDS_COLORS.error)
         raise
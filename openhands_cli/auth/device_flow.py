@@ -8,7 +8,7 @@ from pydantic import BaseModel
 
 from openhands_cli.auth.http_client import AuthHttpError, BaseHttpClient
 from openhands_cli.auth.utils import console_print
-from openhands_cli.theme import OPENHANDS_THEME
+from openhands_cli.theme import OPENHANDS_COLORS
 
 
 class DeviceFlowError(Exception):
@@ -161,14 +161,14 @@ class DeviceFlowClient(BaseHttpClient):
             DeviceFlowError: If authentication fails
         """
         console_print(
-            "Starting OpenHands authentication...", style=OPENHANDS_THEME.accent
+            "Starting OpenHands authentication...", style=OPENHANDS_COLORS.accent
         )
 
         # Step 1: Start device flow
         try:
             auth_response = await self.start_device_flow()
         except DeviceFlowError as e:
-            console_print(f"Error: {e}", style=OPENHANDS_THEME.error)
+            console_print(f"Error: {e}", style=OPENHANDS_COLORS.error)
             raise
 
         # Step 2: Use verification_uri_complete if available, otherwise construct URL
@@ -176,36 +176,36 @@ class DeviceFlowClient(BaseHttpClient):
 
         console_print(
             "\nOpening your web browser for authentication...",
-            style=OPENHANDS_THEME.warning,
+            style=OPENHANDS_COLORS.warning,
         )
         console_print(
             f"URL: [bold]{verification_url}[/bold]",
-            style=OPENHANDS_THEME.secondary,
+            style=OPENHANDS_COLORS.secondary,
         )
 
         # Automatically open the browser
         try:
             webbrowser.open(verification_url)
             console_print(
-                "✓ Browser opened successfully", style=OPENHANDS_THEME.success
+                "✓ Browser opened successfully", style=OPENHANDS_COLORS.success
             )
         except Exception as e:
             console_print(
                 f"Could not open browser automatically: {e}",
-                style=OPENHANDS_THEME.warning,
+                style=OPENHANDS_COLORS.warning,
             )
             console_print(
                 f"Please manually open: [bold]{verification_url}[/bold]",
-                style=OPENHANDS_THEME.secondary,
+                style=OPENHANDS_COLORS.secondary,
             )
 
         console_print(
             "Follow the instructions in your browser to complete authentication",
-            style=OPENHANDS_THEME.secondary,
+            style=OPENHANDS_COLORS.secondary,
         )
         console_print(
             "\nWaiting for authentication to complete...",
-            style=OPENHANDS_THEME.accent,
+            style=OPENHANDS_COLORS.accent,
         )
 
         # Step 3: Poll for token using device_code and interval from auth_response
@@ -213,10 +213,12 @@ class DeviceFlowClient(BaseHttpClient):
             token_response = await self.poll_for_token(
                 auth_response.device_code, auth_response.interval
             )
-            console_print("✓ Authentication successful!", style=OPENHANDS_THEME.success)
+            console_print(
+                "✓ Authentication successful!", style=OPENHANDS_COLORS.success
+            )
             return token_response
         except DeviceFlowError as e:
-            console_print(f"Error: {e}", style=OPENHANDS_THEME.error)
+            console_print(f"Error: {e}", style=OPENHANDS_COLORS.error)
             raise
 
 
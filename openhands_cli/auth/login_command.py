@@ -10,7 +10,7 @@ from openhands_cli.auth.device_flow import (
 )
 from openhands_cli.auth.token_storage import TokenStorage
 from openhands_cli.auth.utils import console_print, is_token_valid
-from openhands_cli.theme import OPENHANDS_THEME
+from openhands_cli.theme import OPENHANDS_COLORS
 
 
 async def _fetch_user_data_with_context(
@@ -25,11 +25,11 @@ async def _fetch_user_data_with_context(
     if already_logged_in:
         console_print(
             "You are already logged in to OpenHands Cloud.",
-            style=OPENHANDS_THEME.warning,
+            style=OPENHANDS_COLORS.warning,
         )
         console_print(
             "Pulling latest settings from remote...",
-            style=OPENHANDS_THEME.secondary,
+            style=OPENHANDS_COLORS.secondary,
         )
 
     # If already logged, skip re-fetching settings
@@ -42,7 +42,7 @@ async def _fetch_user_data_with_context(
         # --- SUCCESS MESSAGES ---
         console_print(
             "\n✓ Settings synchronized successfully!",
-            style=OPENHANDS_THEME.success,
+            style=OPENHANDS_COLORS.success,
         )
 
     except ApiClientError as e:
@@ -51,12 +51,12 @@ async def _fetch_user_data_with_context(
 
         console_print(
             f"\nWarning: Could not fetch user data: {safe_error}",
-            style=OPENHANDS_THEME.warning,
+            style=OPENHANDS_COLORS.warning,
         )
         escaped_cmd = html.escape("openhands logout && openhands login")
         console_print(
             f"Please try: [bold]{escaped_cmd}[/bold]",
-            style=OPENHANDS_THEME.secondary,
+            style=OPENHANDS_COLORS.secondary,
         )
 
 
@@ -78,12 +78,12 @@ async def login_command(server_url: str, skip_settings_sync: bool = False) -> bo
     if existing_api_key and not await is_token_valid(server_url, existing_api_key):
         console_print(
             "Token is invalid or expired. Logging out...",
-            style=OPENHANDS_THEME.warning,
+            style=OPENHANDS_COLORS.warning,
         )
         logout_command(server_url)
 
     # Proceed with normal login flow
-    console_print("Logging in to OpenHands Cloud...", style=OPENHANDS_THEME.accent)
+    console_print("Logging in to OpenHands Cloud...", style=OPENHANDS_COLORS.accent)
 
     # Re-read token (may have been cleared by logout above)
     existing_api_key = token_storage.get_api_key()
@@ -102,7 +102,7 @@ async def login_command(server_url: str, skip_settings_sync: bool = False) -> bo
     try:
         token_response = await authenticate_with_device_flow(server_url)
     except DeviceFlowError as e:
-        console_print(f"Authentication failed: {e}", style=OPENHANDS_THEME.error)
+        console_print(f"Authentication failed: {e}", style=OPENHANDS_COLORS.error)
         return False
 
     api_key = token_response.access_token
@@ -110,10 +110,10 @@ async def login_command(server_url: str, skip_settings_sync: bool = False) -> bo
     # Store the API key securely
     token_storage.store_api_key(api_key)
 
-    console_print("✓ Logged into OpenHands Cloud", style=OPENHANDS_THEME.success)
+    console_print("✓ Logged into OpenHands Cloud", style=OPENHANDS_COLORS.success)
     console_print(
         "Your authentication tokens have been stored securely.",
-        style=OPENHANDS_THEME.secondary,
+        style=OPENHANDS_COLORS.secondary,
     )
 
     # Fetch user data and configure local agent
@@ -138,5 +138,5 @@ def run_login_command(server_url: str) -> bool:
     try:
         return asyncio.run(login_command(server_url))
     except KeyboardInterrupt:
-        console_print("\nLogin cancelled by user.", style=OPENHANDS_THEME.warning)
+        console_print("\nLogin cancelled by user.", style=OPENHANDS_COLORS.warning)
         return False
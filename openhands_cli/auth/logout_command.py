@@ -2,7 +2,7 @@
 
 from openhands_cli.auth.token_storage import TokenStorage
 from openhands_cli.auth.utils import console_print
-from openhands_cli.theme import OPENHANDS_THEME
+from openhands_cli.theme import OPENHANDS_COLORS
 
 
 def logout_command(server_url: str | None = None) -> bool:
@@ -20,18 +20,18 @@ def logout_command(server_url: str | None = None) -> bool:
         # Logging out from a specific server (conceptually; we only store one key)
         if server_url:
             console_print(
-                "Logging out from OpenHands Cloud...", style=OPENHANDS_THEME.accent
+                "Logging out from OpenHands Cloud...", style=OPENHANDS_COLORS.accent
             )
 
             was_logged_in = token_storage.remove_api_key()
             if was_logged_in:
                 console_print(
-                    "✓ Logged out of OpenHands Cloud", style=OPENHANDS_THEME.success
+                    "✓ Logged out of OpenHands Cloud", style=OPENHANDS_COLORS.success
                 )
             else:
                 console_print(
                     "You were not logged in to OpenHands Cloud",
-                    style=OPENHANDS_THEME.warning,
+                    style=OPENHANDS_COLORS.warning,
                 )
 
             return True
@@ -40,20 +40,20 @@ def logout_command(server_url: str | None = None) -> bool:
         if not token_storage.has_api_key():
             console_print(
                 "You are not logged in to OpenHands Cloud.",
-                style=OPENHANDS_THEME.warning,
+                style=OPENHANDS_COLORS.warning,
             )
             return True
 
         console_print(
-            "Logging out from OpenHands Cloud...", style=OPENHANDS_THEME.accent
+            "Logging out from OpenHands Cloud...", style=OPENHANDS_COLORS.accent
         )
         token_storage.remove_api_key()
-        console_print("✓ Logged out of OpenHands Cloud", style=OPENHANDS_THEME.success)
+        console_print("✓ Logged out of OpenHands Cloud", style=OPENHANDS_COLORS.success)
         return True
 
     except Exception as e:
         console_print(
-            f"Unexpected error during logout: {e}", style=OPENHANDS_THEME.error
+            f"Unexpected error during logout: {e}", style=OPENHANDS_COLORS.error
         )
         return False
 
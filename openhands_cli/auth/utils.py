@@ -2,7 +2,7 @@
 
 from rich.console import Console
 
-from openhands_cli.theme import OPENHANDS_THEME
+from openhands_cli.theme import OPENHANDS_COLORS
 
 
 __all__ = [
@@ -21,7 +21,7 @@ def console_print(message: str, *, style: str | None = None) -> None:
 
     Args:
         message: Text to print (may contain Rich markup).
-        style: Optional OPENHANDS_THEME style name.  When given, the message
+        style: Optional OPENHANDS_COLORS style name.  When given, the message
             is automatically wrapped in ``[{style}]…[/{style}]`` tags so
             callers don't have to repeat the verbose markup pattern.
     """
@@ -71,15 +71,15 @@ async def ensure_valid_auth(server_url: str) -> str:
         if not api_key:
             console_print(
                 "You are not logged in to OpenHands Cloud.",
-                style=OPENHANDS_THEME.warning,
+                style=OPENHANDS_COLORS.warning,
             )
         else:
             console_print(
                 "Your connection with OpenHands Cloud has expired.",
-                style=OPENHANDS_THEME.warning,
+                style=OPENHANDS_COLORS.warning,
             )
 
-        console_print("Starting login...", style=OPENHANDS_THEME.accent)
+        console_print("Starting login...", style=OPENHANDS_COLORS.accent)
         success = await login_command(server_url)
         if not success:
             raise AuthenticationError("Login failed")
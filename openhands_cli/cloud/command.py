@@ -13,7 +13,7 @@ from openhands_cli.cloud.conversation import (
     CloudConversationError,
     create_cloud_conversation,
 )
-from openhands_cli.theme import OPENHANDS_THEME
+from openhands_cli.theme import OPENHANDS_COLORS
 from openhands_cli.utils import create_seeded_instructions_from_args
 
 
@@ -42,11 +42,11 @@ def handle_cloud_command(args: argparse.Namespace) -> None:
         if not queued_inputs:
             console_print(
                 "Error: No initial message provided for cloud conversation.",
-                style=OPENHANDS_THEME.error,
+                style=OPENHANDS_COLORS.error,
             )
             console_print(
                 "Use --task or --file to provide an initial message.",
-                style=OPENHANDS_THEME.secondary,
+                style=OPENHANDS_COLORS.secondary,
             )
             return
 
@@ -57,12 +57,12 @@ def handle_cloud_command(args: argparse.Namespace) -> None:
 
         console_print(
             "Cloud conversation created successfully! 🚀",
-            style=OPENHANDS_THEME.success,
+            style=OPENHANDS_COLORS.success,
         )
 
     except (CloudConversationError, AuthenticationError):
         # Error already printed in the function
         sys.exit(1)
     except Exception as e:
-        console_print(f"Unexpected error: {e}", style=OPENHANDS_THEME.error)
+        console_print(f"Unexpected error: {e}", style=OPENHANDS_COLORS.error)
         sys.exit(1)
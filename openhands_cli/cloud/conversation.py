@@ -20,7 +20,7 @@ from typing import Any
 
 from openhands_cli.auth.api_client import OpenHandsApiClient
 from openhands_cli.auth.utils import console_print
-from openhands_cli.theme import OPENHANDS_THEME
+from openhands_cli.theme import OPENHANDS_COLORS
 
 
 logger = logging.getLogger(__name__)
@@ -54,16 +54,16 @@ async def create_cloud_conversation(
     client = OpenHandsApiClient(server_url, api_key)
 
     repo, branch = extract_repository_from_cwd()
-    accent = OPENHANDS_THEME.accent
+    accent = OPENHANDS_COLORS.accent
     if repo:
         console_print(
             f"Detected repository: [{accent}]{repo}[/{accent}]",
-            style=OPENHANDS_THEME.secondary,
+            style=OPENHANDS_COLORS.secondary,
         )
     if branch:
         console_print(
             f"Detected branch: [{accent}]{branch}[/{accent}]",
-            style=OPENHANDS_THEME.secondary,
+            style=OPENHANDS_COLORS.secondary,
         )
 
     payload: dict[str, Any] = {
@@ -76,7 +76,7 @@ async def create_cloud_conversation(
     if branch:
         payload["selected_branch"] = branch
 
-    console_print("Creating cloud conversation...", style=OPENHANDS_THEME.accent)
+    console_print("Creating cloud conversation...", style=OPENHANDS_COLORS.accent)
 
     try:
         resp = await client.create_conversation(json_data=payload)
@@ -85,7 +85,7 @@ async def create_cloud_conversation(
         raise
     except Exception as e:
         console_print(
-            f"Error creating cloud conversation: {e}", style=OPENHANDS_THEME.error
+            f"Error creating cloud conversation: {e}", style=OPENHANDS_COLORS.error
         )
         raise CloudConversationError(f"Failed to create conversation: {e}") from e
 
@@ -95,7 +95,7 @@ async def create_cloud_conversation(
     # V1 returns a start-task; poll until app_conversation_id is available
     if not app_conversation_id and task_id:
         console_print(
-            "Waiting for conversation to start...", style=OPENHANDS_THEME.secondary
+            "Waiting for conversation to start...", style=OPENHANDS_COLORS.secondary
         )
         for _ in range(poll_max_attempts):
             await asyncio.sleep(poll_interval)
@@ -116,18 +116,18 @@ async def create_cloud_conversation(
         console_print(
             "⚠️ Conversation is still initializing. "
             "The link below may take a moment to become active.",
-            style=OPENHANDS_THEME.warning,
+            style=OPENHANDS_COLORS.warning,
         )
     console_print(
         f"Conversation ID: [{accent}]{conversation_id}[/{accent}]",
-        style=OPENHANDS_THEME.secondary,
+        style=OPENHANDS_COLORS.secondary,
     )
 
     if conversation_id:
         url = f"{server_url}/conversations/{conversation_id}"
         console_print(
             f"View in browser: [{accent}]{url}[/{accent}]",
-            style=OPENHANDS_THEME.secondary,
+            style=OPENHANDS_COLORS.secondary,
         )
 
     return conversation
@@ -0,0 +1,106 @@
+"""Compaction of stored conversations into packed event logs."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from rich.console import Console
+
+from openhands_cli.conversations.store.packed import (
+    PackError,
+    pack_conversation,
+)
+from openhands_cli.locations import get_conversations_dir
+from openhands_cli.theme import OPENHANDS_COLORS
+
+
+console = Console()
+
+# Conversations touched more recently than this may still be open in another
+# session, whose SDK event log expects the per-file layout.
+MIN_IDLE_SECONDS = 60 * 60
+
+
+def compact_conversations(
+    conversation_ids: list[str],
+    *,
+    compact_all: bool = False,
+    force: bool = False,
+) -> bool:
+    """Pack the events of stored conversations into segmented logs.
+
+    Args:
+        conversation_ids: IDs of the conversations to compact.
+        compact_all: If True, compact every stored conversation.
+        force: If True, also compact recently modified conversations.
+
+    Returns:
+        True if no conversation failed to compact, False otherwise.
+    """
+    base_dir = Path(get_conversations_dir())
+
+    if compact_all:
+        conversation_dirs = (
+            sorted(path for path in base_dir.iterdir() if path.is_dir())
+            if base_dir.is_dir()
+            else []
+        )
+    else:
+        conversation_dirs = [
+            base_dir / conversation_id.replace("-", "")
+            for conversation_id in conversation_ids
+        ]
+
+    if not conversation_dirs:
+        console.print("No conversations to compact.", style=OPENHANDS_COLORS.warning)
+        return True
+
+    idle_before = time.time() - MIN_IDLE_SECONDS
+    total_packed = 0
+    failures = 0
+
+    for conversation_dir in conversation_dirs:
+        if not conversation_dir.is_dir():
+            console.print(
+                f"Conversation not found: {conversation_dir.name}",
+                style=OPENHANDS_COLORS.error,
+            )
+            failures += 1
+            continue
+
+        events_dir = conversation_dir / "events"
+        if (
+            not force
+            and events_dir.is_dir()
+            and events_dir.stat().st_mtime > idle_before
+        ):
+            console.print(
+                f"Skipping {conversation_dir.name}: modified recently "
+                "(use --force to compact it anyway)",
+                style=f"{OPENHANDS_COLORS.secondary} dim",
+            )
+            continue
+
+        try:
+            packed = pack_conversation(conversation_dir)
+        except (PackError, OSError) as e:
+            console.print(
+                f"Failed to compact {conversation_dir.name}: {e}",
+                style=OPENHANDS_COLORS.error,
+            )
+            failures += 1
+            continue
+
+        total_packed += packed
+        if packed:
+            console.print(
+                f"Compacted {conversation_dir.name}: {packed} event(s) packed",
+                style=OPENHANDS_COLORS.success,
+            )
+
+    console.print(
+        f"Packed {total_packed} event(s) in total",
+        style=f"{OPENHANDS_COLORS.secondary} dim",
+    )
+    return failures == 0
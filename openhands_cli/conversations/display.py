@@ -5,7 +5,7 @@ from datetime import datetime
 from rich.console import Console
 
 from openhands_cli.conversations.store.local import LocalFileStore
-from openhands_cli.theme import OPENHANDS_THEME
+from openhands_cli.theme import OPENHANDS_COLORS
 
 
 console = Console()
@@ -21,15 +21,15 @@ def display_recent_conversations(limit: int = 15) -> None:
     conversations = store.list_conversations(limit=limit)
 
     if not conversations:
-        console.print("No conversations found.", style=OPENHANDS_THEME.warning)
+        console.print("No conversations found.", style=OPENHANDS_COLORS.warning)
         console.print(
             "Start a new conversation with: openhands",
-            style=f"{OPENHANDS_THEME.secondary} dim",
+            style=f"{OPENHANDS_COLORS.secondary} dim",
         )
         return
 
-    console.print("Recent Conversations:", style=f"{OPENHANDS_THEME.primary} bold")
-    console.print("-" * 80, style=f"{OPENHANDS_THEME.secondary} dim")
+    console.print("Recent Conversations:", style=f"{OPENHANDS_COLORS.primary} bold")
+    console.print("-" * 80, style=f"{OPENHANDS_COLORS.secondary} dim")
 
     for i, conv in enumerate(conversations, 1):
         # Format the date nicely
@@ -39,30 +39,30 @@ def display_recent_conversations(limit: int = 15) -> None:
         prompt_preview = _truncate_prompt(conv.title)
 
         # Format the conversation entry
-        console.print(f"{i:2d}. ", style=f"{OPENHANDS_THEME.primary} bold", end="")
-        console.print(f"{conv.id} ", style=OPENHANDS_THEME.accent, end="")
-        console.print(f"({date_str})", style=f"{OPENHANDS_THEME.secondary} dim")
+        console.print(f"{i:2d}. ", style=f"{OPENHANDS_COLORS.primary} bold", end="")
+        console.print(f"{conv.id} ", style=OPENHANDS_COLORS.accent, end="")
+        console.print(f"({date_str})", style=f"{OPENHANDS_COLORS.secondary} dim")
 
         if prompt_preview:
             console.print(
-                f"    {prompt_preview}", style=OPENHANDS_THEME.foreground, markup=False
+                f"    {prompt_preview}", style=OPENHANDS_COLORS.foreground, markup=False
             )
         else:
             console.print(
-                "    (No user message)", style=f"{OPENHANDS_THEME.secondary} dim"
+                "    (No user message)", style=f"{OPENHANDS_COLORS.secondary} dim"
             )
 
         console.print()  # Add spacing between entries
 
-    console.print("-" * 80, style=f"{OPENHANDS_THEME.secondary} dim")
+    console.print("-" * 80, style=f"{OPENHANDS_COLORS.secondary} dim")
     console.print(
         "To resume a conversation, use: ",
-        style=f"{OPENHANDS_THEME.secondary} dim",
+        style=f"{OPENHANDS_COLORS.secondary} dim",
         end="",
     )
     console.print(
         "openhands --resume <conversation-id>",
-        style=f"{OPENHANDS_THEME.primary} bold",
+        style=f"{OPENHANDS_COLORS.primary} bold",
     )
 
 
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
 
-from pydantic.dataclasses import dataclass
-
 
 @dataclass
 class ConversationMetadata:
-    """Metadata for a conversation."""
+    """Metadata for a conversation.
+
+    A standard dataclass, so that listing conversations doesn't import pydantic.
+    """
 
     id: str
     created_at: datetime
     title: str | None = None
     last_modified: datetime | None = None
+    cwd: str | None = None
+    event_count: int | None = None
+    # Id of the conversation this one was forked from
+    parent_id: str | None = None
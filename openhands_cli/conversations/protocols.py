@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
 
-from openhands.sdk import Event
 from openhands_cli.conversations.models import ConversationMetadata
 
 
+if TYPE_CHECKING:
+    from openhands.sdk import Event
+
+
 class ConversationStore(Protocol):
     """Protocol for conversation storage access."""
 
@@ -62,6 +65,38 @@ class ConversationStore(Protocol):
         """
         ...
 
+    def load_events_range(
+        self,
+        conversation_id: str,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> Iterator[Event]:
+        """Load the events of a conversation with positions in ``[start, stop)``.
+
+        Args:
+            conversation_id: The conversation ID.
+            start: Position of the first event to load. Negative values count
+                from the end, as in slicing.
+            stop: Position after the last event to load, or None for the end.
+                Negative values count from the end, as in slicing.
+
+        Returns:
+            Iterator of events. Only the storage for the requested range is read.
+        """
+        ...
+
+    def tail(self, conversation_id: str, n: int) -> Iterator[Event]:
+        """Load the last events of a conversation.
+
+        Args:
+            conversation_id: The conversation ID.
+            n: Number of events to load.
+
+        Returns:
+            Iterator of up to ``n`` events, oldest first.
+        """
+        ...
+
     def exists(self, conversation_id: str) -> bool:
         """Check if a conversation exists.
 
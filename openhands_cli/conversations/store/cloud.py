@@ -41,6 +41,19 @@ class CloudStore(ConversationStore):
         # TODO: Implement API call to GET /conversations/{id}/events (streaming)
         raise NotImplementedError("Cloud storage is not yet implemented")
 
+    def load_events_range(
+        self,
+        conversation_id: str,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> Iterator[Event]:
+        # TODO: Implement API call to GET /conversations/{id}/events with paging
+        raise NotImplementedError("Cloud storage is not yet implemented")
+
+    def tail(self, conversation_id: str, n: int) -> Iterator[Event]:
+        # TODO: Implement API call to GET /conversations/{id}/events with paging
+        raise NotImplementedError("Cloud storage is not yet implemented")
+
     def exists(self, conversation_id: str) -> bool:
         # TODO: Check existence via API
         raise NotImplementedError("Cloud storage is not yet implemented")
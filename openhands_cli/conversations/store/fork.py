@@ -0,0 +1,136 @@
+"""Copy-on-write forks of locally stored conversations.
+
+A fork is a new conversation that starts with the events of its parent up to
+a fork point. Event files are immutable once written, so instead of copying
+them the fork hard-links the parent's per-file events and packed segments
+(falling back to copies where the file system can't link). New events are
+written to the fork's own directory only, and reading a fork is exactly as
+fast as reading its parent.
+
+The fork records its lineage in ``fork.json``::
+
+    {"parent_id": "<parent dir name>", "fork_point": 42,
+     "created_at": "2024-01-01T12:00:00+00:00"}
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import NamedTuple
+
+from openhands_cli.conversations.store.packed import (
+    PACKED_DIRNAME,
+    PackedEventLog,
+    link_or_copy,
+    list_unpacked_event_files,
+)
+
+
+FORK_FILENAME = "fork.json"
+
+
+class ForkInfo(NamedTuple):
+    """Lineage of a forked conversation."""
+
+    parent_id: str
+    fork_point: int
+    created_at: datetime
+
+
+def read_fork_info(conversation_dir: Path) -> ForkInfo | None:
+    """Read the lineage of a conversation, or None if it is not a fork."""
+    try:
+        with open(conversation_dir / FORK_FILENAME, encoding="utf-8") as f:
+            data = json.load(f)
+        return ForkInfo(
+            parent_id=str(data["parent_id"]),
+            fork_point=int(data["fork_point"]),
+            created_at=datetime.fromisoformat(data["created_at"]),
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def fork_conversation(
+    parent_dir: Path, child_dir: Path, fork_point: int | None = None
+) -> int:
+    """Create ``child_dir`` as a fork of the conversation in ``parent_dir``.
+
+    Args:
+        parent_dir: Directory of the conversation to fork.
+        child_dir: Directory of the new conversation; must not exist. Its name
+            is the id of the new conversation.
+        fork_point: Number of parent events the fork starts with. Defaults to
+            all of them.
+
+    Returns:
+        The number of events in the fork.
+
+    Raises:
+        FileNotFoundError: If the parent conversation doesn't exist.
+        FileExistsError: If ``child_dir`` already exists.
+        ValueError: If the fork point is out of range.
+    """
+    if not parent_dir.is_dir():
+        raise FileNotFoundError(f"Conversation not found: {parent_dir.name}")
+
+    packed = PackedEventLog(parent_dir)
+    packed_count = len(packed)
+    event_files = list_unpacked_event_files(parent_dir, packed_count)
+    total = packed_count + len(event_files)
+    if fork_point is None:
+        fork_point = total
+    if not 0 <= fork_point <= total:
+        raise ValueError(f"Fork point {fork_point} is outside of 0..{total}")
+
+    child_dir.mkdir(parents=True)
+    try:
+        events_dir = child_dir / "events"
+        events_dir.mkdir()
+        packed.link_prefix(child_dir, min(fork_point, packed_count))
+        for event_file in event_files[: max(fork_point - packed_count, 0)]:
+            link_or_copy(event_file, events_dir / event_file.name)
+
+        _copy_state(parent_dir, child_dir)
+        with open(child_dir / FORK_FILENAME, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "parent_id": parent_dir.name,
+                    "fork_point": fork_point,
+                    "created_at": datetime.now(UTC).isoformat(),
+                },
+                f,
+            )
+    except BaseException:
+        shutil.rmtree(child_dir, ignore_errors=True)
+        raise
+    return fork_point
+
+
+def _copy_state(parent_dir: Path, child_dir: Path) -> None:
+    """Copy the parent's other files, pointing the persisted state at the fork.
+
+    Unlike events, these files are rewritten in place, so they are copied.
+    """
+    from openhands.sdk.conversation.persistence_const import BASE_STATE
+
+    for path in parent_dir.iterdir():
+        if path.name in ("events", PACKED_DIRNAME, FORK_FILENAME) or path.is_dir():
+            continue
+        if path.name != BASE_STATE:
+            shutil.copy2(path, child_dir / path.name)
+            continue
+
+        state = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(state, dict):
+            try:
+                state["id"] = str(uuid.UUID(child_dir.name))
+            except ValueError:
+                pass
+            if state.get("persistence_dir") == str(parent_dir):
+                state["persistence_dir"] = str(child_dir)
+        (child_dir / BASE_STATE).write_text(json.dumps(state), encoding="utf-8")
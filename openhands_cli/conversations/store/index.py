@@ -0,0 +1,300 @@
+"""On-disk metadata index for locally stored conversations.
+
+Listing conversations used to require globbing and parsing the event files of
+every conversation directory. The index caches the parsed metadata of each
+conversation in a small SQLite database that lives next to the conversation
+directories. Each row is keyed by the conversation id and stamped with the
+mtime of the conversation's ``events`` directory, so a row only needs to be
+recomputed when new events were written to that conversation.
+
+Entries are also kept in creation order, so the newest conversations can be
+listed one page at a time (e.g. for ACP ``session/list``) with a cursor,
+optionally restricted to a working directory.
+
+The index is purely a cache: when it is missing, corrupted or written by an
+incompatible version it is rebuilt transparently, and when it cannot be
+opened at all (e.g. read-only file systems) callers fall back to parsing the
+conversation directories directly.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable
+from contextlib import closing, suppress
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple
+
+from openhands_cli.conversations.models import ConversationMetadata
+
+
+INDEX_FILENAME = ".conversations_index.db"
+
+# Bump whenever the table layout or the meaning of a column changes; older
+# index files are dropped and rebuilt from the conversation directories.
+SCHEMA_VERSION = 3
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS conversations (
+        id TEXT PRIMARY KEY,
+        mtime_ns INTEGER NOT NULL,
+        created_at TEXT,
+        created_us INTEGER,
+        title TEXT,
+        event_count INTEGER NOT NULL,
+        cwd TEXT,
+        parent_id TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS conversations_by_creation "
+    "ON conversations (created_us, id)",
+    "CREATE INDEX IF NOT EXISTS conversations_by_cwd "
+    "ON conversations (cwd, created_us, id)",
+)
+
+_COLUMNS = "id, mtime_ns, created_at, title, event_count, cwd, parent_id"
+
+# Position of an entry in the listing: (creation time in microseconds, id)
+ListPosition = tuple[int, str]
+
+
+class IndexedConversation(NamedTuple):
+    """Cached metadata for a single conversation directory."""
+
+    id: str
+    mtime_ns: int
+    created_at: datetime | None
+    title: str | None
+    event_count: int
+    cwd: str | None = None
+    # Id of the conversation this one was forked from
+    parent_id: str | None = None
+
+    @property
+    def position(self) -> ListPosition | None:
+        """Sort key of the entry, newest last; None without a creation date."""
+        if self.created_at is None:
+            return None
+        return _to_us(self.created_at), self.id
+
+    def to_metadata(self) -> ConversationMetadata | None:
+        """Convert the entry to ConversationMetadata.
+
+        Returns:
+            The metadata, or None if the directory holds no valid conversation.
+        """
+        if self.created_at is None:
+            return None
+        return ConversationMetadata(
+            id=self.id,
+            created_at=self.created_at,
+            title=self.title,
+            last_modified=datetime.fromtimestamp(self.mtime_ns / 1e9),
+            cwd=self.cwd,
+            event_count=self.event_count,
+            parent_id=self.parent_id,
+        )
+
+
+class ConversationIndex:
+    """SQLite-backed cache of conversation metadata."""
+
+    def __init__(self, base_dir: Path) -> None:
+        """Initialize the index.
+
+        Args:
+            base_dir: Directory containing the conversation directories. The
+                index database is stored directly inside it.
+        """
+        self.path = base_dir / INDEX_FILENAME
+
+    def load(self) -> dict[str, IndexedConversation]:
+        """Load all cached entries.
+
+        Returns:
+            Mapping of conversation id to cached entry. Empty if the index is
+            missing or unreadable.
+        """
+        conn = self._connect()
+        if conn is None:
+            return {}
+
+        with closing(conn):
+            try:
+                rows = conn.execute(f"SELECT {_COLUMNS} FROM conversations").fetchall()
+            except sqlite3.Error:
+                return {}
+
+        return {row[0]: _to_entry(row) for row in rows}
+
+    def get(self, conversation_id: str) -> IndexedConversation | None:
+        """Load the cached entry for a single conversation, if any."""
+        conn = self._connect()
+        if conn is None:
+            return None
+
+        with closing(conn):
+            try:
+                row = conn.execute(
+                    f"SELECT {_COLUMNS} FROM conversations WHERE id = ?",
+                    (conversation_id,),
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+
+        return _to_entry(row) if row is not None else None
+
+    def page(
+        self,
+        limit: int,
+        before: ListPosition | None = None,
+        cwd: str | None = None,
+    ) -> list[IndexedConversation] | None:
+        """Load the newest entries with a creation date, newest first.
+
+        Args:
+            limit: Maximum number of entries to return.
+            before: Only return entries older than this position.
+            cwd: Only return conversations with this working directory.
+
+        Returns:
+            The entries, or None if the index is unreadable.
+        """
+        conn = self._connect()
+        if conn is None:
+            return None
+
+        query = f"SELECT {_COLUMNS} FROM conversations WHERE created_us IS NOT NULL"
+        params: list[object] = []
+        if cwd is not None:
+            query += " AND cwd = ?"
+            params.append(cwd)
+        if before is not None:
+            query += " AND (created_us < ? OR (created_us = ? AND id < ?))"
+            params.extend([before[0], before[0], before[1]])
+        query += " ORDER BY created_us DESC, id DESC LIMIT ?"
+        params.append(limit)
+
+        with closing(conn):
+            try:
+                rows = conn.execute(query, params).fetchall()
+            except sqlite3.Error:
+                return None
+        return [_to_entry(row) for row in rows]
+
+    def update(
+        self,
+        entries: Iterable[IndexedConversation],
+        removed_ids: Iterable[str] = (),
+    ) -> None:
+        """Insert or replace entries and drop entries of removed conversations.
+
+        Failures are ignored; the index will simply be refreshed again on the
+        next scan.
+        """
+        conn = self._connect()
+        if conn is None:
+            return
+
+        with closing(conn), suppress(sqlite3.Error):
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO conversations "
+                    "(id, mtime_ns, created_at, created_us, title, event_count, cwd, "
+                    "parent_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            entry.id,
+                            entry.mtime_ns,
+                            entry.created_at.isoformat() if entry.created_at else None,
+                            _to_us(entry.created_at) if entry.created_at else None,
+                            entry.title,
+                            entry.event_count,
+                            entry.cwd,
+                            entry.parent_id,
+                        )
+                        for entry in entries
+                    ],
+                )
+                conn.executemany(
+                    "DELETE FROM conversations WHERE id = ?",
+                    [(conv_id,) for conv_id in removed_ids],
+                )
+
+    def _connect(self) -> sqlite3.Connection | None:
+        """Open the index, (re)creating it if missing, stale or corrupted."""
+        if not self.path.parent.is_dir():
+            return None
+
+        for attempt in range(2):
+            try:
+                return self._open()
+            except sqlite3.DatabaseError:
+                # Corrupted or not a database at all: start from scratch once.
+                if attempt == 0:
+                    with suppress(OSError):
+                        self.path.unlink()
+            except (sqlite3.Error, OSError):
+                return None
+        return None
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                with conn:
+                    conn.execute("DROP TABLE IF EXISTS conversations")
+                    for statement in _SCHEMA:
+                        conn.execute(statement)
+                    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+
+def encode_cursor(position: ListPosition) -> str:
+    """Encode a listing position as an opaque pagination cursor."""
+    created_us, conversation_id = position
+    return f"{created_us}:{conversation_id}"
+
+
+def decode_cursor(cursor: str) -> ListPosition:
+    """Decode a cursor made by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    created_us, sep, conversation_id = cursor.partition(":")
+    if not sep or not conversation_id:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return int(created_us), conversation_id
+
+
+def _to_us(value: datetime) -> int:
+    return int(value.timestamp() * 1_000_000)
+
+
+def _to_entry(row: tuple) -> IndexedConversation:
+    conv_id, mtime_ns, created_at, title, event_count, cwd, parent_id = row
+    return IndexedConversation(
+        id=conv_id,
+        mtime_ns=mtime_ns,
+        created_at=_parse_datetime(created_at),
+        title=title,
+        event_count=event_count,
+        cwd=cwd,
+        parent_id=parent_id,
+    )
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
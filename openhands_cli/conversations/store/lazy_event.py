@@ -0,0 +1,101 @@
+"""Lazy, type-dispatched deserialization of stored events.
+
+Validating an event through the generic ``TypeAdapter(Event)`` discriminated
+union is the dominant cost of reading a conversation from disk. Most readers
+only need a few events in full (or only their ``kind``/``source``), so the
+store hands out ``LazyEvent`` proxies instead: the concrete event class is
+resolved from the raw ``kind`` field and the pydantic model is only built on
+first access to an attribute that is not available in the raw data.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from openhands.sdk.event.base import Event
+
+
+# Fields that can be served from the raw event data without validation.
+# Their serialized form is identical to the validated attribute value.
+_RAW_FIELDS = frozenset({"id", "kind", "source", "timestamp"})
+
+# Class-level attributes probed by pydantic's ``isinstance`` check.
+_CLASS_ATTRIBUTES = frozenset({"__pydantic_decorators__"})
+
+_event_classes: dict[str, type[Event]] = {}
+
+
+def resolve_event_class(kind: str) -> type[Event] | None:
+    """Resolve the concrete Event subclass for a serialized ``kind``.
+
+    Args:
+        kind: The ``kind`` discriminator of a serialized event.
+
+    Returns:
+        The event class, or None if no Event subclass has that name.
+    """
+    from openhands.sdk.event.base import Event
+
+    if kind not in _event_classes:
+        # Subclasses may be imported after the first lookup; rebuild on misses.
+        _event_classes.clear()
+        pending: list[type[Event]] = [Event]
+        while pending:
+            cls = pending.pop()
+            _event_classes.setdefault(cls.__name__, cls)
+            pending.extend(cls.__subclasses__())
+    return _event_classes.get(kind)
+
+
+class LazyEvent:
+    """Proxy for a stored event that defers pydantic validation.
+
+    The proxy reports the concrete event class as its ``__class__``, so
+    ``isinstance`` checks and ``functools.singledispatch`` behave as for the
+    real event. Any attribute not in the raw data triggers validation of the
+    concrete model, which is then cached.
+    """
+
+    __slots__ = ("_data", "_event", "_event_class")
+
+    def __init__(self, data: dict[str, Any], event_class: type[Event]) -> None:
+        self._data = data
+        self._event_class = event_class
+        self._event: Event | None = None
+
+    @property
+    def __class__(self) -> type[Event]:  # type: ignore[override]
+        return self._event_class
+
+    def materialize(self) -> Event:
+        """Validate and return the concrete event model.
+
+        Raises:
+            pydantic.ValidationError: If the stored data is not a valid event.
+        """
+        if self._event is None:
+            self._event = self._event_class.model_validate(self._data)
+        return self._event
+
+    def __getattr__(self, name: str) -> Any:
+        if name in _CLASS_ATTRIBUTES:
+            return getattr(self._event_class, name)
+        if self._event is None and name in _RAW_FIELDS and name in self._data:
+            return self._data[name]
+        return getattr(self.materialize(), name)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyEvent):
+            other = other.materialize()
+        return self.materialize() == other
+
+    def __hash__(self) -> int:
+        return hash(self.materialize())
+
+    def __repr__(self) -> str:
+        if self._event is not None:
+            return repr(self._event)
+        kind = self._event_class.__name__
+        return f"LazyEvent(kind={kind!r}, id={self._data.get('id')!r})"
@@ -2,23 +2,58 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import json
+import os
+import time
 import uuid
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, cast
 
-from pydantic import TypeAdapter
-
-from openhands.sdk import MessageEvent
-from openhands.sdk.event.base import Event
-
-# from openhands.tools.preset.default import register_default_tools (moved to __init__)
 from openhands_cli.conversations.models import ConversationMetadata
 from openhands_cli.conversations.protocols import ConversationStore
+from openhands_cli.conversations.store.fork import read_fork_info
+from openhands_cli.conversations.store.index import (
+    ConversationIndex,
+    IndexedConversation,
+    ListPosition,
+    decode_cursor,
+    encode_cursor,
+)
+from openhands_cli.conversations.store.lazy_event import (
+    LazyEvent,
+    resolve_event_class,
+)
+from openhands_cli.conversations.store.packed import (
+    PackedEventLog,
+    list_unpacked_event_files,
+)
 from openhands_cli.locations import get_conversations_dir
-from openhands_cli.utils import extract_text_from_message_content
+
+
+# The SDK is only imported to deserialize events, so that listing
+# conversations from an up-to-date index doesn't import it.
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+
+    from openhands.sdk import MessageEvent
+    from openhands.sdk.event.base import Event
+
+
+# Directories modified this recently are always re-parsed: some file systems
+# only track mtimes with coarse (up to 2s) granularity, so an event written
+# right after indexing could otherwise leave the directory mtime unchanged.
+_MTIME_SLACK_NS = 2_000_000_000
+
+# Upper bound on the threads used to stat and parse conversation directories.
+# Listing is dominated by file system latency (notably on network mounts), so
+# threads overlap that I/O even though JSON parsing itself holds the GIL.
+LIST_MAX_WORKERS = 16
 
 
 class LocalFileStore(ConversationStore):
@@ -31,36 +66,75 @@ class LocalFileStore(ConversationStore):
             base_dir: Base directory for storing conversations.
                 Defaults to get_conversations_dir().
         """
-        # Register default tools to ensure all Action subclasses are available
-        # for proper deserialization of events.
-        # Import locally to avoid hard dependency on browser-use at module level.
-        from openhands.tools.preset.default import register_default_tools
-
-        register_default_tools(enable_browser=False)
         self.base_dir = Path(
             base_dir if base_dir is not None else get_conversations_dir()
         )
-        self._event_adapter = TypeAdapter(Event)
+        self._index = ConversationIndex(self.base_dir)
+        # ((conversation dir, events dir mtime, packed count), event files)
+        self._event_files_cache: tuple[tuple[Path, int, int], list[Path]] | None
+        self._event_files_cache = None
 
     def list_conversations(self, limit: int = 100) -> list[ConversationMetadata]:
         """List recent conversations."""
-        conversations = []
-
         if not self.base_dir.exists():
-            return conversations
+            return []
 
-        # Iterate through all conversation directories
-        for conversation_dir in self.base_dir.iterdir():
-            if not conversation_dir.is_dir():
-                continue
+        entries = [
+            entry
+            for entry in self._refresh_index().values()
+            if entry.created_at is not None
+        ]
+
+        # Latest first; only the `limit` newest entries become metadata.
+        newest = heapq.nlargest(
+            limit, entries, key=lambda x: cast(datetime, x.created_at)
+        )
+        return [metadata for entry in newest if (metadata := entry.to_metadata())]
 
-            metadata = self._parse_conversation_dir(conversation_dir)
-            if metadata:
-                conversations.append(metadata)
+    def list_conversations_page(
+        self,
+        limit: int = 100,
+        cursor: str | None = None,
+        cwd: str | None = None,
+    ) -> tuple[list[ConversationMetadata], str | None]:
+        """List conversations one page at a time, newest first.
+
+        The index is brought up to date when the first page is requested;
+        following pages are read from the index as is, so paging through the
+        listing doesn't rescan the conversation directories.
+
+        Args:
+            limit: Maximum number of conversations to return.
+            cursor: Cursor returned with the previous page, or None for the
+                first page.
+            cwd: Only list conversations started in this working directory.
 
-        # Sort by creation date, latest first
-        conversations.sort(key=lambda x: x.created_at, reverse=True)
-        return conversations[:limit]
+        Returns:
+            The conversations and the cursor of the next page, if any.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        before = decode_cursor(cursor) if cursor is not None else None
+        if not self.base_dir.exists():
+            return [], None
+        if cwd is not None:
+            cwd = os.path.normpath(cwd)
+
+        current = self._refresh_index() if before is None else None
+        # Fetch one extra entry to know whether there is a next page.
+        entries = self._index.page(limit + 1, before, cwd)
+        if entries is None:
+            # The index can't be read: page through the scanned entries.
+            if current is None:
+                current = self._refresh_index()
+            entries = _page_entries(current.values(), limit + 1, before, cwd)
+
+        page = entries[:limit]
+        next_cursor = None
+        if len(entries) > limit and (position := page[-1].position) is not None:
+            next_cursor = encode_cursor(position)
+        return [m for entry in page if (m := entry.to_metadata())], next_cursor
 
     def get_metadata(self, conversation_id: str) -> ConversationMetadata | None:
         """Get metadata for a specific conversation."""
@@ -71,13 +145,8 @@ class LocalFileStore(ConversationStore):
 
     def get_event_count(self, conversation_id: str) -> int:
         """Get the total number of events in a conversation."""
-        conversation_dir = self.base_dir / conversation_id
-        events_dir = conversation_dir / "events"
-
-        if not events_dir.exists() or not events_dir.is_dir():
-            return 0
-
-        return len(list(events_dir.glob("event-*.json")))
+        packed, event_files = self._get_event_sources(self.base_dir / conversation_id)
+        return len(packed) + len(event_files)
 
     def load_events(
         self,
@@ -86,27 +155,37 @@ class LocalFileStore(ConversationStore):
         start_from_newest: bool = False,
     ) -> Iterator[Event]:
         """Load events for a conversation."""
-        conversation_dir = self.base_dir / conversation_id
-        events_dir = conversation_dir / "events"
-
-        if not events_dir.exists() or not events_dir.is_dir():
-            return
+        if limit is None:
+            return self.load_events_range(conversation_id)
+        if start_from_newest:
+            return self.tail(conversation_id, limit)
+        return self.load_events_range(conversation_id, 0, limit)
 
-        # Get all event files and sort them
-        event_files = list(events_dir.glob("event-*.json"))
-        event_files.sort()
+    def load_events_range(
+        self,
+        conversation_id: str,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> Iterator[Event]:
+        """Load the events of a conversation with positions in ``[start, stop)``.
 
-        if limit is not None:
-            if start_from_newest:
-                event_files = event_files[-limit:]
-            else:
-                event_files = event_files[:limit]
+        Only the event files (or packed records) inside the range are read.
+        """
+        sources = self._get_event_sources(self.base_dir / conversation_id)
+        total = len(sources[0]) + len(sources[1])
+        start, stop, _ = slice(start, stop).indices(total)
 
-        for event_file in event_files:
-            event = self._load_event_from_file(event_file)
-            if event:
+        for event_data in self._iter_event_data(sources, start, stop):
+            event = self._to_event(event_data)
+            if event is not None:
                 yield event
 
+    def tail(self, conversation_id: str, n: int) -> Iterator[Event]:
+        """Load the last ``n`` events of a conversation."""
+        if n <= 0:
+            return iter(())
+        return self.load_events_range(conversation_id, -n)
+
     def exists(self, conversation_id: str) -> bool:
         """Check if a conversation exists."""
         return (self.base_dir / conversation_id).exists()
@@ -131,59 +210,234 @@ class LocalFileStore(ConversationStore):
 
         return conversation_id
 
+    @cached_property
+    def _event_adapter(self) -> TypeAdapter[Event]:
+        """Adapter validating events of any kind, created on first use."""
+        from pydantic import TypeAdapter
+
+        from openhands.sdk.event.base import Event
+
+        # Register default tools to ensure all Action subclasses are available
+        # for proper deserialization of events.
+        # Import locally to avoid hard dependency on browser-use at module level.
+        from openhands.tools.preset.default import register_default_tools
+
+        register_default_tools(enable_browser=False)
+        return TypeAdapter(Event)
+
+    def _refresh_index(self) -> dict[str, IndexedConversation]:
+        """Bring the metadata index up to date with the conversation directories.
+
+        Only conversations whose events directory changed since they were last
+        indexed (or that were never indexed) are parsed again. Directories are
+        checked and parsed concurrently by a bounded thread pool.
+
+        Returns:
+            Mapping of conversation id to up-to-date index entry.
+        """
+        indexed = self._index.load()
+        fresh_before_ns = time.time_ns() - _MTIME_SLACK_NS
+
+        with os.scandir(self.base_dir) as it:
+            conversation_dirs = [Path(e.path) for e in it if e.is_dir()]
+
+        def refresh(conversation_dir: Path) -> tuple[IndexedConversation, bool]:
+            return self._refresh_entry(
+                conversation_dir, indexed.get(conversation_dir.name), fresh_before_ns
+            )
+
+        workers = min(LIST_MAX_WORKERS, len(conversation_dirs))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(refresh, conversation_dirs))
+        else:
+            results = [refresh(d) for d in conversation_dirs]
+
+        current = {entry.id: entry for entry, _ in results}
+        changed = [entry for entry, is_changed in results if is_changed]
+        removed_ids = indexed.keys() - current.keys()
+        if changed or removed_ids:
+            self._index.update(changed, removed_ids)
+
+        return current
+
+    def _refresh_entry(
+        self,
+        conversation_dir: Path,
+        entry: IndexedConversation | None,
+        fresh_before_ns: int,
+    ) -> tuple[IndexedConversation, bool]:
+        """Get the up-to-date index entry of a conversation directory.
+
+        Returns:
+            The entry and whether it had to be rebuilt from the events.
+        """
+        mtime_ns = self._get_mtime_ns(conversation_dir)
+        if entry is not None and _is_fresh(entry, mtime_ns, fresh_before_ns):
+            return entry, False
+        return self._index_conversation_dir(conversation_dir, mtime_ns), True
+
+    def _get_mtime_ns(self, conversation_dir: Path) -> int:
+        """Get the modification stamp used to detect stale index entries.
+
+        Adding an event file updates the mtime of the events directory, so it
+        changes whenever the conversation grows.
+        """
+        try:
+            return (conversation_dir / "events").stat().st_mtime_ns
+        except OSError:
+            return 0
+
     def _parse_conversation_dir(
         self, conversation_dir: Path
     ) -> ConversationMetadata | None:
-        """Parse a single conversation directory."""
-        events_dir = conversation_dir / "events"
+        """Parse a single conversation directory, using the index when fresh."""
+        entry, changed = self._refresh_entry(
+            conversation_dir,
+            self._index.get(conversation_dir.name),
+            time.time_ns() - _MTIME_SLACK_NS,
+        )
+        if changed:
+            self._index.update([entry])
+        return entry.to_metadata()
 
-        # Check if events directory exists
-        if not events_dir.exists() or not events_dir.is_dir():
-            return None
+    def _index_conversation_dir(
+        self, conversation_dir: Path, mtime_ns: int
+    ) -> IndexedConversation:
+        """Build the index entry for a conversation directory from its events.
 
-        # Get all event files
-        event_files = list(events_dir.glob("event-*.json"))
-        if not event_files:
-            return None
+        Directories without a valid first event are still recorded (with no
+        creation date) so they are not parsed again until they change.
+        """
+        entry = IndexedConversation(
+            id=conversation_dir.name,
+            mtime_ns=mtime_ns,
+            created_at=None,
+            title=None,
+            event_count=0,
+        )
+        sources = self._get_event_sources(conversation_dir)
+        event_count = len(sources[0]) + len(sources[1])
+        if not event_count:
+            return entry
 
-        # Sort event files to find the first one
-        event_files.sort()
-        first_event_file = event_files[0]
+        entry = entry._replace(event_count=event_count)
+        events = self._iter_event_data(sources)
 
         try:
-            # Parse the first event file to get timestamp
-            with open(first_event_file, encoding="utf-8") as f:
-                first_event = json.load(f)
+            # Parse the first event to get timestamp
+            first_event = next(events, None)
+            if not first_event:
+                return entry
 
             timestamp_str = first_event.get("timestamp")
             if not timestamp_str:
-                return None
+                return entry
 
             created_at = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
 
             # Find the first user message for the title
-            first_user_prompt = self._find_first_user_prompt(event_files)
+            first_user_prompt = self._find_first_user_prompt(
+                itertools.chain([first_event], events)
+            )
 
-            return ConversationMetadata(
-                id=conversation_dir.name,
+            entry = entry._replace(
                 created_at=created_at,
                 title=first_user_prompt,
+                cwd=self._read_working_dir(conversation_dir),
             )
 
-        except (json.JSONDecodeError, ValueError, KeyError):
+            # A fork shares its first events with its parent but is listed
+            # from the time it was forked.
+            fork = read_fork_info(conversation_dir)
+            if fork is not None:
+                entry = entry._replace(
+                    created_at=_like_timezone(fork.created_at, created_at),
+                    parent_id=fork.parent_id,
+                )
+            return entry
+
+        except (OSError, ValueError, KeyError):
+            return entry
+
+    def _read_working_dir(self, conversation_dir: Path) -> str | None:
+        """Read the workspace directory from the persisted conversation state."""
+        from openhands.sdk.conversation.persistence_const import BASE_STATE
+
+        try:
+            with open(conversation_dir / BASE_STATE, encoding="utf-8") as f:
+                working_dir = json.load(f).get("workspace", {}).get("working_dir")
+        except (OSError, ValueError, AttributeError):
             return None
+        return os.path.normpath(working_dir) if isinstance(working_dir, str) else None
+
+    def _get_event_sources(
+        self, conversation_dir: Path
+    ) -> tuple[PackedEventLog, list[Path]]:
+        """Get the packed log and the per-file events that follow it.
 
-    def _find_first_user_prompt(self, event_files: list[Path]) -> str | None:
+        The file listing of the most recently read conversation is reused
+        while its events directory is unchanged, so counting and then loading
+        a range of events lists the directory only once.
+        """
+        packed = PackedEventLog(conversation_dir)
+        packed_count = len(packed)
+        mtime_ns = self._get_mtime_ns(conversation_dir)
+        key = (conversation_dir, mtime_ns, packed_count)
+
+        cached = self._event_files_cache
+        if (
+            cached is not None
+            and cached[0] == key
+            and mtime_ns < time.time_ns() - _MTIME_SLACK_NS
+        ):
+            return packed, cached[1]
+
+        event_files = list_unpacked_event_files(conversation_dir, packed_count)
+        self._event_files_cache = (key, event_files)
+        return packed, event_files
+
+    def _iter_event_data(
+        self,
+        sources: tuple[PackedEventLog, list[Path]],
+        start: int = 0,
+        stop: int | None = None,
+    ) -> Iterator[dict[str, Any] | None]:
+        """Iterate over raw event data in ``[start, stop)``.
+
+        Packed events come first, followed by per-file events written since
+        the last compaction. Unreadable events are yielded as None.
+        """
+        packed, event_files = sources
+        packed_count = len(packed)
+        total = packed_count + len(event_files)
+        stop = total if stop is None else min(stop, total)
+
+        if start < packed_count:
+            yield from packed.iter_range(start, min(stop, packed_count))
+
+        for event_file in event_files[
+            max(start - packed_count, 0) : max(stop - packed_count, 0)
+        ]:
+            yield self._read_event_data(event_file)
+
+    def _find_first_user_prompt(
+        self, events: Iterable[dict[str, Any] | None]
+    ) -> str | None:
         """Find the first user prompt in the conversation events."""
-        for event_file in event_files:
-            try:
-                with open(event_file, encoding="utf-8") as f:
-                    event_data = json.load(f)
-            except (OSError, json.JSONDecodeError):
+        from openhands_cli.utils import extract_text_from_message_content
+
+        for event_data in events:
+            # Filter on the raw keys so only user messages are validated.
+            if (
+                event_data is None
+                or event_data.get("source") != "user"
+                or event_data.get("kind", "MessageEvent") != "MessageEvent"
+            ):
                 continue
 
             message_event = self._to_message_event(event_data)
-            if message_event is None or message_event.source != "user":
+            if message_event is None:
                 continue
 
             text = extract_text_from_message_content(
@@ -196,16 +450,70 @@ class LocalFileStore(ConversationStore):
 
     def _to_message_event(self, event_data: dict[str, Any]) -> MessageEvent | None:
         """Convert raw event data to a MessageEvent."""
+        from openhands.sdk import MessageEvent
+
         try:
             return MessageEvent(**event_data)
         except Exception:
             return None
 
-    def _load_event_from_file(self, event_file: Path) -> Event | None:
-        """Load and validate an event from a file."""
+    def _read_event_data(self, event_file: Path) -> dict[str, Any] | None:
+        """Read raw event data from a per-file event."""
         try:
             with open(event_file, encoding="utf-8") as f:
-                event_data = json.load(f)
-            return self._event_adapter.validate_python(event_data)
-        except (OSError, json.JSONDecodeError, ValueError):
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _to_event(self, event_data: dict[str, Any] | None) -> Event | None:
+        """Convert raw event data into an Event.
+
+        Events with a known ``kind`` are returned as LazyEvent proxies that
+        validate the concrete model on first use; anything else goes through
+        the generic Event adapter right away.
+        """
+        if not isinstance(event_data, dict):
             return None
+
+        # Also registers the tool events resolve_event_class looks up
+        event_adapter = self._event_adapter
+        kind = event_data.get("kind")
+        event_class = resolve_event_class(kind) if isinstance(kind, str) else None
+        if event_class is not None:
+            # LazyEvent reports the concrete class, so it stands in for Event.
+            return cast("Event", LazyEvent(event_data, event_class))
+
+        try:
+            return event_adapter.validate_python(event_data)
+        except ValueError:
+            return None
+
+
+def _page_entries(
+    entries: Iterable[IndexedConversation],
+    limit: int,
+    before: ListPosition | None,
+    cwd: str | None,
+) -> list[IndexedConversation]:
+    """Select a page of entries like ConversationIndex.page, in memory."""
+    positioned = [
+        (position, entry)
+        for entry in entries
+        if (position := entry.position) is not None
+        and (cwd is None or entry.cwd == cwd)
+        and (before is None or position < before)
+    ]
+    newest = heapq.nlargest(limit, positioned, key=lambda item: item[0])
+    return [entry for _, entry in newest]
+
+
+def _like_timezone(value: datetime, like: datetime) -> datetime:
+    """Express ``value`` as aware or naive (local) datetime, like ``like``."""
+    if like.tzinfo is None:
+        return value.astimezone().replace(tzinfo=None)
+    return value.astimezone(like.tzinfo)
+
+
+def _is_fresh(entry: IndexedConversation, mtime_ns: int, fresh_before_ns: int) -> bool:
+    """Check whether a cached index entry can be used as-is."""
+    return entry.mtime_ns == mtime_ns and mtime_ns < fresh_before_ns
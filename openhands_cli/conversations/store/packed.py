@@ -0,0 +1,321 @@
+"""Packed (segmented JSONL) storage for conversation events.
+
+The SDK persists every event of a conversation as its own
+``events/event-NNNNN-<id>.json`` file. For long conversations that means tens
+of thousands of small files, and every read has to glob and sort the whole
+directory. Packing moves those events into a few append-only JSONL segment
+files plus a fixed-width offset index::
+
+    <conversation_dir>/packed_events/
+        segment-00000.jsonl   # one compact JSON event per line
+        segment-00001.jsonl
+        index.bin             # one record per event: segment, offset, length
+
+With the index, the number of packed events is ``size(index.bin) / record
+size`` and any event can be read with two seeks, so counts, tail reads and
+random access no longer depend on the length of the conversation.
+
+A conversation can be partially packed: events written by the SDK after the
+last compaction stay as per-file events and logically follow the packed
+ones. Event files whose index is below the packed count are leftovers of an
+interrupted compaction and are ignored (and removed by the next compaction).
+Before the SDK resumes a packed conversation, ``unpack_conversation`` restores
+the per-file layout the SDK expects.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import struct
+from collections.abc import Generator
+from contextlib import ExitStack, closing
+from pathlib import Path
+from typing import IO, Any
+
+
+PACKED_DIRNAME = "packed_events"
+INDEX_FILENAME = "index.bin"
+
+# Roll over to a new segment once the current one grows past this size.
+SEGMENT_MAX_BYTES = 16 * 1024 * 1024
+
+# segment number (u32), byte offset (u64), byte length (u32), little-endian
+_RECORD = struct.Struct("<IQI")
+
+_EVENT_FILE_RE = re.compile(r"^event-(\d+)-(.+)\.json$")
+
+
+class PackError(Exception):
+    """Raised when a conversation cannot be packed safely."""
+
+
+def get_event_file_index(name: str) -> int | None:
+    """Get the event index encoded in an SDK event file name, if any."""
+    match = _EVENT_FILE_RE.match(name)
+    return int(match.group(1)) if match else None
+
+
+def _segment_name(segment: int) -> str:
+    return f"segment-{segment:05d}.jsonl"
+
+
+class PackedEventLog:
+    """Read/append access to the packed events of one conversation."""
+
+    def __init__(self, conversation_dir: Path) -> None:
+        self.conversation_dir = conversation_dir
+        self.path = conversation_dir / PACKED_DIRNAME
+        self.index_path = self.path / INDEX_FILENAME
+
+    def exists(self) -> bool:
+        """Check whether the conversation has a packed event log."""
+        return self.index_path.is_file()
+
+    def __len__(self) -> int:
+        """Number of packed events, derived from the index size in O(1)."""
+        try:
+            return self.index_path.stat().st_size // _RECORD.size
+        except OSError:
+            return 0
+
+    def read(self, position: int) -> dict[str, Any] | None:
+        """Read a single packed event.
+
+        Returns:
+            The raw event data, or None if it is missing or malformed.
+        """
+        with closing(self.iter_range(position, position + 1)) as events:
+            return next(events, None)
+
+    def iter_range(
+        self, start: int = 0, stop: int | None = None
+    ) -> Generator[dict[str, Any] | None]:
+        """Iterate over raw packed events in ``[start, stop)``.
+
+        Only the index records of the requested range are read, and each
+        event is fetched with a single seek into its segment. Malformed
+        entries are yielded as None so callers keep positional alignment.
+        """
+        count = len(self)
+        stop = count if stop is None else min(stop, count)
+        start = max(start, 0)
+        if start >= stop:
+            return
+
+        with open(self.index_path, "rb") as index_file:
+            index_file.seek(start * _RECORD.size)
+            records = index_file.read((stop - start) * _RECORD.size)
+
+        with ExitStack() as stack:
+            segments: dict[int, IO[bytes]] = {}
+            for segment, offset, length in _RECORD.iter_unpack(records):
+                segment_file = segments.get(segment)
+                if segment_file is None:
+                    segment_file = stack.enter_context(
+                        open(self.path / _segment_name(segment), "rb")
+                    )
+                    segments[segment] = segment_file
+                segment_file.seek(offset)
+                try:
+                    yield json.loads(segment_file.read(length))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    yield None
+
+    def append(self, events: list[dict[str, Any]]) -> None:
+        """Append events to the log.
+
+        Segment data is flushed to disk before the index records that point
+        at it, so a crash can at worst leave unreferenced bytes at the end of
+        a segment, never an index record pointing at missing data.
+        """
+        if not events:
+            return
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        # Drop a partially written trailing record from an interrupted append.
+        count = len(self)
+        if self.index_path.exists():
+            os.truncate(self.index_path, count * _RECORD.size)
+
+        segment, size = self._last_segment()
+        records: list[bytes] = []
+        segment_file = open(self.path / _segment_name(segment), "ab")
+        try:
+            for data in events:
+                line = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+                payload = line.encode("utf-8")
+                if size > 0 and size + len(payload) + 1 > SEGMENT_MAX_BYTES:
+                    _close_durably(segment_file)
+                    segment += 1
+                    size = 0
+                    segment_file = open(self.path / _segment_name(segment), "ab")
+                records.append(_RECORD.pack(segment, size, len(payload)))
+                segment_file.write(payload + b"\n")
+                size += len(payload) + 1
+        finally:
+            _close_durably(segment_file)
+
+        with open(self.index_path, "ab") as index_file:
+            index_file.write(b"".join(records))
+            index_file.flush()
+            os.fsync(index_file.fileno())
+
+    def link_prefix(self, conversation_dir: Path, count: int) -> None:
+        """Give another conversation the first ``count`` packed events.
+
+        The segments holding them are hard-linked (copied if the file system
+        can't link) and only the index records are copied, so this costs a
+        few file operations regardless of the number of events.
+        """
+        count = min(count, len(self))
+        if count <= 0:
+            return
+
+        with open(self.index_path, "rb") as index_file:
+            records = index_file.read(count * _RECORD.size)
+        last_segment = max(segment for segment, _, _ in _RECORD.iter_unpack(records))
+
+        target = PackedEventLog(conversation_dir)
+        target.path.mkdir(parents=True, exist_ok=True)
+        for segment in range(last_segment + 1):
+            source = self.path / _segment_name(segment)
+            if source.exists():
+                link_or_copy(source, target.path / _segment_name(segment))
+        with open(target.index_path, "wb") as index_file:
+            index_file.write(records)
+
+    def _last_segment(self) -> tuple[int, int]:
+        """Get the segment to append to and its current size.
+
+        A segment shared with a forked conversation (see link_prefix) is never
+        appended to, so each conversation only writes to its own files.
+        """
+        segments = sorted(self.path.glob("segment-*.jsonl"))
+        if not segments:
+            return 0, 0
+        last = segments[-1]
+        number = int(last.stem.split("-")[1])
+        stat = last.stat()
+        if stat.st_nlink > 1:
+            return number + 1, 0
+        return number, stat.st_size
+
+
+def link_or_copy(source: Path, target: Path) -> None:
+    """Hard-link ``source`` to ``target``, copying it if linking fails."""
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def _close_durably(file: IO[bytes]) -> None:
+    file.flush()
+    os.fsync(file.fileno())
+    file.close()
+
+
+def list_unpacked_event_files(
+    conversation_dir: Path, packed_count: int = 0
+) -> list[Path]:
+    """List per-file events that are not part of the packed log, in order.
+
+    Args:
+        conversation_dir: The conversation directory.
+        packed_count: Number of events already in the packed log. Event files
+            with a lower index were already packed and are skipped.
+    """
+    events_dir = conversation_dir / "events"
+    try:
+        with os.scandir(events_dir) as it:
+            names = sorted(
+                entry.name
+                for entry in it
+                if entry.name.startswith("event-") and entry.name.endswith(".json")
+            )
+    except OSError:
+        return []
+
+    return [
+        events_dir / name
+        for name in names
+        if not packed_count
+        or (index := get_event_file_index(name)) is None
+        or index >= packed_count
+    ]
+
+
+def pack_conversation(conversation_dir: Path) -> int:
+    """Move a conversation's per-file events into its packed log.
+
+    Safe to run repeatedly: events already packed are skipped and only newer
+    per-file events are appended.
+
+    Returns:
+        Number of events newly packed.
+
+    Raises:
+        PackError: If an event file is malformed or the files are not a
+            contiguous continuation of the packed log.
+    """
+    log = PackedEventLog(conversation_dir)
+    packed_count = len(log)
+    events_dir = conversation_dir / "events"
+
+    # Remove files left behind by an interrupted compaction.
+    if packed_count and events_dir.is_dir():
+        for event_file in events_dir.glob("event-*.json"):
+            index = get_event_file_index(event_file.name)
+            if index is not None and index < packed_count:
+                event_file.unlink()
+
+    event_files = list_unpacked_event_files(conversation_dir, packed_count)
+    events: list[dict[str, Any]] = []
+    for expected, event_file in enumerate(event_files, start=packed_count):
+        if get_event_file_index(event_file.name) != expected:
+            raise PackError(
+                f"Unexpected event file {event_file.name} "
+                f"(expected event index {expected})"
+            )
+        try:
+            with open(event_file, encoding="utf-8") as f:
+                events.append(json.load(f))
+        except (OSError, json.JSONDecodeError) as e:
+            raise PackError(f"Cannot read event file {event_file.name}: {e}") from e
+
+    log.append(events)
+    for event_file in event_files:
+        event_file.unlink()
+    return len(events)
+
+
+def unpack_conversation(conversation_dir: Path) -> int:
+    """Restore a packed conversation to the per-file layout used by the SDK.
+
+    Returns:
+        Number of events written back as files (0 if nothing was packed).
+    """
+    log = PackedEventLog(conversation_dir)
+    if not log.exists():
+        return 0
+
+    events_dir = conversation_dir / "events"
+    events_dir.mkdir(parents=True, exist_ok=True)
+
+    restored = 0
+    for position, data in enumerate(log.iter_range()):
+        if data is None:
+            continue
+        event_id = data.get("id") or f"packed-{position}"
+        event_file = events_dir / f"event-{position:05d}-{event_id}.json"
+        tmp_file = event_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_file, event_file)
+        restored += 1
+
+    shutil.rmtree(log.path)
+    return restored
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+from pydantic import ValidationError
 from rich.console import Console
 
 from openhands.sdk.conversation.visualizer import DefaultConversationVisualizer
 from openhands_cli.conversations.store.local import LocalFileStore
-from openhands_cli.theme import OPENHANDS_THEME
+from openhands_cli.theme import OPENHANDS_COLORS
 
 
 console = Console()
@@ -19,12 +20,27 @@ class ConversationViewer:
         """Initialize the conversation viewer."""
         self.store = LocalFileStore()
 
-    def view(self, conversation_id: str, limit: int = 20) -> bool:
+    def view(
+        self,
+        conversation_id: str,
+        limit: int = 20,
+        *,
+        tail: int | None = None,
+        start: int | None = None,
+        stop: int | None = None,
+    ) -> bool:
         """View events from a conversation.
 
+        By default the first ``limit`` events are shown. ``tail`` shows the
+        last events instead, and ``start``/``stop`` select an explicit range
+        of event positions (negative values count from the end).
+
         Args:
             conversation_id: The ID of the conversation to view.
             limit: Maximum number of events to display.
+            tail: If set, display only the last ``tail`` events.
+            start: Position of the first event to display.
+            stop: Position after the last event to display.
 
         Returns:
             True if the conversation was found and displayed, False otherwise.
@@ -32,15 +48,22 @@ class ConversationViewer:
         if not self.store.exists(conversation_id):
             console.print(
                 f"Conversation not found: {conversation_id}",
-                style=OPENHANDS_THEME.error,
+                style=OPENHANDS_COLORS.error,
             )
             return False
 
         # Get total count first
         total_events = self.store.get_event_count(conversation_id)
-        events_to_show = min(limit, total_events)
 
-        events_iterator = self.store.load_events(conversation_id, limit=limit)
+        if tail is not None:
+            first, last = max(total_events - tail, 0), total_events
+        elif start is not None or stop is not None:
+            first, last, _ = slice(start, stop).indices(total_events)
+        else:
+            first, last = 0, min(limit, total_events)
+        events_to_show = max(last - first, 0)
+
+        events_iterator = self.store.load_events_range(conversation_id, first, last)
 
         # Create visualizer
         visualizer = DefaultConversationVisualizer()
@@ -48,53 +71,67 @@ class ConversationViewer:
         # Display header
         console.print(
             f"Conversation: {conversation_id}",
-            style=f"{OPENHANDS_THEME.primary} bold",
-        )
-        console.print(
-            f"Showing {events_to_show} of {total_events} event(s)",
-            style=f"{OPENHANDS_THEME.secondary} dim",
+            style=f"{OPENHANDS_COLORS.primary} bold",
         )
-        console.print("-" * 80, style=f"{OPENHANDS_THEME.secondary} dim")
+        showing = f"Showing {events_to_show} of {total_events} event(s)"
+        if events_to_show and (first, last) != (0, events_to_show):
+            showing += f" (events {first}-{last - 1})"
+        console.print(showing, style=f"{OPENHANDS_COLORS.secondary} dim")
+        console.print("-" * 80, style=f"{OPENHANDS_COLORS.secondary} dim")
         console.print()
 
         # Load and display events
         events_displayed = 0
         try:
             for event in events_iterator:
-                visualizer.on_event(event)
+                try:
+                    visualizer.on_event(event)
+                except ValidationError:
+                    # Events are validated lazily; skip ones with invalid data.
+                    continue
                 events_displayed += 1
         except Exception as e:
             console.print(
                 f"Error loading events: {e}",
-                style=OPENHANDS_THEME.error,
+                style=OPENHANDS_COLORS.error,
             )
 
         if events_displayed == 0:
             console.print(
                 "No valid events could be displayed.",
-                style=OPENHANDS_THEME.warning,
+                style=OPENHANDS_COLORS.warning,
             )
             return False
 
         console.print()
-        console.print("-" * 80, style=f"{OPENHANDS_THEME.secondary} dim")
+        console.print("-" * 80, style=f"{OPENHANDS_COLORS.secondary} dim")
         console.print(
             f"Displayed {events_displayed} event(s)",
-            style=f"{OPENHANDS_THEME.secondary} dim",
+            style=f"{OPENHANDS_COLORS.secondary} dim",
         )
 
         return True
 
 
-def view_conversation(conversation_id: str, limit: int = 20) -> bool:
+def view_conversation(
+    conversation_id: str,
+    limit: int = 20,
+    *,
+    tail: int | None = None,
+    start: int | None = None,
+    stop: int | None = None,
+) -> bool:
     """View events from a conversation.
 
     Args:
         conversation_id: The ID of the conversation to view.
         limit: Maximum number of events to display.
+        tail: If set, display only the last ``tail`` events.
+        start: Position of the first event to display.
+        stop: Position after the last event to display.
 
     Returns:
         True if the conversation was found and displayed, False otherwise.
     """
     viewer = ConversationViewer()
-    return viewer.view(conversation_id, limit)
+    return viewer.view(conversation_id, limit, tail=tail, start=start, stop=stop)
@@ -4,32 +4,49 @@ Simple main entry point for OpenHands CLI.
 This is a simplified version that demonstrates the TUI functionality.
 """
 
-import argparse
-import logging
-import os
 import sys
-import warnings
-from pathlib import Path
 
-from dotenv import load_dotenv
-from rich.console import Console
+from openhands_cli.startup_profile import (
+    PROFILE_STARTUP_FLAG,
+    enable_startup_profile,
+    startup_step,
+)
+
 
-from openhands_cli.argparsers.main_parser import create_main_parser
-from openhands_cli.stores import (
+# Enabled before the imports below, so that they are recorded
+if PROFILE_STARTUP_FLAG in sys.argv:
+    enable_startup_profile()
+
+# Only light modules are imported here: each command imports what it needs
+# when it runs (see _COMMANDS), so that commands such as --version, --help,
+# mcp list or logout don't pay for the SDK, litellm, fastmcp or Textual.
+import argparse  # noqa: E402
+import logging  # noqa: E402
+import os  # noqa: E402
+import warnings  # noqa: E402
+from collections.abc import Callable  # noqa: E402
+from functools import cache  # noqa: E402
+from pathlib import Path  # noqa: E402
+from typing import TYPE_CHECKING  # noqa: E402
+
+from openhands_cli.argparsers.main_parser import create_main_parser  # noqa: E402
+from openhands_cli.stores.llm_env import (  # noqa: E402
     MissingEnvironmentVariablesError,
     check_and_warn_env_vars,
 )
-from openhands_cli.terminal_compat import check_terminal_compatibility
-from openhands_cli.theme import OPENHANDS_THEME
-from openhands_cli.utils import create_seeded_instructions_from_args
+from openhands_cli.theme import OPENHANDS_COLORS  # noqa: E402
+
 
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
 
+with startup_step("load .env"):
+    env_path = Path.cwd() / ".env"
+    if env_path.is_file():
+        from dotenv import load_dotenv
 
-env_path = Path.cwd() / ".env"
-if env_path.is_file():
-    load_dotenv(dotenv_path=str(env_path), override=False)
+        load_dotenv(dotenv_path=str(env_path), override=False)
 
 
 debug_env = os.getenv("DEBUG", "false").lower()
@@ -38,6 +55,14 @@ if debug_env != "1" and debug_env != "true":
     warnings.filterwarnings("ignore")
 
 
+@cache
+def _console() -> "Console":
+    """Console for the messages of the entrypoint, created on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
 def handle_resume_logic(args: argparse.Namespace) -> str | None:
     """Handle resume logic and return the conversation ID to resume.
 
@@ -47,11 +72,13 @@ def handle_resume_logic(args: argparse.Namespace) -> str | None:
     Returns:
         Conversation ID to resume, or None if it should show conversation list or exit
     """
+    console = _console()
+
     # Check if --last flag is used
     if args.last:
         if args.resume is None:
             console.print(
-                "Error: --last flag requires --resume", style=OPENHANDS_THEME.warning
+                "Error: --last flag requires --resume", style=OPENHANDS_COLORS.warning
             )
             return None
 
@@ -63,7 +90,7 @@ def handle_resume_logic(args: argparse.Namespace) -> str | None:
 
         if not conversations:
             console.print(
-                "No conversations found to resume.", style=OPENHANDS_THEME.warning
+                "No conversations found to resume.", style=OPENHANDS_COLORS.warning
             )
             return None
 
@@ -71,7 +98,7 @@ def handle_resume_logic(args: argparse.Namespace) -> str | None:
 
         console.print(
             f"Resuming latest conversation: {latest_id}",
-            style=OPENHANDS_THEME.success,
+            style=OPENHANDS_COLORS.success,
         )
         return latest_id
 
@@ -87,6 +114,193 @@ def handle_resume_logic(args: argparse.Namespace) -> str | None:
     return args.resume
 
 
+def _run_serve(args: argparse.Namespace) -> None:
+    from openhands_cli.gui_launcher import launch_gui_server
+
+    launch_gui_server(mount_cwd=args.mount_cwd, gpu=args.gpu)
+
+
+def _run_web(args: argparse.Namespace) -> None:
+    from openhands_cli.tui.serve import launch_web_server
+
+    launch_web_server(host=args.host, port=args.port, debug=args.debug)
+
+
+def _run_acp(args: argparse.Namespace) -> None:
+    import asyncio
+
+    from openhands_cli.acp_impl.agent import run_acp_server
+    from openhands_cli.acp_impl.confirmation import ConfirmationMode
+
+    # Determine confirmation mode from arguments
+    confirmation_mode: ConfirmationMode = "always-ask"  # default
+    if args.always_approve:
+        confirmation_mode = "always-approve"
+    elif args.llm_approve:
+        confirmation_mode = "llm-approve"
+
+    # Handle resume logic for ACP (same as main command)
+    resume_id = handle_resume_logic(args)
+    if resume_id is None and (args.last or args.resume == ""):
+        # Either showed conversation list or had an error
+        return
+
+    asyncio.run(
+        run_acp_server(
+            initial_confirmation_mode=confirmation_mode,
+            resume_conversation_id=resume_id,
+            cloud=args.cloud,
+            cloud_api_url=args.cloud_url,
+        )
+    )
+
+
+def _run_login(args: argparse.Namespace) -> None:
+    from openhands_cli.auth.login_command import run_login_command
+
+    if not run_login_command(args.server_url):
+        sys.exit(1)
+
+
+def _run_logout(args: argparse.Namespace) -> None:
+    from openhands_cli.auth.logout_command import run_logout_command
+
+    if not run_logout_command(args.server_url):
+        sys.exit(1)
+
+
+def _run_mcp(args: argparse.Namespace) -> None:
+    from openhands_cli.mcp.mcp_commands import handle_mcp_command
+
+    handle_mcp_command(args)
+
+
+def _run_cloud(args: argparse.Namespace) -> None:
+    from openhands_cli.cloud.command import handle_cloud_command
+
+    handle_cloud_command(args)
+
+
+def _run_view(args: argparse.Namespace) -> None:
+    from openhands_cli.conversations.viewer import view_conversation
+
+    success = view_conversation(
+        args.conversation_id,
+        args.limit,
+        tail=args.tail,
+        start=args.from_index,
+        stop=args.to_index,
+    )
+    if not success:
+        sys.exit(1)
+
+
+def _run_compact(args: argparse.Namespace) -> None:
+    from openhands_cli.conversations.compact import compact_conversations
+
+    success = compact_conversations(
+        args.conversation_ids, compact_all=args.all, force=args.force
+    )
+    if not success:
+        sys.exit(1)
+
+
+def _run_tui(args: argparse.Namespace) -> None:
+    # Handle resume logic (including --last and conversation list)
+    resume_id = handle_resume_logic(args)
+    if resume_id is None and (args.last or args.resume == ""):
+        # Either showed conversation list or had an error
+        return
+
+    # Checked once the TUI is going to start, so that listing conversations
+    # doesn't import what the check needs.
+    from openhands_cli.terminal_compat import check_terminal_compatibility
+
+    console = _console()
+    compat_result = check_terminal_compatibility(console=console)
+    if not compat_result.is_tty:
+        print(
+            "OpenHands CLI terminal UI may not work correctly in this "
+            f"environment: {compat_result.reason}"
+        )
+        print(
+            "To override Rich's detection, you can set TTY_INTERACTIVE=1 "
+            "(and optionally TTY_COMPATIBLE=1)."
+        )
+
+    # Use textual-based UI as default
+    from openhands_cli.tui.textual_app import main as textual_main
+    from openhands_cli.utils import create_seeded_instructions_from_args
+
+    queued_inputs = create_seeded_instructions_from_args(args)
+
+    conversation_id = textual_main(
+        resume_conversation_id=resume_id,
+        queued_inputs=queued_inputs,
+        always_approve=args.always_approve,
+        llm_approve=args.llm_approve,
+        exit_without_confirmation=args.exit_without_confirmation,
+        headless=args.headless,
+        # --json only works with --headless
+        json_mode=args.json and args.headless,
+        env_overrides_enabled=getattr(args, "override_with_envs", False),
+        # Disable critic in headless mode to avoid interactive prompts
+        critic_disabled=args.headless,
+    )
+    console.print("Goodbye! 👋", style=OPENHANDS_COLORS.success)
+    # Show conversation ID if available (may be None if app exited early)
+    if conversation_id is not None:
+        console.print(
+            f"Conversation ID: {conversation_id.hex}",
+            style=OPENHANDS_COLORS.accent,
+        )
+        console.print(
+            f"Hint: run openhands --resume {conversation_id} "
+            "to resume this conversation.",
+            style=OPENHANDS_COLORS.secondary,
+        )
+
+
+# Handler of each subcommand; the TUI runs when no subcommand is given.
+# Handlers import their modules when called, so that a command only loads
+# the dependencies it uses.
+_COMMANDS: dict[str, Callable[[argparse.Namespace], None]] = {
+    "serve": _run_serve,
+    "web": _run_web,
+    "acp": _run_acp,
+    "login": _run_login,
+    "logout": _run_logout,
+    "mcp": _run_mcp,
+    "cloud": _run_cloud,
+    "view": _run_view,
+    "compact": _run_compact,
+}
+
+
+def _validate_args(args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
+    """Check the argument combinations argparse can't express.
+
+    Exits through ``parser.error`` on invalid combinations.
+    """
+    if args.headless and not args.task and not args.file:
+        parser.error("--headless requires either --task or --file to be specified")
+
+    if args.command == "cloud" and not args.task and not args.file:
+        parser.error(
+            "cloud subcommand requires either --task or --file to be specified"
+        )
+
+    if (
+        args.command == "view"
+        and args.tail is not None
+        and (args.from_index is not None or args.to_index is not None)
+    ):
+        parser.error("view --tail cannot be combined with --from/--to")
+
+    if args.command == "compact" and not args.all and not args.conversation_ids:
+        parser.error("compact requires conversation IDs or --all to be specified")
+
+
 def main() -> None:
     """Main entry point for the OpenHands CLI.
 
@@ -94,159 +308,37 @@ def main() -> None:
         ImportError: If agent chat dependencies are missing
         Exception: On other error conditions
     """
-    parser = create_main_parser()
-    args = parser.parse_args()
+    with startup_step("create_main_parser"):
+        parser = create_main_parser()
+    with startup_step("parse_args"):
+        args = parser.parse_args()
 
-    # Handle --json flag (only works with --headless)
-    json_mode = args.json and args.headless
-
-    # Validate headless mode requirements
-    if args.headless and not args.task and not args.file:
-        parser.error("--headless requires either --task or --file to be specified")
+    _validate_args(args, parser)
 
     # Automatically set exit_without_confirmation when headless mode is used
     if args.headless:
         args.exit_without_confirmation = True
 
-    # Handle --override-with-envs flag
-    env_overrides_enabled = getattr(args, "override_with_envs", False)
-
-    # Disable critic in headless mode to avoid interactive prompts
-    critic_disabled = args.headless
-
     # Warn about env vars if they are set but not being used
-    if not env_overrides_enabled:
-        check_and_warn_env_vars()
+    if not getattr(args, "override_with_envs", False):
+        with startup_step("check_and_warn_env_vars"):
+            check_and_warn_env_vars()
 
+    run_command = _COMMANDS.get(args.command, _run_tui)
     try:
-        if args.command == "serve":
-            # Import gui_launcher only when needed
-            from openhands_cli.gui_launcher import launch_gui_server
-
-            launch_gui_server(mount_cwd=args.mount_cwd, gpu=args.gpu)
-        elif args.command == "web":
-            # Import web server launcher only when needed
-            from openhands_cli.tui.serve import launch_web_server
-
-            launch_web_server(host=args.host, port=args.port, debug=args.debug)
-        elif args.command == "acp":
-            import asyncio
-
-            from openhands_cli.acp_impl.agent import run_acp_server
-            from openhands_cli.acp_impl.confirmation import ConfirmationMode
-
-            # Determine confirmation mode from arguments
-            confirmation_mode: ConfirmationMode = "always-ask"  # default
-            if args.always_approve:
-                confirmation_mode = "always-approve"
-            elif args.llm_approve:
-                confirmation_mode = "llm-approve"
-
-            # Handle resume logic for ACP (same as main command)
-            resume_id = handle_resume_logic(args)
-            if resume_id is None and (args.last or args.resume == ""):
-                # Either showed conversation list or had an error
-                return
-
-            asyncio.run(
-                run_acp_server(
-                    initial_confirmation_mode=confirmation_mode,
-                    resume_conversation_id=resume_id,
-                    cloud=args.cloud,
-                    cloud_api_url=args.cloud_url,
-                )
-            )
-
-        elif args.command == "login":
-            from openhands_cli.auth.login_command import run_login_command
-
-            success = run_login_command(args.server_url)
-            if not success:
-                sys.exit(1)
-        elif args.command == "logout":
-            from openhands_cli.auth.logout_command import run_logout_command
-
-            success = run_logout_command(args.server_url)
-            if not success:
-                sys.exit(1)
-        elif args.command == "mcp":
-            # Import MCP command handler only when needed
-            from openhands_cli.mcp.mcp_commands import handle_mcp_command
-
-            handle_mcp_command(args)
-        elif args.command == "cloud":
-            # Validate cloud mode requirements
-            if not args.task and not args.file:
-                parser.error(
-                    "cloud subcommand requires either --task or --file to be specified"
-                )
-
-            from openhands_cli.cloud.command import handle_cloud_command
-
-            handle_cloud_command(args)
-
-        elif args.command == "view":
-            from openhands_cli.conversations.viewer import view_conversation
-
-            success = view_conversation(args.conversation_id, args.limit)
-            if not success:
-                sys.exit(1)
-
-        else:
-            compat_result = check_terminal_compatibility(console=console)
-            if not compat_result.is_tty:
-                print(
-                    "OpenHands CLI terminal UI may not work correctly in this "
-                    f"environment: {compat_result.reason}"
-                )
-                print(
-                    "To override Rich's detection, you can set TTY_INTERACTIVE=1 "
-                    "(and optionally TTY_COMPATIBLE=1)."
-                )
-            # Handle resume logic (including --last and conversation list)
-            resume_id = handle_resume_logic(args)
-            if resume_id is None and (args.last or args.resume == ""):
-                # Either showed conversation list or had an error
-                return
-
-            # Use textual-based UI as default
-            from openhands_cli.tui.textual_app import main as textual_main
-
-            queued_inputs = create_seeded_instructions_from_args(args)
-
-            conversation_id = textual_main(
-                resume_conversation_id=resume_id,
-                queued_inputs=queued_inputs,
-                always_approve=args.always_approve,
-                llm_approve=args.llm_approve,
-                exit_without_confirmation=args.exit_without_confirmation,
-                headless=args.headless,
-                json_mode=json_mode,
-                env_overrides_enabled=env_overrides_enabled,
-                critic_disabled=critic_disabled,
-            )
-            console.print("Goodbye! 👋", style=OPENHANDS_THEME.success)
-            # Show conversation ID if available (may be None if app exited early)
-            if conversation_id is not None:
-                console.print(
-                    f"Conversation ID: {conversation_id.hex}",
-                    style=OPENHANDS_THEME.accent,
-                )
-                console.print(
-                    f"Hint: run openhands --resume {conversation_id} "
-                    "to resume this conversation.",
-                    style=OPENHANDS_THEME.secondary,
-                )
+        run_command(args)
     except KeyboardInterrupt:
-        console.print("\nGoodbye! 👋", style=OPENHANDS_THEME.warning)
+        _console().print("\nGoodbye! 👋", style=OPENHANDS_COLORS.warning)
     except EOFError:
-        console.print("\nGoodbye! 👋", style=OPENHANDS_THEME.warning)
+        _console().print("\nGoodbye! 👋", style=OPENHANDS_COLORS.warning)
     except MissingEnvironmentVariablesError as e:
         # Display clean error message for missing env vars
-        console.print(f"[{OPENHANDS_THEME.error}]Error:[/{OPENHANDS_THEME.error}] {e}")
+        _console().print(
+            f"[{OPENHANDS_COLORS.error}]Error:[/{OPENHANDS_COLORS.error}] {e}"
+        )
         sys.exit(1)
     except Exception as e:
-        console.print(f"Error: {str(e)}", style=OPENHANDS_THEME.error, markup=False)
+        _console().print(f"Error: {str(e)}", style=OPENHANDS_COLORS.error, markup=False)
         import traceback
 
         traceback.print_exc()
@@ -44,6 +44,11 @@ def get_project_dir() -> str:
 
 def get_prompt_history_path() -> str:
     """Get the path to the prompt history file for the current project."""
+    return os.path.join(get_project_dir(), "prompt_history.jsonl")
+
+
+def get_legacy_prompt_history_path() -> str:
+    """Get the path of the JSON-list prompt history used by older versions."""
     return os.path.join(get_project_dir(), "prompt_history.json")
 
 
@@ -5,8 +5,8 @@ through the command line interface.
 """
 
 import argparse
+from typing import Any
 
-from fastmcp.mcp_config import RemoteMCPServer, StdioMCPServer
 from rich.console import Console
 
 from openhands_cli.mcp.mcp_display_utils import mask_sensitive_value
@@ -16,11 +16,10 @@ from openhands_cli.mcp.mcp_utils import (
     disable_server,
     enable_server,
     get_server,
-    is_server_enabled,
-    list_servers,
+    list_server_configs,
     remove_server,
 )
-from openhands_cli.theme import OPENHANDS_THEME
+from openhands_cli.theme import OPENHANDS_COLORS
 
 
 console = Console()
@@ -47,10 +46,10 @@ def handle_mcp_add(args: argparse.Namespace) -> None:
         status = "enabled" if enabled else "disabled"
         console.print(
             f"Successfully added MCP server '{args.name}' ({status})",
-            style=OPENHANDS_THEME.success,
+            style=OPENHANDS_COLORS.success,
         )
     except MCPConfigurationError as e:
-        console.print(f"Error: {e}", style=OPENHANDS_THEME.error)
+        console.print(f"Error: {e}", style=OPENHANDS_COLORS.error)
         raise SystemExit(1)
 
 
@@ -64,14 +63,14 @@ def handle_mcp_remove(args: argparse.Namespace) -> None:
         remove_server(args.name)
         console.print(
             f"Successfully removed MCP server '{args.name}'",
-            style=OPENHANDS_THEME.success,
+            style=OPENHANDS_COLORS.success,
         )
         console.print(
             "Restart your OpenHands session to apply the changes",
-            style=OPENHANDS_THEME.warning,
+            style=OPENHANDS_COLORS.warning,
         )
     except MCPConfigurationError as e:
-        console.print(f"Error: {e}", style=OPENHANDS_THEME.error)
+        console.print(f"Error: {e}", style=OPENHANDS_COLORS.error)
         raise SystemExit(1)
 
 
@@ -82,20 +81,21 @@ def handle_mcp_list(_args: argparse.Namespace) -> None:
         args: Parsed command line arguments
     """
     try:
-        servers = list_servers()
+        # Read the file directly: validating it needs fastmcp, slow to import
+        servers = list_server_configs()
 
         if not servers:
-            console.print("No MCP servers configured", style=OPENHANDS_THEME.warning)
+            console.print("No MCP servers configured", style=OPENHANDS_COLORS.warning)
             console.print(
                 "Use [bold]openhands mcp add[/bold] to add a server, "
                 "or create [bold]~/.openhands/mcp.json[/bold] manually",
-                style=OPENHANDS_THEME.accent,
+                style=OPENHANDS_COLORS.accent,
             )
             return
 
         console.print(
             f"Configured MCP servers ({len(servers)}):",
-            style=OPENHANDS_THEME.foreground,
+            style=OPENHANDS_COLORS.foreground,
         )
         console.print()
 
@@ -104,7 +104,7 @@ def handle_mcp_list(_args: argparse.Namespace) -> None:
             console.print()
 
     except MCPConfigurationError as e:
-        console.print(f"Error: {e}", style=OPENHANDS_THEME.error)
+        console.print(f"Error: {e}", style=OPENHANDS_COLORS.error)
         raise SystemExit(1)
 
 
@@ -117,65 +117,70 @@ def handle_mcp_get(args: argparse.Namespace) -> None:
     try:
         server = get_server(args.name)
 
-        console.print(f"MCP server '{args.name}':", style=OPENHANDS_THEME.foreground)
+        console.print(f"MCP server '{args.name}':", style=OPENHANDS_COLORS.foreground)
         console.print()
-        _render_server_details(args.name, server, show_name=False)
+        _render_server_details(args.name, server.model_dump(), show_name=False)
 
     except MCPConfigurationError as e:
-        console.print(f"Error: {e}", style=OPENHANDS_THEME.error)
+        console.print(f"Error: {e}", style=OPENHANDS_COLORS.error)
         raise SystemExit(1)
 
 
 def _render_server_details(
-    name: str, server: StdioMCPServer | RemoteMCPServer, show_name: bool = True
+    name: str, server: dict[str, Any], show_name: bool = True
 ) -> None:
     """Render server configuration details.
 
     Args:
         name: Server name
-        server: Server object
+        server: Server configuration, as stored in the configuration file
         show_name: Whether to show the server name
     """
     if show_name:
-        # Show enabled/disabled status
-        enabled = is_server_enabled(name)
+        # Show enabled/disabled status (servers are enabled by default)
+        enabled = server.get("enabled", True)
         status = "✓ enabled" if enabled else "✗ disabled"
-        status_style = OPENHANDS_THEME.success if enabled else OPENHANDS_THEME.warning
-        console.print(f"  • {name}", style=OPENHANDS_THEME.accent, end="")
+        status_style = OPENHANDS_COLORS.success if enabled else OPENHANDS_COLORS.warning
+        console.print(f"  • {name}", style=OPENHANDS_COLORS.accent, end="")
         console.print(f" [{status}]", style=status_style)
 
-    console.print(f"    Transport: {server.transport}", style=OPENHANDS_THEME.secondary)
+    console.print(
+        f"    Transport: {server.get('transport')}", style=OPENHANDS_COLORS.secondary
+    )
 
-    # Show authentication method if specified (only for RemoteMCPServer)
-    if isinstance(server, RemoteMCPServer) and server.auth:
-        console.print(
-            f"    Authentication: {server.auth}", style=OPENHANDS_THEME.secondary
-        )
+    if server.get("transport") != "stdio":
+        # Show authentication method if specified
+        if server.get("auth"):
+            console.print(
+                f"    Authentication: {server['auth']}",
+                style=OPENHANDS_COLORS.secondary,
+            )
 
-    if isinstance(server, RemoteMCPServer):
-        if server.url:
-            console.print(f"    URL: {server.url}", style=OPENHANDS_THEME.secondary)
+        if server.get("url"):
+            console.print(f"    URL: {server['url']}", style=OPENHANDS_COLORS.secondary)
 
-        if server.headers:
-            console.print("    Headers:", style=OPENHANDS_THEME.secondary)
-            for key, value in server.headers.items():
+        if server.get("headers"):
+            console.print("    Headers:", style=OPENHANDS_COLORS.secondary)
+            for key, value in server["headers"].items():
                 # Mask potential sensitive values
                 display_value = mask_sensitive_value(key, value)
                 console.print(f"      {key}: {display_value}")
 
-    elif isinstance(server, StdioMCPServer):
-        if server.command:
+    else:
+        if server.get("command"):
             console.print(
-                f"    Command: {server.command}", style=OPENHANDS_THEME.secondary
+                f"    Command: {server['command']}", style=OPENHANDS_COLORS.secondary
             )
 
-        if server.args:
-            args_str = " ".join(server.args)
-            console.print(f"    Arguments: {args_str}", style=OPENHANDS_THEME.secondary)
+        if server.get("args"):
+            args_str = " ".join(server["args"])
+            console.print(
+                f"    Arguments: {args_str}", style=OPENHANDS_COLORS.secondary
+            )
 
-        if server.env:
-            console.print("    Environment:", style=OPENHANDS_THEME.secondary)
-            for key, value in server.env.items():
+        if server.get("env"):
+            console.print("    Environment:", style=OPENHANDS_COLORS.secondary)
+            for key, value in server["env"].items():
                 # Mask potential sensitive values
                 display_value = mask_sensitive_value(key, value)
                 console.print(f"      {key}={display_value}")
@@ -191,14 +196,14 @@ def handle_mcp_enable(args: argparse.Namespace) -> None:
         enable_server(args.name)
         console.print(
             f"Successfully enabled MCP server '{args.name}'",
-            style=OPENHANDS_THEME.success,
+            style=OPENHANDS_COLORS.success,
         )
         console.print(
             "Restart your OpenHands session to apply the changes",
-            style=OPENHANDS_THEME.warning,
+            style=OPENHANDS_COLORS.warning,
         )
     except MCPConfigurationError as e:
-        console.print(f"Error: {e}", style=OPENHANDS_THEME.error)
+        console.print(f"Error: {e}", style=OPENHANDS_COLORS.error)
         raise SystemExit(1)
 
 
@@ -212,14 +217,14 @@ def handle_mcp_disable(args: argparse.Namespace) -> None:
         disable_server(args.name)
         console.print(
             f"Successfully disabled MCP server '{args.name}'",
-            style=OPENHANDS_THEME.success,
+            style=OPENHANDS_COLORS.success,
         )
         console.print(
             "Restart your OpenHands session to apply the changes",
-            style=OPENHANDS_THEME.warning,
+            style=OPENHANDS_COLORS.warning,
         )
     except MCPConfigurationError as e:
-        console.print(f"Error: {e}", style=OPENHANDS_THEME.error)
+        console.print(f"Error: {e}", style=OPENHANDS_COLORS.error)
         raise SystemExit(1)
 
 
@@ -242,5 +247,5 @@ def handle_mcp_command(args: argparse.Namespace) -> None:
     elif args.mcp_command == "disable":
         handle_mcp_disable(args)
     else:
-        console.print("Unknown MCP command", style=OPENHANDS_THEME.error)
+        console.print("Unknown MCP command", style=OPENHANDS_COLORS.error)
         raise SystemExit(1)
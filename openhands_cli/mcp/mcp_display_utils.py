@@ -4,9 +4,13 @@ This module provides shared utilities for formatting MCP server
 configuration details across different display contexts (CLI, TUI, etc.).
 """
 
-from typing import Any
+from __future__ import annotations
 
-from fastmcp.mcp_config import RemoteMCPServer, StdioMCPServer
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from fastmcp.mcp_config import RemoteMCPServer, StdioMCPServer
 
 
 def normalize_server_object(
@@ -23,6 +27,8 @@ def normalize_server_object(
     Returns:
         FastMCP server object (StdioMCPServer or RemoteMCPServer)
     """
+    from fastmcp.mcp_config import RemoteMCPServer, StdioMCPServer
+
     if isinstance(server, dict):
         # Legacy dict format - convert to appropriate server object for processing
         # Detect server type based on transport field or presence of command vs url
@@ -4,12 +4,19 @@ This module provides functionality to manage MCP server configurations
 similar to Claude's MCP command line interface.
 """
 
+from __future__ import annotations
+
+import json
+import re
 from pathlib import Path
-from typing import Any, Literal, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
+from urllib.parse import urlparse
+
 
-from fastmcp.exceptions import ValidationError
-from fastmcp.mcp_config import MCPConfig, RemoteMCPServer, StdioMCPServer
-from pydantic import ValidationError as PydanticValidationError
+# fastmcp is imported by the functions that build its models: importing it
+# takes most of a second, which read-only commands such as `mcp list` skip.
+if TYPE_CHECKING:
+    from fastmcp.mcp_config import MCPConfig, RemoteMCPServer, StdioMCPServer
 
 
 def _get_mcp_config_path() -> Path:
@@ -49,6 +56,9 @@ def load_mcp_config() -> MCPConfig:
         MCPConfigurationError: If the configuration file is invalid.
         ValidationError: If the configuration format is invalid.
     """
+    from fastmcp.mcp_config import MCPConfig
+    from pydantic import ValidationError as PydanticValidationError
+
     config_path = _get_mcp_config_path()
     if not config_path.exists():
         # Return empty config with mcpServers structure
@@ -157,6 +167,8 @@ def add_server(
     Raises:
         MCPConfigurationError: If configuration is invalid or server already exists
     """
+    from fastmcp.mcp_config import RemoteMCPServer, StdioMCPServer
+
     config = load_mcp_config()
 
     # Check if server already exists
@@ -202,6 +214,8 @@ def remove_server(name: str) -> None:
     Raises:
         MCPConfigurationError: If server doesn't exist
     """
+    from fastmcp.mcp_config import MCPConfig
+
     config = load_mcp_config()
 
     # Check if server exists
@@ -227,6 +241,79 @@ def list_servers() -> dict[str, StdioMCPServer | RemoteMCPServer]:
     return config.mcpServers
 
 
+def list_server_configs() -> dict[str, dict[str, Any]]:
+    """List all configured MCP servers as plain dictionaries.
+
+    Reads the configuration file directly instead of validating it with
+    fastmcp, for commands that only display the servers. The ``transport``
+    of each server is filled in the way fastmcp infers it when missing.
+
+    Returns:
+        Dictionary of server configurations keyed by name
+
+    Raises:
+        MCPConfigurationError: If the configuration file is invalid.
+    """
+    config_path = _get_mcp_config_path()
+    try:
+        content = config_path.read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        return {}
+    except OSError as e:
+        raise MCPConfigurationError(f"Error reading config file: {e}") from e
+    if not content:
+        return {}
+
+    try:
+        data = json.loads(content)
+    except ValueError as e:
+        raise MCPConfigurationError(f"Invalid MCP configuration file: {e}") from e
+    if not isinstance(data, dict):
+        raise MCPConfigurationError(
+            "Invalid MCP configuration file: expected a JSON object"
+        )
+
+    # Like MCPConfig, accept servers at the root of the file: when any entry
+    # looks like a server, every entry is read as one
+    servers = data.get("mcpServers")
+    if "mcpServers" not in data:
+        servers = data
+        if not any(
+            isinstance(server, dict) and ("command" in server or "url" in server)
+            for server in data.values()
+        ):
+            servers = {}
+    if not isinstance(servers, dict):
+        raise MCPConfigurationError(
+            "Invalid MCP configuration file: 'mcpServers' must be an object"
+        )
+
+    configs = {}
+    for name, server in servers.items():
+        if not isinstance(server, dict) or not (
+            isinstance(server.get("command"), str) or isinstance(server.get("url"), str)
+        ):
+            raise MCPConfigurationError(
+                f"Invalid MCP configuration file: server '{name}' needs "
+                "a 'command' or a 'url'"
+            )
+        configs[name] = {**server, "transport": server.get("transport")}
+        if configs[name]["transport"] is None:
+            configs[name]["transport"] = _infer_transport(server)
+    return configs
+
+
+def _infer_transport(server: dict[str, Any]) -> str:
+    """Get the transport fastmcp uses for a server configuration."""
+    # fastmcp validates a server with a command as stdio, even with a url
+    if "command" in server or "url" not in server:
+        return "stdio"
+    # Same rule as fastmcp: an /sse path segment means the SSE transport
+    if re.search(r"/sse(/|\?|&|$)", urlparse(server["url"]).path):
+        return "sse"
+    return "http"
+
+
 def get_server(name: str) -> StdioMCPServer | RemoteMCPServer:
     """Get configuration for a specific MCP server.
 
@@ -257,6 +344,8 @@ def enable_server(name: str) -> None:
     Raises:
         MCPConfigurationError: If server doesn't exist
     """
+    from fastmcp.mcp_config import RemoteMCPServer, StdioMCPServer
+
     config = load_mcp_config()
 
     # Check if server exists
@@ -293,6 +382,8 @@ def disable_server(name: str) -> None:
     Raises:
         MCPConfigurationError: If server doesn't exist
     """
+    from fastmcp.mcp_config import RemoteMCPServer, StdioMCPServer
+
     config = load_mcp_config()
 
     # Check if server exists
@@ -329,6 +420,8 @@ def server_exists(name: str) -> bool:
     Returns:
         True if server exists, False otherwise
     """
+    from fastmcp.exceptions import ValidationError
+
     try:
         config = load_mcp_config()
         return name in config.mcpServers
@@ -345,6 +438,8 @@ def is_server_enabled(name: str) -> bool:
     Returns:
         True if server exists and is enabled, False otherwise
     """
+    from fastmcp.exceptions import ValidationError
+
     try:
         server = get_server(name)
         server_dict = server.model_dump()
@@ -384,6 +479,8 @@ def get_config_status() -> dict[str, Any]:
             'message': str
         }
     """
+    from fastmcp.exceptions import ValidationError
+
     config_path = _get_mcp_config_path()
     if not config_path.exists():
         return {
@@ -1,4 +1,5 @@
 from collections.abc import Callable
+from pathlib import Path
 from typing import Any
 from uuid import UUID
 
@@ -15,6 +16,7 @@ from openhands.sdk.security.llm_analyzer import LLMSecurityAnalyzer
 from openhands.tools.preset.default import register_builtins_agents
 
 # Register tools on import
+from openhands_cli.conversations.store.packed import unpack_conversation
 from openhands_cli.locations import get_conversations_dir, get_work_dir
 from openhands_cli.stores import AgentStore
 from openhands_cli.tui.widgets.richlog_visualizer import ConversationVisualizer
@@ -62,24 +64,41 @@ def load_agent_specs(
             "Agent specification not found. Please configure your settings."
         )
 
-    # If MCP servers are provided, augment the agent's MCP configuration
+    return augment_agent(agent, mcp_servers=mcp_servers, skills=skills)
+
+
+def augment_agent(
+    agent: Agent,
+    mcp_servers: dict[str, dict[str, Any]] | None = None,
+    skills: list[Skill] | None = None,
+) -> Agent:
+    """Add MCP servers and skills to a copy of an agent.
+
+    The agent itself is left untouched, so it can be augmented again (e.g. a
+    prepared agent shared by several sessions).
+
+    Args:
+        agent: The agent to augment
+        mcp_servers: MCP servers to merge into the agent's MCP configuration
+            (they take precedence over configured servers)
+        skills: Skills to add to the agent context
+
+    Returns:
+        The augmented agent
+    """
     if mcp_servers:
-        # Merge with existing MCP configuration (provided servers take precedence)
         mcp_config: dict[str, Any] = agent.mcp_config or {}
         existing_servers: dict[str, dict[str, Any]] = mcp_config.get("mcpServers", {})
-        existing_servers.update(mcp_servers)
         agent = agent.model_copy(
-            update={"mcp_config": {"mcpServers": existing_servers}}
+            update={"mcp_config": {"mcpServers": {**existing_servers, **mcp_servers}}}
         )
 
     if skills:
         if agent.agent_context is not None:
-            existing_skills = agent.agent_context.skills
-            existing_skills.extend(skills)
             agent = agent.model_copy(
                 update={
                     "agent_context": agent.agent_context.model_copy(
-                        update={"skills": existing_skills}
+                        update={"skills": [*agent.agent_context.skills, *skills]}
                     )
                 }
             )
@@ -129,6 +148,10 @@ def setup_conversation(
     # enable_browser=False because CLI mode doesn't provide browser tools.
     register_builtins_agents(enable_browser=False)
 
+    # The SDK only reads per-file events, so restore compacted conversations
+    # before resuming them.
+    unpack_conversation(Path(get_conversations_dir()) / conversation_id.hex)
+
     agent = load_agent_specs(
         str(conversation_id),
         env_overrides_enabled=env_overrides_enabled,
@@ -0,0 +1,175 @@
+"""Profiling of the CLI startup, enabled with ``--profile-startup``.
+
+Records the time spent importing each module as a tree, where the imports
+made while importing a module are nested under it (like
+``python -X importtime``), and the time of the setup steps of the entrypoint
+(loading ``.env``, building the argument parser...). The report is printed
+to stderr when the process exits, so that it also covers commands exiting
+while their arguments are parsed, such as ``--version`` and ``--help``.
+
+Imports shorter than OPENHANDS_PROFILE_STARTUP_THRESHOLD_MS (default 1) are
+left out of the report.
+
+This module only uses the standard library, and must be imported before the
+imports it is meant to record.
+"""
+
+from __future__ import annotations
+
+import _thread
+import atexit
+import os
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+
+PROFILE_STARTUP_FLAG = "--profile-startup"
+
+DEFAULT_THRESHOLD_MS = 1.0
+
+
+class ImportRecord:
+    """Time spent importing a module, and the modules it imported.
+
+    A plain class rather than a dataclass: this module is imported on every
+    start, and importing dataclasses is a noticeable part of a light command.
+    """
+
+    __slots__ = ("children", "duration", "name")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.duration = 0.0
+        self.children: list[ImportRecord] = []
+
+    @property
+    def self_time(self) -> float:
+        return self.duration - sum(child.duration for child in self.children)
+
+
+class StartupProfiler:
+    """Records module imports and timed steps of the startup."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self.started = clock()
+        self.imports = ImportRecord("<startup>")
+        self.steps: list[tuple[str, float]] = []
+        self._stack = [self.imports]
+        self._thread_id = _thread.get_ident()
+        self._original_find_and_load: Callable[..., Any] | None = None
+
+    def install(self) -> None:
+        """Start recording the first import of every module."""
+        import importlib._bootstrap as bootstrap  # type: ignore[import-not-found]
+
+        if self._original_find_and_load is not None:
+            return
+        original = bootstrap._find_and_load  # type: ignore[attr-defined]
+        self._original_find_and_load = original
+
+        def find_and_load(name: str, import_: Any) -> Any:
+            # Only the first import of a module, from the main thread, counts
+            if name in sys.modules or _thread.get_ident() != self._thread_id:
+                return original(name, import_)
+            record = ImportRecord(name)
+            self._stack[-1].children.append(record)
+            self._stack.append(record)
+            start = self._clock()
+            try:
+                return original(name, import_)
+            finally:
+                record.duration = self._clock() - start
+                self._stack.pop()
+
+        bootstrap._find_and_load = find_and_load  # type: ignore[attr-defined]
+
+    def uninstall(self) -> None:
+        """Stop recording imports."""
+        import importlib._bootstrap as bootstrap  # type: ignore[import-not-found]
+
+        if self._original_find_and_load is not None:
+            bootstrap._find_and_load = self._original_find_and_load  # type: ignore[attr-defined]
+            self._original_find_and_load = None
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """Time a step of the startup."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.steps.append((name, self._clock() - start))
+
+    def report(self, threshold_ms: float = DEFAULT_THRESHOLD_MS) -> str:
+        """Human-readable report of the steps and the import tree."""
+        total = self._clock() - self.started
+        lines = [
+            "",
+            "=== Startup profile ===",
+            f"Until exit: {total * 1000:.1f} ms",
+            "",
+        ]
+
+        lines.append("Steps (ms):")
+        for name, duration in self.steps:
+            lines.append(f"  {duration * 1000:9.1f}  {name}")
+
+        imported = sum(child.duration for child in self.imports.children)
+        lines += [
+            "",
+            f"Imports: {imported * 1000:.1f} ms "
+            f"(cumulative | self ms, imports >= {threshold_ms:g} ms)",
+        ]
+        for record, depth in self._walk(self.imports, threshold_ms / 1000):
+            lines.append(
+                f"  {record.duration * 1000:9.1f} | {record.self_time * 1000:7.1f}  "
+                f"{'  ' * depth}{record.name}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def _walk(
+        self, parent: ImportRecord, threshold: float, depth: int = 0
+    ) -> Iterator[tuple[ImportRecord, int]]:
+        for child in parent.children:
+            if child.duration >= threshold:
+                yield child, depth
+                yield from self._walk(child, threshold, depth + 1)
+
+
+_profiler: StartupProfiler | None = None
+
+
+def enable_startup_profile() -> StartupProfiler:
+    """Profile the rest of the startup and print the report on exit."""
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler()
+        _profiler.install()
+        atexit.register(_print_report, _profiler)
+    return _profiler
+
+
+def _print_report(profiler: StartupProfiler) -> None:
+    profiler.uninstall()
+    try:
+        threshold_ms = float(
+            os.environ.get("OPENHANDS_PROFILE_STARTUP_THRESHOLD_MS", "")
+            or DEFAULT_THRESHOLD_MS
+        )
+    except ValueError:
+        threshold_ms = DEFAULT_THRESHOLD_MS
+    sys.stderr.write(profiler.report(threshold_ms))
+
+
+@contextmanager
+def startup_step(name: str) -> Iterator[None]:
+    """Time a step of the startup, if the startup is being profiled."""
+    if _profiler is None:
+        yield
+        return
+    with _profiler.step(name):
+        yield
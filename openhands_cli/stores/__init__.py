@@ -1,17 +1,47 @@
-from openhands_cli.stores.agent_store import (
-    AgentStore,
-    MissingEnvironmentVariablesError,
-    check_and_warn_env_vars,
-)
-from openhands_cli.stores.cli_settings import (
-    DEFAULT_MAX_REFINEMENT_ITERATIONS,
-    CliSettings,
-    CriticSettings,
-)
-from openhands_cli.stores.prompt_history import (
-    PromptHistoryEntry,
-    PromptHistoryStore,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from openhands_cli.stores.agent_store import AgentStore
+    from openhands_cli.stores.cli_settings import (
+        DEFAULT_MAX_REFINEMENT_ITERATIONS,
+        CliSettings,
+        CriticSettings,
+    )
+    from openhands_cli.stores.llm_env import (
+        MissingEnvironmentVariablesError,
+        check_and_warn_env_vars,
+    )
+    from openhands_cli.stores.prompt_history import (
+        PromptHistoryEntry,
+        PromptHistoryStore,
+    )
+
+
+# Exports are imported on first use: the agent store imports the SDK, which
+# commands reading only the settings or the environment don't need.
+_EXPORTS = {
+    "AgentStore": "openhands_cli.stores.agent_store",
+    "CliSettings": "openhands_cli.stores.cli_settings",
+    "CriticSettings": "openhands_cli.stores.cli_settings",
+    "DEFAULT_MAX_REFINEMENT_ITERATIONS": "openhands_cli.stores.cli_settings",
+    "MissingEnvironmentVariablesError": "openhands_cli.stores.llm_env",
+    "PromptHistoryEntry": "openhands_cli.stores.prompt_history",
+    "PromptHistoryStore": "openhands_cli.stores.prompt_history",
+    "check_and_warn_env_vars": "openhands_cli.stores.llm_env",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
 
 
 __all__ = [
@@ -1,11 +1,43 @@
-"""Storage and management of user prompt history."""
+"""Storage and management of user prompt history.
 
+The history is an append-only JSONL file (one entry per line) in the
+project's directory, so submitting a prompt is a single appended line rather
+than a rewrite of the whole history. Writers serialize through an advisory
+lock on a sibling ``.lock`` file, which keeps concurrent CLI sessions in the
+same project from losing entries. The file is periodically compacted down
+to ``max_entries`` lines, and readers stream it from the end.
+
+Histories written by older versions as a single JSON list are migrated to
+the JSONL file on first write.
+"""
+
+import heapq
+import itertools
 import json
+import os
+import sys
+from collections.abc import Generator, Iterator
+from contextlib import closing, contextmanager, suppress
 from datetime import datetime
 from pathlib import Path
-from typing import TypedDict
+from typing import Any, TypedDict
+
+from openhands_cli.locations import (
+    get_legacy_prompt_history_path,
+    get_persistence_dir,
+    get_prompt_history_path,
+)
+
 
-from openhands_cli.locations import get_prompt_history_path
+if sys.platform != "win32":
+    import fcntl
+
+
+# Number of prompts kept per project.
+DEFAULT_MAX_ENTRIES = 10_000
+
+# Block size used when streaming the history backwards from the end.
+_READ_BLOCK_SIZE = 8192
 
 
 class PromptHistoryEntry(TypedDict):
@@ -18,39 +50,63 @@ class PromptHistoryEntry(TypedDict):
 class PromptHistoryStore:
     """Manages persistence of user prompt history for a project.
 
-    Stored as a JSON list of entries in the project's directory.
+    Stored as JSONL in the project's directory, oldest entry first.
     """
 
-    def __init__(self, max_entries: int = 100) -> None:
-        self.path = Path(get_prompt_history_path())
+    def __init__(
+        self, max_entries: int = DEFAULT_MAX_ENTRIES, path: Path | None = None
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            max_entries: Maximum number of prompts loaded and kept on disk.
+            path: History file to use. Defaults to the current project's.
+        """
+        if path is None:
+            self.path = Path(get_prompt_history_path())
+            self.legacy_path = Path(get_legacy_prompt_history_path())
+        else:
+            self.path = path
+            self.legacy_path = path.with_suffix(".json")
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
         self.max_entries = max_entries
+        # Appends by this instance since it last compacted the file. Starts
+        # at max_entries so the first append compacts what earlier sessions
+        # left behind.
+        self._appends_since_compaction = max_entries
 
-    def load_entries(self) -> list[PromptHistoryEntry]:
-        """Load prompt history entries, newest first."""
+    def iter_entries(self) -> Generator[PromptHistoryEntry]:
+        """Iterate over all stored entries, newest first.
+
+        The file is read backwards in blocks, so consumers that stop early
+        only read the end of the file. Malformed lines (including a line that
+        is still being appended by another session) are skipped.
+        """
         if not self.path.exists():
-            return []
+            yield from reversed(self._load_legacy_entries())
+            return
 
         try:
-            with open(self.path, encoding="utf-8") as f:
-                raw_entries = json.load(f)
-
-            if not isinstance(raw_entries, list):
-                return []
-
-            entries: list[PromptHistoryEntry] = []
-            for entry in reversed(raw_entries):
-                if not isinstance(entry, dict):
-                    continue
-
-                text = entry.get("text")
-                timestamp = entry.get("timestamp")
-                if isinstance(text, str) and isinstance(timestamp, str):
-                    entries.append({"text": text, "timestamp": timestamp})
+            with closing(_iter_lines_reversed(self.path)) as lines:
+                for line in lines:
+                    entry = _parse_line(line)
+                    if entry is not None:
+                        yield entry
+        except OSError:
+            return
 
+    def load_entries(self) -> list[PromptHistoryEntry]:
+        """Load up to ``max_entries`` prompt history entries, newest first."""
+        entries: list[PromptHistoryEntry] = []
+        if self.max_entries <= 0:
             return entries
 
-        except (json.JSONDecodeError, OSError):
-            return []
+        with closing(self.iter_entries()) as it:
+            for entry in it:
+                entries.append(entry)
+                if len(entries) >= self.max_entries:
+                    break
+        return entries
 
     def load(self) -> list[str]:
         """Load prompt history strings, newest first."""
@@ -62,34 +118,156 @@ class PromptHistoryStore:
         if not text:
             return
 
-        entries: list[PromptHistoryEntry] = []
-        if self.path.exists():
-            try:
-                with open(self.path, encoding="utf-8") as f:
-                    entries = json.load(f)
-                if not isinstance(entries, list):
-                    entries = []
-            except (json.JSONDecodeError, OSError):
-                entries = []
-
-        # Don't add if it's identical to the last entry
-        if entries and entries[-1].get("text") == text:
-            return
-
         new_entry: PromptHistoryEntry = {
             "text": text,
             "timestamp": datetime.now().isoformat(),
         }
-        entries.append(new_entry)
+        line = (json.dumps(new_entry, ensure_ascii=False) + "\n").encode("utf-8")
 
-        # Truncate if too many entries
-        if len(entries) > self.max_entries:
-            entries = entries[-self.max_entries :]
-
-        # Ensure parent directory exists and write to file
         try:
-            self.path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.path, "w", encoding="utf-8") as f:
-                json.dump(entries, f, indent=2)
+            with self._lock():
+                self._migrate_legacy()
+
+                # Don't add if it's identical to the last entry
+                with closing(self.iter_entries()) as it:
+                    last = next(it, None)
+                if last is not None and last["text"] == text:
+                    return
+
+                with open(self.path, "a+b") as f:
+                    # Don't glue the entry onto a line left partial by a crash
+                    if f.seek(0, os.SEEK_END) > 0:
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b"\n":
+                            line = b"\n" + line
+                    f.write(line)
+
+                self._appends_since_compaction += 1
+                if self._appends_since_compaction >= self.max_entries:
+                    self._compact()
         except OSError:
             pass
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        """Hold the exclusive history write lock."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a") as lock_file:
+            if sys.platform != "win32":
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            yield
+
+    def _compact(self) -> None:
+        """Rewrite the file with only the newest ``max_entries`` entries.
+
+        Must be called with the write lock held.
+        """
+        self._appends_since_compaction = 0
+        entries: list[PromptHistoryEntry] = []
+        with closing(self.iter_entries()) as it:
+            for entry in it:
+                entries.append(entry)
+                if len(entries) > self.max_entries:
+                    break
+        if len(entries) <= self.max_entries:
+            return
+        entries = entries[: self.max_entries]
+        entries.reverse()
+        self._write_entries(entries)
+
+    def _migrate_legacy(self) -> None:
+        """Convert a JSON-list history from older versions to JSONL.
+
+        Must be called with the write lock held.
+        """
+        if self.path.exists() or not self.legacy_path.exists():
+            return
+        entries = self._load_legacy_entries()
+        self._write_entries(entries[-self.max_entries :] if entries else [])
+        with suppress(OSError):
+            self.legacy_path.unlink()
+
+    def _write_entries(self, entries: list[PromptHistoryEntry]) -> None:
+        """Atomically replace the history file with ``entries`` (oldest first)."""
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
+
+    def _load_legacy_entries(self) -> list[PromptHistoryEntry]:
+        """Load entries from the legacy JSON list format, oldest first."""
+        try:
+            with open(self.legacy_path, encoding="utf-8") as f:
+                raw_entries = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return []
+
+        if not isinstance(raw_entries, list):
+            return []
+
+        entries: list[PromptHistoryEntry] = []
+        for raw_entry in raw_entries:
+            entry = _to_entry(raw_entry)
+            if entry is not None:
+                entries.append(entry)
+        return entries
+
+
+def load_global_entries(max_entries: int) -> list[PromptHistoryEntry]:
+    """Load the prompt history of all projects, newest first.
+
+    Args:
+        max_entries: Maximum total number of entries to return.
+    """
+    projects_dir = Path(get_persistence_dir()) / "projects"
+    try:
+        project_dirs = [p for p in projects_dir.iterdir() if p.is_dir()]
+    except OSError:
+        return []
+
+    filename = Path(get_prompt_history_path()).name
+    histories = [
+        PromptHistoryStore(max_entries, path=project_dir / filename).load_entries()
+        for project_dir in project_dirs
+    ]
+    # ISO timestamps of local time sort chronologically as strings.
+    merged = heapq.merge(*histories, key=lambda e: e["timestamp"], reverse=True)
+    return list(itertools.islice(merged, max_entries))
+
+
+def _to_entry(raw_entry: Any) -> PromptHistoryEntry | None:
+    """Validate a decoded entry, returning None if it is malformed."""
+    if not isinstance(raw_entry, dict):
+        return None
+
+    text = raw_entry.get("text")
+    timestamp = raw_entry.get("timestamp")
+    if isinstance(text, str) and isinstance(timestamp, str):
+        return {"text": text, "timestamp": timestamp}
+    return None
+
+
+def _parse_line(line: bytes) -> PromptHistoryEntry | None:
+    if not line.strip():
+        return None
+    try:
+        return _to_entry(json.loads(line))
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+
+def _iter_lines_reversed(path: Path) -> Generator[bytes]:
+    """Yield the lines of a file from last to first, reading it in blocks."""
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            size = min(_READ_BLOCK_SIZE, position)
+            position -= size
+            f.seek(position)
+            lines = (f.read(size) + remainder).split(b"\n")
+            # The first piece may be the tail of a line that starts earlier.
+            remainder = lines.pop(0)
+            yield from reversed(lines)
+        yield remainder
@@ -1,22 +1,56 @@
-"""OpenHands custom theme for textual UI."""
+"""OpenHands custom theme for textual UI.
 
-from textual.theme import Theme
+The theme colors are also used by the commands printing with Rich (``mcp``,
+``view``, ``login``...). They are kept in OPENHANDS_COLORS, which doesn't
+import Textual, so that these commands don't pay for importing it; the
+Textual theme, OPENHANDS_THEME, is created on first use.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+
+if TYPE_CHECKING:
+    from textual.theme import Theme
+
+
+class ThemeColors(NamedTuple):
+    """Colors of the OpenHands theme."""
+
+    primary: str
+    secondary: str
+    accent: str
+    foreground: str
+    background: str
+    surface: str
+    panel: str
+    success: str
+    warning: str
+    error: str
+
+
+OPENHANDS_COLORS = ThemeColors(
+    primary="#ffe165",  # Logo, cursor color
+    secondary="#ffffff",  # Borders, plain text
+    accent="#277dff",  # Special text like "initialize conversation"
+    foreground="#ffffff",  # Default text color
+    background="#222222",  # Background color
+    surface="#222222",  # Surface color (same as background)
+    panel="#222222",  # Panel color (same as background)
+    success="#ffe165",  # Success messages (use logo color)
+    warning="#ffe165",  # Warning messages (use logo color)
+    error="#ff6b6b",  # Error messages (light red)
+)
 
 
 def create_openhands_theme() -> Theme:
     """Create and return the custom OpenHands theme."""
+    from textual.theme import Theme
+
     return Theme(
         name="openhands",
-        primary="#ffe165",  # Logo, cursor color
-        secondary="#ffffff",  # Borders, plain text
-        accent="#277dff",  # Special text like "initialize conversation"
-        foreground="#ffffff",  # Default text color
-        background="#222222",  # Background color
-        surface="#222222",  # Surface color (same as background)
-        panel="#222222",  # Panel color (same as background)
-        success="#ffe165",  # Success messages (use logo color)
-        warning="#ffe165",  # Warning messages (use logo color)
-        error="#ff6b6b",  # Error messages (light red)
+        **OPENHANDS_COLORS._asdict(),
         dark=True,  # This is a dark theme
         variables={
             # Placeholder text color
@@ -27,5 +61,10 @@ def create_openhands_theme() -> Theme:
     )
 
 
-# Create the theme instance
-OPENHANDS_THEME = create_openhands_theme()
+def __getattr__(name: str) -> Theme:
+    # The theme instance is created on first use, importing Textual
+    if name == "OPENHANDS_THEME":
+        theme = create_openhands_theme()
+        globals()[name] = theme
+        return theme
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
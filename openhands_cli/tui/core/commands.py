@@ -6,6 +6,8 @@ and the logic for handling command execution.
 
 from __future__ import annotations
 
+from functools import partial
+
 from textual.containers import VerticalScroll
 from textual.widgets import Static
 from textual_autocomplete import DropdownItem
@@ -86,8 +88,7 @@ def show_help(scroll_view: VerticalScroll) -> None:
   • Use arrow keys to navigate through suggestions
   • Press Enter to select a command
 """
-    help_widget = Static(help_text, classes="help-message")
-    scroll_view.mount(help_widget)
+    _mount_message(scroll_view, help_text, "help-message")
 
 
 def show_skills(
@@ -111,5 +112,14 @@ def show_skills(
         lines.append("[dim]No skills, hooks, or MCPs loaded.[/dim]")
     skills_text = "\n".join(lines)
 
-    skills_widget = Static(skills_text, classes="skills-message")
-    scroll_view.mount(skills_widget)
+    _mount_message(scroll_view, skills_text, "skills-message")
+
+
+def _mount_message(scroll_view: VerticalScroll, text: str, classes: str) -> None:
+    """Mount a message, through the transcript of the conversation view if any."""
+    build = partial(Static, text, classes=classes)
+    transcript = getattr(scroll_view, "transcript", None)
+    if transcript is None:
+        scroll_view.mount(build())
+    else:
+        transcript.append(build(), build)
@@ -66,6 +66,7 @@ class RunnerFactory:
             self._scroll_view_provider(),
             app,
             name=DEFAULT_AGENT_NAME,
+            conversation_id=conversation_id,
         )
 
         event_callback: Callable[[Event], None] | None = (
@@ -31,6 +31,7 @@ from typing import TYPE_CHECKING, Any
 
 from textual.app import ComposeResult
 from textual.containers import Container
+from textual.css.query import NoMatches
 from textual.message import Message
 from textual.reactive import var
 
@@ -311,9 +312,15 @@ class ConversationContainer(Container):
         Uses Textual's call_from_thread() for thread safety when called from
         a background thread. If already on the main thread, performs the
         update directly.
+
+        UI operations buffered by the scroll view's render queue are flushed
+        first: they were submitted before this update and must not see its
+        effects (e.g. land after the confirmation panel or in the transcript
+        of the next conversation).
         """
 
         def do_update() -> None:
+            self._flush_render_queue()
             setattr(self, attr, value)
 
         if threading.current_thread() is threading.main_thread():
@@ -323,6 +330,14 @@ class ConversationContainer(Container):
             # Cross-thread call - use Textual's thread-safe mechanism
             self.app.call_from_thread(do_update)
 
+    def _flush_render_queue(self) -> None:
+        try:
+            scroll_view = self.scroll_view
+        except NoMatches:
+            return
+        if scroll_view.render_queue is not None:
+            scroll_view.render_queue.flush()
+
     def set_running(self, value: bool) -> None:
         """Set the running state. Thread-safe."""
         self._schedule_update("running", value)
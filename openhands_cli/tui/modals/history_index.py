@@ -0,0 +1,209 @@
+"""Search index for the prompt history modal.
+
+All prompts are lowercased and joined into a single newline-separated corpus
+once, when the index is built. Searches then run as C-level ``str.find`` and
+regex scans over that corpus instead of a Python loop over every entry, and
+stop as soon as enough results are found.
+
+Results are ranked in two tiers:
+
+1. Entries containing every search term as a substring, newest first.
+2. Fuzzy matches, where every term appears as a subsequence (e.g. ``rfct``
+   matches ``refactor``), ordered by how tightly the letters cluster.
+
+When a search saw every match and the next query only extends it (the user
+kept typing), the next search filters the previous matches instead of
+rescanning the corpus.
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import re
+from collections.abc import Sequence
+
+from openhands_cli.stores.prompt_history import PromptHistoryEntry
+
+
+# Number of fuzzy matches collected (newest first) and ranked by compactness.
+FUZZY_RANK_POOL = 1000
+
+
+class HistorySearchIndex:
+    """Precomputed search structure over prompt history entries."""
+
+    def __init__(self, entries: Sequence[PromptHistoryEntry]) -> None:
+        """Build the index.
+
+        Args:
+            entries: History entries, newest first. Result ids are positions
+                in this sequence.
+        """
+        self.entries = entries
+        # Newlines inside prompts are flattened so every entry is one line.
+        self._texts = [e["text"].lower().replace("\n", " ") for e in entries]
+        self._corpus = "\n".join(self._texts)
+        self._starts = list(
+            itertools.accumulate((len(t) + 1 for t in self._texts[:-1]), initial=0)
+        )
+        # Query and all matching ids of the last search that saw every match.
+        self._complete: tuple[str, list[int]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def search(self, query: str, limit: int) -> list[int]:
+        """Find the best matching entries for a query.
+
+        Args:
+            query: Whitespace separated search terms (case-insensitive).
+            limit: Maximum number of results.
+
+        Returns:
+            Ids of matching entries, best match first.
+        """
+        query = " ".join(query.lower().split())
+        terms = query.split()
+        if not terms or limit <= 0:
+            return list(range(min(limit, len(self.entries))))
+
+        previous = self._complete
+        if previous is not None and query.startswith(previous[0]):
+            exact, fuzzy = self._filter(previous[1], terms)
+            complete = True
+        else:
+            exact, fuzzy, complete = self._scan(terms, limit)
+
+        self._complete = (query, sorted(exact + fuzzy)) if complete else None
+
+        results = exact[:limit]
+        if len(results) < limit:
+            patterns = [(_subsequence_pattern(term), len(term)) for term in terms]
+            ranked = sorted(fuzzy, key=lambda i: (self._spread(i, patterns), i))
+            results += ranked[: limit - len(results)]
+        return results
+
+    def _scan(self, terms: list[str], limit: int) -> tuple[list[int], list[int], bool]:
+        """Search the whole corpus.
+
+        Returns:
+            Exact and fuzzy match ids (newest first), and whether every
+            match was seen.
+        """
+        # A letter that appears nowhere rules out any match, cheaply.
+        if any(c not in self._corpus for c in set("".join(terms))):
+            return [], [], True
+
+        exact = self._scan_exact(terms, limit)
+        if len(exact) >= limit:
+            return exact, [], False
+
+        exact_ids = set(exact)
+        fuzzy: list[int] = []
+        pattern = _fuzzy_pattern(terms, multiline=True)
+        for match in pattern.finditer(self._corpus):
+            i = self._line_at(match.start())
+            if i in exact_ids:
+                continue
+            fuzzy.append(i)
+            if len(fuzzy) >= FUZZY_RANK_POOL:
+                return exact, fuzzy, False
+        return exact, fuzzy, True
+
+    def _scan_exact(self, terms: list[str], limit: int) -> list[int]:
+        """Find entries containing every term, newest first."""
+        # Scan for the longest term, which usually has the fewest hits.
+        anchor = max(terms, key=len)
+        corpus = self._corpus
+        results: list[int] = []
+        position = 0
+        while len(results) < limit:
+            position = corpus.find(anchor, position)
+            if position == -1:
+                break
+            i = self._line_at(position)
+            text = self._texts[i]
+            if all(term in text for term in terms):
+                results.append(i)
+            # Continue with the next entry.
+            position = self._starts[i] + len(text) + 1
+        return results
+
+    def _filter(
+        self, candidates: list[int], terms: list[str]
+    ) -> tuple[list[int], list[int]]:
+        """Split candidate ids into exact and fuzzy matches."""
+        pattern = _fuzzy_pattern(terms)
+        exact: list[int] = []
+        fuzzy: list[int] = []
+        for i in candidates:
+            text = self._texts[i]
+            if all(term in text for term in terms):
+                exact.append(i)
+            elif pattern.match(text):
+                fuzzy.append(i)
+        return exact, fuzzy
+
+    def _line_at(self, position: int) -> int:
+        return bisect.bisect_right(self._starts, position) - 1
+
+    def _spread(self, i: int, patterns: list[tuple[re.Pattern[str], int]]) -> int:
+        """Number of extra characters between the letters of fuzzy matches.
+
+        Args:
+            i: Entry id.
+            patterns: Subsequence pattern and length of each search term.
+        """
+        text = self._texts[i]
+        spread = 0
+        for pattern, length in patterns:
+            match = pattern.search(text)
+            if match is not None:
+                spread += match.end() - match.start() - length
+        return spread
+
+
+def find_match_positions(text: str, term: str) -> list[int]:
+    """Find the positions of the letters of ``term`` matched in ``text``.
+
+    Args:
+        text: Lowercased text to search.
+        term: Lowercased search term.
+
+    Returns:
+        Positions of the matched letters: the first substring occurrence if
+        there is one, otherwise the first fuzzy (subsequence) match. Empty if
+        the term does not match.
+    """
+    idx = text.find(term)
+    if idx != -1:
+        return list(range(idx, idx + len(term)))
+
+    match = _subsequence_pattern(term).search(text)
+    if match is None:
+        return []
+    positions = [match.start()]
+    for c in term[1:]:
+        positions.append(text.index(c, positions[-1] + 1))
+    return positions
+
+
+def _subsequence_pattern(term: str) -> re.Pattern[str]:
+    """Pattern matching the letters of ``term`` in order within one line.
+
+    Each gap excludes the next letter and newlines, so matching is linear.
+    """
+    first, *rest = term
+    return re.compile(
+        re.escape(first) + "".join(f"[^{re.escape(c)}\\n]*{re.escape(c)}" for c in rest)
+    )
+
+
+def _fuzzy_pattern(terms: list[str], multiline: bool = False) -> re.Pattern[str]:
+    """Pattern matching at the start of lines containing every term fuzzily."""
+    lookaheads = "".join(
+        "(?=" + "".join(f"[^{re.escape(c)}\\n]*{re.escape(c)}" for c in term) + ")"
+        for term in terms
+    )
+    return re.compile("^" + lookaheads, re.MULTILINE if multiline else 0)
@@ -6,20 +6,40 @@ from datetime import datetime
 from typing import ClassVar
 
 from rich.text import Text
-from textual import events, on
+from textual import events, on, work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import Input, OptionList, Static
 from textual.widgets.option_list import Option
+from textual.worker import get_current_worker
 
-from openhands_cli.stores.prompt_history import PromptHistoryEntry, PromptHistoryStore
+from openhands_cli.stores.prompt_history import (
+    PromptHistoryStore,
+    load_global_entries,
+)
+from openhands_cli.tui.modals.history_index import (
+    HistorySearchIndex,
+    find_match_positions,
+)
 
 
 # Maximum number of search results to display in the history search modal
 MAX_SEARCH_RESULTS = 100
 
+# Maximum number of prompts loaded when searching the history of all projects
+GLOBAL_HISTORY_MAX_ENTRIES = 100_000
+
+# Histories at least this large are searched off the UI thread, once typing
+# pauses for SEARCH_DEBOUNCE_SECONDS; smaller ones are searched on each key.
+BACKGROUND_SEARCH_MIN_ENTRIES = 5_000
+SEARCH_DEBOUNCE_SECONDS = 0.05
+
+_TITLE = "Search History (Fuzzy Matching)"
+_GLOBAL_TITLE = "Search History - All Projects (Fuzzy Matching)"
+
 
 class HistorySearchScreen(ModalScreen[str | None]):
     """A modal screen for searching through prompt history.
@@ -29,6 +49,7 @@ class HistorySearchScreen(ModalScreen[str | None]):
 
     BINDINGS: ClassVar = [
         Binding("escape", "dismiss(None)", "Cancel"),
+        Binding("ctrl+g", "toggle_global_history", "All projects", show=False),
         Binding("ctrl+q", "request_quit", "Quit", priority=True),
         Binding("ctrl+c", "request_quit", "Quit", priority=True, show=False),
     ]
@@ -82,15 +103,28 @@ class HistorySearchScreen(ModalScreen[str | None]):
     }
     """
 
-    def __init__(self, **kwargs) -> None:
+    def __init__(self, global_history: bool = False, **kwargs) -> None:
+        """Initialize the screen.
+
+        Args:
+            global_history: Search the prompts of all projects instead of only
+                the current one. Can be toggled with Ctrl+G.
+        """
         super().__init__(**kwargs)
         self.history_store = PromptHistoryStore()
-        self._all_entries: list[PromptHistoryEntry] = []
+        self.global_history = global_history
+        self._index = HistorySearchIndex([])
         self._option_full_texts: dict[int, str] = {}  # option index -> full text
+        self._shown: tuple[list[str], list[int]] | None = None  # terms, entry ids
+        self._search_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         with Vertical(id="search_container"):
-            yield Static("Search History (Fuzzy Matching)", classes="form_label")
+            yield Static(
+                _GLOBAL_TITLE if self.global_history else _TITLE,
+                id="search_title",
+                classes="form_label",
+            )
             yield Input(placeholder="Type to search...", id="search_input")
             yield Static("", id="results_info")
 
@@ -102,52 +136,100 @@ class HistorySearchScreen(ModalScreen[str | None]):
 
     def on_mount(self) -> None:
         """Load history when mounted."""
-        self._all_entries = self.history_store.load_entries()
-
-        self._update_results("")
+        self._load_history()
         self.query_one("#search_input").focus()
 
+    def _load_history(self) -> None:
+        """Build the search index for the current history scope."""
+        if self.global_history:
+            self.query_one("#results_info", Static).update("Loading prompts...")
+            self._load_global_history()
+        else:
+            self._set_index(HistorySearchIndex(self.history_store.load_entries()))
+
+    @work(thread=True, exclusive=True, group="history_load")
+    def _load_global_history(self) -> None:
+        """Load and index the history of all projects off the UI thread."""
+        index = HistorySearchIndex(load_global_entries(GLOBAL_HISTORY_MAX_ENTRIES))
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._set_index, index)
+
+    def _set_index(self, index: HistorySearchIndex) -> None:
+        self._index = index
+        self._shown = None
+        self._update_results(self.query_one("#search_input", Input).value)
+
+    def action_toggle_global_history(self) -> None:
+        """Switch between this project's history and all projects'."""
+        self.global_history = not self.global_history
+        self.query_one("#search_title", Static).update(
+            _GLOBAL_TITLE if self.global_history else _TITLE
+        )
+        self._load_history()
+
     @on(Input.Changed, "#search_input")
     def _on_input_changed(self, event: Input.Changed) -> None:
         """Update results as the user types."""
-        self._update_results(event.value)
+        if self._search_timer is not None:
+            self._search_timer.stop()
+            self._search_timer = None
+
+        if len(self._index) < BACKGROUND_SEARCH_MIN_ENTRIES:
+            self._update_results(event.value)
+            return
+
+        query = event.value
+        self._search_timer = self.set_timer(
+            SEARCH_DEBOUNCE_SECONDS, lambda: self._search_in_background(query)
+        )
+
+    @work(thread=True, exclusive=True, group="history_search")
+    def _search_in_background(self, search_text: str) -> None:
+        """Search a large history off the UI thread."""
+        index = self._index
+        results = index.search(search_text, MAX_SEARCH_RESULTS)
+        if not get_current_worker().is_cancelled and index is self._index:
+            self.app.call_from_thread(self._show_results, search_text, results)
 
     def _update_results(self, search_text: str) -> None:
         """Filter and display results based on search text."""
+        results = self._index.search(search_text, MAX_SEARCH_RESULTS)
+        self._show_results(search_text, results)
+
+    def _show_results(self, search_text: str, results: list[int]) -> None:
+        """Display the given entries of the index as options."""
+        search_terms = search_text.lower().split()
+        if self._shown == (search_terms, results):
+            return
+        self._shown = (search_terms, results)
+
         option_list = self.query_one("#results_list", OptionList)
         info_label = self.query_one("#results_info", Static)
 
         option_list.clear_options()
         self._option_full_texts.clear()  # Clear stale texts from previous search
 
-        search_terms = search_text.lower().split()
-
-        match_count = 0
-        for entry in self._all_entries:
+        options: list[Option] = []
+        for match_count, entry_id in enumerate(results):
+            entry = self._index.entries[entry_id]
             text = entry["text"]
-            text_lower = text.lower()
-
-            if all(term in text_lower for term in search_terms):
-                # Create the highlighted rich text for the option
-                rich_text = self._format_history_item(
-                    text, entry["timestamp"], search_terms
-                )
-                option_list.add_option(Option(rich_text, id=f"opt_{match_count}"))
-                # Store the full text in our dictionary for retrieval
-                self._option_full_texts[match_count] = text
-
-                match_count += 1
-                if match_count >= MAX_SEARCH_RESULTS:
-                    break
+            # Create the highlighted rich text for the option
+            rich_text = self._format_history_item(
+                text, entry["timestamp"], search_terms
+            )
+            options.append(Option(rich_text, id=f"opt_{match_count}"))
+            # Store the full text in our dictionary for retrieval
+            self._option_full_texts[match_count] = text
 
-        if match_count > 0:
+        if options:
+            option_list.add_options(options)
             option_list.highlighted = 0
         else:
             option_list.add_option(Option("No matches found", disabled=True))
 
         # Update info label
-        total = len(self._all_entries)
-        info_label.update(f"Showing {match_count} of {total} prompts")
+        total = len(self._index)
+        info_label.update(f"Showing {len(results)} of {total} prompts")
 
     def _format_history_item(
         self, full_text: str, timestamp: str, search_terms: list[str]
@@ -165,8 +247,14 @@ class HistorySearchScreen(ModalScreen[str | None]):
         if search_terms:
             first_match_idx = -1
             lower_text = raw_text.lower()
+            # Letters of terms that only match fuzzily, by position
+            fuzzy_positions: list[int] = []
             for term in search_terms:
                 idx = lower_text.find(term)
+                if idx == -1:
+                    positions = find_match_positions(lower_text, term)
+                    fuzzy_positions.extend(positions)
+                    idx = positions[0] if positions else -1
                 if idx != -1:
                     if first_match_idx == -1 or idx < first_match_idx:
                         first_match_idx = idx
@@ -175,14 +263,22 @@ class HistorySearchScreen(ModalScreen[str | None]):
                 start = first_match_idx - 30
                 end = start + 100
                 display_plain = "..." + raw_text[start:end]
+                offset = 3 - start
             else:
+                start, end = 0, 100
                 display_plain = raw_text[:100]
+                offset = 0
 
             display_text = Text(display_plain)
             for term in search_terms:
                 display_text.highlight_words(
                     [term], style="bold reverse italic", case_sensitive=False
                 )
+            for position in fuzzy_positions:
+                if start <= position < end:
+                    display_text.stylize(
+                        "bold reverse italic", position + offset, position + offset + 1
+                    )
         else:
             display_text = Text(raw_text[:100])
 
@@ -1,17 +1,44 @@
-import litellm
+"""Provider and model choices for the settings screen.
 
-from openhands.sdk.llm import UNVERIFIED_MODELS_EXCLUDING_BEDROCK, VERIFIED_MODELS
+The catalogue of providers and models is read from a snapshot generated at
+build time by ``scripts/generate_model_catalog.py``, so that opening the
+settings doesn't import litellm. When there is no usable snapshot, or it was
+taken with other versions of litellm or the SDK than the installed ones, it is
+built from litellm and the SDK instead; `refresh_catalog` does the same to
+pick up models added since the snapshot was taken.
+"""
 
+import json
+from dataclasses import dataclass, field
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
 
-# Get set of valid litellm provider names for filtering
-# See: https://docs.litellm.ai/docs/providers
-_VALID_LITELLM_PROVIDERS: set[str] = {
-    str(getattr(p, "value", p)) for p in litellm.provider_list
-}
+from textual.fuzzy import Matcher
 
 
-def get_provider_options() -> list[tuple[str, str]]:
-    """Get list of available LLM providers.
+CATALOG_PATH = Path(__file__).with_name("model_catalog.json")
+# Bump when the layout of the snapshot changes: older snapshots are ignored
+CATALOG_SCHEMA_VERSION = 1
+# Distributions the catalogue is built from, by the snapshot key recording
+# the version it was built with
+SNAPSHOT_DISTRIBUTIONS = {"litellm_version": "litellm", "sdk_version": "openhands-sdk"}
+
+
+@dataclass(frozen=True)
+class ModelCatalog:
+    """Providers, in display order, and the models available for each."""
+
+    providers: list[str]
+    models: dict[str, list[str]]
+    from_snapshot: bool = field(default=False, compare=False)
+
+
+_catalog: ModelCatalog | None = None
+
+
+def build_catalog() -> ModelCatalog:
+    """Build the catalogue from litellm and the SDK model lists.
 
     Includes:
     - All VERIFIED_MODELS providers (openhands, openai, anthropic, mistral)
@@ -20,43 +47,145 @@ def get_provider_options() -> list[tuple[str, str]]:
       "providers" like 'meta-llama', 'Qwen' which are vendor names)
 
     'openhands' is always listed first; remaining providers are sorted
-    alphabetically.
+    alphabetically. Models keep their original order (VERIFIED first, then
+    UNVERIFIED) and casing, without duplicates.
     """
+    import litellm
+
+    from openhands.sdk.llm import UNVERIFIED_MODELS_EXCLUDING_BEDROCK, VERIFIED_MODELS
+
+    # Get set of valid litellm provider names for filtering
+    # See: https://docs.litellm.ai/docs/providers
+    valid_litellm_providers = {
+        str(getattr(p, "value", p)) for p in litellm.provider_list
+    }
+
     # Verified providers always included (includes custom like 'openhands')
     verified_providers = set(VERIFIED_MODELS.keys())
 
     # Unverified providers are filtered to only valid litellm providers
     unverified_providers = set(UNVERIFIED_MODELS_EXCLUDING_BEDROCK.keys())
-    valid_unverified = unverified_providers & _VALID_LITELLM_PROVIDERS
+    valid_unverified = unverified_providers & valid_litellm_providers
 
     # Combine and sort alphabetically, then pin 'openhands' to the top
-    all_valid_providers = sorted(verified_providers | valid_unverified)
-    if "openhands" in all_valid_providers:
-        all_valid_providers.remove("openhands")
-        all_valid_providers.insert(0, "openhands")
+    providers = sorted(verified_providers | valid_unverified)
+    if "openhands" in providers:
+        providers.remove("openhands")
+        providers.insert(0, "openhands")
+
+    models = {
+        provider: list(
+            dict.fromkeys(
+                VERIFIED_MODELS.get(provider, [])
+                + UNVERIFIED_MODELS_EXCLUDING_BEDROCK.get(provider, [])
+            )
+        )
+        for provider in providers
+    }
+    return ModelCatalog(providers=providers, models=models)
+
+
+def load_snapshot(path: Path = CATALOG_PATH) -> ModelCatalog | None:
+    """Load a catalogue snapshot, or None if it is missing or unusable.
+
+    A snapshot recording another version of litellm or the SDK than the
+    installed one is unusable. Versions that aren't recorded, or whose
+    distribution metadata isn't available (e.g. in frozen builds), aren't
+    checked.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(data, dict)
+        or data.get("schema_version") != CATALOG_SCHEMA_VERSION
+        or not isinstance(data.get("providers"), list)
+        or not isinstance(data.get("models"), dict)
+    ):
+        return None
+    for key, distribution in SNAPSHOT_DISTRIBUTIONS.items():
+        recorded = data.get(key)
+        installed = _installed_version(distribution)
+        if None not in (recorded, installed) and recorded != installed:
+            return None
+    return ModelCatalog(
+        providers=data["providers"], models=data["models"], from_snapshot=True
+    )
+
+
+def _installed_version(distribution: str) -> str | None:
+    try:
+        return version(distribution)
+    except PackageNotFoundError:
+        return None
+
+
+def write_snapshot(
+    catalog: ModelCatalog, path: Path = CATALOG_PATH, **versions: str
+) -> None:
+    """Write a catalogue snapshot, recording the versions it was built from."""
+    data: dict[str, Any] = {
+        "schema_version": CATALOG_SCHEMA_VERSION,
+        **versions,
+        "providers": catalog.providers,
+        "models": catalog.models,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1)
+        f.write("\n")
+
+
+def get_catalog() -> ModelCatalog:
+    """Get the catalogue, loading the snapshot (or building it) on first use."""
+    global _catalog
+    if _catalog is None:
+        _catalog = load_snapshot(CATALOG_PATH) or build_catalog()
+    return _catalog
+
+
+def refresh_catalog() -> bool:
+    """Rebuild the catalogue from litellm; return whether it changed.
+
+    Slow (it imports litellm), so the settings screen calls it off the UI
+    thread.
+    """
+    global _catalog
+    catalog = build_catalog()
+    changed = catalog != _catalog
+    _catalog = catalog
+    return changed
 
-    return [(provider, provider) for provider in all_valid_providers]
+
+def get_provider_options() -> list[tuple[str, str]]:
+    """Get list of available LLM providers, 'openhands' first."""
+    return [(provider, provider) for provider in get_catalog().providers]
 
 
 def get_model_options(provider: str) -> list[tuple[str, str]]:
     """Get list of available models for a provider.
 
     Models are returned in their original order (VERIFIED first, then UNVERIFIED),
-    preserving the original casing. Duplicates are removed while maintaining order.
+    preserving the original casing.
     """
-    models = VERIFIED_MODELS.get(
-        provider, []
-    ) + UNVERIFIED_MODELS_EXCLUDING_BEDROCK.get(provider, [])
+    return [(model, model) for model in get_catalog().models.get(provider, [])]
 
-    # Remove duplicates while preserving order
-    seen: set[str] = set()
-    unique_models: list[str] = []
-    for model in models:
-        if model not in seen:
-            seen.add(model)
-            unique_models.append(model)
 
-    return [(model, model) for model in unique_models]
+def filter_model_options(
+    options: list[tuple[str, str]], query: str
+) -> list[tuple[str, str]]:
+    """Keep the options fuzzily matching `query`, best matches first.
 
-
-provider_options = get_provider_options()
+    Options matching equally well keep their original order.
+    """
+    query = query.strip()
+    if not query:
+        return options
+
+    matcher = Matcher(query)
+    scored = [(matcher.match(label), label, value) for label, value in options]
+    scored = [option for option in scored if option[0] > 0]
+    scored.sort(key=lambda option: option[0], reverse=True)
+    return [(label, value) for _, label, value in scored]
@@ -4,9 +4,7 @@ from textual.app import ComposeResult
 from textual.containers import Container, VerticalScroll
 from textual.widgets import Input, Label, Select, Static
 
-from openhands_cli.tui.modals.settings.choices import (
-    provider_options,
-)
+from openhands_cli.tui.modals.settings.choices import get_provider_options
 from openhands_cli.tui.modals.settings.model_recommendations import (
     render_model_recommendations,
 )
@@ -40,7 +38,7 @@ class SettingsTab(Container):
                     with Container(classes="form_group"):
                         yield Label("LLM Provider:", classes="form_label")
                         yield Select(
-                            provider_options,
+                            get_provider_options(),
                             id="provider_select",
                             classes="form_select",
                             type_to_search=True,
@@ -51,6 +49,13 @@ class SettingsTab(Container):
                     # LLM Model
                     with Container(classes="form_group"):
                         yield Label("LLM Model:", classes="form_label")
+                        yield Input(
+                            placeholder="Type to filter models",
+                            id="model_filter_input",
+                            classes="form_input",
+                            # Disabled until provider is selected
+                            disabled=True,
+                        )
                         yield Select(
                             [("Select provider first", "")],
                             id="model_select",
@@ -8,7 +8,7 @@ LLM provider, model, API keys, and advanced options.
 from collections.abc import Callable
 from typing import TYPE_CHECKING, ClassVar, Literal, cast
 
-from textual import getters
+from textual import getters, work
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal
 from textual.screen import ModalScreen
@@ -26,7 +26,11 @@ from textual.widgets._select import NoSelection
 from openhands.sdk import LLMSummarizingCondenser
 from openhands_cli.stores import AgentStore, CliSettings, CriticSettings
 from openhands_cli.tui.modals.settings.choices import (
+    filter_model_options,
+    get_catalog,
     get_model_options,
+    get_provider_options,
+    refresh_catalog,
 )
 from openhands_cli.tui.modals.settings.components import (
     CliSettingsTab,
@@ -53,6 +57,9 @@ class SettingsScreen(ModalScreen):
     mode_select: getters.query_one[Select] = getters.query_one("#mode_select")
     provider_select: getters.query_one[Select] = getters.query_one("#provider_select")
     model_select: getters.query_one[Select] = getters.query_one("#model_select")
+    model_filter_input: getters.query_one[Input] = getters.query_one(
+        "#model_filter_input"
+    )
     custom_model_input: getters.query_one[Input] = getters.query_one(
         "#custom_model_input"
     )
@@ -153,6 +160,31 @@ class SettingsScreen(ModalScreen):
         self._load_current_settings()
         self._update_advanced_visibility()
         self._update_field_dependencies()
+        if get_catalog().from_snapshot:
+            self._refresh_model_catalog()
+
+    @work(thread=True, exclusive=True, group="model_catalog")
+    def _refresh_model_catalog(self) -> None:
+        """Check litellm for models added since the catalogue snapshot."""
+        try:
+            changed = refresh_catalog()
+        except Exception:
+            # The snapshot is still usable; try again next time
+            return
+        if changed:
+            self.app.call_from_thread(self._apply_model_catalog)
+
+    def _apply_model_catalog(self) -> None:
+        """Show the providers and models of the refreshed catalogue."""
+        provider = self.provider_select.value
+        # Restoring the provider must not reset the model filter being typed
+        with self.provider_select.prevent(Select.Changed):
+            self.provider_select.set_options(get_provider_options())
+            if not isinstance(provider, NoSelection) and provider in (
+                get_catalog().providers
+            ):
+                self.provider_select.value = provider
+                self._update_model_options(str(provider))
 
     def on_show(self) -> None:
         """Reload settings when the screen is shown."""
@@ -174,6 +206,7 @@ class SettingsScreen(ModalScreen):
         self.mode_select.value = "basic"
         self.provider_select.clear()
         self.model_select.clear()
+        self.model_filter_input.value = ""
         self.memory_select.value = True
         self.timeout_input.value = ""
         self.max_tokens_input.value = ""
@@ -289,16 +322,35 @@ class SettingsScreen(ModalScreen):
         current_selection = self.model_select.value
 
         model_options = get_model_options(provider)
+        filtered_options = filter_model_options(
+            model_options, self.model_filter_input.value
+        )
 
-        if model_options:
-            self.model_select.set_options(model_options)
+        # Keep the current selection, if it is a model of the provider, even
+        # when the filter hides it: set_options would otherwise clear it
+        has_selection = bool(current_selection) and not isinstance(
+            current_selection, NoSelection
+        )
+        if (
+            has_selection
+            and current_selection not in [value for _, value in filtered_options]
+            and current_selection in [value for _, value in model_options]
+        ):
+            filtered_options = [
+                option for option in model_options if option[1] == current_selection
+            ] + filtered_options
+
+        if filtered_options:
+            self.model_select.set_options(filtered_options)
 
             # Try to preserve the current selection if it's still valid
-            if current_selection and not isinstance(current_selection, NoSelection):
+            if has_selection:
                 # Check if the current selection is still in the new options
-                option_values = [option[1] for option in model_options]
+                option_values = [option[1] for option in filtered_options]
                 if current_selection in option_values:
                     self.model_select.value = current_selection
+        elif model_options:
+            self.model_select.set_options([("No models match the filter", "")])
         else:
             self.model_select.set_options([("No models available", "")])
 
@@ -354,10 +406,11 @@ class SettingsScreen(ModalScreen):
                     # Provider is always enabled in basic mode
                     self.provider_select.disabled = False
 
-                    # Model select: enabled when provider is selected
+                    # Model select and filter: enabled when provider is selected
                     self.model_select.disabled = not (
                         provider and not isinstance(provider, NoSelection)
                     )
+                    self.model_filter_input.disabled = self.model_select.disabled
 
                     # API Key: enabled when model is selected
                     self.api_key_input.disabled = not (
@@ -431,6 +484,8 @@ class SettingsScreen(ModalScreen):
             self._clear_message()
         elif event.select.id == "provider_select":
             if event.value is not NoSelection:
+                # The filter was typed for the models of the previous provider
+                self.model_filter_input.value = ""
                 self._update_model_options(str(event.value))
             self._update_field_dependencies()
             self._clear_message()
@@ -448,6 +503,11 @@ class SettingsScreen(ModalScreen):
         elif event.input.id in ["api_key_input"]:
             self._update_field_dependencies()
             self._clear_message()
+        elif event.input.id == "model_filter_input":
+            provider = self.provider_select.value
+            if provider and not isinstance(provider, NoSelection):
+                self._update_model_options(str(provider))
+            self._update_field_dependencies()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
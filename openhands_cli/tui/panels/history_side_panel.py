@@ -43,6 +43,7 @@ class HistoryItemContent(Static):
         self,
         conversation: ConversationMetadata,
         is_current: bool,
+        parent_title: str | None = None,
         **kwargs,
     ) -> None:
         """Initialize history item content.
@@ -50,22 +51,23 @@ class HistoryItemContent(Static):
         Args:
             conversation: The conversation metadata to display
             is_current: Whether this is the currently active conversation
+            parent_title: Title of the conversation this one was forked from
         """
-        # Build the content string - show title, id as secondary
-        time_str = _format_time(conversation.created_at)
-        conv_id = _escape_rich_markup(conversation.id)
+        self.conversation_id = conversation.id
+        self._created_at = conversation.created_at
+        self._parent_id = conversation.parent_id
+        self._parent_title = parent_title
 
+        # Build the content string - show title, id as secondary
         # Use title if available, otherwise use ID
         has_title = bool(conversation.title)
         if conversation.title:
             title = _escape_rich_markup(_truncate(conversation.title, 100))
-            content = f"{title}\n[dim]{conv_id} • {time_str}[/dim]"
+            content = f"{title}\n{self._details()}"
         else:
-            content = f"[dim]New conversation[/dim]\n[dim]{conv_id} • {time_str}[/dim]"
+            content = f"[dim]New conversation[/dim]\n{self._details()}"
 
         super().__init__(content, markup=True, **kwargs)
-        self.conversation_id = conversation.id
-        self._created_at = conversation.created_at
         self._has_title = has_title
         self.is_current = is_current
 
@@ -81,12 +83,19 @@ class HistoryItemContent(Static):
 
     def set_title(self, title: str) -> None:
         """Update the displayed title for this history item."""
-        time_str = _format_time(self._created_at)
         title_text = _escape_rich_markup(_truncate(title, 100))
-        conv_id = _escape_rich_markup(self.conversation_id)
-        self.update(f"{title_text}\n[dim]{conv_id} • {time_str}[/dim]")
+        self.update(f"{title_text}\n{self._details()}")
         self._has_title = True
 
+    def _details(self) -> str:
+        """Secondary line: id, creation time and, for forks, the parent."""
+        conv_id = _escape_rich_markup(self.conversation_id)
+        details = f"{conv_id} • {_format_time(self._created_at)}"
+        if self._parent_id:
+            parent = self._parent_title or self._parent_id
+            details += f" • ⑂ {_escape_rich_markup(_truncate(parent, 40))}"
+        return f"[dim]{details}[/dim]"
+
     def set_current(self, is_current: bool) -> None:
         """Set current flag and update styles."""
         self.is_current = is_current
@@ -297,6 +306,9 @@ class HistorySidePanel(Container):
             self.current_conversation_id.hex if self.current_conversation_id else None
         )
 
+        # Forks show the title of the conversation they were forked from
+        titles = {conv.id: conv.title for conv in self._local_rows}
+
         # Track which index should be initially highlighted
         initial_index = 0
         for i, conv in enumerate(self._local_rows):
@@ -307,6 +319,7 @@ class HistorySidePanel(Container):
             content = HistoryItemContent(
                 conversation=conv,
                 is_current=is_current,
+                parent_title=titles.get(conv.parent_id) if conv.parent_id else None,
             )
             list_view.mount(ListItem(content, id=f"history-item-{conv.id}"))
 
@@ -421,6 +434,9 @@ class HistorySidePanel(Container):
                     created_at=conv.created_at,
                     title=title,
                     last_modified=conv.last_modified,
+                    cwd=conv.cwd,
+                    event_count=conv.event_count,
+                    parent_id=conv.parent_id,
                 )
                 break
 
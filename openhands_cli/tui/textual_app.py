@@ -511,14 +511,19 @@ class OpenHandsApp(CollapsibleNavigationMixin, App):
 
         Collapses all cells if any are expanded, otherwise expands all cells.
         This provides a quick way to minimize or maximize all content at once.
+        Cells unmounted by the transcript are toggled through their records.
         """
         collapsibles = self.scroll_view.query(Collapsible)
+        transcript = self.scroll_view.transcript
 
         # If any cell is expanded, collapse all; otherwise expand all
-        any_expanded = any(not collapsible.collapsed for collapsible in collapsibles)
+        any_expanded = transcript.any_unmounted_expanded() or any(
+            not collapsible.collapsed for collapsible in collapsibles
+        )
 
         for collapsible in collapsibles:
             collapsible.collapsed = any_expanded
+        transcript.set_unmounted_collapsed(any_expanded)
 
     def on_key(self, event: events.Key) -> None:
         """Handle keyboard navigation.
@@ -545,13 +550,14 @@ class OpenHandsApp(CollapsibleNavigationMixin, App):
                     event.prevent_default()
                     return
 
-                collapsibles = list(self.scroll_view.query(Collapsible))
-                if collapsibles:
-                    # Focus the last (most recent) collapsible's title
-                    last_collapsible = collapsibles[-1]
-                    last_title = last_collapsible.query_one(CollapsibleTitle)
-                    last_title.focus()
-                    last_collapsible.scroll_visible()
+                # Mount the most recent cells first if they were virtualized
+                if self.scroll_view.transcript.reveal_end():
+                    self.call_after_refresh(self._focus_last_cell)
+                    event.stop()
+                    event.prevent_default()
+                    return
+
+                if self._focus_last_cell():
                     event.stop()
                     event.prevent_default()
                     return
@@ -566,6 +572,17 @@ class OpenHandsApp(CollapsibleNavigationMixin, App):
             # Prevent the key from being processed elsewhere
             event.stop()
 
+    def _focus_last_cell(self) -> bool:
+        """Focus the most recent (last) collapsible's title, if there is one."""
+        collapsibles = list(self.scroll_view.query(Collapsible))
+        if not collapsibles:
+            return False
+        last_collapsible = collapsibles[-1]
+        last_title = last_collapsible.query_one(CollapsibleTitle)
+        last_title.focus()
+        last_collapsible.scroll_visible()
+        return True
+
     def _is_autocomplete_showing(self) -> bool:
         """Check if the autocomplete dropdown is currently visible.
 
@@ -5,7 +5,8 @@ title or pressing Enter when focused. It also supports programmatic control via
 Ctrl+O to toggle all cells at once.
 """
 
-from typing import TYPE_CHECKING, ClassVar, Protocol
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol
 
 from rich.text import Text
 from textual import events
@@ -302,13 +303,21 @@ class _HasQueryOne(Protocol):
 
     def query_one(self, selector: str) -> "DOMNode": ...
 
+    def call_after_refresh(self, callback: Callable[..., Any], *args: Any) -> bool: ...
+
+    def on_collapsible_title_navigate(
+        self, event: CollapsibleTitle.Navigate
+    ) -> None: ...
+
 
 class CollapsibleNavigationMixin:
     """Mixin providing navigation handler for apps with Collapsible widgets.
 
     Apps that contain Collapsible widgets can use this mixin to handle
     arrow key navigation between cells. The app must have a container
-    with id="scroll_view" containing the Collapsible widgets.
+    with id="scroll_view" containing the Collapsible widgets. If the container
+    has a transcript, cells it unmounted are mounted again when navigation
+    reaches the first or last mounted cell.
 
     Usage:
         class MyApp(CollapsibleNavigationMixin, App):
@@ -343,6 +352,10 @@ class CollapsibleNavigationMixin:
 
         # Check bounds
         if target_index < 0 or target_index >= len(collapsibles):
+            # Mount more cells in that direction, then navigate again
+            transcript = getattr(scroll_view, "transcript", None)
+            if transcript is not None and transcript.reveal(event.direction):
+                self.call_after_refresh(self.on_collapsible_title_navigate, event)
             return
 
         # Focus the target collapsible's title
@@ -16,16 +16,26 @@ Widget Hierarchy (within ConversationContainer):
 
 ScrollableContent handles:
 - Clearing dynamic content when conversation_id changes
+- Owning the Transcript that virtualizes conversation widgets
+- Owning the RenderQueue that batches updates from the conversation worker
 - Mounting InlineConfirmationPanel when pending_action_count becomes > 0
 
 Message handling (SendMessage) is done by ConversationManager.
 """
 
 import uuid
+from typing import TYPE_CHECKING
 
 from textual.containers import VerticalScroll
 from textual.reactive import var
 
+from openhands_cli.tui.widgets.render_queue import RenderQueue
+from openhands_cli.tui.widgets.transcript import Transcript
+
+
+if TYPE_CHECKING:
+    from textual.app import App
+
 
 class ScrollableContent(VerticalScroll, can_focus=False):
     """Scrollable container for conversation content.
@@ -46,6 +56,23 @@ class ScrollableContent(VerticalScroll, can_focus=False):
     conversation_id: var[uuid.UUID | None] = var(None)
     pending_action_count: var[int] = var(0)
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Conversation widgets, mounted only near the viewport
+        self.transcript = Transcript(self)
+        # Queue of UI operations from worker threads, shared by all visualizers
+        self.render_queue: RenderQueue | None = None
+
+    def get_render_queue(self, app: "App") -> RenderQueue:
+        """Get the render queue, creating it on first use.
+
+        Takes the app explicitly: visualizers may be created before this
+        widget is mounted.
+        """
+        if self.render_queue is None:
+            self.render_queue = RenderQueue(app, self, self.transcript)
+        return self.render_queue
+
     def watch_conversation_id(
         self, old_id: uuid.UUID | None, new_id: uuid.UUID | None
     ) -> None:
@@ -66,6 +93,7 @@ class ScrollableContent(VerticalScroll, can_focus=False):
             for widget in list(self.children):
                 if widget.id != "splash_content":
                     widget.remove()
+            self.transcript.clear()
             self.scroll_home(animate=False)
 
     def watch_pending_action_count(self, old_count: int, new_count: int) -> None:
@@ -83,5 +111,6 @@ class ScrollableContent(VerticalScroll, can_focus=False):
                 InlineConfirmationPanel,
             )
 
-            self.mount(InlineConfirmationPanel(new_count))
+            self.transcript.reveal_end()
+            self.transcript.attach(InlineConfirmationPanel(new_count))
             self.scroll_end(animate=False)
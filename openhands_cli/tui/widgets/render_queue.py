@@ -0,0 +1,114 @@
+"""Frame-batched UI updates from the conversation worker thread.
+
+The conversation runs in a worker thread and every event used to cross over to
+the UI thread with its own ``call_from_thread``, followed by its own mount and
+scroll. During bursts (fast terminal observations, condensation, resuming a
+conversation) that means hundreds of tiny cross-thread calls and relayouts.
+
+``RenderQueue`` buffers the operations submitted from other threads and runs
+them on the UI thread at most once per frame. Widgets appended to the
+transcript during a flush are mounted together, and the container is scrolled
+to the end at most once.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from textual.app import App
+    from textual.containers import ScrollableContainer
+
+    from openhands_cli.tui.widgets.transcript import Transcript
+
+
+# Delay between the first buffered operation and the flush (about 60 Hz).
+FLUSH_INTERVAL = 1 / 60
+
+
+class RenderQueue:
+    """Buffers UI operations from worker threads and runs them once per frame.
+
+    ``submit`` may be called from any thread. Everything else must be called
+    from the main thread.
+    """
+
+    def __init__(
+        self,
+        app: App,
+        container: ScrollableContainer,
+        transcript: Transcript,
+        interval: float = FLUSH_INTERVAL,
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            app: The Textual app running the main thread.
+            container: The scrollable container the operations update.
+            transcript: Transcript whose appended widgets are mounted together.
+            interval: Seconds to wait before flushing buffered operations.
+        """
+        self._app = app
+        self._container = container
+        self._transcript = transcript
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._ops: list[tuple[Callable[..., Any], tuple[Any, ...]]] = []
+        self._flush_scheduled = False
+        self._flushing = False
+        self._scroll_requested = False
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> None:
+        """Run ``func(*args)`` on the main thread with the next flush.
+
+        Only the first operation of a batch crosses over to the main thread,
+        to schedule the flush.
+        """
+        with self._lock:
+            self._ops.append((func, args))
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+
+        try:
+            self._app.call_from_thread(self._schedule_flush)
+        except Exception:
+            with self._lock:
+                self._flush_scheduled = False
+            raise
+
+    def flush(self) -> None:
+        """Run all buffered operations now, in the order they were submitted."""
+        with self._lock:
+            ops, self._ops = self._ops, []
+            self._flush_scheduled = False
+        if not ops:
+            return
+
+        at_end = self._container.is_vertical_scroll_end
+        self._flushing = True
+        try:
+            with self._app.batch_update(), self._transcript.deferred():
+                for func, args in ops:
+                    func(*args)
+        finally:
+            self._flushing = False
+            scroll, self._scroll_requested = self._scroll_requested, False
+        if scroll and at_end:
+            self._container.scroll_end(animate=False)
+
+    def follow_end(self) -> None:
+        """Keep the container scrolled to the end after adding content.
+
+        Inside a flush, the scroll happens once after all operations ran.
+        """
+        if self._flushing:
+            self._scroll_requested = True
+        elif self._container.is_vertical_scroll_end:
+            self._container.scroll_end(animate=False)
+
+    def _schedule_flush(self) -> None:
+        self._app.set_timer(self._interval, self.flush)
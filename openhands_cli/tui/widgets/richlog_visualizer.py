@@ -5,6 +5,8 @@ This replaces the Rich-based CLIVisualizer with a Textual-compatible version.
 
 import re
 import threading
+import uuid
+from functools import partial
 from typing import TYPE_CHECKING
 
 from rich.text import Text
@@ -35,6 +37,9 @@ from openhands_cli.theme import OPENHANDS_THEME
 from openhands_cli.tui.widgets.collapsible import (
     Collapsible,
 )
+from openhands_cli.tui.widgets.main_display import ScrollableContent
+from openhands_cli.tui.widgets.render_queue import RenderQueue
+from openhands_cli.tui.widgets.transcript import Transcript
 
 
 # Icons for different event types
@@ -53,6 +58,8 @@ DEFAULT_AGENT_NAME = "OpenHands Agent"
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from textual.containers import VerticalScroll
     from textual.widget import Widget
 
@@ -87,11 +94,23 @@ def _get_event_symbol_color(event: Event) -> str:
         return DEFAULT_COLOR
 
 
+def _create_user_message_widget(content: str) -> "Widget":
+    """Create the widget showing a message typed by the user."""
+    from textual.widgets import Static
+
+    return Static(f"> {content}", classes="user-message", markup=False)
+
+
 class ConversationVisualizer(ConversationVisualizerBase):
     """Handles visualization of conversation events for Textual apps.
 
     This visualizer creates Collapsible widgets and adds them to a VerticalScroll
     container. Supports delegate visualization by tracking agent identity.
+
+    Widgets are added through a Transcript, which keeps only the widgets near
+    the viewport mounted and rebuilds the others from their events on scroll.
+    UI operations from the conversation worker thread are buffered in a
+    RenderQueue and applied once per frame.
     """
 
     def __init__(
@@ -99,6 +118,9 @@ class ConversationVisualizer(ConversationVisualizerBase):
         container: "VerticalScroll",
         app: "OpenHandsApp",
         name: str | None = None,
+        transcript: Transcript | None = None,
+        render_queue: RenderQueue | None = None,
+        conversation_id: uuid.UUID | None = None,
     ) -> None:
         """Initialize the visualizer.
 
@@ -107,10 +129,30 @@ class ConversationVisualizer(ConversationVisualizerBase):
             app: The Textual app instance for thread-safe UI updates
             name: Agent name to display in panel titles for delegation context.
                   When set, titles will be prefixed with the agent name.
+            transcript: Transcript of the container. Defaults to the
+                  container's own transcript for ScrollableContent.
+            render_queue: Queue for UI operations from other threads. Defaults
+                  to the container's own queue for ScrollableContent, so that
+                  all visualizers of the container stay in order.
+            conversation_id: Conversation rendered by this visualizer. Queued
+                  operations are dropped once the container shows another one.
         """
         super().__init__()
         self._container = container
+        if transcript is None:
+            if isinstance(container, ScrollableContent):
+                transcript = container.transcript
+            else:
+                transcript = Transcript(container)
+        self._transcript = transcript
         self._app = app
+        if render_queue is None:
+            if isinstance(container, ScrollableContent):
+                render_queue = container.get_render_queue(app)
+            else:
+                render_queue = RenderQueue(app, container, transcript)
+        self._render_queue = render_queue
+        self._conversation_id = conversation_id
         self._name = name
         # Store the main thread ID for thread safety checks
         self._main_thread_id = threading.get_ident()
@@ -146,6 +188,9 @@ class ConversationVisualizer(ConversationVisualizerBase):
             container=self._container,
             app=self._app,
             name=agent_id,
+            transcript=self._transcript,
+            render_queue=self._render_queue,
+            conversation_id=self._conversation_id,
         )
 
     @staticmethod
@@ -233,7 +278,11 @@ class ConversationVisualizer(ConversationVisualizerBase):
         return ""
 
     def _run_on_main_thread(self, func, *args) -> None:
-        """Run a function on the main thread via call_from_thread if needed."""
+        """Run a function on the main thread, batched with the next frame if needed.
+
+        On the main thread, buffered operations are flushed first so that
+        everything runs in order.
+        """
         import asyncio
 
         has_loop = False
@@ -244,9 +293,24 @@ class ConversationVisualizer(ConversationVisualizerBase):
             pass
 
         if threading.get_ident() == self._main_thread_id and has_loop:
+            self._render_queue.flush()
             func(*args)
         else:
-            self._app.call_from_thread(func, *args)
+            self._render_queue.submit(self._run_if_current, func, *args)
+
+    def _run_if_current(self, func, *args) -> None:
+        """Run a queued operation unless the container moved to another conversation.
+
+        Operations from a conversation that was switched away from while they
+        were buffered would otherwise render into the new transcript.
+        """
+        if (
+            self._conversation_id is not None
+            and isinstance(self._container, ScrollableContent)
+            and self._container.conversation_id != self._conversation_id
+        ):
+            return
+        func(*args)
 
     def _do_refresh_plan_panel(self) -> None:
         """Refresh the plan panel (must be called from main thread)."""
@@ -291,18 +355,35 @@ class ConversationVisualizer(ConversationVisualizerBase):
 
         widget = self._create_event_widget(event)
         if widget:
-            self._run_on_main_thread(self._add_widget_to_ui, widget)
+            if isinstance(event, ActionEvent) and isinstance(widget, Collapsible):
+                self._pending_actions[event.tool_call_id] = (event, widget)
+            self._run_on_main_thread(
+                self._add_widget_to_ui,
+                widget,
+                partial(self._create_event_widget, event),
+            )
 
             # Add critic collapsible if present (for MessageEvent and ActionEvent)
             critic_result = getattr(event, "critic_result", None)
             if critic_result is not None:
                 self._handle_critic_result(critic_result)
 
-    def _add_widget_to_ui(self, widget: "Widget") -> None:
-        """Add a widget to the UI (must be called from main thread)."""
-        self._container.mount(widget)
-        if self._container.is_vertical_scroll_end:
-            self._container.scroll_end(animate=False)
+    def _add_widget_to_ui(
+        self, widget: "Widget", build: "Callable[[], Widget] | None" = None
+    ) -> None:
+        """Add a widget to the UI (must be called from main thread).
+
+        Args:
+            widget: The widget to add.
+            build: Recreates the widget after it was unmounted by the
+                transcript. Widgets without one are pinned to the previous
+                widget instead of being unmounted.
+        """
+        if build is None:
+            self._transcript.attach(widget)
+        else:
+            self._transcript.append(widget, build)
+        self._render_queue.follow_end()
 
     def _handle_critic_result(self, critic_result: "CriticResult") -> None:
         """Handle a critic result by displaying widgets and notifying controller.
@@ -344,7 +425,11 @@ class ConversationVisualizer(ConversationVisualizerBase):
 
         # Display critic score collapsible
         critic_widget = create_critic_collapsible(critic_result)
-        self._run_on_main_thread(self._add_widget_to_ui, critic_widget)
+        self._run_on_main_thread(
+            self._add_widget_to_ui,
+            critic_widget,
+            partial(create_critic_collapsible, critic_result),
+        )
 
         # Add feedback widget after critic collapsible
         feedback_widget = CriticFeedbackWidget(
@@ -364,7 +449,8 @@ class ConversationVisualizer(ConversationVisualizerBase):
         """Dismiss any pending feedback widgets.
 
         Called when a new user turn starts - user chose to continue
-        instead of rating the critic feedback.
+        instead of rating the critic feedback. Must be called from the main
+        thread, after buffered operations that may add feedback widgets.
         """
         from openhands_cli.tui.utils.critic.feedback import CriticFeedbackWidget
 
@@ -377,12 +463,8 @@ class ConversationVisualizer(ConversationVisualizerBase):
         Args:
             content: The message text to display.
         """
-        from textual.widgets import Static
-
-        user_message_widget = Static(
-            f"> {content}", classes="user-message", markup=False
-        )
-        self._run_on_main_thread(self._add_widget_to_ui, user_message_widget)
+        build = partial(_create_user_message_widget, content)
+        self._run_on_main_thread(self._add_widget_to_ui, build(), build)
 
     def render_user_message(self, content: str) -> None:
         """Render a user message to the UI.
@@ -399,7 +481,7 @@ class ConversationVisualizer(ConversationVisualizerBase):
         Args:
             content: The user's message text to display.
         """
-        self._dismiss_pending_feedback_widgets()
+        self._run_on_main_thread(self._dismiss_pending_feedback_widgets)
         self._render_message_widget(content)
 
     def render_refinement_message(self, content: str) -> None:
@@ -412,17 +494,15 @@ class ConversationVisualizer(ConversationVisualizerBase):
         Args:
             content: The refinement message text to display.
         """
-        self._dismiss_pending_feedback_widgets()
+        self._run_on_main_thread(self._dismiss_pending_feedback_widgets)
         self._render_message_widget(content)
 
     def _update_widget_in_ui(
         self, collapsible: Collapsible, new_title: str, new_content: str
     ) -> None:
         """Update an existing widget in the UI (must be called from main thread)."""
-        collapsible.update_title(new_title)
-        collapsible.update_content(new_content)
-        if self._container.is_vertical_scroll_end:
-            self._container.scroll_end(animate=False)
+        self._transcript.update_collapsible(collapsible, new_title, new_content)
+        self._render_queue.follow_end()
 
     def _handle_observation_event(
         self, event: ObservationEvent | UserRejectObservation | AgentErrorEvent
@@ -815,13 +895,11 @@ class ConversationVisualizer(ConversationVisualizerBase):
 
         if isinstance(event, ActionEvent):
             title = self._build_action_title(event)
-            collapsible = self._make_collapsible(
+            return self._make_collapsible(
                 self._escape_rich_markup(str(content)),
                 title,
                 event,
             )
-            self._pending_actions[event.tool_call_id] = (event, collapsible)
-            return collapsible
 
         fallback_titles: list[tuple[type[Event], str]] = [
             (ObservationEvent, "Observation"),
@@ -0,0 +1,530 @@
+"""Virtualized conversation transcript.
+
+Long conversations produce thousands of widgets, and keeping all of them
+mounted makes layout, scrolling and ``scroll_end`` progressively slower.
+``Transcript`` keeps a lightweight ``TranscriptEntry`` per widget and only
+mounts the entries in or near the viewport. Entries scrolled far away are
+unmounted and replaced by spacers of the same height, then rebuilt from their
+record when they come back into view.
+
+Short conversations are unaffected: nothing is unmounted until more than
+``MAX_MOUNTED_ENTRIES`` entries are mounted. Widgets appended inside
+``Transcript.deferred()`` are mounted together when the block exits.
+
+Widgets that can't be rebuilt (e.g. interactive panels) are added with
+``Transcript.attach()``: they are pinned to the entry before them, and hidden
+rather than unmounted along with it.
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+from textual.widget import Widget
+
+from openhands_cli.tui.widgets.collapsible import Collapsible, CollapsibleContent
+
+
+if TYPE_CHECKING:
+    from rich.text import Text
+    from textual.containers import ScrollableContainer
+
+
+# Mounted entries allowed before entries far from the viewport are unmounted.
+MAX_MOUNTED_ENTRIES = 200
+
+# Number of entries mounted at once when revealing entries beyond the window
+# (keyboard navigation past the first or last mounted cell).
+REVEAL_PAGE_ENTRIES = 20
+
+# Viewport heights kept mounted above and below the viewport.
+OVERSCAN_SCREENS = 1
+
+# Height assumed for entries that have not been laid out yet.
+ESTIMATED_ENTRY_HEIGHT = 3
+
+
+class TranscriptEntry:
+    """Lightweight record of a transcript widget.
+
+    Holds what is needed to rebuild the widget after it has been unmounted,
+    including the state of collapsible cells.
+    """
+
+    __slots__ = (
+        "build",
+        "widget",
+        "height",
+        "collapsed",
+        "title",
+        "content",
+        "attached",
+    )
+
+    def __init__(self, widget: Widget, build: Callable[[], Widget]) -> None:
+        """Initialize the entry.
+
+        Args:
+            widget: The widget as initially created.
+            build: Creates a new copy of the widget as initially created.
+        """
+        self.build = build
+        # The mounted widget, or None while the entry is virtualized.
+        self.widget: Widget | None = widget
+        # Distance to the next entry (or own height with margins if last).
+        self.height = ESTIMATED_ENTRY_HEIGHT
+        # Collapsible state applied on rebuild; title and content are only
+        # set once they were updated after the widget was created.
+        self.collapsed = widget.collapsed if isinstance(widget, Collapsible) else None
+        self.title: str | Text | None = None
+        self.content: CollapsibleContent | None = None
+        # Widgets pinned after this one, kept mounted but hidden while the
+        # entry is virtualized.
+        self.attached: list[Widget] = []
+
+    def materialize(self) -> Widget:
+        """Rebuild the widget with its last known state."""
+        widget = self.build()
+        if isinstance(widget, Collapsible):
+            if self.title is not None:
+                widget.update_title(self.title)
+            if self.content is not None:
+                widget.update_content(self.content)
+            if self.collapsed is not None:
+                widget.collapsed = self.collapsed
+        self.widget = widget
+        return widget
+
+
+class TranscriptSpacer(Widget):
+    """Blank space standing in for unmounted transcript entries."""
+
+    DEFAULT_CSS = """
+    TranscriptSpacer {
+        width: 1fr;
+        height: 0;
+    }
+    """
+
+
+class Transcript:
+    """Mounts the entries of a conversation transcript near the viewport.
+
+    Entries form a contiguous window ``[start, end)`` of mounted widgets, with
+    a spacer above and below it for the unmounted entries. The window moves
+    as the container scrolls. All methods must be called from the main thread.
+    """
+
+    def __init__(self, container: ScrollableContainer) -> None:
+        """Initialize the transcript.
+
+        Args:
+            container: The scrollable container the entries are mounted in.
+        """
+        self._container = container
+        self._entries: list[TranscriptEntry] = []
+        # Entries by the widget they were created with, so updates to a cell
+        # reach it after it has been rebuilt.
+        self._entries_by_widget: WeakKeyDictionary[Widget, TranscriptEntry] = (
+            WeakKeyDictionary()
+        )
+        self._start = 0
+        self._end = 0
+        self._top_spacer: TranscriptSpacer | None = None
+        self._bottom_spacer: TranscriptSpacer | None = None
+        self._watching = False
+        self._sync_pending = False
+        # Entries appended inside deferred(), not added to the window yet.
+        self._deferred: list[TranscriptEntry] | None = None
+        # Whether the view sticks to the end of the transcript. Updated on
+        # scroll, since the scroll position lags behind newly mounted entries.
+        self._following = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def mounted_count(self) -> int:
+        """Number of entries that are currently mounted."""
+        return self._end - self._start
+
+    def append(self, widget: Widget, build: Callable[[], Widget]) -> None:
+        """Add a widget to the end of the transcript.
+
+        The widget is mounted unless the end of the transcript is currently
+        virtualized (scrolled far away), in which case only its record is kept.
+        Inside ``deferred()``, mounting waits until the block exits.
+
+        Args:
+            widget: The widget to add.
+            build: Creates a new copy of the widget as initially created.
+        """
+        entry = TranscriptEntry(widget, build)
+        self._entries_by_widget[widget] = entry
+        if self._deferred is not None:
+            self._deferred.append(entry)
+        else:
+            self._add_entries([entry])
+
+    def attach(self, widget: Widget) -> None:
+        """Mount a widget that can't be rebuilt at the end of the transcript.
+
+        The widget is pinned to the last entry: it is hidden while that entry
+        is unmounted, and its height counts towards the entry's.
+
+        Args:
+            widget: The widget to mount.
+        """
+        self.mount_deferred()
+        if not self._entries:
+            self._container.mount(widget)
+            return
+
+        entry = self._entries[-1]
+        entry.attached = [w for w in entry.attached if w.is_attached]
+        entry.attached.append(widget)
+        if entry.widget is None:
+            widget.display = False
+            self._container.mount(widget)
+        else:
+            self._container.mount(widget, after=self._last_widget(entry))
+
+    @contextmanager
+    def deferred(self) -> Iterator[None]:
+        """Mount the widgets appended inside the block with a single mount."""
+        if self._deferred is not None:
+            yield
+            return
+        self._deferred = []
+        try:
+            yield
+        finally:
+            self.mount_deferred()
+            self._deferred = None
+
+    def mount_deferred(self) -> None:
+        """Mount the widgets appended so far inside ``deferred()``.
+
+        Call this before mounting other widgets into the container, so they
+        stay in order with the transcript.
+        """
+        if self._deferred:
+            entries, self._deferred = self._deferred, []
+            self._add_entries(entries)
+
+    def update_collapsible(
+        self, widget: Collapsible, title: str | Text, content: CollapsibleContent
+    ) -> None:
+        """Update the title and content of a collapsible cell.
+
+        Args:
+            widget: The collapsible as it was added to the transcript.
+            title: The new title.
+            content: The new content.
+        """
+        entry = self._entries_by_widget.get(widget)
+        if entry is None:
+            widget.update_title(title)
+            widget.update_content(content)
+            return
+
+        entry.title = title
+        entry.content = content
+        if isinstance(entry.widget, Collapsible):
+            entry.widget.update_title(title)
+            entry.widget.update_content(content)
+
+    def any_unmounted_expanded(self) -> bool:
+        """Whether any unmounted collapsible cell is expanded."""
+        return any(
+            entry.widget is None and entry.collapsed is False for entry in self._entries
+        )
+
+    def set_unmounted_collapsed(self, collapsed: bool) -> None:
+        """Collapse or expand every unmounted collapsible cell.
+
+        Mounted cells are toggled directly on their widgets.
+        """
+        for entry in self._entries:
+            if entry.widget is None and entry.collapsed not in (None, collapsed):
+                entry.collapsed = collapsed
+                entry.height = ESTIMATED_ENTRY_HEIGHT
+        self._update_spacers()
+
+    def reveal(self, direction: int) -> bool:
+        """Mount more entries before or after the mounted window.
+
+        Args:
+            direction: -1 to reveal earlier entries, 1 for later ones.
+
+        Returns:
+            False if there are no unmounted entries in that direction.
+        """
+        if direction < 0:
+            if self._start == 0:
+                return False
+            start = max(0, self._start - REVEAL_PAGE_ENTRIES)
+            self._move_window(start, self._end)
+        else:
+            if self._end == len(self._entries):
+                return False
+            end = min(len(self._entries), self._end + REVEAL_PAGE_ENTRIES)
+            self._move_window(self._start, end)
+        return True
+
+    def reveal_end(self) -> bool:
+        """Mount the last entries if the end of the transcript is unmounted.
+
+        Returns:
+            False if the last entry was already mounted.
+        """
+        count = len(self._entries)
+        if self._end == count:
+            return False
+        self._move_window(max(0, count - REVEAL_PAGE_ENTRIES), count)
+        self._container.call_after_refresh(self._container.scroll_end, animate=False)
+        return True
+
+    def clear(self) -> None:
+        """Forget all entries after the container's children were removed."""
+        self._entries.clear()
+        self._entries_by_widget.clear()
+        if self._deferred is not None:
+            self._deferred = []
+        self._start = self._end = 0
+        self._top_spacer = None
+        self._bottom_spacer = None
+
+    def _add_entries(self, entries: list[TranscriptEntry]) -> None:
+        """Add entries to the end, mounting them if the window reaches it."""
+        count = len(self._entries)
+        self._entries.extend(entries)
+        if self._end != count:
+            for entry in entries:
+                entry.widget = None
+            self._update_spacers()
+        elif len(entries) > MAX_MOUNTED_ENTRIES and self._following:
+            self._jump_to_end(len(entries))
+        else:
+            self._container.mount_all(
+                [entry.widget for entry in entries if entry.widget is not None]
+            )
+            self._end = len(self._entries)
+
+        if not self._watching and self._container.is_attached:
+            self._container.watch(
+                self._container, "scroll_y", self._on_scroll, init=False
+            )
+            self._watching = True
+        self._schedule_sync()
+
+    def _jump_to_end(self, added: int) -> None:
+        """Mount only the last entries after a large batch was added.
+
+        Mounting the whole batch only to unmount most of it on the next sync
+        would be wasted work, e.g. when resuming a long conversation.
+        """
+        entries = self._entries
+        for i in range(self._start, self._end):
+            self._unmount(entries[i])
+        count = len(entries)
+        start = count - MAX_MOUNTED_ENTRIES
+        for entry in entries[count - added : start]:
+            entry.widget = None
+
+        if self._top_spacer is None:
+            self._top_spacer = TranscriptSpacer()
+            self._container.mount(self._top_spacer)
+        self._container.mount_all(
+            [entry.widget for entry in entries[start:] if entry.widget is not None]
+        )
+        self._start, self._end = start, count
+        self._update_spacers()
+
+    def _on_scroll(self, _old: float, _new: float) -> None:
+        self._following = self._container.is_vertical_scroll_end
+        self._schedule_sync()
+
+    def _schedule_sync(self) -> None:
+        if self._sync_pending or not self._container.is_attached:
+            return
+        self._sync_pending = True
+        self._container.call_after_refresh(self._sync)
+
+    def _sync(self) -> None:
+        """Move the window if the viewport approaches its edges."""
+        self._sync_pending = False
+        container = self._container
+        if not self._entries or not container.is_attached:
+            return
+        viewport = container.scrollable_content_region.height
+        offsets = self._measure()
+        if not viewport or offsets is None:
+            return
+
+        if self._following and self._end == len(self._entries):
+            top = offsets[-1] - viewport
+        else:
+            top = container.scroll_offset.y
+        needed = _overlapping(offsets, top - viewport // 2, top + viewport * 3 // 2)
+        if (
+            self._start <= needed[0]
+            and needed[1] <= self._end
+            and self.mounted_count <= MAX_MOUNTED_ENTRIES
+        ):
+            return
+
+        overscan = viewport * OVERSCAN_SCREENS
+        start, end = _overlapping(offsets, top - overscan, top + viewport + overscan)
+        self._move_window(start, end)
+
+    def _measure(self) -> list[int] | None:
+        """Record the heights of mounted entries and compute all positions.
+
+        Returns:
+            The y offset of every entry and of the end of the transcript, or
+            None if no mounted entry has been laid out yet.
+        """
+        entries = self._entries[self._start : self._end]
+        regions = [entry.widget.virtual_region for entry in entries if entry.widget]
+        if len(regions) != len(entries) or not regions[0].height:
+            return None
+
+        for i, (entry, region) in enumerate(zip(entries, regions)):
+            if not region.height:
+                continue
+            if i + 1 < len(regions) and regions[i + 1].height:
+                entry.height = regions[i + 1].y - region.y
+            elif entry.widget is not None:
+                entry.height = sum(
+                    widget.virtual_region_with_margin.height
+                    for widget in (entry.widget, *entry.attached)
+                    if widget.is_attached and widget.display
+                )
+
+        offsets = list(
+            itertools.accumulate((e.height for e in self._entries), initial=0)
+        )
+        shift = regions[0].y - offsets[self._start]
+        return [offset + shift for offset in offsets]
+
+    def _move_window(self, start: int, end: int) -> None:
+        """Mount exactly the entries in ``[start, end)``."""
+        if (start, end) == (self._start, self._end):
+            return
+        container = self._container
+        entries = self._entries
+        count = len(entries)
+        self._measure()
+
+        # Keep the first entry that stays mounted at the same screen position,
+        # since rebuilt entries may not have exactly their estimated height.
+        keep_start, keep_end = max(start, self._start), min(end, self._end)
+        anchor = entries[keep_start].widget if keep_start < keep_end else None
+        anchor_offset = anchor.virtual_region.y - container.scroll_y if anchor else 0
+        following = self._following and end == count
+
+        # Create spacers while the current window is still mounted.
+        first = entries[self._start].widget
+        last = self._last_widget(entries[self._end - 1])
+        if start > 0 and self._top_spacer is None:
+            self._top_spacer = TranscriptSpacer()
+            container.mount(self._top_spacer, before=first)
+        if end < count and self._bottom_spacer is None:
+            self._bottom_spacer = TranscriptSpacer()
+            container.mount(self._bottom_spacer, after=last)
+
+        for i in range(self._start, self._end):
+            if not start <= i < end:
+                self._unmount(entries[i])
+
+        if anchor is None:
+            above = range(start, end)
+            below = range(0)
+        else:
+            above = range(start, keep_start)
+            below = range(keep_end, end)
+        if above and self._top_spacer is not None:
+            container.mount_all(
+                [entries[i].materialize() for i in above], after=self._top_spacer
+            )
+            self._show_attached(above)
+        if below and self._bottom_spacer is not None:
+            container.mount_all(
+                [entries[i].materialize() for i in below], before=self._bottom_spacer
+            )
+            self._show_attached(below)
+        if end == count and self._bottom_spacer is not None:
+            self._bottom_spacer.remove()
+            self._bottom_spacer = None
+
+        self._start, self._end = start, end
+        self._update_spacers()
+
+        if following:
+            container.call_after_refresh(container.scroll_end, animate=False)
+        elif anchor is not None and above:
+            container.call_after_refresh(self._restore_anchor, anchor, anchor_offset)
+
+    def _unmount(self, entry: TranscriptEntry) -> None:
+        widget = entry.widget
+        if widget is None:
+            return
+        if isinstance(widget, Collapsible):
+            entry.collapsed = widget.collapsed
+        entry.widget = None
+        widget.remove()
+        for attached in entry.attached:
+            attached.display = False
+
+    def _show_attached(self, indices: range) -> None:
+        """Move the widgets pinned to rebuilt entries back after them."""
+        for i in indices:
+            entry = self._entries[i]
+            entry.attached = [w for w in entry.attached if w.is_attached]
+            previous = entry.widget
+            if previous is None:
+                continue
+            for widget in entry.attached:
+                self._container.move_child(widget, after=previous)
+                widget.display = True
+                previous = widget
+
+    @staticmethod
+    def _last_widget(entry: TranscriptEntry) -> Widget | None:
+        """The entry's widget, or the last widget pinned to it."""
+        attached = [w for w in entry.attached if w.is_attached]
+        return attached[-1] if attached else entry.widget
+
+    def _restore_anchor(self, anchor: Widget, offset: int) -> None:
+        if anchor.is_attached:
+            self._container.scroll_to(y=anchor.virtual_region.y - offset, animate=False)
+
+    def _update_spacers(self) -> None:
+        if self._top_spacer is not None:
+            self._top_spacer.styles.height = sum(
+                entry.height for entry in self._entries[: self._start]
+            )
+        if self._bottom_spacer is not None:
+            self._bottom_spacer.styles.height = sum(
+                entry.height for entry in self._entries[self._end :]
+            )
+
+
+def _overlapping(offsets: list[int], top: int, bottom: int) -> tuple[int, int]:
+    """Range of entries overlapping ``[top, bottom)``, at least one entry.
+
+    Args:
+        offsets: Start offset of every entry, followed by the end offset.
+        top: Top of the area.
+        bottom: Bottom of the area.
+    """
+    count = len(offsets) - 1
+    start = min(max(bisect.bisect_right(offsets, top) - 1, 0), count - 1)
+    end = max(min(bisect.bisect_left(offsets, bottom), count), start + 1)
+    return start, end
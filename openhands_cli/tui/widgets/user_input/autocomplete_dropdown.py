@@ -1,3 +1,5 @@
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Final
 
@@ -8,6 +10,7 @@ from textual.widgets import OptionList
 from textual.widgets.option_list import Option
 
 from openhands_cli.locations import get_work_dir
+from openhands_cli.tui.widgets.user_input.file_index import FileIndex
 from openhands_cli.tui.widgets.user_input.models import (
     CompletionItem,
     CompletionType,
@@ -17,6 +20,10 @@ from openhands_cli.tui.widgets.user_input.single_line_input import (
 )
 
 
+# Slack for file systems that only track mtimes with coarse granularity
+_MTIME_SLACK_NS = 2_000_000_000
+
+
 class AutoCompleteDropdown(Container):
     """Custom autocomplete dropdown for text input.
 
@@ -28,6 +35,12 @@ class AutoCompleteDropdown(Container):
     # Min spaces between command name and description
     DESCRIPTION_GAP: Final[int] = 3
 
+    # Max number of file path completions shown
+    MAX_FILE_CANDIDATES: Final[int] = 50
+
+    # Max number of directory listings kept, least recently used dropped first
+    MAX_DIR_LISTINGS: Final[int] = 64
+
     DEFAULT_CSS = """
     AutoCompleteDropdown {
         width: 100%;
@@ -64,6 +77,11 @@ class AutoCompleteDropdown(Container):
         self.command_candidates = command_candidates or []
         self._current_completion_type = CompletionType.NONE
         self._completion_items: list[CompletionItem] = []
+        self._file_index: FileIndex | None = None
+        # directory -> (mtime, sorted (name, is_dir) entries)
+        self._dir_listings: OrderedDict[Path, tuple[int, list[tuple[str, bool]]]] = (
+            OrderedDict()
+        )
 
     def compose(self) -> ComposeResult:
         """Create the options list for autocomplete."""
@@ -211,55 +229,111 @@ class AutoCompleteDropdown(Container):
         return candidates
 
     def _get_file_candidates(self, text: str) -> list[CompletionItem]:
-        """Get file path candidates for @ paths."""
+        """Get file path candidates for @ paths.
+
+        Entries of the typed directory whose name starts with the typed
+        prefix come first, followed by fuzzy full-path matches from the
+        background file index.
+        """
         at_index = text.rfind("@")
         path_part = text[at_index + 1 :]
+        work_dir = Path(get_work_dir())
 
         # Determine the directory to search
         if "/" in path_part:
             dir_part = "/".join(path_part.split("/")[:-1])
-            search_dir = Path(get_work_dir()) / dir_part
+            search_dir = work_dir / dir_part
             filename_part = path_part.split("/")[-1]
         else:
-            search_dir = Path(get_work_dir())
+            search_dir = work_dir
             filename_part = path_part
 
         candidates = []
+        seen: set[str] = set()
+
+        for name, is_dir in self._list_dir(search_dir):
+            # Skip hidden files unless specifically typing them
+            if name.startswith(".") and not filename_part.startswith("."):
+                continue
+
+            # Match against filename part
+            if not name.lower().startswith(filename_part.lower()):
+                continue
+
+            try:
+                rel_path = (search_dir / name).relative_to(work_dir)
+            except ValueError:
+                continue
+            path_str = str(rel_path)
+            prefix = "📁 " if is_dir else "📄 "
+            if is_dir:
+                path_str += "/"
+
+            display = f"{prefix}@{path_str}"
+            candidates.append(
+                CompletionItem(
+                    display_text=display,
+                    completion_value=f"@{path_str}",
+                    completion_type=CompletionType.FILE,
+                )
+            )
+            seen.add(path_str)
 
-        if not (search_dir.exists() and search_dir.is_dir()):
-            return candidates
-
-        try:
-            for item in sorted(search_dir.iterdir()):
-                # Skip hidden files unless specifically typing them
-                if item.name.startswith(".") and not filename_part.startswith("."):
+        if path_part:
+            limit = self.MAX_FILE_CANDIDATES - len(candidates)
+            for path_str in self._get_file_index(work_dir).search(path_part, limit):
+                if path_str in seen:
                     continue
+                candidates.append(
+                    CompletionItem(
+                        display_text=f"📄 @{path_str}",
+                        completion_value=f"@{path_str}",
+                        completion_type=CompletionType.FILE,
+                    )
+                )
 
-                # Match against filename part
-                if not item.name.lower().startswith(filename_part.lower()):
-                    continue
+        return candidates[: self.MAX_FILE_CANDIDATES]
 
-                try:
-                    rel_path = item.relative_to(Path(get_work_dir()))
-                    path_str = str(rel_path)
-                    prefix = "📁 " if item.is_dir() else "📄 "
-                    if item.is_dir():
-                        path_str += "/"
-
-                    display = f"{prefix}@{path_str}"
-                    candidates.append(
-                        CompletionItem(
-                            display_text=display,
-                            completion_value=f"@{path_str}",
-                            completion_type=CompletionType.FILE,
-                        )
-                    )
-                except ValueError:
-                    continue
-        except (OSError, PermissionError):
-            pass
+    def _list_dir(self, search_dir: Path) -> list[tuple[str, bool]]:
+        """List a directory as sorted (name, is_dir) pairs.
 
-        return candidates
+        Listings are cached until the directory's mtime changes, so typing
+        within one directory costs a single stat per keystroke. Directories
+        modified within the last couple of seconds are always listed again,
+        as some file systems only track mtimes with coarse granularity.
+        """
+        try:
+            mtime_ns = search_dir.stat().st_mtime_ns
+        except OSError:
+            return []
+
+        cached = self._dir_listings.get(search_dir)
+        if (
+            cached is not None
+            and cached[0] == mtime_ns
+            and mtime_ns < time.time_ns() - _MTIME_SLACK_NS
+        ):
+            self._dir_listings.move_to_end(search_dir)
+            return cached[1]
+
+        try:
+            entries = [
+                (item.name, item.is_dir()) for item in sorted(search_dir.iterdir())
+            ]
+        except (OSError, PermissionError):
+            return []
+        self._dir_listings[search_dir] = (mtime_ns, entries)
+        self._dir_listings.move_to_end(search_dir)
+        if len(self._dir_listings) > self.MAX_DIR_LISTINGS:
+            self._dir_listings.popitem(last=False)
+        return entries
+
+    def _get_file_index(self, work_dir: Path) -> FileIndex:
+        """Get the file index of the work dir, starting it on first use."""
+        if self._file_index is None or self._file_index.root != work_dir:
+            self._file_index = FileIndex(work_dir)
+            self._file_index.start()
+        return self._file_index
 
     def update_candidates(self) -> None:
         """Update candidates based on current input text."""
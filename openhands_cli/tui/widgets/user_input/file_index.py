@@ -0,0 +1,386 @@
+"""Background file index for ``@`` path completion.
+
+Listing directories on every keystroke stalls typing in large repositories,
+and only completes one directory level at a time. ``FileIndex`` instead
+collects every file under the work dir once, in a background thread, and
+answers fuzzy full-path queries (``tuivis`` matches
+``tui/widgets/richlog_visualizer.py``) from memory.
+
+Inside a git work tree the file list comes from ``git ls-files``, so
+``.gitignore`` rules apply exactly. Elsewhere the tree is walked directly,
+skipping hidden directories and common dependency/cache directories.
+
+The index notices changes by polling directory mtimes, at most every
+``POLL_INTERVAL_SECONDS`` while completions are requested. Walked trees only
+rescan the directories that changed; git trees are listed again.
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+import re
+import subprocess
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+
+# Minimum time between two checks of the directory mtimes.
+POLL_INTERVAL_SECONDS = 2.0
+
+# Files beyond this count are left out of the index.
+MAX_INDEXED_FILES = 500_000
+
+# Number of matches collected per search before ranking.
+RANK_POOL = 500
+
+# Time a single search may spend scanning for fuzzy matches. Searches that
+# run out of time return the matches found so far.
+SEARCH_BUDGET_SECONDS = 0.004
+
+# Number of paths scanned between two checks of the search budget.
+_SCAN_CHUNK_PATHS = 2000
+
+_GIT_TIMEOUT_SECONDS = 10
+
+# Directories never descended into when walking a tree without git.
+_SKIPPED_DIRS = frozenset(
+    {"node_modules", "__pycache__", "venv", "env", "build", "dist", "target"}
+)
+
+
+class _Snapshot(NamedTuple):
+    """Immutable state of the index, swapped atomically on refresh."""
+
+    paths: list[str]
+    lower_paths: list[str]
+    corpus: str
+    starts: list[int]
+    files_by_dir: dict[str, list[str]]
+    dir_mtimes: dict[str, int]
+    from_git: bool
+
+
+class FileIndex:
+    """Fuzzy-searchable index of the files under a directory."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._snapshot: _Snapshot | None = None
+        # Held while a refresh runs, so at most one runs at a time.
+        self._refresh_lock = threading.Lock()
+        self._last_check = 0.0
+        # Query and all matching ids of the last search that saw every match.
+        self._complete: tuple[_Snapshot, str, list[int]] | None = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether the index has been built."""
+        return self._snapshot is not None
+
+    def start(self) -> None:
+        """Build or refresh the index in a background thread.
+
+        Does nothing if a refresh is already running.
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        thread = threading.Thread(
+            target=self._refresh_in_background, name="file-index", daemon=True
+        )
+        thread.start()
+
+    def refresh(self) -> None:
+        """Build or refresh the index in the calling thread."""
+        with self._refresh_lock:
+            self._refresh()
+
+    def search(self, query: str, limit: int) -> list[str]:
+        """Find indexed files matching a query.
+
+        Files whose name contains the query rank first, then files whose
+        path contains it, then fuzzy matches whose letters appear in order.
+        The fuzzy scan stops after ``SEARCH_BUDGET_SECONDS``, so in very large
+        trees rare fuzzy matches may only show up once the query narrows.
+
+        Args:
+            query: Path fragment typed after ``@`` (case-insensitive).
+            limit: Maximum number of results.
+
+        Returns:
+            Matching paths relative to the root, best match first. Empty
+            while the index is still being built.
+        """
+        if time.monotonic() - self._last_check >= POLL_INTERVAL_SECONDS:
+            self.start()
+
+        snapshot = self._snapshot
+        query = query.lower()
+        if snapshot is None or not query or limit <= 0:
+            return []
+
+        complete = self._complete
+        if (
+            complete is not None
+            and complete[0] is snapshot
+            and query.startswith(complete[1])
+        ):
+            pattern = _subsequence_pattern(query)
+            lower_paths = snapshot.lower_paths
+            matches = [i for i in complete[2] if pattern.search(lower_paths[i])]
+            is_complete = True
+        else:
+            matches, is_complete = _scan(snapshot, query)
+
+        self._complete = (snapshot, query, matches) if is_complete else None
+
+        pattern = _subsequence_pattern(query)
+        ranked = sorted(
+            matches, key=lambda i: _rank(snapshot.lower_paths[i], query, pattern)
+        )
+        return [snapshot.paths[i] for i in ranked[:limit]]
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self._refresh()
+        except Exception:
+            # A failed refresh keeps the previous snapshot; retried on poll.
+            pass
+        finally:
+            self._refresh_lock.release()
+
+    def _refresh(self) -> None:
+        self._last_check = time.monotonic()
+        snapshot = self._snapshot
+        if snapshot is None:
+            self._snapshot = self._build()
+            return
+
+        changed = [
+            rel_dir
+            for rel_dir, mtime_ns in snapshot.dir_mtimes.items()
+            if _mtime_ns(self.root / rel_dir) != mtime_ns
+        ]
+        if not changed:
+            return
+        if snapshot.from_git:
+            self._snapshot = self._build()
+            return
+
+        # Rescan only the subtrees of directories that changed. Parents sort
+        # first, so subdirectories of a rescanned directory are skipped.
+        files_by_dir = dict(snapshot.files_by_dir)
+        dir_mtimes = dict(snapshot.dir_mtimes)
+        rescanned: list[str] = []
+        for rel_dir in sorted(changed):
+            if any(_is_within(rel_dir, parent) for parent in rescanned):
+                continue
+            rescanned.append(rel_dir)
+            for mapping in (files_by_dir, dir_mtimes):
+                for key in [k for k in mapping if _is_within(k, rel_dir)]:
+                    del mapping[key]
+            self._walk(rel_dir, files_by_dir, dir_mtimes)
+        self._snapshot = _make_snapshot(files_by_dir, dir_mtimes, from_git=False)
+
+    def _build(self) -> _Snapshot:
+        files_by_dir: dict[str, list[str]] = {}
+        dir_mtimes: dict[str, int] = {}
+
+        git_files = self._list_git_files()
+        if git_files is None:
+            self._walk("", files_by_dir, dir_mtimes)
+            return _make_snapshot(files_by_dir, dir_mtimes, from_git=False)
+
+        for path in git_files[:MAX_INDEXED_FILES]:
+            rel_dir, _, name = path.rpartition("/")
+            files_by_dir.setdefault(rel_dir, []).append(name)
+        dirs = {""}
+        for rel_dir in files_by_dir:
+            while rel_dir and rel_dir not in dirs:
+                dirs.add(rel_dir)
+                rel_dir = rel_dir.rpartition("/")[0]
+        for rel_dir in dirs:
+            dir_mtimes[rel_dir] = _mtime_ns(self.root / rel_dir)
+        return _make_snapshot(files_by_dir, dir_mtimes, from_git=True)
+
+    def _list_git_files(self) -> list[str] | None:
+        """List tracked and untracked, non-ignored files via git.
+
+        Returns:
+            Paths relative to the root, or None if git cannot list them.
+        """
+        try:
+            result = subprocess.run(
+                [
+                    "git",
+                    "-C",
+                    str(self.root),
+                    "ls-files",
+                    "-z",
+                    "--cached",
+                    "--others",
+                    "--exclude-standard",
+                ],
+                capture_output=True,
+                timeout=_GIT_TIMEOUT_SECONDS,
+                check=True,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        output = result.stdout.decode("utf-8", errors="surrogateescape")
+        return sorted(set(filter(None, output.split("\0"))))
+
+    def _walk(
+        self,
+        rel_dir: str,
+        files_by_dir: dict[str, list[str]],
+        dir_mtimes: dict[str, int],
+    ) -> None:
+        """Add the files under ``rel_dir`` (recursively) to the mappings."""
+        count = sum(len(names) for names in files_by_dir.values())
+        pending = [rel_dir]
+        while pending and count < MAX_INDEXED_FILES:
+            current = pending.pop()
+            directory = self.root / current
+            names: list[str] = []
+            try:
+                dir_mtimes[current] = directory.stat().st_mtime_ns
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.name.startswith("."):
+                            continue
+                        rel_path = f"{current}/{entry.name}" if current else entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _SKIPPED_DIRS:
+                                pending.append(rel_path)
+                        else:
+                            names.append(entry.name)
+            except OSError:
+                continue
+            files_by_dir[current] = names
+            count += len(names)
+
+
+def _make_snapshot(
+    files_by_dir: dict[str, list[str]],
+    dir_mtimes: dict[str, int],
+    from_git: bool,
+) -> _Snapshot:
+    paths = sorted(
+        f"{rel_dir}/{name}" if rel_dir else name
+        for rel_dir, names in files_by_dir.items()
+        for name in names
+    )
+    lower_paths = [path.lower() for path in paths]
+    corpus = "\n".join(lower_paths)
+    starts: list[int] = []
+    position = 0
+    for path in lower_paths:
+        starts.append(position)
+        position += len(path) + 1
+    return _Snapshot(
+        paths=paths,
+        lower_paths=lower_paths,
+        corpus=corpus,
+        starts=starts,
+        files_by_dir=files_by_dir,
+        dir_mtimes=dir_mtimes,
+        from_git=from_git,
+    )
+
+
+def _scan(snapshot: _Snapshot, query: str) -> tuple[list[int], bool]:
+    """Collect candidate ids from the whole index, within the search budget.
+
+    Returns:
+        Candidate ids and whether they are all the matches of the query.
+    """
+    started = time.perf_counter()
+    corpus = snapshot.corpus
+    # A letter that appears nowhere rules out any match, cheaply.
+    if any(c not in corpus for c in set(query)):
+        return [], True
+
+    # Substring matches first (with half of the budget), so they are not
+    # crowded out of the pool by fuzzy matches.
+    matches: list[int] = []
+    complete = True
+    deadline = started + SEARCH_BUDGET_SECONDS / 2
+    for begin, end in _chunks(snapshot):
+        # The first chunk is always scanned, so every search makes progress.
+        if begin and time.perf_counter() > deadline:
+            complete = False
+            break
+        position = corpus.find(query, begin, end)
+        while position != -1:
+            i = bisect.bisect_right(snapshot.starts, position) - 1
+            matches.append(i)
+            if len(matches) >= RANK_POOL:
+                return matches, False
+            next_start = snapshot.starts[i] + len(snapshot.lower_paths[i])
+            position = corpus.find(query, next_start, end)
+
+    seen = set(matches)
+    pattern = re.compile("^" + _subsequence_regex(query), re.MULTILINE)
+    deadline = started + SEARCH_BUDGET_SECONDS
+    for begin, end in _chunks(snapshot):
+        if begin and time.perf_counter() > deadline:
+            return matches, False
+        for match in pattern.finditer(corpus, begin, end):
+            i = bisect.bisect_right(snapshot.starts, match.start()) - 1
+            if i in seen:
+                continue
+            matches.append(i)
+            if len(matches) >= RANK_POOL:
+                return matches, False
+    return matches, complete
+
+
+def _chunks(snapshot: _Snapshot) -> Iterator[tuple[int, int]]:
+    """Split the corpus into ``(begin, end)`` ranges of whole paths."""
+    starts = snapshot.starts
+    for first in range(0, len(starts), _SCAN_CHUNK_PATHS):
+        last = first + _SCAN_CHUNK_PATHS
+        end = starts[last] if last < len(starts) else len(snapshot.corpus)
+        yield starts[first], end
+
+
+def _rank(path: str, query: str, pattern: re.Pattern[str]) -> tuple[int, int, int, str]:
+    """Sort key of a matching lowercased path (lower is better)."""
+    name_start = path.rfind("/") + 1
+    if path.find(query, name_start) != -1:
+        return (0, 0, len(path), path)
+    if query in path:
+        return (1, 0, len(path), path)
+    # Prefer fuzzy matches that end in the file name and are compact.
+    match = pattern.search(path, name_start) or pattern.search(path)
+    spread = match.end() - match.start() - len(query) if match else len(path)
+    return (2, spread, len(path), path)
+
+
+def _subsequence_regex(query: str) -> str:
+    """Regex for the letters of ``query`` in order within one line.
+
+    Each gap excludes the next letter and newlines, so matching is linear.
+    """
+    return "".join(f"[^{re.escape(c)}\\n]*{re.escape(c)}" for c in query)
+
+
+def _subsequence_pattern(query: str) -> re.Pattern[str]:
+    first = re.escape(query[0])
+    return re.compile(first + _subsequence_regex(query[1:]))
+
+
+def _is_within(rel_path: str, rel_dir: str) -> bool:
+    """Check whether a relative path is ``rel_dir`` or below it."""
+    return not rel_dir or rel_path == rel_dir or rel_path.startswith(rel_dir + "/")
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark listing of locally stored conversations.
+
+Creates synthetic conversation directories (1k and 10k by default) in a
+temporary directory and times ``LocalFileStore.list_conversations``:
+
+- cold: no metadata index, every directory is parsed
+- warm: index up to date, only directory mtimes are checked
+
+Each scenario runs with the default thread pool and serially (one worker),
+so the effect of the parallel scan is visible. Use ``--dir`` to benchmark on a
+specific file system (e.g. an NFS mount).
+
+Usage:
+    uv run python scripts/bench_list_conversations.py [--sizes 1000 10000]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+import openhands_cli.conversations.store.local as local_store
+from openhands_cli.conversations.store.index import INDEX_FILENAME
+from openhands_cli.conversations.store.local import LocalFileStore
+
+
+EVENTS_PER_CONVERSATION = 20
+# Backdate directory mtimes so the index trusts them in the warm runs.
+BACKDATE_SECONDS = 3600
+
+
+def create_conversations(base_dir: Path, count: int) -> None:
+    """Create `count` synthetic conversations with a few events each."""
+    mtime = time.time() - BACKDATE_SECONDS
+    for i in range(count):
+        events_dir = base_dir / uuid.uuid4().hex / "events"
+        events_dir.mkdir(parents=True)
+        for j in range(EVENTS_PER_CONVERSATION):
+            source = "user" if j % 2 else "agent"
+            event = {
+                "id": f"{i}-{j}",
+                "kind": "MessageEvent",
+                "timestamp": f"2024-01-01T{i % 24:02d}:{j % 60:02d}:00Z",
+                "source": source,
+                "llm_message": {
+                    "role": "user" if source == "user" else "assistant",
+                    "content": [{"type": "text", "text": f"Message {j} of {i}"}],
+                },
+            }
+            with open(events_dir / f"event-{j:05d}-{i}-{j}.json", "w") as f:
+                json.dump(event, f)
+        os.utime(events_dir, (mtime, mtime))
+
+
+def timed_list(store: LocalFileStore, workers: int, cold: bool) -> float:
+    local_store.LIST_MAX_WORKERS = workers
+    if cold:
+        (store.base_dir / INDEX_FILENAME).unlink(missing_ok=True)
+    start = time.perf_counter()
+    store.list_conversations(limit=100)
+    return time.perf_counter() - start
+
+
+def run(sizes: list[int], root: Path | None) -> None:
+    default_workers = local_store.LIST_MAX_WORKERS
+    for size in sizes:
+        base_dir = Path(tempfile.mkdtemp(prefix="oh-bench-", dir=root))
+        try:
+            create_conversations(base_dir, size)
+            store = LocalFileStore(base_dir=str(base_dir))
+            print(f"\n{size} conversations ({EVENTS_PER_CONVERSATION} events each)")
+            for workers in (default_workers, 1):
+                cold = timed_list(store, workers, cold=True)
+                warm = timed_list(store, workers, cold=False)
+                print(
+                    f"  workers={workers:<3} cold: {cold * 1000:9.1f} ms"
+                    f"   warm: {warm * 1000:9.1f} ms"
+                )
+        finally:
+            shutil.rmtree(base_dir, ignore_errors=True)
+    local_store.LIST_MAX_WORKERS = default_workers
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").partition("\n")[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1000, 10000], metavar="N"
+    )
+    parser.add_argument(
+        "--dir", type=Path, default=None, help="Directory to create data in"
+    )
+    args = parser.parse_args()
+    run(args.sizes, args.dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Generate the provider/model catalogue snapshot used by the settings screen.
+
+Builds the catalogue from litellm and the SDK model lists, and writes it with
+the versions it was built from, so that the settings screen can list providers
+and models without importing litellm. Run by ``build.py`` before packaging.
+
+Usage:
+    uv run python scripts/generate_model_catalog.py [--output PATH]
+"""
+
+import argparse
+from importlib.metadata import version
+from pathlib import Path
+
+from openhands_cli.tui.modals.settings.choices import (
+    CATALOG_PATH,
+    SNAPSHOT_DISTRIBUTIONS,
+    build_catalog,
+    write_snapshot,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").partition("\n")[0])
+    parser.add_argument("--output", type=Path, default=CATALOG_PATH)
+    args = parser.parse_args()
+
+    catalog = build_catalog()
+    versions = {key: version(dist) for key, dist in SNAPSHOT_DISTRIBUTIONS.items()}
+    write_snapshot(catalog, args.output, **versions)
+    model_count = sum(len(models) for models in catalog.models.values())
+    print(
+        f"Wrote {len(catalog.providers)} providers and {model_count} models "
+        f"to {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
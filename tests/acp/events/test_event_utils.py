@@ -6,14 +6,22 @@ ToolCallState. See test_tool_state.py for those tests.
 
 from __future__ import annotations
 
+import gc
+from types import SimpleNamespace
+from unittest.mock import Mock
+
 import pytest
 
+from openhands.sdk.conversation.conversation_stats import ConversationStats
+from openhands.sdk.llm.utils.metrics import Metrics, TokenUsage
 from openhands.tools.delegate.definition import DelegateAction
 from openhands.tools.file_editor.definition import FileEditorAction
 from openhands.tools.task_tracker import TaskTrackerAction
 from openhands.tools.terminal import TerminalAction
+from openhands_cli.acp_impl.events import utils as event_utils
 from openhands_cli.acp_impl.events.utils import (
     format_content_blocks,
+    get_metadata,
     get_tool_kind,
     get_tool_title,
 )
@@ -169,3 +177,86 @@ class TestFormatContentBlocks:
         assert result is not None
         assert len(result) == 1
         assert result[0].content.text == "Hello, world!"
+
+
+class TestGetMetadataCache:
+    @staticmethod
+    def _conversation(prompt_tokens: int):
+        llm_metrics = SimpleNamespace(token_usages=[object()], costs=[])
+        conversation = Mock()
+        stats = conversation.conversation_stats
+        stats.usage_to_metrics = {"agent": llm_metrics}
+        stats.get_combined_metrics.return_value = SimpleNamespace(
+            accumulated_cost=0.5,
+            accumulated_token_usage=SimpleNamespace(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=10,
+                cache_read_tokens=0,
+                reasoning_tokens=0,
+            ),
+        )
+        return conversation, llm_metrics
+
+    def test_reused_until_new_usage_is_reported(self):
+        conversation, llm_metrics = self._conversation(100)
+        stats = conversation.conversation_stats
+
+        first = get_metadata(conversation)
+        assert get_metadata(conversation) is first
+        assert stats.get_combined_metrics.call_count == 1
+
+        stats.get_combined_metrics.return_value.accumulated_token_usage = (
+            SimpleNamespace(
+                prompt_tokens=250,
+                completion_tokens=20,
+                cache_read_tokens=0,
+                reasoning_tokens=0,
+            )
+        )
+        llm_metrics.token_usages.append(object())
+
+        updated = get_metadata(conversation)
+        assert updated is not None
+        assert updated["openhands.dev/metrics"]["input_tokens"] == 250
+        assert stats.get_combined_metrics.call_count == 2
+
+    def test_cached_per_conversation(self):
+        first, _ = self._conversation(100)
+        second, _ = self._conversation(200)
+
+        first_meta = get_metadata(first)
+        second_meta = get_metadata(second)
+        assert first_meta is not None and second_meta is not None
+        assert first_meta["openhands.dev/metrics"]["input_tokens"] == 100
+        assert second_meta["openhands.dev/metrics"]["input_tokens"] == 200
+
+    def test_not_cached_without_usage_records(self):
+        conversation = Mock()
+        stats = conversation.conversation_stats
+        stats.get_combined_metrics.return_value = None
+
+        assert get_metadata(conversation) is None
+        assert get_metadata(conversation) is None
+        assert stats.get_combined_metrics.call_count == 2
+
+    def test_cached_for_real_conversation_stats(self):
+        usage = TokenUsage(prompt_tokens=100, completion_tokens=10)
+        metrics = Metrics()
+        metrics.accumulated_cost = 0.5
+        metrics.accumulated_token_usage = usage
+        metrics.token_usages = [usage]
+        conversation = Mock()
+        conversation.conversation_stats = ConversationStats(
+            usage_to_metrics={"agent": metrics}
+        )
+
+        first = get_metadata(conversation)
+        assert first is not None
+        assert first["openhands.dev/metrics"]["input_tokens"] == 100
+        assert get_metadata(conversation) is first
+
+        key = id(conversation.conversation_stats)
+        assert key in event_utils._metadata_cache
+        del conversation.conversation_stats
+        gc.collect()
+        assert key not in event_utils._metadata_cache
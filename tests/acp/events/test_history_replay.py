@@ -0,0 +1,95 @@
+"""Tests for paged replay of conversation history."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from openhands.sdk import Message, TextContent
+from openhands.sdk.event import MessageEvent
+from openhands_cli.acp_impl.events.history_replay import (
+    HISTORY_REPLAY_META_KEY,
+    get_recent_turns,
+    recent_turns_start,
+    replay_history,
+)
+
+
+def _message(source: str, text: str) -> MessageEvent:
+    role = "user" if source == "user" else "assistant"
+    return MessageEvent(
+        source=source,  # type: ignore[arg-type]
+        llm_message=Message(role=role, content=[TextContent(text=text)]),
+    )
+
+
+EVENTS = [
+    _message("agent", "welcome"),
+    _message("user", "q0"),
+    _message("agent", "a0"),
+    _message("user", "q1"),
+    _message("agent", "a1"),
+    _message("user", "q2"),
+    _message("agent", "a2"),
+]
+
+
+@pytest.mark.parametrize(
+    ("turns", "end", "expected"),
+    [(1, None, 5), (2, None, 3), (3, None, 1), (10, None, 0), (1, 5, 3), (1, 1, 0)],
+)
+def test_recent_turns_start(turns: int, end: int | None, expected: int):
+    assert recent_turns_start(EVENTS, turns, end) == expected
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [
+        ({}, None),
+        ({HISTORY_REPLAY_META_KEY: {"recentTurns": 3}}, 3),
+        ({HISTORY_REPLAY_META_KEY: {"recentTurns": 0}}, None),
+        ({HISTORY_REPLAY_META_KEY: {"recentTurns": True}}, None),
+        ({HISTORY_REPLAY_META_KEY: True}, None),
+    ],
+)
+def test_get_recent_turns(kwargs: dict, expected: int | None):
+    assert get_recent_turns(kwargs) == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("page_size", [1, 2, 50])
+async def test_replay_preserves_order_across_pages(page_size: int):
+    conn = AsyncMock()
+    sent = await replay_history(
+        conn, "session", EVENTS, start=1, end=6, page_size=page_size
+    )
+
+    texts = [
+        call.kwargs["update"].content.text
+        for call in conn.session_update.call_args_list
+    ]
+    assert sent == len(texts)
+    joined = "".join(texts)
+    assert joined.index("a0") < joined.index("a1")
+    assert "welcome" not in joined
+    assert "a2" not in joined
+    assert all(
+        call.kwargs["session_id"] == "session"
+        for call in conn.session_update.call_args_list
+    )
+
+
+@pytest.mark.asyncio
+async def test_replay_coalesces_consecutive_messages():
+    conn = AsyncMock()
+    sent = await replay_history(conn, "session", EVENTS, field_meta={"k": 1})
+
+    # User messages are not echoed, so all agent replies form a single chunk
+    assert sent == 1
+    assert conn.session_update.call_args.kwargs["field_meta"] == {"k": 1}
+
+
+@pytest.mark.asyncio
+async def test_replay_of_empty_range_sends_nothing():
+    conn = AsyncMock()
+    assert await replay_history(conn, "session", EVENTS, start=3, end=3) == 0
+    conn.session_update.assert_not_called()
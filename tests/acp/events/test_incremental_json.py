@@ -0,0 +1,97 @@
+"""Tests for IncrementalJSONObject (chunked parsing of tool call arguments)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from openhands_cli.acp_impl.events.incremental_json import IncrementalJSONObject
+
+
+DOCUMENTS = [
+    "{}",
+    '{"command": "ls -la", "is_input": false, "timeout": 10.5}',
+    '{"path": "/tmp/a.py", "file_text": "print(\\"hi\\")\\n\\tx = \'\\\\\'\\n"}',
+    '{"thought": "caf\\u00e9 \\ud83d\\ude00 \\/ done"}',
+    '{"command":"spawn","ids":["a","b"],"tasks":{"a":{"x":[1,{"y":"}]"}]}}}',
+    ' {\n  "empty": "",\n  "none": null,\n  "neg": -3e2\n}\n',
+]
+
+
+def feed_in_chunks(text: str, size: int) -> IncrementalJSONObject:
+    parser = IncrementalJSONObject()
+    for i in range(0, len(text), size):
+        parser.feed(text[i : i + size])
+    return parser
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 1000])
+def test_chunked_parse_matches_json_loads(document: str, size: int):
+    parser = feed_in_chunks(document, size)
+    expected = json.loads(document)
+
+    assert parser.complete
+    assert not parser.failed
+    for key, value in expected.items():
+        assert key in parser
+        assert parser.get(key) == value
+
+
+def test_partial_values_are_available_while_streaming():
+    parser = IncrementalJSONObject()
+    parser.feed('{"command": "vi')
+    assert parser.get("command") == "vi"
+    assert not parser.complete
+
+    parser.feed('ew", "ids": ["a", "b')
+    assert parser.get("command") == "view"
+    assert parser.get("ids") == ["a", "b"]
+    assert parser.get("path") is None
+
+
+def test_string_delta_returns_only_new_text():
+    parser = IncrementalJSONObject()
+    parser.feed('{"file_text": "ab')
+    assert parser.string_delta("file_text") == "ab"
+    assert parser.string_delta("file_text") == ""
+
+    parser.feed('c\\nd", "command": "create"}')
+    assert parser.string_delta("file_text") == "c\nd"
+    assert parser.string_delta("command") == "create"
+    assert parser.string_delta("missing") == ""
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("", False),
+        ('{"command"', False),
+        ('{"command": ', False),
+        ('{"command": ""', False),
+        ('{"command": nu', False),
+        ('{"command": "l', True),
+        ('{"timeout": 0', True),
+        ('{"ids": [', True),
+    ],
+)
+def test_has_content(text: str, expected: bool):
+    parser = IncrementalJSONObject()
+    parser.feed(text)
+    assert parser.has_content() is expected
+
+
+@pytest.mark.parametrize("text", ["[1, 2]", '{"a" 1}', '{"a": 1,}', '{"a": "\\q"}'])
+def test_invalid_json_stops_parsing(text: str):
+    parser = IncrementalJSONObject()
+    parser.feed(text)
+    assert parser.failed
+    assert not parser.complete
+
+
+def test_fields_read_before_an_error_are_kept():
+    parser = IncrementalJSONObject()
+    parser.feed('{"command": "ls"} trailing')
+    assert parser.failed
+    assert parser.get("command") == "ls"
@@ -0,0 +1,113 @@
+"""Tests for coalescing streamed ACP updates."""
+
+from acp import (
+    start_tool_call,
+    update_agent_message_text,
+    update_agent_thought_text,
+    update_tool_call,
+)
+from acp.schema import (
+    AgentMessageChunk,
+    AgentThoughtChunk,
+    TextContentBlock,
+    ToolCallStart,
+)
+
+from openhands_cli.acp_impl.events.stream_buffer import StreamBuffer
+from openhands_cli.acp_impl.events.utils import (
+    TOOL_CALL_DELTA_META_KEY,
+    get_tool_call_delta,
+)
+
+
+def _delta(tool_call_id: str, text: str, title: str | None = None):
+    update = update_tool_call(tool_call_id, title=title)
+    return update.model_copy(
+        update={"field_meta": {TOOL_CALL_DELTA_META_KEY: {"append": text}}}
+    )
+
+
+def _text(update) -> str:
+    assert isinstance(update, AgentMessageChunk | AgentThoughtChunk)
+    assert isinstance(update.content, TextContentBlock)
+    return update.content.text
+
+
+def test_consecutive_text_chunks_are_concatenated():
+    buffer = StreamBuffer()
+    buffer.add(update_agent_thought_text("Let me "))
+    buffer.add(update_agent_thought_text("think"))
+    buffer.add(update_agent_message_text("Hello "))
+    size = buffer.add(update_agent_message_text("world"))
+
+    updates = buffer.drain()
+
+    assert size == len("Let me thinkHello world")
+    assert [u.session_update for u in updates] == [
+        "agent_thought_chunk",
+        "agent_message_chunk",
+    ]
+    assert _text(updates[0]) == "Let me think"
+    assert _text(updates[1]) == "Hello world"
+    assert len(buffer) == 0
+    assert buffer.text_size == 0
+
+
+def test_only_adjacent_updates_are_merged():
+    buffer = StreamBuffer()
+    buffer.add(update_agent_message_text("a"))
+    buffer.add(update_agent_thought_text("b"))
+    buffer.add(update_agent_message_text("c"))
+
+    assert [_text(u) for u in buffer.drain()] == ["a", "b", "c"]
+
+
+def test_tool_call_updates_merge_into_latest_fields():
+    buffer = StreamBuffer()
+    buffer.add(start_tool_call("call-1", "Run", kind="execute", status="in_progress"))
+    buffer.add(update_tool_call("call-1", title="Run ls"))
+    buffer.add(update_tool_call("call-1", title="Run ls -la", status="in_progress"))
+    buffer.add(update_tool_call("call-2", title="Other"))
+
+    updates = buffer.drain()
+
+    assert len(updates) == 2
+    start = updates[0]
+    assert isinstance(start, ToolCallStart)
+    assert start.tool_call_id == "call-1"
+    assert start.title == "Run ls -la"
+    assert start.kind == "execute"
+    assert updates[1].tool_call_id == "call-2"
+
+
+def test_message_after_tool_call_is_not_merged():
+    buffer = StreamBuffer()
+    buffer.add(update_tool_call("call-1", title="Run"))
+    buffer.add(update_agent_message_text("Done"))
+
+    updates = buffer.drain()
+
+    assert len(updates) == 2
+    assert isinstance(updates[1], AgentMessageChunk)
+
+
+def test_argument_deltas_are_joined():
+    buffer = StreamBuffer()
+    buffer.add(start_tool_call("call-1", "Run", content=None))
+    buffer.add(_delta("call-1", '{"comm', title="Run ls"))
+    buffer.add(_delta("call-1", 'and": "ls"}'))
+
+    updates = buffer.drain()
+
+    assert len(updates) == 2
+    assert get_tool_call_delta(updates[0]) is None
+    assert get_tool_call_delta(updates[1]) == '{"command": "ls"}'
+    assert updates[1].title == "Run ls"
+
+
+def test_argument_deltas_and_snapshots_are_not_merged():
+    buffer = StreamBuffer()
+    buffer.add(_delta("call-1", "a"))
+    buffer.add(update_tool_call("call-1", title="Done"))
+
+    assert len(buffer.drain()) == 2
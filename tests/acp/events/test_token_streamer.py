@@ -10,16 +10,19 @@ import pytest
 from acp.schema import (
     AgentMessageChunk,
     AgentThoughtChunk,
+    ContentToolCallContent,
+    TextContentBlock,
     ToolCallProgress,
     ToolCallStart,
 )
 
 from openhands.sdk import TextContent
-from openhands.sdk.event import ActionEvent, ObservationEvent
+from openhands.sdk.event import ActionEvent, ObservationEvent, PauseEvent
 from openhands.sdk.llm import MessageToolCall
 from openhands.tools.terminal import TerminalAction, TerminalObservation
 from openhands_cli.acp_impl.events.token_streamer import TokenBasedEventSubscriber
 from openhands_cli.acp_impl.events.tool_state import ToolCallState
+from openhands_cli.acp_impl.events.utils import TOOL_CALL_DELTA_META_KEY
 
 
 @pytest.fixture
@@ -680,6 +683,131 @@ class TestScheduleUpdate:
         loop.close()
 
 
+class TestStreamCoalescing:
+    async def test_chunks_from_worker_thread_are_sent_together(self, mock_connection):
+        subscriber = TokenBasedEventSubscriber(
+            session_id="test-session",
+            conn=mock_connection,
+            loop=asyncio.get_running_loop(),
+            flush_interval=0.01,
+        )
+
+        def stream():
+            for text in ("Hel", "lo ", "world"):
+                subscriber.on_token(_chunk(content=text))
+
+        await asyncio.to_thread(stream)
+        await asyncio.sleep(0.05)
+
+        assert mock_connection.session_update.call_count == 1
+        update = mock_connection.session_update.call_args.kwargs["update"]
+        assert isinstance(update, AgentMessageChunk)
+        assert update.content.text == "Hello world"
+
+    async def test_size_threshold_flushes_before_interval(self, mock_connection):
+        subscriber = TokenBasedEventSubscriber(
+            session_id="test-session",
+            conn=mock_connection,
+            loop=asyncio.get_running_loop(),
+            flush_interval=60,
+            flush_max_chars=5,
+        )
+
+        await asyncio.to_thread(subscriber.on_token, _chunk(content="Hello!"))
+        await asyncio.sleep(0.01)
+
+        assert mock_connection.session_update.call_count == 1
+
+    async def test_event_boundary_flushes_buffered_chunks_first(self, mock_connection):
+        subscriber = TokenBasedEventSubscriber(
+            session_id="test-session",
+            conn=mock_connection,
+            loop=asyncio.get_running_loop(),
+            flush_interval=60,
+        )
+
+        await asyncio.to_thread(subscriber.on_token, _chunk(reasoning="Hmm"))
+        await asyncio.to_thread(subscriber.on_token, _chunk(content="Done"))
+        assert not mock_connection.session_update.called
+
+        await subscriber.unstreamed_event_handler(PauseEvent(source="user"))
+
+        updates = [
+            c.kwargs["update"] for c in mock_connection.session_update.call_args_list
+        ]
+        assert [u.session_update for u in updates] == [
+            "agent_thought_chunk",
+            "agent_message_chunk",
+            "agent_thought_chunk",
+        ]
+        assert updates[1].content.text == "Done"
+
+
+class TestToolCallArgumentStreaming:
+    def _stream_terminal_call(self, subscriber, event_loop, pieces):
+        chunks = [
+            _tool_call(
+                index=0, tool_call_id="call-1", name="terminal", arguments=pieces[0]
+            )
+        ] + [_tool_call(index=0, arguments=piece) for piece in pieces[1:]]
+        with patch.object(event_loop, "is_running", return_value=False):
+            for tool_call in chunks:
+                subscriber.on_token(_chunk(tool_calls=[tool_call]))
+
+    def test_delta_mode_sends_only_appended_arguments(
+        self, mock_connection, event_loop
+    ):
+        subscriber = TokenBasedEventSubscriber(
+            session_id="test-session",
+            conn=mock_connection,
+            loop=event_loop,
+            tool_call_deltas=True,
+        )
+
+        self._stream_terminal_call(
+            subscriber, event_loop, ['{"command":"l', "s -l", 'a"}']
+        )
+
+        updates = [
+            c.kwargs["update"] for c in mock_connection.session_update.call_args_list
+        ]
+        start = updates[0]
+        assert isinstance(start, ToolCallStart) and start.content is not None
+        block = start.content[0]
+        assert isinstance(block, ContentToolCallContent)
+        assert isinstance(block.content, TextContentBlock)
+        assert block.content.text == '{"command":"l'
+        appended, titles = [], []
+        for update in updates[1:]:
+            assert isinstance(update, ToolCallProgress)
+            assert update.content is None
+            assert update.field_meta is not None
+            appended.append(update.field_meta[TOOL_CALL_DELTA_META_KEY]["append"])
+            titles.append(update.title)
+        assert appended == ["s -l", 'a"}']
+        # Title is only sent again when it changed
+        assert titles == ["ls -l", "ls -la"]
+
+    def test_snapshot_mode_throttles_full_arguments(self, mock_connection, event_loop):
+        subscriber = TokenBasedEventSubscriber(
+            session_id="test-session",
+            conn=mock_connection,
+            loop=event_loop,
+            snapshot_interval=60,
+        )
+
+        self._stream_terminal_call(
+            subscriber, event_loop, ['{"command":"l', "s -l", 'a"}']
+        )
+
+        updates = [
+            c.kwargs["update"] for c in mock_connection.session_update.call_args_list
+        ]
+        # Start plus a single snapshot within the interval
+        assert [u.session_update for u in updates] == ["tool_call", "tool_call_update"]
+        assert TOOL_CALL_DELTA_META_KEY not in (updates[1].field_meta or {})
+
+
 def test_terminal_tool_lifecycle_stream_then_action_then_observation(
     mock_connection, event_loop
 ):
@@ -36,38 +36,27 @@ class TestExtractThoughtPiece:
         state.append_args('{"thought":"hi"}')
         assert state.extract_thought_piece() is None
 
-    def test_parse_error_returns_none_and_does_not_update_prev(
-        self, monkeypatch: pytest.MonkeyPatch
-    ):
+    def test_invalid_json_returns_none(self):
         state = ToolCallState("call-1", "think")
-        state.append_args('{"thought":"hi"}')
-
-        monkeypatch.setattr(state.lexer, "complete_json", lambda: "{not json")
+        state.append_args("{not json")
 
         assert state.extract_thought_piece() is None
-        assert state.prev_emitted_thought_chunk == ""
+        assert state.thought_header_emitted is False
 
-    def test_missing_thought_key_returns_none(self, monkeypatch: pytest.MonkeyPatch):
+    def test_missing_thought_key_returns_none(self):
         state = ToolCallState("call-1", "think")
         state.append_args('{"other":"x"}')
 
-        monkeypatch.setattr(state.lexer, "complete_json", lambda: '{"other":"x"}')
-
         assert state.extract_thought_piece() is None
-        assert state.prev_emitted_thought_chunk == ""
 
-    def test_empty_thought_returns_none(self, monkeypatch: pytest.MonkeyPatch):
+    def test_empty_thought_returns_none(self):
         state = ToolCallState("call-1", "think")
         state.append_args('{"thought":""}')
 
-        monkeypatch.setattr(state.lexer, "complete_json", lambda: '{"thought":""}')
-
         assert state.extract_thought_piece() is None
-        assert state.prev_emitted_thought_chunk == ""
+        assert state.thought_header_emitted is False
 
-    def test_incremental_diff_emits_only_new_suffix(
-        self, monkeypatch: pytest.MonkeyPatch
-    ):
+    def test_incremental_diff_emits_only_new_suffix(self):
         """Monotonic growth contract with header on first delta only.
 
         - thought grows: "" -> "hel" -> "hello" -> "hello world"
@@ -76,53 +65,52 @@ class TestExtractThoughtPiece:
         """
         state = ToolCallState("call-1", "think")
 
-        # Deterministic snapshots from best-effort parse after each append.
-        snapshots = iter(
-            [
-                '{"thought":"hel"}',
-                '{"thought":"hello"}',
-                '{"thought":"hello world"}',
-            ]
-        )
-        monkeypatch.setattr(state.lexer, "complete_json", lambda: next(snapshots))
-
         state.append_args('{"thought":"hel')
         out1 = state.extract_thought_piece()
         assert out1 == THOUGHT_HEADER + "hel"
-        assert state.prev_emitted_thought_chunk == "hel"
         assert state.thought_header_emitted is True
 
-        state.append_args('lo"}')
+        state.append_args("lo")
         out2 = state.extract_thought_piece()
         assert out2 == "lo"
-        assert state.prev_emitted_thought_chunk == "hello"
 
         state.append_args(' world"}')
         out3 = state.extract_thought_piece()
         assert out3 == " world"
-        assert state.prev_emitted_thought_chunk == "hello world"
 
-    def test_no_delta_when_thought_unchanged(self, monkeypatch: pytest.MonkeyPatch):
+    def test_no_delta_when_thought_unchanged(self):
         state = ToolCallState("call-1", "think")
 
-        snapshots = iter(
-            [
-                '{"thought":"hello"}',
-                '{"thought":"hello"}',
-            ]
-        )
-        monkeypatch.setattr(state.lexer, "complete_json", lambda: next(snapshots))
-
-        state.append_args('{"thought":"hello"}')
+        state.append_args('{"thought":"hello"')
         out = state.extract_thought_piece()
         assert out == THOUGHT_HEADER + "hello"
-        assert state.prev_emitted_thought_chunk == "hello"
 
         # args can still "grow" by appending irrelevant tokens; thought
         # stays same => no delta
         state.append_args("   ")
         assert state.extract_thought_piece() is None
-        assert state.prev_emitted_thought_chunk == "hello"
+
+    def test_escapes_split_across_chunks_are_decoded(self):
+        state = ToolCallState("call-1", "think")
+        pieces = []
+        for chunk in ['{"thought":"a\\', "nb \\u00", "e9 \\ud83d", '\\ude00"}']:
+            state.append_args(chunk)
+            pieces.append(state.extract_thought_piece() or "")
+
+        assert "".join(pieces) == THOUGHT_HEADER + "a\nb \u00e9 \U0001f600"
+
+    def test_long_thought_is_streamed_in_order(self):
+        state = ToolCallState("call-1", "think")
+        thought = "word " * 20_000
+        state.append_args('{"thought":"')
+        pieces = []
+        for i in range(0, len(thought), 7):
+            state.append_args(thought[i : i + 7])
+            pieces.append(state.extract_thought_piece() or "")
+        state.append_args('"}')
+
+        assert "".join(pieces) == THOUGHT_HEADER + thought
+        assert state.args == '{"thought":"' + thought + '"}'
 
 
 class TestHasValidSkeleton:
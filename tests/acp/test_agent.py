@@ -1,6 +1,7 @@
 """Tests for the OpenHands ACP Agent."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, call, patch
 from uuid import UUID
 
 import pytest
@@ -306,7 +307,7 @@ async def test_prompt_success(acp_agent, mock_connection):
     mock_event = MessageEvent(source="agent", llm_message=mock_message)
 
     # Mock conversation.run to trigger callbacks
-    async def mock_run(fn):
+    async def mock_run(_session_id, fn):
         # Call the real function which is conversation.run
         fn()
         mock_conversation.state.events.append(mock_event)
@@ -314,7 +315,7 @@ async def test_prompt_success(acp_agent, mock_connection):
         for callback in callbacks_holder:
             callback(mock_event)
 
-    with patch("asyncio.to_thread", side_effect=mock_run):
+    with patch.object(acp_agent._scheduler, "run", side_effect=mock_run):
         response = await acp_agent.prompt(
             session_id=session_id, prompt=[TextContentBlock(type="text", text="Hello")]
         )
@@ -473,14 +474,14 @@ async def test_prompt_with_image(acp_agent, mock_connection):
     mock_event = MessageEvent(source="agent", llm_message=mock_message)
 
     # Mock conversation.run to trigger callbacks
-    async def mock_run(fn):
+    async def mock_run(_session_id, fn):
         fn()
         mock_conversation.state.events.append(mock_event)
         # Trigger the callbacks that were set during newSession
         for callback in callbacks_holder:
             callback(mock_event)
 
-    with patch("asyncio.to_thread", side_effect=mock_run):
+    with patch.object(acp_agent._scheduler, "run", side_effect=mock_run):
         # Create request with both text and image
         # Note: ACP ImageContentBlock uses 'data' field which can be a URL
         # or base64 data
@@ -667,7 +668,7 @@ async def test_new_session_replays_historic_events_on_resume(mock_connection, tm
         patch("openhands_cli.acp_impl.agent.local_agent.load_agent_specs") as mock_load,
         patch("openhands_cli.acp_impl.agent.local_agent.Conversation") as mock_conv,
         patch(
-            "openhands_cli.acp_impl.agent.base_agent.EventSubscriber"
+            "openhands_cli.acp_impl.events.history_replay.EventSubscriber"
         ) as mock_subscriber_class,
     ):
         mock_agent = MagicMock()
@@ -705,7 +706,7 @@ async def test_new_session_replays_historic_events_on_resume(mock_connection, tm
         assert response.session_id == resume_id
 
         # Verify EventSubscriber was created for replaying events
-        mock_subscriber_class.assert_called_with(resume_id, mock_connection)
+        assert mock_subscriber_class.call_args.args[0] == resume_id
 
         # Verify all historic events were replayed
         assert mock_subscriber.call_count == 2
@@ -723,7 +724,7 @@ async def test_new_session_no_replay_for_new_conversation(mock_connection, tmp_p
         patch("openhands_cli.acp_impl.agent.local_agent.load_agent_specs") as mock_load,
         patch("openhands_cli.acp_impl.agent.local_agent.Conversation") as mock_conv,
         patch(
-            "openhands_cli.acp_impl.agent.base_agent.EventSubscriber"
+            "openhands_cli.acp_impl.events.history_replay.EventSubscriber"
         ) as mock_subscriber_class,
     ):
         mock_agent = MagicMock()
@@ -748,3 +749,156 @@ async def test_new_session_no_replay_for_new_conversation(mock_connection, tmp_p
         # Verify EventSubscriber was NOT called for replaying events
         # (it may be created for _send_available_commands, but not called with events)
         mock_subscriber.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_sessions_pages_stored_conversations(acp_agent, tmp_path):
+    """list_sessions lists stored conversations with cursor pagination."""
+    import json
+    from uuid import uuid4
+
+    from acp import RequestError
+
+    from openhands_cli.acp_impl.agent import local_agent
+    from openhands_cli.conversations.store.local import LocalFileStore
+
+    ids = []
+    for day in range(1, 4):
+        conversation_id = uuid4()
+        ids.append(conversation_id)
+        conversation_dir = tmp_path / conversation_id.hex
+        (conversation_dir / "events").mkdir(parents=True)
+        (conversation_dir / "events" / "event-00000-a.json").write_text(
+            json.dumps(
+                {
+                    "timestamp": f"2024-01-0{day}T12:00:00Z",
+                    "source": "user",
+                    "llm_message": {
+                        "role": "user",
+                        "content": [{"type": "text", "text": f"Task {day}"}],
+                    },
+                }
+            )
+        )
+        (conversation_dir / "base_state.json").write_text(
+            json.dumps({"workspace": {"working_dir": str(tmp_path)}})
+        )
+    acp_agent._conversation_store = LocalFileStore(base_dir=str(tmp_path))
+
+    with patch.object(local_agent, "SESSION_LIST_PAGE_SIZE", 2):
+        first = await acp_agent.list_sessions(cwd=str(tmp_path))
+        assert [s.session_id for s in first.sessions] == [str(ids[2]), str(ids[1])]
+        assert first.sessions[0].title == "Task 3"
+        assert first.sessions[0].cwd == str(tmp_path)
+        assert first.next_cursor is not None
+
+        second = await acp_agent.list_sessions(cursor=first.next_cursor)
+        assert [s.session_id for s in second.sessions] == [str(ids[0])]
+        assert second.next_cursor is None
+
+    other = await acp_agent.list_sessions(cwd=str(tmp_path / "elsewhere"))
+    assert other.sessions == []
+
+    with pytest.raises(RequestError):
+        await acp_agent.list_sessions(cursor="bogus")
+
+
+@pytest.mark.asyncio
+async def test_fork_session_links_parent_events(acp_agent, tmp_path):
+    """fork_session creates a new session starting with the parent's events."""
+    import json
+    from uuid import uuid4
+
+    from acp import RequestError
+
+    from openhands_cli.acp_impl.agent.local_agent import FORK_META_KEY
+
+    parent_id = uuid4()
+    events_dir = tmp_path / parent_id.hex / "events"
+    events_dir.mkdir(parents=True)
+    for i in range(3):
+        (events_dir / f"event-{i:05d}-id{i}.json").write_text(json.dumps({"id": i}))
+
+    acp_agent._get_or_create_conversation = AsyncMock(return_value=MagicMock())
+    with patch(
+        "openhands_cli.acp_impl.agent.local_agent.get_conversations_dir",
+        return_value=str(tmp_path),
+    ):
+        response = await acp_agent.fork_session(
+            cwd=str(tmp_path),
+            session_id=str(parent_id),
+            **{FORK_META_KEY: {"eventCount": 2}},
+        )
+
+        fork_dir = tmp_path / UUID(response.session_id).hex
+        assert sorted(p.name for p in (fork_dir / "events").iterdir()) == [
+            "event-00000-id0.json",
+            "event-00001-id1.json",
+        ]
+        acp_agent._get_or_create_conversation.assert_awaited_once()
+        assert response.modes is not None
+
+        with pytest.raises(RequestError):
+            await acp_agent.fork_session(cwd=str(tmp_path), session_id=str(uuid4()))
+
+
+@pytest.mark.asyncio
+async def test_evicted_session_is_closed_and_reloaded(acp_agent):
+    """Sessions evicted from the session cache are reloaded on next use."""
+    from uuid import uuid4
+
+    from openhands_cli.acp_impl.agent.session_cache import SessionCacheLimits
+
+    acp_agent._active_sessions.limits = SessionCacheLimits(max_sessions=1)
+    first, second = str(uuid4()), str(uuid4())
+
+    with (
+        patch.object(
+            acp_agent, "_setup_conversation", side_effect=lambda **_: MagicMock()
+        ),
+        patch(
+            "openhands_cli.acp_impl.agent.local_agent."
+            "apply_confirmation_mode_to_conversation"
+        ) as mock_apply,
+    ):
+        evicted = await acp_agent._get_or_create_conversation(session_id=first)
+        await acp_agent._get_or_create_conversation(session_id=second)
+
+        evicted.close.assert_called_once()
+        assert list(acp_agent._active_sessions) == [second]
+
+        # The mode of an evicted session is kept until it is reloaded
+        await acp_agent.set_session_mode(session_id=first, mode_id="always-approve")
+        await acp_agent.cancel(session_id=first)
+
+        reloaded = acp_agent._active_sessions[first]
+        assert reloaded is not evicted
+        reloaded.pause.assert_called_once()
+        mock_apply.assert_called_with(reloaded, "always-approve", first)
+        assert list(acp_agent._active_sessions) == [first]
+
+
+@pytest.mark.asyncio
+async def test_new_session_takes_prepared_session(acp_agent, tmp_path):
+    """new_session uses a session configured ahead of time for its directory."""
+    with (
+        patch("openhands_cli.acp_impl.agent.local_agent.load_agent_specs") as mock_load,
+        patch("openhands_cli.acp_impl.agent.local_agent.Conversation") as mock_conv,
+    ):
+        mock_agent = MagicMock()
+        mock_agent.llm.uses_responses_api.return_value = False
+        mock_load.return_value = mock_agent
+
+        acp_agent._agent_pool.fill(str(tmp_path))
+        while acp_agent._agent_pool._filling:
+            await asyncio.gather(*acp_agent._agent_pool._filling.values())
+        prepared_id = mock_load.call_args_list[0].kwargs["conversation_id"]
+        mock_load.reset_mock()
+
+        response = await acp_agent.new_session(cwd=str(tmp_path), mcp_servers=[])
+
+        assert response.session_id == prepared_id
+        assert mock_conv.call_args.kwargs["agent"] is mock_agent
+        # Apart from preparing the next session, only the authentication check
+        # loaded the agent
+        assert [c for c in mock_load.call_args_list if not c.kwargs] == [call()]
@@ -0,0 +1,165 @@
+"""Tests for sessions prepared ahead of time."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from openhands_cli.acp_impl.agent.agent_pool import (
+    AgentPool,
+    PreparedSession,
+    config_fingerprint,
+)
+
+
+class FakeConfig:
+    """Prepares sessions and fingerprints a configuration version."""
+
+    def __init__(self) -> None:
+        self.version = 0
+        self.prepared: list[tuple[str, str]] = []
+
+    def prepare(self, working_dir: str, session_id: str) -> PreparedSession:
+        self.prepared.append((working_dir, session_id))
+        return PreparedSession(session_id, MagicMock(), MagicMock())
+
+    def fingerprint(self, working_dir: str) -> tuple:  # noqa: ARG002
+        return (("config", self.version, 0),)
+
+
+async def _settle(pool: AgentPool) -> None:
+    while pool._filling:
+        await asyncio.gather(*pool._filling.values())
+
+
+@pytest.fixture
+def config():
+    return FakeConfig()
+
+
+@pytest.fixture
+def pool(config):
+    return AgentPool(config.prepare, config.fingerprint, size=2)
+
+
+@pytest.mark.asyncio
+async def test_cold_directory_is_prepared_for_the_next_session(pool, config, tmp_path):
+    assert await pool.take(str(tmp_path)) is None
+    await _settle(pool)
+    assert len(config.prepared) == 2
+
+    prepared = await pool.take(str(tmp_path))
+    assert prepared is not None
+    assert prepared.session_id == config.prepared[0][1]
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_directories_are_dropped(config, tmp_path):
+    pool = AgentPool(config.prepare, config.fingerprint, size=1, max_dirs=2)
+    dirs = [str(tmp_path / name) for name in ("a", "b", "c")]
+    for working_dir in dirs:
+        await pool.take(working_dir)
+        await _settle(pool)
+
+    assert list(pool._pools) == dirs[1:]
+    assert await pool.take(dirs[0]) is None
+    assert await pool.take(dirs[2]) is not None
+    await _settle(pool)
+
+
+@pytest.mark.asyncio
+async def test_take_fingerprints_in_worker_thread(config, tmp_path):
+    import threading
+
+    threads = []
+
+    def fingerprint(working_dir: str) -> tuple:
+        threads.append(threading.current_thread())
+        return config.fingerprint(working_dir)
+
+    pool = AgentPool(config.prepare, fingerprint, size=1)
+    pool.fill(str(tmp_path))
+    await _settle(pool)
+    threads.clear()
+
+    assert await pool.take(str(tmp_path)) is not None
+    assert threads and threading.main_thread() not in threads
+    await _settle(pool)
+
+
+@pytest.mark.asyncio
+async def test_take_waits_for_session_being_prepared(pool, config, tmp_path):
+    pool.fill(str(tmp_path))
+
+    prepared = await pool.take(str(tmp_path))
+
+    assert prepared is not None
+    assert config.prepared[0] == (str(tmp_path), prepared.session_id)
+
+
+@pytest.mark.asyncio
+async def test_taken_sessions_are_replaced(pool, config, tmp_path):
+    pool.fill(str(tmp_path))
+    await _settle(pool)
+    assert len(config.prepared) == 2
+
+    first = await pool.take(str(tmp_path))
+    await _settle(pool)
+    second = await pool.take(str(tmp_path))
+
+    assert first is not None and second is not None
+    assert first.session_id != second.session_id
+    await _settle(pool)
+    assert len(config.prepared) == 4
+
+
+@pytest.mark.asyncio
+async def test_configuration_change_discards_prepared_sessions(pool, config, tmp_path):
+    pool.fill(str(tmp_path))
+    await _settle(pool)
+
+    config.version += 1
+    assert await pool.take(str(tmp_path)) is None
+
+    # The directory is prepared again with the new configuration
+    prepared = await pool.take(str(tmp_path))
+    assert prepared is not None
+    assert prepared.session_id == config.prepared[2][1]
+
+
+@pytest.mark.asyncio
+async def test_failures_leave_the_directory_cold(config, tmp_path):
+    prepare = MagicMock(side_effect=RuntimeError("not configured"))
+    pool = AgentPool(prepare, config.fingerprint)
+
+    pool.fill(str(tmp_path))
+
+    assert await pool.take(str(tmp_path)) is None
+    assert prepare.call_count == 1
+    # Retried in the background for the next session
+    await _settle(pool)
+    assert prepare.call_count == 2
+
+
+def test_config_fingerprint_tracks_skills_and_settings(tmp_path, monkeypatch):
+    persistence_dir = tmp_path / "persistence"
+    work_dir = tmp_path / "project"
+    skills_dir = work_dir / ".openhands" / "skills"
+    skills_dir.mkdir(parents=True)
+    persistence_dir.mkdir()
+    monkeypatch.setenv("OPENHANDS_PERSISTENCE_DIR", str(persistence_dir))
+    monkeypatch.setenv("OPENHANDS_WORK_DIR", str(work_dir))
+
+    fingerprints = [config_fingerprint(str(work_dir))]
+    (skills_dir / "repo.md").write_text("skill")
+    fingerprints.append(config_fingerprint(str(work_dir)))
+    (work_dir / "AGENTS.md").write_text("agents")
+    fingerprints.append(config_fingerprint(str(work_dir)))
+    (persistence_dir / "mcp.json").write_text("{}")
+    fingerprints.append(config_fingerprint(str(work_dir)))
+    (work_dir / "main.py").write_text("")
+    fingerprints.append(config_fingerprint(str(work_dir)))
+
+    assert len(set(fingerprints[:4])) == 4
+    # Unrelated files don't invalidate prepared sessions
+    assert fingerprints[4] == fingerprints[3]
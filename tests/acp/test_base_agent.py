@@ -99,6 +99,31 @@ class TestInitialize:
         assert caps.prompt_capabilities.embedded_context is True
         assert caps.prompt_capabilities.audio is False
 
+    @pytest.mark.asyncio
+    async def test_initialize_tool_call_delta_opt_in(self, test_agent):
+        """Clients opt into tool call argument deltas through capability _meta."""
+        from acp.schema import ClientCapabilities
+
+        from openhands_cli.acp_impl.events.history_replay import (
+            HISTORY_REPLAY_META_KEY,
+        )
+        from openhands_cli.acp_impl.events.utils import TOOL_CALL_DELTA_META_KEY
+
+        response = await test_agent.initialize(protocol_version=1)
+        assert response.agent_capabilities.field_meta == {
+            TOOL_CALL_DELTA_META_KEY: True,
+            HISTORY_REPLAY_META_KEY: True,
+        }
+        assert test_agent._tool_call_deltas is False
+
+        await test_agent.initialize(
+            protocol_version=1,
+            client_capabilities=ClientCapabilities(
+                field_meta={TOOL_CALL_DELTA_META_KEY: True}
+            ),
+        )
+        assert test_agent._tool_call_deltas is True
+
 
 class TestAuthenticate:
     """Tests for the authenticate method."""
@@ -186,7 +211,7 @@ class TestNewSession:
         agent._mock_conversation = mock_conversation
 
         with patch(
-            "openhands_cli.acp_impl.agent.base_agent.EventSubscriber"
+            "openhands_cli.acp_impl.events.history_replay.EventSubscriber"
         ) as mock_subscriber_class:
             mock_subscriber = AsyncMock()
             mock_subscriber_class.return_value = mock_subscriber
@@ -321,3 +346,136 @@ class TestExtMethods:
         """Test ext_notification completes without error."""
         # Should not raise
         await test_agent.ext_notification("test_notification", {"key": "value"})
+
+
+def _turns(count: int) -> list:
+    """Events of `count` turns, each a user message and an agent reply."""
+    from openhands.sdk import Message, TextContent
+    from openhands.sdk.event.llm_convertible.message import MessageEvent
+
+    events = []
+    for i in range(count):
+        events.append(
+            MessageEvent(
+                source="user",
+                llm_message=Message(role="user", content=[TextContent(text=f"q{i}")]),
+            )
+        )
+        events.append(
+            MessageEvent(
+                source="agent",
+                llm_message=Message(
+                    role="assistant", content=[TextContent(text=f"reply {i}")]
+                ),
+            )
+        )
+    return events
+
+
+class TestHistoryReplay:
+    """Tests for replaying only recent turns and loading older ones on demand."""
+
+    @staticmethod
+    def _replies(mock_connection) -> list[str]:
+        return [
+            call.kwargs["update"].content.text
+            for call in mock_connection.session_update.call_args_list
+            if call.kwargs["update"].session_update == "agent_message_chunk"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_load_session_replays_recent_turns(self, test_agent, mock_connection):
+        from openhands_cli.acp_impl.events.history_replay import (
+            HISTORY_REPLAY_META_KEY,
+        )
+
+        session_id = str(uuid4())
+        conversation = MagicMock()
+        conversation.state.events = _turns(5)
+        test_agent._mock_conversation = conversation
+
+        response = await test_agent.load_session(
+            cwd="/tmp",
+            session_id=session_id,
+            **{HISTORY_REPLAY_META_KEY: {"recentTurns": 2}},
+        )
+
+        replies = self._replies(mock_connection)
+        assert len(replies) == 1
+        assert "reply 3" in replies[0] and "reply 4" in replies[0]
+        assert "reply 2" not in replies[0]
+        assert response is not None
+        assert response.field_meta == {
+            HISTORY_REPLAY_META_KEY: {
+                "totalEvents": 10,
+                "omittedEvents": {"start": 0, "end": 6},
+            }
+        }
+
+    @pytest.mark.asyncio
+    async def test_load_session_without_opt_in_replays_everything(
+        self, test_agent, mock_connection
+    ):
+        conversation = MagicMock()
+        conversation.state.events = _turns(3)
+        test_agent._mock_conversation = conversation
+
+        response = await test_agent.load_session(cwd="/tmp", session_id=str(uuid4()))
+
+        assert response is not None
+        assert response.field_meta is None
+        assert "reply 0" in self._replies(mock_connection)[0]
+
+    @pytest.mark.asyncio
+    async def test_ext_method_loads_older_turns(self, test_agent, mock_connection):
+        from openhands_cli.acp_impl.events.history_replay import (
+            HISTORY_REPLAY_META_KEY,
+            HISTORY_REPLAY_METHOD,
+        )
+
+        session_id = str(uuid4())
+        conversation = MagicMock()
+        conversation.state.events = _turns(5)
+        test_agent._active_sessions[session_id] = conversation
+
+        result = await test_agent.ext_method(
+            HISTORY_REPLAY_METHOD,
+            {"sessionId": session_id, "end": 6, "recentTurns": 2},
+        )
+
+        assert result == {"totalEvents": 10, "omittedEvents": {"start": 0, "end": 2}}
+        call = mock_connection.session_update.call_args
+        assert "reply 1" in call.kwargs["update"].content.text
+        assert "reply 3" not in call.kwargs["update"].content.text
+        assert call.kwargs["field_meta"] == {
+            HISTORY_REPLAY_META_KEY: {"start": 2, "end": 6}
+        }
+
+        result = await test_agent.ext_method(
+            HISTORY_REPLAY_METHOD, {"sessionId": session_id, "end": 2}
+        )
+        assert result == {}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"sessionId": "missing", "end": 0},
+            {"sessionId": None, "end": 0},
+            {"end": -1},
+            {"end": True},
+            {"end": 99},
+        ],
+    )
+    async def test_ext_method_rejects_invalid_requests(self, test_agent, params):
+        from openhands_cli.acp_impl.events.history_replay import HISTORY_REPLAY_METHOD
+
+        session_id = str(uuid4())
+        conversation = MagicMock()
+        conversation.state.events = _turns(1)
+        test_agent._active_sessions[session_id] = conversation
+        if "sessionId" not in params:
+            params = {**params, "sessionId": session_id}
+
+        with pytest.raises(RequestError):
+            await test_agent.ext_method(HISTORY_REPLAY_METHOD, params)
@@ -0,0 +1,66 @@
+"""Tests for the content-addressed ACP attachment cache."""
+
+import os
+
+import pytest
+
+from openhands_cli.acp_impl.utils.blob_cache import BlobCache, blob_digest
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """A directory of its own for the cache, apart from the isolated home."""
+    path = tmp_path / "cache"
+    path.mkdir()
+    return path
+
+
+def test_store_is_content_addressed(cache_dir):
+    cache = BlobCache(lambda: cache_dir, max_bytes=0)
+
+    first = cache.store(b"screenshot", ".png")
+    second = cache.store(b"screenshot", ".png")
+
+    assert first == second == cache_dir / f"{blob_digest(b'screenshot')}.png"
+    assert first.read_bytes() == b"screenshot"
+    assert cache.store(b"other", ".png") != first
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_get_missing_file(cache_dir):
+    cache = BlobCache(lambda: cache_dir, max_bytes=0)
+
+    assert cache.get("missing") is None
+    cache.put("converted.png", b"data")
+    assert cache.get("converted.png") == b"data"
+
+
+def test_least_recently_used_files_are_evicted(cache_dir):
+    cache = BlobCache(lambda: cache_dir, max_bytes=25)
+    paths = [cache.put(name, b"x" * 10) for name in ("a", "b")]
+    # Make "a" older than "b", then use it again
+    os.utime(paths[0], (1, 1))
+    os.utime(paths[1], (2, 2))
+    assert cache.get("a") == b"x" * 10
+
+    cache.put("c", b"x" * 10)
+
+    assert sorted(p.name for p in cache_dir.iterdir()) == ["a", "c"]
+
+
+def test_file_being_stored_is_never_evicted(cache_dir):
+    cache = BlobCache(lambda: cache_dir, max_bytes=5)
+    cache.put("old", b"x" * 4)
+
+    path = cache.put("large", b"x" * 10)
+
+    assert [p.name for p in cache_dir.iterdir()] == ["large"]
+    assert path.read_bytes() == b"x" * 10
+
+
+def test_cache_size_from_env(cache_dir, monkeypatch):
+    monkeypatch.setenv("OPENHANDS_ACP_CACHE_MB", "1")
+    assert BlobCache(lambda: cache_dir).max_bytes == 1024 * 1024
+
+    monkeypatch.setenv("OPENHANDS_ACP_CACHE_MB", "0")
+    assert BlobCache(lambda: cache_dir).max_bytes == 0
@@ -2,7 +2,10 @@
 
 import base64
 import io
+import threading
+from unittest.mock import patch
 
+import pytest
 from acp.schema import (
     BlobResourceContents,
     EmbeddedResourceContentBlock,
@@ -14,7 +17,12 @@ from acp.schema import (
 from PIL import Image
 
 from openhands.sdk import ImageContent, TextContent
-from openhands_cli.acp_impl.utils.convert import convert_acp_prompt_to_message_content
+from openhands_cli.acp_impl.utils.convert import (
+    _convert_block,
+    convert_acp_prompt_to_message_content,
+    convert_acp_prompt_to_message_content_async,
+)
+from openhands_cli.acp_impl.utils.images import ImageReport
 
 
 def test_convert_text_content():
@@ -188,6 +196,25 @@ def test_convert_corrupted_image_falls_back():
     assert "Saved to file:" in result[0].text
 
 
+def test_convert_image_data_that_is_not_base64_is_passed_through():
+    """Test that image data of a supported type that isn't base64 is kept."""
+    acp_prompt: list = [
+        ImageContentBlock(
+            type="image",
+            data="https://example.com/image.png",
+            mime_type="image/png",
+        )
+    ]
+
+    result = convert_acp_prompt_to_message_content(acp_prompt)
+
+    assert len(result) == 1
+    assert isinstance(result[0], ImageContent)
+    assert result[0].image_urls == [
+        "data:image/png;base64,https://example.com/image.png"
+    ]
+
+
 def test_convert_resource_content_block():
     """Test converting ResourceContentBlock to TextContent."""
     acp_prompt: list = [
@@ -361,3 +388,54 @@ def test_convert_mixed_content_with_resources():
     assert "Some notes" in result[3].text
     assert isinstance(result[4], TextContent)
     assert result[4].text == "What do you think?"
+
+
+@pytest.mark.asyncio
+async def test_convert_async_decodes_attachments_off_the_event_loop():
+    """Test that images are converted in worker threads, in prompt order."""
+    img = Image.new("RGB", (10, 10), color="yellow")
+    buffer = io.BytesIO()
+    img.save(buffer, format="BMP")
+    bmp_data = base64.b64encode(buffer.getvalue()).decode("utf-8")
+    acp_prompt: list = [
+        TextContentBlock(type="text", text="Before"),
+        ImageContentBlock(type="image", data=bmp_data, mime_type="image/bmp"),
+        TextContentBlock(type="text", text="After"),
+    ]
+    threads: dict[str, str] = {}
+
+    def record_thread(block, report=None):
+        threads[block.type] = threading.current_thread().name
+        return _convert_block(block, report)
+
+    with patch(
+        "openhands_cli.acp_impl.utils.convert._convert_block",
+        side_effect=record_thread,
+    ):
+        result = await convert_acp_prompt_to_message_content_async(acp_prompt)
+
+    assert [type(c) for c in result] == [TextContent, ImageContent, TextContent]
+    assert isinstance(result[1], ImageContent)
+    assert result[1].image_urls[0].startswith("data:image/png;base64,")
+    assert threads["text"] == threading.main_thread().name
+    assert threads["image"].startswith("acp-convert")
+
+
+def test_convert_downscales_large_screenshots():
+    """Test that large images are re-encoded and their savings reported."""
+    img = Image.new("RGB", (3000, 2000), color="white")
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    png_data = base64.b64encode(buffer.getvalue()).decode("utf-8")
+    acp_prompt: list = [
+        ImageContentBlock(type="image", data=png_data, mime_type="image/png")
+    ]
+    report = ImageReport()
+
+    result = convert_acp_prompt_to_message_content(acp_prompt, report)
+
+    assert isinstance(result[0], ImageContent)
+    assert result[0].image_urls[0].startswith("data:image/webp;base64,")
+    assert (report.images, report.processed) == (1, 1)
+    assert report.original_bytes == len(buffer.getvalue())
+    assert report.bytes_saved == report.original_bytes - report.sent_bytes
@@ -0,0 +1,114 @@
+"""Tests for the preprocessing of prompt images."""
+
+import io
+import os
+
+import pytest
+from PIL import Image
+
+from openhands_cli.acp_impl.utils.images import (
+    ImageLimits,
+    ImageReport,
+    preprocess_image,
+)
+
+
+def _encode(img: Image.Image, image_format: str, **kwargs) -> bytes:
+    buffer = io.BytesIO()
+    img.save(buffer, format=image_format, **kwargs)
+    return buffer.getvalue()
+
+
+def _noise(size: tuple[int, int]) -> Image.Image:
+    """An image that doesn't compress well."""
+    return Image.frombytes("RGB", size, os.urandom(size[0] * size[1] * 3))
+
+
+def test_small_supported_image_is_unchanged():
+    data = _encode(Image.new("RGB", (100, 50), "red"), "PNG")
+
+    assert preprocess_image(data, "image/png", ImageLimits()) == ("image/png", data)
+
+
+def test_large_image_is_downscaled():
+    data = _encode(Image.new("RGB", (4000, 2000), "blue"), "PNG")
+
+    result = preprocess_image(data, "image/png", ImageLimits())
+    assert result is not None
+    mime_type, processed = result
+
+    assert mime_type == "image/webp"
+    assert Image.open(io.BytesIO(processed)).size == (1568, 784)
+
+
+@pytest.mark.parametrize("image_format", ["webp", "jpeg"])
+def test_image_is_encoded_within_max_bytes(image_format):
+    limits = ImageLimits(max_dimension=0, max_bytes=40 * 1024, format=image_format)
+    data = _encode(_noise((400, 400)), "PNG")
+
+    result = preprocess_image(data, "image/png", limits)
+    assert result is not None
+    mime_type, processed = result
+
+    assert mime_type == f"image/{image_format}"
+    assert len(processed) <= limits.max_bytes
+
+
+def test_metadata_is_stripped():
+    img = Image.new("RGB", (100, 100), "green")
+    exif = Image.Exif()
+    exif[0x010F] = "Camera maker"
+    data = _encode(img, "JPEG", exif=exif.tobytes())
+
+    result = preprocess_image(data, "image/jpeg", ImageLimits())
+    assert result is not None
+    mime_type, processed = result
+
+    assert mime_type == "image/webp"
+    assert not Image.open(io.BytesIO(processed)).info.get("exif")
+
+
+def test_transparency_is_flattened_for_jpeg():
+    data = _encode(Image.new("RGBA", (2000, 100), (255, 0, 0, 0)), "PNG")
+
+    result = preprocess_image(data, "image/png", ImageLimits(format="jpeg"))
+    assert result is not None
+    mime_type, processed = result
+
+    assert mime_type == "image/jpeg"
+    assert Image.open(io.BytesIO(processed)).mode == "RGB"
+
+
+def test_small_unsupported_image_is_converted_to_png():
+    data = _encode(Image.new("RGB", (10, 10), "red"), "BMP")
+
+    result = preprocess_image(data, "image/bmp", ImageLimits())
+    assert result is not None
+    mime_type, processed = result
+
+    assert mime_type == "image/png"
+    assert Image.open(io.BytesIO(processed)).format == "PNG"
+
+
+def test_unreadable_image():
+    assert preprocess_image(b"not an image", "image/png", ImageLimits()) is None
+
+
+def test_limits_from_env(monkeypatch):
+    monkeypatch.setenv("OPENHANDS_ACP_IMAGE_MAX_DIMENSION", "0")
+    monkeypatch.setenv("OPENHANDS_ACP_IMAGE_MAX_KB", "100")
+    monkeypatch.setenv("OPENHANDS_ACP_IMAGE_FORMAT", "JPG")
+    monkeypatch.setenv("OPENHANDS_ACP_IMAGE_QUALITY", "70")
+
+    assert ImageLimits.from_env() == ImageLimits(
+        max_dimension=0, max_bytes=100 * 1024, format="jpeg", quality=70
+    )
+
+
+def test_report_counts_bytes_saved():
+    report = ImageReport()
+    report.add(1000, 1000)
+    report.add(5000, 2000)
+
+    assert (report.images, report.processed, report.bytes_saved) == (2, 1, 3000)
+    assert "3000 saved" in report.summary()
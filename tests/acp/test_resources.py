@@ -2,6 +2,7 @@
 
 import base64
 import io
+from unittest.mock import patch
 
 from acp.schema import (
     BlobResourceContents,
@@ -12,8 +13,8 @@ from PIL import Image
 
 from openhands.sdk import ImageContent, TextContent
 from openhands_cli.acp_impl.utils.resources import (
-    _convert_image_to_supported_format,
     _materialize_embedded_resource,
+    _prepare_image,
 )
 
 
@@ -136,7 +137,7 @@ def test_materialize_non_image_blob():
     assert "unsupported format" not in result.text.lower()
 
 
-def test_convert_image_to_supported_format_bmp():
+def test_prepare_image_converts_bmp_to_png():
     """Test converting BMP to PNG."""
     # Create a real BMP image
     img = Image.new("RGB", (10, 10), color="blue")
@@ -145,20 +146,18 @@ def test_convert_image_to_supported_format_bmp():
     buffer.seek(0)
     bmp_data = buffer.read()
 
-    result = _convert_image_to_supported_format(bmp_data, "image/bmp")
+    result = _prepare_image(bmp_data, "image/bmp")
 
     assert result is not None
     mime_type, converted_data = result
     assert mime_type == "image/png"
     assert len(converted_data) > 0
 
-    # Verify it's valid base64 PNG data
-    decoded = base64.b64decode(converted_data)
-    converted_img = Image.open(io.BytesIO(decoded))
+    converted_img = Image.open(io.BytesIO(converted_data))
     assert converted_img.format == "PNG"
 
 
-def test_convert_image_to_supported_format_with_transparency():
+def test_prepare_image_with_transparency():
     """Test converting image with transparency preserves alpha channel."""
     # Create an image with transparency
     img = Image.new("RGBA", (10, 10), color=(255, 0, 0, 128))
@@ -168,17 +167,62 @@ def test_convert_image_to_supported_format_with_transparency():
     # Pretend it's TIFF
     png_data = buffer.read()
 
-    result = _convert_image_to_supported_format(png_data, "image/tiff")
+    result = _prepare_image(png_data, "image/tiff")
 
     assert result is not None
     mime_type, converted_data = result
     assert mime_type == "image/png"  # Should use PNG to preserve transparency
+    assert Image.open(io.BytesIO(converted_data)).mode == "RGBA"
 
 
-def test_convert_image_to_supported_format_invalid_data():
-    """Test that invalid image data returns None."""
+def test_prepare_image_invalid_data():
+    """Test that invalid image data in an unsupported format returns None."""
     invalid_data = b"not_a_real_image"
 
-    result = _convert_image_to_supported_format(invalid_data, "image/bmp")
+    result = _prepare_image(invalid_data, "image/bmp")
 
     assert result is None
+
+
+def test_materialize_same_blob_reuses_file():
+    """Test that resending a blob doesn't write a new file."""
+    test_data = base64.b64encode(b"same binary data").decode("utf-8")
+    block = EmbeddedResourceContentBlock(
+        type="resource",
+        resource=BlobResourceContents(
+            uri="file:///example.bin",
+            mime_type="application/octet-stream",
+            blob=test_data,
+        ),
+    )
+
+    first = _materialize_embedded_resource(block)
+    second = _materialize_embedded_resource(block)
+
+    assert isinstance(first, TextContent) and isinstance(second, TextContent)
+    assert first.text == second.text
+
+
+def test_materialize_unsupported_image_is_converted_once():
+    """Test that resending an image reuses the earlier conversion."""
+    img = Image.new("RGB", (10, 10), color="purple")
+    buffer = io.BytesIO()
+    img.save(buffer, format="BMP")
+    block = EmbeddedResourceContentBlock(
+        type="resource",
+        resource=BlobResourceContents(
+            uri="file:///example.bmp",
+            mime_type="image/bmp",
+            blob=base64.b64encode(buffer.getvalue()).decode("utf-8"),
+        ),
+    )
+
+    first = _materialize_embedded_resource(block)
+    with patch(
+        "openhands_cli.acp_impl.utils.resources.preprocess_image"
+    ) as mock_convert:
+        second = _materialize_embedded_resource(block)
+
+    mock_convert.assert_not_called()
+    assert isinstance(first, ImageContent) and isinstance(second, ImageContent)
+    assert first.image_urls == second.image_urls
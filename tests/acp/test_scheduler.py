@@ -0,0 +1,89 @@
+"""Tests for scheduling conversation runs on per-session threads."""
+
+import asyncio
+import threading
+
+import pytest
+
+from openhands_cli.acp_impl.scheduler import SessionScheduler
+
+
+@pytest.mark.asyncio
+async def test_session_runs_on_its_own_thread():
+    scheduler = SessionScheduler(max_concurrent_runs=0)
+
+    a1 = await scheduler.run("session-a", threading.get_ident)
+    a2 = await scheduler.run("session-a", threading.get_ident)
+    b = await scheduler.run("session-b", threading.get_ident)
+
+    assert a1 == a2
+    assert a1 != b
+    assert a1 != threading.get_ident()
+    assert scheduler.stats().sessions == 2
+
+    scheduler.close_session("session-a")
+    assert scheduler.stats().sessions == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_queues_runs():
+    scheduler = SessionScheduler(max_concurrent_runs=1)
+    release = threading.Event()
+
+    first = asyncio.create_task(scheduler.run("session-a", release.wait))
+    await asyncio.sleep(0.05)
+    second = asyncio.create_task(scheduler.run("session-b", lambda: "done"))
+    await asyncio.sleep(0.05)
+
+    stats = scheduler.stats()
+    assert (stats.running, stats.queued) == (1, 1)
+    assert not second.done()
+
+    release.set()
+    assert await second == "done"
+    assert await first is True
+
+    stats = scheduler.stats()
+    assert (stats.running, stats.queued, stats.total_runs) == (0, 0, 2)
+    assert stats.max_wait_time > 0
+    assert stats.to_dict()["averageWaitTime"] == stats.total_wait_time / 2
+
+
+@pytest.mark.asyncio
+async def test_slot_is_held_until_cancelled_run_returns():
+    scheduler = SessionScheduler(max_concurrent_runs=1)
+    release = threading.Event()
+
+    first = asyncio.create_task(scheduler.run("session-a", release.wait))
+    await asyncio.sleep(0.05)
+    first.cancel()
+    await asyncio.sleep(0.05)
+
+    # The thread is still running, so the slot is not free yet
+    assert scheduler.stats().running == 1
+    second = asyncio.create_task(scheduler.run("session-b", lambda: "done"))
+    await asyncio.sleep(0.05)
+    assert not second.done()
+
+    release.set()
+    assert await second == "done"
+
+
+@pytest.mark.asyncio
+async def test_errors_are_raised_and_free_the_slot():
+    scheduler = SessionScheduler(max_concurrent_runs=1)
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await scheduler.run("session-a", fail)
+    assert await scheduler.run("session-a", lambda: 1) == 1
+
+
+def test_limit_from_env(monkeypatch):
+    monkeypatch.setenv("OPENHANDS_ACP_MAX_CONCURRENT_RUNS", "2")
+    assert SessionScheduler().max_concurrent_runs == 2
+
+    monkeypatch.setenv("OPENHANDS_ACP_MAX_CONCURRENT_RUNS", "many")
+    assert SessionScheduler().max_concurrent_runs == 4
@@ -0,0 +1,116 @@
+"""Tests for the bounded ACP session cache."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from openhands_cli.acp_impl.agent.session_cache import (
+    SessionCache,
+    SessionCacheLimits,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _conversation(events: int = 0) -> MagicMock:
+    conversation = MagicMock()
+    conversation.state.events = [object()] * events
+    return conversation
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def _cache(clock, evicted, busy=(), **limits) -> SessionCache:
+    return SessionCache(
+        SessionCacheLimits(**{"memory_budget": 0, "idle_ttl": 0, **limits}),
+        on_evict=lambda sid, _conversation: evicted.append(sid),
+        is_busy=lambda sid: sid in busy,
+        size_of=lambda conversation: len(conversation.state.events),
+        clock=clock,
+    )
+
+
+def test_least_recently_used_session_is_evicted(clock):
+    evicted: list[str] = []
+    cache = _cache(clock, evicted, max_sessions=2)
+    cache["a"] = _conversation()
+    cache["b"] = _conversation()
+
+    cache["a"]  # noqa: B018
+    cache["c"] = _conversation()
+
+    assert evicted == ["b"]
+    assert list(cache) == ["a", "c"]
+
+
+def test_memory_budget(clock):
+    evicted: list[str] = []
+    cache = _cache(clock, evicted, max_sessions=0, memory_budget=10)
+    cache["a"] = _conversation(4)
+    cache["b"] = _conversation(4)
+    cache["c"] = _conversation(4)
+
+    assert evicted == ["a"]
+    assert cache.memory_usage == 8
+
+    # The session being used stays even if it alone exceeds the budget
+    cache["d"] = _conversation(20)
+    assert list(cache) == ["d"]
+
+
+def test_idle_sessions_are_evicted(clock):
+    evicted: list[str] = []
+    cache = _cache(clock, evicted, idle_ttl=60)
+    cache["a"] = _conversation()
+    clock.now = 30
+    cache["b"] = _conversation()
+
+    clock.now = 70
+    assert cache.evict_idle() == ["a"]
+    assert evicted == ["a"]
+
+    # Reading a session keeps it alive
+    cache["b"]  # noqa: B018
+    clock.now = 120
+    assert cache.evict_idle() == []
+
+
+def test_busy_sessions_are_not_evicted(clock):
+    evicted: list[str] = []
+    cache = _cache(clock, evicted, busy={"a"}, max_sessions=1)
+    cache["a"] = _conversation()
+    cache["b"] = _conversation()
+
+    assert evicted == []
+    assert len(cache) == 2
+
+
+def test_removal_does_not_evict(clock):
+    evicted: list[str] = []
+    cache = _cache(clock, evicted, max_sessions=1)
+    cache["a"] = _conversation()
+
+    assert cache.pop("a") is not None
+    assert "a" not in cache
+    assert evicted == []
+
+
+def test_limits_from_env(monkeypatch):
+    monkeypatch.setenv("OPENHANDS_ACP_MAX_SESSIONS", "4")
+    monkeypatch.setenv("OPENHANDS_ACP_SESSION_MEMORY_MB", "1")
+    monkeypatch.setenv("OPENHANDS_ACP_SESSION_IDLE_TTL", "not a number")
+
+    limits = SessionCacheLimits.from_env()
+
+    assert limits == SessionCacheLimits(
+        max_sessions=4, memory_budget=1024 * 1024, idle_ttl=30 * 60
+    )
@@ -0,0 +1,143 @@
+import json
+import uuid
+
+import pytest
+
+from openhands_cli.conversations.store.fork import (
+    FORK_FILENAME,
+    fork_conversation,
+    read_fork_info,
+)
+from openhands_cli.conversations.store.local import LocalFileStore
+from openhands_cli.conversations.store.packed import (
+    PACKED_DIRNAME,
+    PackedEventLog,
+    pack_conversation,
+)
+
+
+def _make_event(i: int) -> dict:
+    return {
+        "id": f"id{i}",
+        "timestamp": f"2024-01-01T12:00:{i:02d}Z",
+        "source": "user",
+        "kind": "MessageEvent",
+        "llm_message": {
+            "role": "user",
+            "content": [{"type": "text", "text": f"Msg {i}"}],
+        },
+    }
+
+
+def _write_events(conversation_dir, start: int, stop: int) -> None:
+    events_dir = conversation_dir / "events"
+    events_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(start, stop):
+        event_file = events_dir / f"event-{i:05d}-id{i}.json"
+        event_file.write_text(json.dumps(_make_event(i)))
+
+
+@pytest.fixture
+def parent_dir(tmp_path):
+    parent_dir = tmp_path / uuid.uuid4().hex
+    _write_events(parent_dir, 0, 6)
+    (parent_dir / "base_state.json").write_text(
+        json.dumps({"id": str(uuid.UUID(parent_dir.name)), "agent": {}})
+    )
+    return parent_dir
+
+
+def _ids(store: LocalFileStore, conversation_id: str) -> list[str]:
+    return [e.id for e in store.load_events(conversation_id)]
+
+
+class TestForkConversation:
+    def test_fork_links_events_up_to_fork_point(self, tmp_path, parent_dir):
+        child_dir = tmp_path / uuid.uuid4().hex
+
+        assert fork_conversation(parent_dir, child_dir, fork_point=4) == 4
+
+        store = LocalFileStore(base_dir=str(tmp_path))
+        assert _ids(store, child_dir.name) == [f"id{i}" for i in range(4)]
+        parent_file = next((parent_dir / "events").glob("event-00000-*.json"))
+        child_file = child_dir / "events" / parent_file.name
+        assert child_file.stat().st_ino == parent_file.stat().st_ino
+
+    def test_fork_records_lineage_and_rewrites_state(self, tmp_path, parent_dir):
+        child_dir = tmp_path / uuid.uuid4().hex
+
+        fork_conversation(parent_dir, child_dir)
+
+        info = read_fork_info(child_dir)
+        assert info is not None
+        assert info.parent_id == parent_dir.name
+        assert info.fork_point == 6
+        state = json.loads((child_dir / "base_state.json").read_text())
+        assert state["id"] == str(uuid.UUID(child_dir.name))
+        assert read_fork_info(parent_dir) is None
+
+    def test_new_child_events_do_not_reach_parent(self, tmp_path, parent_dir):
+        child_dir = tmp_path / uuid.uuid4().hex
+        fork_conversation(parent_dir, child_dir)
+
+        _write_events(child_dir, 6, 8)
+
+        store = LocalFileStore(base_dir=str(tmp_path))
+        assert store.get_event_count(child_dir.name) == 8
+        assert store.get_event_count(parent_dir.name) == 6
+
+    def test_fork_of_packed_conversation(self, tmp_path, parent_dir):
+        pack_conversation(parent_dir)
+        _write_events(parent_dir, 6, 8)
+        child_dir = tmp_path / uuid.uuid4().hex
+
+        fork_conversation(parent_dir, child_dir, fork_point=7)
+
+        store = LocalFileStore(base_dir=str(tmp_path))
+        assert _ids(store, child_dir.name) == [f"id{i}" for i in range(7)]
+        assert len(PackedEventLog(child_dir)) == 6
+
+    def test_packing_after_fork_does_not_write_shared_segments(
+        self, tmp_path, parent_dir
+    ):
+        pack_conversation(parent_dir)
+        child_dir = tmp_path / uuid.uuid4().hex
+        fork_conversation(parent_dir, child_dir)
+        shared = child_dir / PACKED_DIRNAME / "segment-00000.jsonl"
+        shared_size = shared.stat().st_size
+
+        _write_events(child_dir, 6, 7)
+        pack_conversation(child_dir)
+
+        assert shared.stat().st_size == shared_size
+        store = LocalFileStore(base_dir=str(tmp_path))
+        assert _ids(store, child_dir.name)[-1] == "id6"
+        assert store.get_event_count(parent_dir.name) == 6
+
+    @pytest.mark.parametrize("fork_point", [-1, 7])
+    def test_invalid_fork_point(self, tmp_path, parent_dir, fork_point):
+        child_dir = tmp_path / uuid.uuid4().hex
+
+        with pytest.raises(ValueError):
+            fork_conversation(parent_dir, child_dir, fork_point)
+        assert not child_dir.exists()
+
+    def test_missing_parent(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            fork_conversation(tmp_path / "missing", tmp_path / "child")
+
+    def test_fork_is_listed_with_its_parent(self, tmp_path, parent_dir):
+        child_dir = tmp_path / uuid.uuid4().hex
+        fork_conversation(parent_dir, child_dir)
+
+        store = LocalFileStore(base_dir=str(tmp_path))
+        conversations = {c.id: c for c in store.list_conversations()}
+
+        assert conversations[child_dir.name].parent_id == parent_dir.name
+        assert conversations[parent_dir.name].parent_id is None
+        # Forks are listed from the time they were forked
+        assert (
+            conversations[child_dir.name].created_at
+            > conversations[parent_dir.name].created_at
+        )
+        assert (child_dir / FORK_FILENAME).exists()
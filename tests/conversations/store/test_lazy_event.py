@@ -0,0 +1,92 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from openhands.sdk import MessageEvent
+from openhands_cli.conversations.store.lazy_event import (
+    LazyEvent,
+    resolve_event_class,
+)
+from openhands_cli.conversations.store.local import LocalFileStore
+
+
+def _message_event(i: int, source: str = "user") -> dict:
+    return {
+        "id": str(i),
+        "timestamp": f"2024-01-01T12:00:0{i}Z",
+        "source": source,
+        "kind": "MessageEvent",
+        "llm_message": {
+            "role": source if source == "user" else "assistant",
+            "content": [{"type": "text", "text": f"Msg {i}"}],
+        },
+    }
+
+
+class TestLazyEvent:
+    def test_resolve_event_class(self):
+        assert resolve_event_class("MessageEvent") is MessageEvent
+        assert resolve_event_class("NoSuchEvent") is None
+
+    def test_raw_fields_do_not_validate(self):
+        event = LazyEvent(_message_event(1), MessageEvent)
+
+        assert event.source == "user"
+        assert event.id == "1"
+        assert event._event is None
+
+    def test_model_fields_validate_once(self):
+        event = LazyEvent(_message_event(1), MessageEvent)
+
+        with patch.object(
+            MessageEvent, "model_validate", wraps=MessageEvent.model_validate
+        ) as validate:
+            assert event.llm_message.content[0].text == "Msg 1"
+            assert event.llm_message.role == "user"
+
+        validate.assert_called_once()
+
+    def test_isinstance_reports_concrete_class(self):
+        event = LazyEvent(_message_event(1), MessageEvent)
+
+        assert isinstance(event, MessageEvent)
+        assert event._event is None
+
+    def test_invalid_data_raises_on_access(self):
+        data = _message_event(1)
+        del data["llm_message"]
+        event = LazyEvent(data, MessageEvent)
+
+        assert event.source == "user"
+        with pytest.raises(ValueError):
+            _ = event.llm_message
+
+
+class TestLocalFileStoreLazyLoading:
+    @pytest.fixture
+    def store(self, tmp_path):
+        events_dir = tmp_path / "lazy" / "events"
+        events_dir.mkdir(parents=True)
+        for i in range(4):
+            source = "user" if i == 2 else "agent"
+            with open(events_dir / f"event-{i:05d}-{i}.json", "w") as f:
+                json.dump(_message_event(i, source), f)
+        return LocalFileStore(base_dir=str(tmp_path))
+
+    def test_load_events_returns_lazy_proxies(self, store):
+        events = list(store.load_events("lazy"))
+
+        assert all(isinstance(e, LazyEvent) for e in events)
+        assert [e.source for e in events] == ["agent", "agent", "user", "agent"]
+        assert all(e._event is None for e in events)
+
+    def test_title_scan_only_validates_user_messages(self, store):
+        with patch.object(
+            store, "_to_message_event", wraps=store._to_message_event
+        ) as to_message:
+            metadata = store.get_metadata("lazy")
+
+        assert metadata is not None
+        assert metadata.title == "Msg 2"
+        to_message.assert_called_once()
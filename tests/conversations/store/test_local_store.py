@@ -1,8 +1,12 @@
 import json
+import os
+import shutil
 from datetime import UTC, datetime
+from unittest.mock import patch
 
 import pytest
 
+from openhands_cli.conversations.store.index import INDEX_FILENAME
 from openhands_cli.conversations.store.local import LocalFileStore
 
 
@@ -177,3 +181,231 @@ class TestLocalFileStore:
         assert len(events) == 2
         assert events[0].id == "3"
         assert events[1].id == "4"
+
+
+class TestLocalFileStoreIndex:
+    @pytest.fixture
+    def store(self, tmp_path):
+        return LocalFileStore(base_dir=str(tmp_path))
+
+    @staticmethod
+    def _write_conversation(tmp_path, conv_id, text, timestamp):
+        events_dir = tmp_path / conv_id / "events"
+        events_dir.mkdir(parents=True)
+        user_event = {
+            "timestamp": timestamp,
+            "source": "user",
+            "llm_message": {
+                "role": "user",
+                "content": [{"type": "text", "text": text}],
+            },
+        }
+        with open(events_dir / "event-00000-a.json", "w") as f:
+            json.dump(user_event, f)
+        return events_dir
+
+    def test_list_conversations_creates_index(self, store, tmp_path):
+        self._write_conversation(tmp_path, "conv-a", "First", "2024-01-01T12:00:00Z")
+
+        convs = store.list_conversations()
+
+        assert [c.id for c in convs] == ["conv-a"]
+        assert (tmp_path / INDEX_FILENAME).exists()
+        entry = store._index.get("conv-a")
+        assert entry is not None
+        assert entry.title == "First"
+        assert entry.event_count == 1
+
+    def test_unchanged_conversations_are_not_reparsed(
+        self, store, tmp_path, monkeypatch
+    ):
+        self._write_conversation(tmp_path, "conv-a", "First", "2024-01-01T12:00:00Z")
+        # Treat every mtime as old enough to be trusted.
+        monkeypatch.setattr(
+            "openhands_cli.conversations.store.local._MTIME_SLACK_NS", -(10**18)
+        )
+        store.list_conversations()
+
+        with patch.object(
+            store, "_index_conversation_dir", wraps=store._index_conversation_dir
+        ) as index_dir:
+            convs = store.list_conversations()
+
+        index_dir.assert_not_called()
+        assert convs[0].title == "First"
+
+    def test_changed_conversation_is_reparsed(self, store, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            "openhands_cli.conversations.store.local._MTIME_SLACK_NS", -(10**18)
+        )
+        events_dir = self._write_conversation(
+            tmp_path, "conv-a", "First", "2024-01-01T12:00:00Z"
+        )
+        store.list_conversations()
+
+        (events_dir / "event-00001-b.json").write_text("{}")
+        os.utime(events_dir, ns=(0, 1))
+
+        store.list_conversations()
+        entry = store._index.get("conv-a")
+        assert entry is not None
+        assert entry.event_count == 2
+
+    def test_removed_conversation_is_dropped_from_index(self, store, tmp_path):
+        self._write_conversation(tmp_path, "conv-a", "First", "2024-01-01T12:00:00Z")
+        self._write_conversation(tmp_path, "conv-b", "Second", "2024-01-02T12:00:00Z")
+        assert len(store.list_conversations()) == 2
+
+        shutil.rmtree(tmp_path / "conv-a")
+
+        assert [c.id for c in store.list_conversations()] == ["conv-b"]
+        assert store._index.get("conv-a") is None
+
+    def test_corrupted_index_is_rebuilt(self, store, tmp_path):
+        self._write_conversation(tmp_path, "conv-a", "First", "2024-01-01T12:00:00Z")
+        (tmp_path / INDEX_FILENAME).write_bytes(b"definitely not sqlite")
+
+        convs = store.list_conversations()
+
+        assert [c.title for c in convs] == ["First"]
+        assert store._index.get("conv-a") is not None
+
+    def test_list_conversations_returns_newest_limit(self, store, tmp_path):
+        for day in range(1, 10):
+            self._write_conversation(
+                tmp_path, f"conv-{day}", f"Day {day}", f"2024-01-0{day}T12:00:00Z"
+            )
+
+        convs = store.list_conversations(limit=3)
+
+        assert [c.id for c in convs] == ["conv-9", "conv-8", "conv-7"]
+
+    def test_parallel_and_serial_listing_match(self, store, tmp_path, monkeypatch):
+        for day in range(1, 10):
+            self._write_conversation(
+                tmp_path, f"conv-{day}", f"Day {day}", f"2024-01-0{day}T12:00:00Z"
+            )
+        (tmp_path / "empty").mkdir()
+
+        parallel = store.list_conversations()
+        (tmp_path / INDEX_FILENAME).unlink()
+        monkeypatch.setattr(
+            "openhands_cli.conversations.store.local.LIST_MAX_WORKERS", 1
+        )
+        serial = store.list_conversations()
+
+        assert parallel == serial
+        assert len(parallel) == 9
+
+
+class TestLocalFileStoreRanges:
+    @pytest.fixture
+    def store(self, tmp_path):
+        events_dir = tmp_path / "range-test" / "events"
+        events_dir.mkdir(parents=True)
+        for i in range(10):
+            event = {
+                "id": str(i),
+                "timestamp": f"2024-01-01T12:00:0{i}Z",
+                "source": "user",
+                "kind": "MessageEvent",
+                "llm_message": {
+                    "role": "user",
+                    "content": [{"type": "text", "text": f"Msg {i}"}],
+                },
+            }
+            with open(events_dir / f"event-{i:05d}-{i}.json", "w") as f:
+                json.dump(event, f)
+        return LocalFileStore(base_dir=str(tmp_path))
+
+    def test_load_events_range(self, store):
+        events = list(store.load_events_range("range-test", 3, 6))
+        assert [e.id for e in events] == ["3", "4", "5"]
+
+    def test_load_events_range_negative_positions(self, store):
+        events = list(store.load_events_range("range-test", -3))
+        assert [e.id for e in events] == ["7", "8", "9"]
+
+        events = list(store.load_events_range("range-test", -5, -3))
+        assert [e.id for e in events] == ["5", "6"]
+
+    def test_load_events_range_only_reads_requested_files(self, store):
+        with patch.object(
+            store, "_read_event_data", wraps=store._read_event_data
+        ) as read_event:
+            list(store.load_events_range("range-test", 8))
+
+        assert read_event.call_count == 2
+
+    def test_tail(self, store):
+        assert [e.id for e in store.tail("range-test", 2)] == ["8", "9"]
+        assert list(store.tail("range-test", 0)) == []
+        assert len(list(store.tail("range-test", 50))) == 10
+        assert list(store.tail("missing", 5)) == []
+
+
+class TestLocalFileStorePages:
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = LocalFileStore(base_dir=str(tmp_path))
+        for day in range(1, 8):
+            TestLocalFileStoreIndex._write_conversation(
+                tmp_path, f"conv-{day}", f"Day {day}", f"2024-01-0{day}T12:00:00Z"
+            )
+            workspace = "/work/odd" if day % 2 else "/work/even"
+            (tmp_path / f"conv-{day}" / "base_state.json").write_text(
+                json.dumps({"workspace": {"working_dir": workspace}})
+            )
+        return store
+
+    @staticmethod
+    def _all_pages(store, limit, cwd=None):
+        pages = []
+        cursor = None
+        while True:
+            page, cursor = store.list_conversations_page(limit, cursor, cwd)
+            pages.append([c.id for c in page])
+            if cursor is None:
+                return pages
+
+    def test_pages_cover_all_conversations_newest_first(self, store):
+        pages = self._all_pages(store, 3)
+
+        assert pages == [
+            ["conv-7", "conv-6", "conv-5"],
+            ["conv-4", "conv-3", "conv-2"],
+            ["conv-1"],
+        ]
+
+    def test_page_includes_catalogue_fields(self, store):
+        page, _ = store.list_conversations_page(1)
+
+        assert page[0].title == "Day 7"
+        assert page[0].cwd == "/work/odd"
+        assert page[0].event_count == 1
+
+    def test_pages_filter_by_cwd(self, store):
+        pages = self._all_pages(store, 2, cwd="/work/even/")
+
+        assert pages == [["conv-6", "conv-4"], ["conv-2"]]
+
+    def test_following_pages_do_not_rescan(self, store):
+        _, cursor = store.list_conversations_page(3)
+
+        with patch.object(store, "_refresh_index") as refresh:
+            page, _ = store.list_conversations_page(3, cursor)
+
+        refresh.assert_not_called()
+        assert [c.id for c in page] == ["conv-4", "conv-3", "conv-2"]
+
+    def test_pages_without_readable_index(self, store, monkeypatch):
+        monkeypatch.setattr(store._index, "page", lambda *args: None)
+
+        assert self._all_pages(store, 4) == [
+            ["conv-7", "conv-6", "conv-5", "conv-4"],
+            ["conv-3", "conv-2", "conv-1"],
+        ]
+
+    def test_invalid_cursor_raises(self, store):
+        with pytest.raises(ValueError):
+            store.list_conversations_page(3, "not-a-cursor")
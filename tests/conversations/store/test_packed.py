@@ -0,0 +1,140 @@
+import json
+
+import pytest
+
+from openhands_cli.conversations.store import packed as packed_module
+from openhands_cli.conversations.store.local import LocalFileStore
+from openhands_cli.conversations.store.packed import (
+    PACKED_DIRNAME,
+    PackedEventLog,
+    PackError,
+    pack_conversation,
+    unpack_conversation,
+)
+
+
+def _make_event(i: int) -> dict:
+    return {
+        "id": f"id{i}",
+        "timestamp": f"2024-01-01T12:00:{i:02d}Z",
+        "source": "user",
+        "kind": "MessageEvent",
+        "llm_message": {
+            "role": "user",
+            "content": [{"type": "text", "text": f"Msg {i}"}],
+        },
+    }
+
+
+def _write_events(conversation_dir, start: int, stop: int) -> None:
+    events_dir = conversation_dir / "events"
+    events_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(start, stop):
+        event_file = events_dir / f"event-{i:05d}-id{i}.json"
+        event_file.write_text(json.dumps(_make_event(i)))
+
+
+class TestPackedEventLog:
+    def test_pack_moves_events_into_segments(self, tmp_path):
+        conversation_dir = tmp_path / "conv"
+        _write_events(conversation_dir, 0, 5)
+
+        assert pack_conversation(conversation_dir) == 5
+
+        log = PackedEventLog(conversation_dir)
+        assert len(log) == 5
+        assert list((conversation_dir / "events").glob("event-*.json")) == []
+        assert [e["id"] for e in log.iter_range() if e] == [f"id{i}" for i in range(5)]
+
+    def test_random_access_and_ranges(self, tmp_path):
+        conversation_dir = tmp_path / "conv"
+        _write_events(conversation_dir, 0, 10)
+        pack_conversation(conversation_dir)
+
+        log = PackedEventLog(conversation_dir)
+        event = log.read(7)
+        assert event is not None
+        assert event["id"] == "id7"
+        assert log.read(10) is None
+        assert [e["id"] for e in log.iter_range(8) if e] == ["id8", "id9"]
+
+    def test_segments_roll_over(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(packed_module, "SEGMENT_MAX_BYTES", 300)
+        conversation_dir = tmp_path / "conv"
+        _write_events(conversation_dir, 0, 6)
+        pack_conversation(conversation_dir)
+
+        segments = list((conversation_dir / PACKED_DIRNAME).glob("segment-*.jsonl"))
+        assert len(segments) > 1
+        log = PackedEventLog(conversation_dir)
+        assert [e["id"] for e in log.iter_range() if e] == [f"id{i}" for i in range(6)]
+
+    def test_pack_appends_new_events(self, tmp_path):
+        conversation_dir = tmp_path / "conv"
+        _write_events(conversation_dir, 0, 3)
+        pack_conversation(conversation_dir)
+        _write_events(conversation_dir, 3, 5)
+
+        assert pack_conversation(conversation_dir) == 2
+        assert len(PackedEventLog(conversation_dir)) == 5
+
+    def test_pack_removes_leftovers_of_interrupted_compaction(self, tmp_path):
+        conversation_dir = tmp_path / "conv"
+        _write_events(conversation_dir, 0, 3)
+        pack_conversation(conversation_dir)
+        # Simulate a crash after the index was written but before cleanup
+        _write_events(conversation_dir, 0, 3)
+
+        assert pack_conversation(conversation_dir) == 0
+        assert list((conversation_dir / "events").glob("event-*.json")) == []
+
+    def test_pack_rejects_gaps(self, tmp_path):
+        conversation_dir = tmp_path / "conv"
+        _write_events(conversation_dir, 0, 2)
+        _write_events(conversation_dir, 3, 4)
+
+        with pytest.raises(PackError):
+            pack_conversation(conversation_dir)
+        assert not PackedEventLog(conversation_dir).exists()
+
+    def test_unpack_restores_event_files(self, tmp_path):
+        conversation_dir = tmp_path / "conv"
+        _write_events(conversation_dir, 0, 3)
+        pack_conversation(conversation_dir)
+
+        assert unpack_conversation(conversation_dir) == 3
+
+        names = sorted(p.name for p in (conversation_dir / "events").iterdir())
+        assert names == [f"event-{i:05d}-id{i}.json" for i in range(3)]
+        assert not (conversation_dir / PACKED_DIRNAME).exists()
+
+    def test_unpack_without_packed_log_is_noop(self, tmp_path):
+        assert unpack_conversation(tmp_path / "missing") == 0
+
+
+class TestLocalFileStorePacked:
+    @pytest.fixture
+    def store(self, tmp_path):
+        return LocalFileStore(base_dir=str(tmp_path))
+
+    def test_reads_packed_and_newer_per_file_events(self, store, tmp_path):
+        conversation_dir = tmp_path / "conv"
+        _write_events(conversation_dir, 0, 4)
+        pack_conversation(conversation_dir)
+        _write_events(conversation_dir, 4, 6)
+
+        assert store.get_event_count("conv") == 6
+        events = list(store.load_events("conv"))
+        assert [e.id for e in events] == [f"id{i}" for i in range(6)]
+
+        tail = list(store.load_events("conv", limit=3, start_from_newest=True))
+        assert [e.id for e in tail] == ["id3", "id4", "id5"]
+
+    def test_metadata_of_packed_conversation(self, store, tmp_path):
+        conversation_dir = tmp_path / "conv"
+        _write_events(conversation_dir, 0, 3)
+        pack_conversation(conversation_dir)
+
+        convs = store.list_conversations()
+        assert len(convs) == 1
+        assert convs[0].title == "Msg 0"
@@ -0,0 +1,39 @@
+import json
+import os
+from pathlib import Path
+
+from openhands_cli.conversations.compact import compact_conversations
+from openhands_cli.conversations.store.packed import PackedEventLog
+from openhands_cli.locations import get_conversations_dir
+
+
+def _write_conversation(conv_id: str, count: int, mtime: float | None = None) -> Path:
+    conversation_dir = Path(get_conversations_dir()) / conv_id
+    events_dir = conversation_dir / "events"
+    events_dir.mkdir(parents=True)
+    for i in range(count):
+        event = {"id": f"id{i}", "timestamp": "2024-01-01T12:00:00Z"}
+        (events_dir / f"event-{i:05d}-id{i}.json").write_text(json.dumps(event))
+    if mtime is not None:
+        os.utime(events_dir, (mtime, mtime))
+    return conversation_dir
+
+
+class TestCompactConversations:
+    def test_compacts_idle_conversations(self):
+        conversation_dir = _write_conversation("idleconv", 3, mtime=0)
+
+        assert compact_conversations([], compact_all=True) is True
+        assert len(PackedEventLog(conversation_dir)) == 3
+
+    def test_skips_recent_conversations_unless_forced(self):
+        conversation_dir = _write_conversation("busyconv", 2)
+
+        compact_conversations(["busyconv"])
+        assert not PackedEventLog(conversation_dir).exists()
+
+        compact_conversations(["busyconv"], force=True)
+        assert len(PackedEventLog(conversation_dir)) == 2
+
+    def test_missing_conversation_reports_failure(self):
+        assert compact_conversations(["does-not-exist"]) is False
@@ -34,7 +34,7 @@ class TestViewer:
             MockStore.return_value.exists.return_value = True
             MockStore.return_value.get_event_count.return_value = 5
 
-            # Mock load_events to return an iterator
+            # Mock load_events_range to return an iterator
             # MessageEvent schema: has llm_message
             event = MessageEvent(
                 source="user",
@@ -42,7 +42,7 @@ class TestViewer:
                 # type="message" is removed as it might be extra
                 llm_message={"role": "user", "content": "Hello"},  # type: ignore
             )
-            MockStore.return_value.load_events.return_value = iter([event])
+            MockStore.return_value.load_events_range.return_value = iter([event])
 
             with mock.patch(
                 "openhands_cli.conversations.viewer.console"
@@ -78,7 +78,7 @@ class TestViewer:
                 yield mock.Mock()  # one good event
                 raise ValueError("Corrupt data")
 
-            MockStore.return_value.load_events.return_value = faulty_iterator()
+            MockStore.return_value.load_events_range.return_value = faulty_iterator()
 
             with mock.patch(
                 "openhands_cli.conversations.viewer.console"
@@ -100,3 +100,43 @@ class TestViewer:
                             error_printed = True
                             break
                     assert error_printed
+
+    def test_view_conversation_tail_loads_last_events(self):
+        with mock.patch(
+            "openhands_cli.conversations.viewer.LocalFileStore"
+        ) as MockStore:
+            MockStore.return_value.exists.return_value = True
+            MockStore.return_value.get_event_count.return_value = 100
+            MockStore.return_value.load_events_range.return_value = iter([mock.Mock()])
+
+            with (
+                mock.patch("openhands_cli.conversations.viewer.console"),
+                mock.patch(
+                    "openhands_cli.conversations.viewer.DefaultConversationVisualizer"
+                ),
+            ):
+                assert viewer.view_conversation("big-id", tail=5) is True
+
+            MockStore.return_value.load_events_range.assert_called_once_with(
+                "big-id", 95, 100
+            )
+
+    def test_view_conversation_range_supports_negative_positions(self):
+        with mock.patch(
+            "openhands_cli.conversations.viewer.LocalFileStore"
+        ) as MockStore:
+            MockStore.return_value.exists.return_value = True
+            MockStore.return_value.get_event_count.return_value = 100
+            MockStore.return_value.load_events_range.return_value = iter([mock.Mock()])
+
+            with (
+                mock.patch("openhands_cli.conversations.viewer.console"),
+                mock.patch(
+                    "openhands_cli.conversations.viewer.DefaultConversationVisualizer"
+                ),
+            ):
+                assert viewer.view_conversation("big-id", start=-10, stop=-5) is True
+
+            MockStore.return_value.load_events_range.assert_called_once_with(
+                "big-id", 90, 95
+            )
@@ -5,7 +5,7 @@ import tempfile
 from unittest.mock import patch
 
 import pytest
-from fastmcp.mcp_config import RemoteMCPServer, StdioMCPServer
+from fastmcp.mcp_config import RemoteMCPServer
 
 from openhands_cli.mcp.mcp_commands import (
     handle_mcp_add,
@@ -165,7 +165,9 @@ class TestMCPCommands:
         """Test listing when no servers exist."""
         args = argparse.Namespace()
 
-        with patch("openhands_cli.mcp.mcp_commands.list_servers") as mock_list_servers:
+        with patch(
+            "openhands_cli.mcp.mcp_commands.list_server_configs"
+        ) as mock_list_servers:
             mock_list_servers.return_value = {}
 
             with patch("openhands_cli.mcp.mcp_commands.console.print") as mock_print:
@@ -180,22 +182,23 @@ class TestMCPCommands:
         """Test listing when servers exist."""
         args = argparse.Namespace()
 
-        # Create FastMCP server objects instead of dicts
         test_servers = {
-            "http_server": RemoteMCPServer(
-                transport="http",
-                url="https://api.example.com",
-                headers={"Authorization": "Bearer token"},
-            ),
-            "stdio_server": StdioMCPServer(
-                transport="stdio",
-                command="python",
-                args=["-m", "server"],
-                env={"API_KEY": "secret"},
-            ),
+            "http_server": {
+                "transport": "http",
+                "url": "https://api.example.com",
+                "headers": {"Authorization": "Bearer token"},
+            },
+            "stdio_server": {
+                "transport": "stdio",
+                "command": "python",
+                "args": ["-m", "server"],
+                "env": {"API_KEY": "secret"},
+            },
         }
 
-        with patch("openhands_cli.mcp.mcp_commands.list_servers") as mock_list_servers:
+        with patch(
+            "openhands_cli.mcp.mcp_commands.list_server_configs"
+        ) as mock_list_servers:
             mock_list_servers.return_value = test_servers
 
             with patch("openhands_cli.mcp.mcp_commands.console.print") as mock_print:
@@ -322,42 +325,34 @@ class TestMCPCommands:
         """Test listing servers shows enabled/disabled status."""
         args = argparse.Namespace()
 
-        # Create test servers with enabled field
         test_servers = {
-            "enabled_server": RemoteMCPServer(
-                transport="http",
-                url="https://api.example.com",
-            ),
-            "disabled_server": StdioMCPServer(
-                transport="stdio",
-                command="python",
-                args=["-m", "server"],
-            ),
+            "enabled_server": {
+                "transport": "http",
+                "url": "https://api.example.com",
+            },
+            "disabled_server": {
+                "transport": "stdio",
+                "command": "python",
+                "args": ["-m", "server"],
+                "enabled": False,
+            },
         }
 
-        with patch("openhands_cli.mcp.mcp_commands.list_servers") as mock_list_servers:
+        with patch(
+            "openhands_cli.mcp.mcp_commands.list_server_configs"
+        ) as mock_list_servers:
             mock_list_servers.return_value = test_servers
 
-            with patch(
-                "openhands_cli.mcp.mcp_commands.is_server_enabled"
-            ) as mock_is_enabled:
-                # Mock is_server_enabled to return True for enabled_server,
-                # False for disabled_server
-                mock_is_enabled.side_effect = lambda name: name == "enabled_server"
-
-                with patch(
-                    "openhands_cli.mcp.mcp_commands.console.print"
-                ) as mock_print:
-                    handle_mcp_list(args)
-
-                    # Should call is_server_enabled for each server
-                    assert mock_is_enabled.call_count == 2
-
-                    # Check that output contains status indicators
-                    call_args_list = [str(call) for call in mock_print.call_args_list]
-                    content = " ".join(call_args_list)
-                    assert "enabled_server" in content
-                    assert "disabled_server" in content
+            with patch("openhands_cli.mcp.mcp_commands.console.print") as mock_print:
+                handle_mcp_list(args)
+
+                # Check that output contains status indicators
+                call_args_list = [str(call) for call in mock_print.call_args_list]
+                content = " ".join(call_args_list)
+                assert "enabled_server" in content
+                assert "disabled_server" in content
+                assert "✓ enabled" in content
+                assert "✗ disabled" in content
 
     def test_handle_mcp_command_routing(self):
         """Test that handle_mcp_command routes to correct handlers."""
@@ -401,7 +396,7 @@ class TestMCPCommandsIntegration:
         from openhands_cli.mcp.mcp_utils import (
             add_server,
             get_server,
-            list_servers,
+            list_server_configs,
             remove_server,
             server_exists,
         )
@@ -410,7 +405,8 @@ class TestMCPCommandsIntegration:
         with (
             patch("openhands_cli.mcp.mcp_commands.add_server", side_effect=add_server),
             patch(
-                "openhands_cli.mcp.mcp_commands.list_servers", side_effect=list_servers
+                "openhands_cli.mcp.mcp_commands.list_server_configs",
+                side_effect=list_server_configs,
             ),
             patch("openhands_cli.mcp.mcp_commands.get_server", side_effect=get_server),
             patch(
@@ -3,7 +3,11 @@
 import json
 
 import pytest
-from fastmcp.mcp_config import RemoteMCPServer, StdioMCPServer
+from fastmcp.mcp_config import (
+    RemoteMCPServer,
+    StdioMCPServer,
+    infer_transport_type_from_url,
+)
 
 from openhands_cli.mcp.mcp_utils import (
     MCPConfigurationError,
@@ -16,6 +20,7 @@ from openhands_cli.mcp.mcp_utils import (
     get_server,
     is_server_enabled,
     list_enabled_servers,
+    list_server_configs,
     list_servers,
     load_mcp_config,
     remove_server,
@@ -173,6 +178,99 @@ class TestMCPFunctions:
         assert isinstance(servers["test1"], StdioMCPServer)
         assert isinstance(servers["test2"], RemoteMCPServer)
 
+    def test_list_server_configs_matches_list_servers(self, temp_config_path):
+        """Test the plain listing reads what the validated listing reads."""
+        add_server("test1", "stdio", "python", args=["-m", "server"])
+        add_server("test2", "sse", "https://example.com/sse", enabled=False)
+
+        configs = list_server_configs()
+        servers = list_servers()
+
+        assert configs.keys() == servers.keys()
+        for name, server in servers.items():
+            for key in ("transport", "command", "args", "url", "enabled"):
+                assert configs[name].get(key) == server.model_dump().get(key)
+
+    def test_list_server_configs_infers_transport(self, temp_config_path):
+        """Test servers at the root of the file and a missing transport."""
+        temp_config_path.write_text(
+            json.dumps(
+                {
+                    "local": {"command": "python"},
+                    "remote": {"url": "https://example.com/mcp"},
+                    "events": {"url": "https://example.com/sse?x=1"},
+                }
+            )
+        )
+
+        configs = list_server_configs()
+
+        assert configs["local"]["transport"] == "stdio"
+        assert configs["remote"]["transport"] == "http"
+        assert configs["events"]["transport"] == "sse"
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {
+                "mcpServers": {
+                    "local": {"command": "python", "args": ["-m", "server"]},
+                    "remote": {"url": "https://example.com/mcp"},
+                    "events": {"url": "https://example.com/sse"},
+                    "query": {"url": "https://example.com/sse?x=1"},
+                    "nested": {"url": "https://example.com/api/sse/stream"},
+                    "prefix": {"url": "https://example.com/ssex"},
+                    "both": {"command": "python", "url": "https://example.com/sse"},
+                }
+            },
+            {
+                "local": {"command": "python"},
+                "remote": {"url": "https://example.com/mcp", "transport": "sse"},
+                "other": 1,
+            },
+            {"mcpServers": {}},
+            {"mcpServers": []},
+            {"mcpServers": {"test": {"args": []}}},
+            {"mcpServers": {"test": {"command": 3}}},
+        ],
+    )
+    def test_list_server_configs_agrees_with_fastmcp(self, temp_config_path, data):
+        """Test the plain listing accepts and reads configs like fastmcp does."""
+        temp_config_path.write_text(json.dumps(data))
+
+        try:
+            servers = load_mcp_config().mcpServers
+        except MCPConfigurationError:
+            with pytest.raises(MCPConfigurationError):
+                list_server_configs()
+            return
+
+        configs = list_server_configs()
+        assert configs.keys() == servers.keys()
+        for name, server in servers.items():
+            if isinstance(server, RemoteMCPServer):
+                transport = server.transport or infer_transport_type_from_url(
+                    server.url
+                )
+            else:
+                transport = "stdio"
+            assert configs[name]["transport"] == transport
+
+    def test_list_server_configs_empty(self, temp_config_path):
+        """Test the plain listing without a configuration file."""
+        assert list_server_configs() == {}
+
+    @pytest.mark.parametrize(
+        "content",
+        ["invalid json", "[]", '{"mcpServers": {"test": {"args": []}}}'],
+    )
+    def test_list_server_configs_invalid(self, temp_config_path, content):
+        """Test the plain listing rejects invalid configuration files."""
+        temp_config_path.write_text(content)
+
+        with pytest.raises(MCPConfigurationError, match="Invalid MCP configuration"):
+            list_server_configs()
+
     def test_get_server_success(self, temp_config_path):
         """Test getting an existing server."""
         add_server("test", "http", "https://example.com")
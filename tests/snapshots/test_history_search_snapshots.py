@@ -17,9 +17,9 @@ class TestHistorySearchSnapshots:
         """Snapshot test for history search modal with mock data."""
 
         # Setup mock history data
-        from openhands_cli.locations import get_prompt_history_path
+        from openhands_cli.locations import get_legacy_prompt_history_path
 
-        history_file = Path(get_prompt_history_path())
+        history_file = Path(get_legacy_prompt_history_path())
         history_file.parent.mkdir(parents=True, exist_ok=True)
 
         test_data = [
@@ -57,9 +57,9 @@ class TestHistorySearchSnapshots:
         """Snapshot test for history search modal with a filter active."""
 
         # Setup mock history data
-        from openhands_cli.locations import get_prompt_history_path
+        from openhands_cli.locations import get_legacy_prompt_history_path
 
-        history_file = Path(get_prompt_history_path())
+        history_file = Path(get_legacy_prompt_history_path())
         history_file.parent.mkdir(parents=True, exist_ok=True)
 
         test_data = [
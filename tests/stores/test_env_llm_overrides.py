@@ -14,8 +14,8 @@ from openhands_cli.stores.agent_store import (
     LLMEnvOverrides,
     MissingEnvironmentVariablesError,
     apply_llm_overrides,
-    check_and_warn_env_vars,
 )
+from openhands_cli.stores.llm_env import check_and_warn_env_vars
 
 
 class TestLLMEnvOverridesFromEnv:
@@ -2,7 +2,12 @@ import json
 from pathlib import Path
 from unittest.mock import patch
 
-from openhands_cli.locations import get_project_id, get_prompt_history_path
+from openhands_cli.locations import (
+    get_legacy_prompt_history_path,
+    get_project_id,
+    get_prompt_history_path,
+)
+from openhands_cli.stores import prompt_history
 from openhands_cli.stores.prompt_history import PromptHistoryStore
 
 
@@ -48,25 +53,24 @@ def test_prompt_history_max_entries(mock_locations):
 
 
 def test_prompt_history_file_content(mock_locations):
-    """Test that the history file contains expected JSON structure."""
+    """Test that the history file contains one JSON entry per line."""
     store = PromptHistoryStore()
     store.append("test prompt")
+    store.append("other prompt")
 
     path = Path(get_prompt_history_path())
     assert path.exists()
 
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    data = [json.loads(line) for line in lines]
 
-    assert isinstance(data, list)
-    assert len(data) == 1
-    assert data[0]["text"] == "test prompt"
-    assert "timestamp" in data[0]
+    assert [entry["text"] for entry in data] == ["test prompt", "other prompt"]
+    assert all("timestamp" in entry for entry in data)
 
 
 def test_prompt_history_corrupt_json(mock_locations):
     """Test handling of corrupt JSON in history file."""
-    path = Path(get_prompt_history_path())
+    path = Path(get_legacy_prompt_history_path())
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text("invalid json", encoding="utf-8")
 
@@ -77,7 +81,7 @@ def test_prompt_history_corrupt_json(mock_locations):
 
 def test_prompt_history_invalid_format(mock_locations):
     """Test handling of unexpected JSON format (not a list)."""
-    path = Path(get_prompt_history_path())
+    path = Path(get_legacy_prompt_history_path())
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps({"not": "a list"}), encoding="utf-8")
 
@@ -118,7 +122,7 @@ def test_prompt_history_write_error(mock_locations):
     original_open = open
 
     def side_effect(file, mode="r", *args, **kwargs):
-        if "w" in mode:
+        if "w" in mode or "a" in mode:
             raise OSError("Write failed")
         return original_open(file, mode, *args, **kwargs)
 
@@ -129,7 +133,7 @@ def test_prompt_history_write_error(mock_locations):
 
 def test_prompt_history_append_corrupt_load(mock_locations):
     """Test that append handles corrupt existing file by overwriting."""
-    path = Path(get_prompt_history_path())
+    path = Path(get_legacy_prompt_history_path())
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text("invalid json", encoding="utf-8")
 
@@ -142,7 +146,7 @@ def test_prompt_history_append_corrupt_load(mock_locations):
 
 def test_prompt_history_ignores_malformed_entries(mock_locations):
     """Test malformed list items are skipped instead of crashing callers."""
-    path = Path(get_prompt_history_path())
+    path = Path(get_legacy_prompt_history_path())
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(
         json.dumps(
@@ -163,3 +167,99 @@ def test_prompt_history_ignores_malformed_entries(mock_locations):
         {"text": "first prompt", "timestamp": "2026-05-01T10:00:00"},
     ]
     assert store.load() == ["latest prompt", "first prompt"]
+
+
+def test_prompt_history_migrates_legacy_json(mock_locations):
+    """Test that the legacy JSON list is converted to JSONL on first append."""
+    legacy_path = Path(get_legacy_prompt_history_path())
+    legacy_path.parent.mkdir(parents=True, exist_ok=True)
+    legacy_path.write_text(
+        json.dumps(
+            [
+                {"text": "old 1", "timestamp": "2026-05-01T10:00:00"},
+                {"text": "old 2", "timestamp": "2026-05-02T10:00:00"},
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    store = PromptHistoryStore()
+    assert store.load() == ["old 2", "old 1"]
+
+    store.append("new")
+
+    assert not legacy_path.exists()
+    assert Path(get_prompt_history_path()).exists()
+    assert store.load() == ["new", "old 2", "old 1"]
+
+
+def test_prompt_history_concurrent_stores_keep_all_entries(mock_locations):
+    """Test that interleaved appends from separate sessions are not lost."""
+    store_a = PromptHistoryStore()
+    store_b = PromptHistoryStore()
+
+    for i in range(5):
+        store_a.append(f"a{i}")
+        store_b.append(f"b{i}")
+
+    expected = [p for i in range(5) for p in (f"a{i}", f"b{i}")]
+    assert PromptHistoryStore().load() == list(reversed(expected))
+
+
+def test_prompt_history_compacts_file(mock_locations):
+    """Test that the file is periodically compacted to max_entries."""
+    store = PromptHistoryStore(max_entries=3)
+
+    for i in range(10):
+        store.append(f"p{i}")
+
+    lines = Path(get_prompt_history_path()).read_text(encoding="utf-8").splitlines()
+    assert len(lines) <= 2 * store.max_entries
+    assert store.load() == ["p9", "p8", "p7"]
+
+
+def test_prompt_history_reads_across_blocks(mock_locations, monkeypatch):
+    """Test that the reverse reader handles lines spanning read blocks."""
+    monkeypatch.setattr(prompt_history, "_READ_BLOCK_SIZE", 7)
+    store = PromptHistoryStore()
+    prompts = [f"prompt number {i}" for i in range(10)]
+    for prompt in prompts:
+        store.append(prompt)
+
+    assert store.load() == list(reversed(prompts))
+
+
+def test_prompt_history_skips_partial_line(mock_locations):
+    """Test that a partially written trailing line is ignored."""
+    store = PromptHistoryStore()
+    store.append("complete")
+
+    with open(get_prompt_history_path(), "a", encoding="utf-8") as f:
+        f.write('{"text": "half')
+
+    assert store.load() == ["complete"]
+
+
+def test_prompt_history_append_after_partial_line(mock_locations):
+    """Test that an entry appended after a partial line is kept."""
+    store = PromptHistoryStore()
+    store.append("complete")
+
+    with open(get_prompt_history_path(), "a", encoding="utf-8") as f:
+        f.write('{"text": "half')
+    store.append("next")
+
+    assert store.load() == ["next", "complete"]
+
+
+def test_load_global_entries_merges_projects(mock_locations, monkeypatch):
+    """Test that global history merges all projects, newest first."""
+    PromptHistoryStore().append("project a")
+
+    monkeypatch.setenv("OPENHANDS_WORK_DIR", str(mock_locations.work_dir / "other"))
+    PromptHistoryStore().append("project b")
+
+    entries = prompt_history.load_global_entries(max_entries=10)
+
+    assert [e["text"] for e in entries] == ["project b", "project a"]
+    assert len(prompt_history.load_global_entries(max_entries=1)) == 1
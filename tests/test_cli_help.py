@@ -82,3 +82,34 @@ def test_view_subcommand_parses_correctly() -> None:
     assert args.command == "view"
     assert args.conversation_id == "test-conversation-id"
     assert args.limit == 5
+
+
+def test_view_subcommand_parses_range_options() -> None:
+    """View subcommand should parse --tail, --from and --to."""
+    parser = create_main_parser()
+
+    args = parser.parse_args(["view", "conv-id", "--tail", "50"])
+    assert args.tail == 50
+    assert args.from_index is None
+    assert args.to_index is None
+
+    args = parser.parse_args(["view", "conv-id", "--from", "-100", "--to", "-50"])
+    assert args.tail is None
+    assert args.from_index == -100
+    assert args.to_index == -50
+
+
+def test_compact_subcommand_parses_correctly() -> None:
+    """Compact subcommand should accept conversation IDs, --all and --force."""
+    parser = create_main_parser()
+
+    args = parser.parse_args(["compact", "conv-a", "conv-b"])
+    assert args.command == "compact"
+    assert args.conversation_ids == ["conv-a", "conv-b"]
+    assert args.all is False
+    assert args.force is False
+
+    args = parser.parse_args(["compact", "--all", "--force"])
+    assert args.conversation_ids == []
+    assert args.all is True
+    assert args.force is True
@@ -0,0 +1,181 @@
+"""Tests that lightweight commands don't import the heavy dependencies.
+
+Each command runs in a fresh interpreter, since the test process already has
+most modules imported.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from openhands_cli.conversations.store.local import LocalFileStore
+
+
+# Top-level packages (or package prefixes) only the agent, the TUI and the
+# commands changing the MCP configuration need
+HEAVY_MODULES = ("openhands.sdk", "openhands.tools", "litellm", "textual", "fastmcp")
+
+_DRIVER = """
+import json
+import sys
+import types
+
+argv, fake_viewer, out = json.loads(sys.argv[1])
+if fake_viewer:
+    # Rendering events needs the SDK; only the dispatch of `view` is audited
+    viewer = types.ModuleType("openhands_cli.conversations.viewer")
+    viewer.view_conversation = lambda *args, **kwargs: True
+    sys.modules[viewer.__name__] = viewer
+
+sys.argv = ["openhands", *argv]
+try:
+    from openhands_cli.entrypoint import main
+
+    main()
+except SystemExit:
+    pass
+
+with open(out, "w") as f:
+    json.dump(sorted(sys.modules), f)
+"""
+
+
+def _imported_modules(
+    tmp_path: Path, argv: list[str], fake_viewer: bool = False
+) -> list[str]:
+    out = tmp_path / "modules.json"
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if key not in ("LLM_API_KEY", "LLM_BASE_URL", "LLM_MODEL")
+    }
+    env["OPENHANDS_PERSISTENCE_DIR"] = str(tmp_path / "persistence")
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(Path(__file__).parent.parent), env.get("PYTHONPATH", "")]
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", _DRIVER, json.dumps([argv, fake_viewer, str(out)])],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert out.exists(), result.stderr
+    return json.loads(out.read_text())
+
+
+def _heavy(modules: list[str]) -> list[str]:
+    return [
+        name
+        for name in modules
+        if any(name == heavy or name.startswith(f"{heavy}.") for heavy in HEAVY_MODULES)
+    ]
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--version"],
+        ["--help"],
+        ["mcp", "list"],
+        ["mcp", "--help"],
+        ["view", "--help"],
+        ["logout"],
+        ["--resume"],
+    ],
+    ids=lambda argv: " ".join(argv),
+)
+def test_lightweight_commands_skip_heavy_imports(tmp_path, argv):
+    modules = _imported_modules(tmp_path, argv)
+
+    assert "openhands_cli.entrypoint" in modules
+    assert _heavy(modules) == []
+
+
+def test_mcp_list_with_servers_skips_heavy_imports(tmp_path):
+    persistence_dir = tmp_path / "persistence"
+    persistence_dir.mkdir()
+    (persistence_dir / "mcp.json").write_text(
+        json.dumps(
+            {
+                "mcpServers": {
+                    "local": {"command": "python", "args": ["-m", "server"]},
+                    "remote": {"url": "https://example.com/mcp", "enabled": False},
+                }
+            }
+        )
+    )
+
+    modules = _imported_modules(tmp_path, ["mcp", "list"])
+
+    assert "openhands_cli.mcp.mcp_commands" in modules
+    assert _heavy(modules) == []
+
+
+def test_resume_listing_from_index_skips_heavy_imports(tmp_path):
+    conversations_dir = tmp_path / "persistence" / "conversations"
+    events_dir = conversations_dir / "0123456789abcdef0123456789abcdef" / "events"
+    events_dir.mkdir(parents=True)
+    event = {
+        "kind": "MessageEvent",
+        "timestamp": "2024-01-01T12:00:00Z",
+        "source": "user",
+        "llm_message": {
+            "role": "user",
+            "content": [{"type": "text", "text": "Fix the bug"}],
+        },
+    }
+    (events_dir / "event-00000.json").write_text(json.dumps(event))
+    # Old enough for the index to trust the directory mtime
+    backdated = time.time() - 3600
+    os.utime(events_dir, (backdated, backdated))
+    # Index the conversation, as an earlier listing would have
+    (conversation,) = LocalFileStore(str(conversations_dir)).list_conversations()
+    assert conversation.title == "Fix the bug"
+
+    modules = _imported_modules(tmp_path, ["--resume"])
+
+    assert "openhands_cli.conversations.display" in modules
+    assert _heavy(modules) == []
+
+
+def test_view_dispatch_skips_heavy_imports(tmp_path):
+    modules = _imported_modules(
+        tmp_path, ["view", "00000000000000000000000000000000"], fake_viewer=True
+    )
+
+    assert _heavy(modules) == []
+
+
+def test_profile_startup_prints_report(tmp_path):
+    env = {**os.environ, "OPENHANDS_PROFILE_STARTUP_THRESHOLD_MS": "0"}
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(Path(__file__).parent.parent), env.get("PYTHONPATH", "")]
+    )
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from openhands_cli.entrypoint import main; main()",
+            "--profile-startup",
+            "--version",
+        ],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "OpenHands CLI" in result.stdout
+    assert "=== Startup profile ===" in result.stderr
+    assert "create_main_parser" in result.stderr
+    assert "openhands_cli.argparsers.main_parser" in result.stderr
@@ -0,0 +1,81 @@
+"""Tests for the startup profiler."""
+
+import sys
+from itertools import count
+
+import pytest
+
+from openhands_cli.startup_profile import StartupProfiler
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    """A package whose module `outer` imports `inner`."""
+    root = tmp_path / "profiled_pkg"
+    root.mkdir()
+    (root / "__init__.py").write_text("")
+    (root / "outer.py").write_text("from profiled_pkg import inner\n")
+    (root / "inner.py").write_text("VALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "profiled_pkg"
+    for name in [m for m in sys.modules if m.startswith("profiled_pkg")]:
+        del sys.modules[name]
+
+
+def _profile_import(name: str, profiler: StartupProfiler) -> None:
+    profiler.install()
+    try:
+        __import__(name)
+    finally:
+        profiler.uninstall()
+
+
+def test_imports_are_recorded_as_a_tree(package):
+    __import__(package)
+    profiler = StartupProfiler()
+
+    _profile_import(f"{package}.outer", profiler)
+
+    (outer,) = profiler.imports.children
+    assert outer.name == f"{package}.outer"
+    assert [child.name for child in outer.children] == [f"{package}.inner"]
+    assert outer.duration >= outer.children[0].duration
+    assert outer.self_time == pytest.approx(outer.duration - outer.children[0].duration)
+
+
+def test_modules_already_imported_are_not_recorded(package):
+    __import__(f"{package}.inner")
+    profiler = StartupProfiler()
+
+    _profile_import(f"{package}.outer", profiler)
+
+    (outer,) = profiler.imports.children
+    assert outer.name == f"{package}.outer"
+    assert outer.children == []
+
+
+def test_report_lists_steps_and_slow_imports(package):
+    ticks = count()
+    # Each clock reading is 1 ms after the previous one
+    profiler = StartupProfiler(clock=lambda: next(ticks) / 1000)
+
+    with profiler.step("create_main_parser"):
+        pass
+    __import__(package)
+    _profile_import(f"{package}.outer", profiler)
+
+    report = profiler.report(threshold_ms=0)
+    assert "create_main_parser" in report
+    assert f"    {package}.inner" in report
+    # The innermost import took a single tick
+    assert f"{package}.inner" not in profiler.report(threshold_ms=1.5)
+
+
+def test_uninstall_restores_the_import_system(package):
+    profiler = StartupProfiler()
+    profiler.install()
+    profiler.uninstall()
+
+    __import__(f"{package}.outer")
+
+    assert profiler.imports.children == []
@@ -1,6 +1,20 @@
 """Tests for openhands_cli.tui.modals.settings.choices."""
 
-from openhands_cli.tui.modals.settings.choices import get_provider_options
+from unittest.mock import Mock
+
+import pytest
+
+from openhands_cli.tui.modals.settings import choices
+from openhands_cli.tui.modals.settings.choices import (
+    ModelCatalog,
+    filter_model_options,
+    get_catalog,
+    get_model_options,
+    get_provider_options,
+    load_snapshot,
+    refresh_catalog,
+    write_snapshot,
+)
 
 
 def test_openhands_provider_is_listed_first() -> None:
@@ -22,3 +36,97 @@ def test_remaining_providers_are_sorted_alphabetically() -> None:
     options = get_provider_options()
     other_values = [value for value, _ in options if value != "openhands"]
     assert other_values == sorted(other_values)
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, monkeypatch):
+    """Point the catalogue to a snapshot in a temporary directory."""
+    path = tmp_path / "model_catalog.json"
+    monkeypatch.setattr(choices, "CATALOG_PATH", path)
+    monkeypatch.setattr(choices, "_catalog", None)
+    monkeypatch.setattr(choices, "_installed_version", INSTALLED_VERSIONS.get)
+    return path
+
+
+INSTALLED_VERSIONS = {"litellm": "1.0.0", "openhands-sdk": "2.0.0"}
+
+
+CATALOG = ModelCatalog(
+    providers=["openhands", "openai"],
+    models={"openhands": ["claude-sonnet-4"], "openai": ["gpt-4o", "gpt-4o-mini"]},
+)
+
+
+def test_snapshot_is_used_without_building_the_catalog(snapshot_path, monkeypatch):
+    write_snapshot(CATALOG, snapshot_path, litellm_version="1.0.0")
+    monkeypatch.setattr(choices, "build_catalog", Mock(side_effect=AssertionError))
+
+    assert get_provider_options() == [("openhands", "openhands"), ("openai", "openai")]
+    assert get_model_options("openai") == [
+        ("gpt-4o", "gpt-4o"),
+        ("gpt-4o-mini", "gpt-4o-mini"),
+    ]
+    assert get_model_options("unknown") == []
+    assert get_catalog().from_snapshot
+
+
+@pytest.mark.parametrize("content", ["not json", "[]", '{"schema_version": 0}'])
+def test_unusable_snapshot_is_ignored(snapshot_path, monkeypatch, content):
+    snapshot_path.write_text(content)
+    monkeypatch.setattr(choices, "build_catalog", Mock(return_value=CATALOG))
+
+    assert load_snapshot(snapshot_path) is None
+    assert get_catalog() == CATALOG
+    assert not get_catalog().from_snapshot
+
+
+@pytest.mark.parametrize(
+    ("versions", "usable"),
+    [
+        ({"litellm_version": "1.0.0", "sdk_version": "2.0.0"}, True),
+        ({"litellm_version": "0.9.0", "sdk_version": "2.0.0"}, False),
+        ({"litellm_version": "1.0.0", "sdk_version": "1.9.0"}, False),
+        ({}, True),
+    ],
+)
+def test_snapshot_of_other_versions_is_ignored(snapshot_path, versions, usable):
+    write_snapshot(CATALOG, snapshot_path, **versions)
+
+    assert (load_snapshot(snapshot_path) == CATALOG) is usable
+
+
+def test_versions_without_metadata_are_not_checked(snapshot_path, monkeypatch):
+    write_snapshot(CATALOG, snapshot_path, litellm_version="0.9.0")
+    monkeypatch.setattr(choices, "_installed_version", lambda _distribution: None)
+
+    assert load_snapshot(snapshot_path) == CATALOG
+
+
+def test_refresh_reports_whether_the_catalog_changed(snapshot_path, monkeypatch):
+    write_snapshot(CATALOG, snapshot_path)
+    get_catalog()
+    monkeypatch.setattr(choices, "build_catalog", Mock(return_value=CATALOG))
+    assert refresh_catalog() is False
+
+    updated = ModelCatalog(
+        providers=CATALOG.providers,
+        models={**CATALOG.models, "openai": ["gpt-4o", "gpt-5"]},
+    )
+    monkeypatch.setattr(choices, "build_catalog", Mock(return_value=updated))
+    assert refresh_catalog() is True
+    assert get_model_options("openai") == [("gpt-4o", "gpt-4o"), ("gpt-5", "gpt-5")]
+
+
+def test_filter_model_options_is_fuzzy():
+    options = [
+        ("gpt-4o", "gpt-4o"),
+        ("claude-sonnet-4-5", "claude-sonnet-4-5"),
+        ("claude-opus-4", "claude-opus-4"),
+    ]
+
+    assert filter_model_options(options, "") == options
+    assert filter_model_options(options, "son45") == [
+        ("claude-sonnet-4-5", "claude-sonnet-4-5")
+    ]
+    assert filter_model_options(options, "cl4") == options[1:]
+    assert filter_model_options(options, "xyz") == []
@@ -12,7 +12,7 @@ from unittest.mock import Mock, patch
 import pytest
 from textual.app import App, ComposeResult
 from textual.css.query import NoMatches
-from textual.widgets import Button, Static
+from textual.widgets import Button, Select, Static
 
 from openhands.sdk import LLM, Agent
 from openhands_cli.tui.modals.settings import settings_screen as ss
@@ -376,6 +376,75 @@ async def test_advanced_mode_dependency_chain(app):
     assert screen.memory_select.disabled is False
 
 
+@pytest.mark.asyncio
+async def test_model_filter_narrows_model_options(app):
+    """The model filter keeps the models matching it, and is reset per provider."""
+    app_obj, pilot = app
+    screen = app_obj.settings_screen
+    assert screen is not None
+
+    with patch.object(ss, "get_model_options") as mock_get_options:
+        mock_get_options.return_value = [
+            ("gpt-4o", "gpt-4o"),
+            ("gpt-4o-mini", "gpt-4o-mini"),
+            ("o4-mini", "o4-mini"),
+        ]
+        screen.mode_select.value = "basic"
+        screen.provider_select.value = "openai"
+        await pilot.pause()
+        assert screen.model_filter_input.disabled is False
+
+        screen.model_filter_input.value = "mini"
+        await pilot.pause()
+        options = list(screen.model_select._options)  # noqa: SLF001
+        assert [value for _, value in options if value is not Select.NULL] == [
+            "gpt-4o-mini",
+            "o4-mini",
+        ]
+
+        screen.model_filter_input.value = "claude"
+        await pilot.pause()
+        options = list(screen.model_select._options)  # noqa: SLF001
+        assert ("No models match the filter", "") in options
+
+        screen.provider_select.value = "anthropic"
+        await pilot.pause()
+        assert screen.model_filter_input.value == ""
+
+
+@pytest.mark.asyncio
+async def test_model_filter_keeps_current_selection(app):
+    """Filtering out the selected model neither clears nor loses the selection."""
+    app_obj, pilot = app
+    screen = app_obj.settings_screen
+    assert screen is not None
+
+    with patch.object(ss, "get_model_options") as mock_get_options:
+        mock_get_options.return_value = [
+            ("gpt-4o", "gpt-4o"),
+            ("gpt-4o-mini", "gpt-4o-mini"),
+            ("o4-mini", "o4-mini"),
+        ]
+        screen.mode_select.value = "basic"
+        screen.provider_select.value = "openai"
+        await pilot.pause()
+        screen.model_select.value = "gpt-4o"
+        await pilot.pause()
+
+        screen.model_filter_input.value = "o4"
+        await pilot.pause()
+        options = list(screen.model_select._options)  # noqa: SLF001
+        assert [value for _, value in options if value is not Select.NULL] == [
+            "gpt-4o",
+            "o4-mini",
+        ]
+        assert screen.model_select.value == "gpt-4o"
+
+        screen.model_filter_input.value = ""
+        await pilot.pause()
+        assert screen.model_select.value == "gpt-4o"
+
+
 #
 # 5. Save button wiring: success & error flows
 #
@@ -30,6 +30,7 @@ class TestSettingsTab:
             tab.query_one("#mode_select", Select)
             tab.query_one("#provider_select", Select)
             tab.query_one("#model_select", Select)
+            tab.query_one("#model_filter_input", Input)
 
             tab.query_one("#custom_model_input", Input)
             tab.query_one("#base_url_input", Input)
@@ -48,6 +49,7 @@ class TestSettingsTab:
             mode = tab.query_one("#mode_select", Select)
             provider = tab.query_one("#provider_select", Select)
             model = tab.query_one("#model_select", Select)
+            model_filter = tab.query_one("#model_filter_input", Input)
 
             custom_model = tab.query_one("#custom_model_input", Input)
             base_url = tab.query_one("#base_url_input", Input)
@@ -59,6 +61,7 @@ class TestSettingsTab:
             # Provider explicitly enabled; model disabled until provider chosen
             assert provider.disabled is False
             assert model.disabled is True
+            assert model_filter.disabled is True
 
             # Advanced inputs disabled by default
             assert custom_model.disabled is True
@@ -0,0 +1,88 @@
+"""Tests for the prompt history search index."""
+
+from unittest.mock import patch
+
+from openhands_cli.tui.modals import history_index
+from openhands_cli.tui.modals.history_index import (
+    HistorySearchIndex,
+    find_match_positions,
+)
+
+
+def _index(*texts: str) -> HistorySearchIndex:
+    return HistorySearchIndex([{"text": t, "timestamp": ""} for t in texts])
+
+
+class TestHistorySearchIndex:
+    def test_empty_query_returns_newest_entries(self):
+        index = _index("c", "b", "a")
+
+        assert index.search("", limit=2) == [0, 1]
+
+    def test_all_terms_must_match(self):
+        index = _index("fix the parser", "fix the layout", "parser tests")
+
+        assert index.search("FIX parser", limit=10) == [0]
+
+    def test_exact_matches_rank_before_fuzzy_matches(self):
+        index = _index("fix a cat", "review fact sheet", "react form")
+
+        assert index.search("fact", limit=10) == [1, 0]
+
+    def test_fuzzy_matches_ranked_by_compactness(self):
+        index = _index("r x x x f x x x c", "rfc draft", "nothing here")
+
+        assert index.search("rfc", limit=10) == [1, 0]
+
+    def test_multiline_prompts_match(self):
+        index = _index("first line\nsecond line", "other")
+
+        assert index.search("line second", limit=10) == [0]
+
+    def test_respects_limit(self):
+        index = _index(*[f"prompt {i}" for i in range(50)])
+
+        assert index.search("prompt", limit=5) == [0, 1, 2, 3, 4]
+
+    def test_growing_query_narrows_previous_matches(self):
+        index = _index("debug logic", "logging", "layout")
+        assert index.search("lo", limit=10) == [0, 1, 2]
+
+        with patch.object(index, "_scan", wraps=index._scan) as scan:
+            assert index.search("log", limit=10) == [0, 1]
+            assert index.search("logic", limit=10) == [0]
+
+        scan.assert_not_called()
+
+    def test_new_query_rescans(self):
+        index = _index("debug logic", "layout")
+        index.search("logic", limit=10)
+
+        with patch.object(index, "_scan", wraps=index._scan) as scan:
+            assert index.search("lay", limit=10) == [1]
+
+        scan.assert_called_once()
+
+    def test_truncated_results_are_not_narrowed(self, monkeypatch):
+        monkeypatch.setattr(history_index, "FUZZY_RANK_POOL", 1)
+        index = _index("a1b", "a2b", "a3b x")
+        index.search("ab", limit=10)
+
+        assert index.search("ab x", limit=10) == [2]
+
+    def test_special_characters_are_literal(self):
+        index = _index("fix [bug] in a.b", "fix bug in ab")
+
+        assert index.search("[bug]", limit=10) == [0]
+        assert index.search("a.b", limit=10) == [0]
+
+
+class TestFindMatchPositions:
+    def test_substring(self):
+        assert find_match_positions("the bug", "bug") == [4, 5, 6]
+
+    def test_subsequence(self):
+        assert find_match_positions("refactor", "rfc") == [0, 2, 4]
+
+    def test_no_match(self):
+        assert find_match_positions("refactor", "xyz") == []
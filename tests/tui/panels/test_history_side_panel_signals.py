@@ -305,3 +305,39 @@ async def test_switch_modal_result_cancelled() -> None:
         await pilot.pause()
 
         assert result == [False]
+
+
+@pytest.mark.asyncio
+async def test_history_panel_shows_fork_lineage(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Forked conversations show the title of the conversation they came from."""
+    parent_id = uuid.uuid4().hex
+    fork_id = uuid.uuid4().hex
+    conversations = [
+        ConversationMetadata(
+            id=fork_id,
+            created_at=datetime(2025, 1, 2, tzinfo=UTC),
+            title="refactor the parser",
+            parent_id=parent_id,
+        ),
+        ConversationMetadata(
+            id=parent_id,
+            created_at=datetime(2025, 1, 1, tzinfo=UTC),
+            title="refactor the parser",
+        ),
+    ]
+    monkeypatch.setattr(
+        LocalFileStore, "list_conversations", lambda self, limit=100: conversations
+    )
+
+    app = HistoryMessagesTestApp()
+    async with app.run_test():
+        panel = app.query_one(HistorySidePanel)
+        items = {
+            item.conversation_id: str(item.render())
+            for item in panel.query(HistoryItemContent)
+        }
+
+        assert "⑂ refactor the parser" in items[fork_id]
+        assert "⑂" not in items[parent_id]
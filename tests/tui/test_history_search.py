@@ -11,10 +11,10 @@ from openhands_cli.tui.modals.history_search import HistorySearchScreen
 async def test_history_search_flow(mock_locations):
     """Test the fuzzy search and selection flow in HistorySearchScreen."""
     # 1. Setup mock history data
-    from openhands_cli.locations import get_prompt_history_path
+    from openhands_cli.locations import get_legacy_prompt_history_path
 
     # We MUST use the actual location helper so the hash matches the code being tested
-    history_file = Path(get_prompt_history_path())
+    history_file = Path(get_legacy_prompt_history_path())
     history_file.parent.mkdir(parents=True, exist_ok=True)
 
     test_data = [
@@ -67,3 +67,44 @@ async def test_history_search_flow(mock_locations):
 
         # The screen should dismiss and call our callback
         assert app.search_result == "find the bug in logic"
+
+
+@pytest.mark.asyncio
+async def test_history_search_fuzzy_and_global(mock_locations, monkeypatch):
+    """Test fuzzy matching and toggling to the history of all projects."""
+    from textual.app import App
+
+    from openhands_cli.stores.prompt_history import PromptHistoryStore
+
+    PromptHistoryStore().append("refactor the code")
+    PromptHistoryStore().append("run the tests")
+    monkeypatch.setenv("OPENHANDS_WORK_DIR", str(mock_locations.work_dir / "other"))
+    PromptHistoryStore().append("release notes")
+    monkeypatch.setenv("OPENHANDS_WORK_DIR", str(mock_locations.work_dir))
+
+    screen = HistorySearchScreen()
+
+    class TestApp(App):
+        def on_mount(self) -> None:
+            self.push_screen(screen)
+
+    app = TestApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        option_list = screen.query_one("#results_list", OptionList)
+        assert option_list.option_count == 2
+
+        # Letters in order, but not contiguous
+        await pilot.press(*"rfctr")
+        await pilot.pause()
+        assert option_list.option_count == 1
+        assert screen._option_full_texts[0] == "refactor the code"
+
+        await pilot.press("ctrl+g")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        assert screen.global_history
+
+        await pilot.press(*["backspace"] * 5, "r", "l")
+        await pilot.pause()
+        assert screen._option_full_texts[0] == "release notes"
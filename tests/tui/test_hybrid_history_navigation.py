@@ -13,9 +13,9 @@ from openhands_cli.tui.widgets.user_input.input_field import (
 async def test_hybrid_history_navigation(mock_locations):
     """Test automatic mode switching and boundary navigation in history."""
     # 1. Setup mixed history data (single and multi-line)
-    from openhands_cli.locations import get_prompt_history_path
+    from openhands_cli.locations import get_legacy_prompt_history_path
 
-    history_file = Path(get_prompt_history_path())
+    history_file = Path(get_legacy_prompt_history_path())
     history_file.parent.mkdir(parents=True, exist_ok=True)
 
     test_data = [
@@ -88,9 +88,9 @@ async def test_hybrid_history_navigation(mock_locations):
 @pytest.mark.asyncio
 async def test_multiline_wip_preservation(mock_locations):
     """Test that a multi-line WIP is preserved when navigating history."""
-    from openhands_cli.locations import get_prompt_history_path
+    from openhands_cli.locations import get_legacy_prompt_history_path
 
-    history_file = Path(get_prompt_history_path())
+    history_file = Path(get_legacy_prompt_history_path())
     history_file.parent.mkdir(parents=True, exist_ok=True)
     with open(history_file, "w") as f:
         json.dump([{"text": "old prompt", "timestamp": "2026-05-01T10:00:00"}], f)
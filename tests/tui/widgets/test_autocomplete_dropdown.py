@@ -1,5 +1,6 @@
 """Tests for AutoCompleteDropdown widget functionality."""
 
+import os
 from unittest import mock
 
 import pytest
@@ -7,6 +8,7 @@ import pytest
 from openhands_cli.tui.widgets.user_input.autocomplete_dropdown import (
     AutoCompleteDropdown,
 )
+from openhands_cli.tui.widgets.user_input.file_index import FileIndex
 from openhands_cli.tui.widgets.user_input.models import (
     CompletionItem,
     CompletionType,
@@ -234,6 +236,50 @@ class TestAutoCompleteDropdown:
 
         assert candidates == []
 
+    def test_file_candidates_include_fuzzy_path_matches(self, mock_locations):
+        """Fuzzy full-path matches from the file index follow directory matches."""
+        widgets_dir = mock_locations.work_dir / "tui" / "widgets"
+        widgets_dir.mkdir(parents=True)
+        (widgets_dir / "richlog_visualizer.py").write_text("test")
+
+        mock_widget = create_mock_single_line_widget()
+        autocomplete = AutoCompleteDropdown(mock_widget, command_candidates=[])
+        with mock.patch.object(FileIndex, "_list_git_files", return_value=None):
+            autocomplete._get_file_index(mock_locations.work_dir).refresh()
+            candidates = autocomplete._get_file_candidates("@tuivis")
+
+        completion_values = [c.completion_value for c in candidates]
+        assert completion_values == ["@tui/widgets/richlog_visualizer.py"]
+
+    def test_directory_listing_is_cached(self, mock_locations):
+        """Unchanged directories are not listed again on every keystroke."""
+        (mock_locations.work_dir / "README.md").write_text("test")
+        os.utime(mock_locations.work_dir, ns=(1, 1))
+
+        mock_widget = create_mock_single_line_widget()
+        autocomplete = AutoCompleteDropdown(mock_widget, command_candidates=[])
+        autocomplete._get_file_candidates("@")
+
+        with mock.patch("pathlib.Path.iterdir") as iterdir:
+            candidates = autocomplete._get_file_candidates("@")
+
+        iterdir.assert_not_called()
+        assert [c.completion_value for c in candidates] == ["@README.md"]
+
+    def test_directory_listing_cache_is_bounded(self, tmp_path, autocomplete):
+        """Only the most recently used directory listings are kept."""
+        autocomplete.MAX_DIR_LISTINGS = 2
+        dirs = [tmp_path / name for name in ("a", "b", "c")]
+        for directory in dirs:
+            directory.mkdir()
+
+        autocomplete._list_dir(dirs[0])
+        autocomplete._list_dir(dirs[1])
+        autocomplete._list_dir(dirs[0])
+        autocomplete._list_dir(dirs[2])
+
+        assert list(autocomplete._dir_listings) == [dirs[0], dirs[2]]
+
     # Dropdown visibility behavior
 
     def test_show_dropdown_displays_candidates(self, autocomplete):
@@ -0,0 +1,116 @@
+"""Tests for the background file index used by @ path completion."""
+
+import os
+import shutil
+import subprocess
+from unittest import mock
+
+import pytest
+
+from openhands_cli.tui.widgets.user_input import file_index
+from openhands_cli.tui.widgets.user_input.file_index import FileIndex
+
+
+def _touch(root, *paths):
+    for path in paths:
+        full = root / path
+        full.parent.mkdir(parents=True, exist_ok=True)
+        full.write_text("x")
+
+
+def _backdate(root):
+    """Give every directory an old mtime so later changes are detected."""
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, ns=(1, 1))
+
+
+@pytest.fixture
+def no_git():
+    with mock.patch.object(FileIndex, "_list_git_files", return_value=None):
+        yield
+
+
+class TestFileIndex:
+    def test_not_ready_until_built(self, tmp_path, no_git):
+        _touch(tmp_path, "a.py")
+        index = FileIndex(tmp_path)
+
+        assert not index.ready
+        index.refresh()
+        assert index.ready
+        assert index.search("a", limit=10) == ["a.py"]
+
+    def test_fuzzy_full_path_matching(self, tmp_path, no_git):
+        _touch(
+            tmp_path,
+            "tui/widgets/richlog_visualizer.py",
+            "tui/widgets/status_line.py",
+            "docs/visual.md",
+        )
+        index = FileIndex(tmp_path)
+        index.refresh()
+
+        assert index.search("tuivis", limit=10) == ["tui/widgets/richlog_visualizer.py"]
+
+    def test_name_matches_rank_first(self, tmp_path, no_git):
+        _touch(tmp_path, "parser/utils.py", "src/parser.py", "pxaxrxsxexr.txt")
+        index = FileIndex(tmp_path)
+        index.refresh()
+
+        assert index.search("parser", limit=10) == [
+            "src/parser.py",
+            "parser/utils.py",
+            "pxaxrxsxexr.txt",
+        ]
+
+    def test_skips_hidden_and_dependency_dirs(self, tmp_path, no_git):
+        _touch(tmp_path, "main.py", ".git/config.py", "node_modules/x/main.py")
+        index = FileIndex(tmp_path)
+        index.refresh()
+
+        assert index.search("main", limit=10) == ["main.py"]
+
+    def test_refresh_picks_up_changes_incrementally(self, tmp_path, no_git):
+        _touch(tmp_path, "src/one.py", "docs/guide.md")
+        _backdate(tmp_path)
+        index = FileIndex(tmp_path)
+        index.refresh()
+
+        _touch(tmp_path, "src/two.py")
+        (tmp_path / "src" / "one.py").unlink()
+        with mock.patch.object(index, "_walk", wraps=index._walk) as walk:
+            index.refresh()
+
+        walk.assert_called_once()
+        assert walk.call_args.args[0] == "src"
+        assert index.search(".py", limit=10) == ["src/two.py"]
+        assert index.search("guide", limit=10) == ["docs/guide.md"]
+
+    def test_growing_query_narrows_previous_matches(self, tmp_path, no_git):
+        _touch(tmp_path, "alpha.py", "beta.py")
+        index = FileIndex(tmp_path)
+        index.refresh()
+        index.search("a", limit=10)
+
+        with mock.patch.object(file_index, "_scan", wraps=file_index._scan) as scan:
+            assert index.search("alp", limit=10) == ["alpha.py"]
+
+        scan.assert_not_called()
+
+    def test_search_polls_for_changes_in_background(self, tmp_path, no_git):
+        index = FileIndex(tmp_path)
+
+        with mock.patch.object(index, "start") as start:
+            assert index.search("a", limit=10) == []
+
+        start.assert_called_once()
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_git_repositories_respect_gitignore(self, tmp_path):
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        (tmp_path / ".gitignore").write_text("build/\n*.log\n")
+        _touch(tmp_path, "src/app.py", "build/app.py", "app.log")
+        index = FileIndex(tmp_path)
+        index.refresh()
+
+        assert index.search("app", limit=10) == ["src/app.py"]
@@ -0,0 +1,91 @@
+"""Tests for frame-batched UI updates from worker threads."""
+
+import threading
+from functools import partial
+from unittest.mock import MagicMock
+
+from textual.app import App, ComposeResult
+
+from openhands_cli.tui.widgets.collapsible import Collapsible
+from openhands_cli.tui.widgets.main_display import ScrollableContent
+from openhands_cli.tui.widgets.render_queue import RenderQueue
+
+
+def make_cell(i: int) -> Collapsible:
+    return Collapsible(f"Content {i}", title=f"Cell {i}", collapsed=True)
+
+
+class RenderQueueTestApp(App):
+    def compose(self) -> ComposeResult:
+        yield ScrollableContent(id="scroll_view")
+
+    @property
+    def scroll_view(self) -> ScrollableContent:
+        return self.query_one("#scroll_view", ScrollableContent)
+
+
+def test_operations_from_worker_thread_schedule_one_flush():
+    app = MagicMock()
+    queue = RenderQueue(app, MagicMock(), MagicMock())
+    calls = []
+
+    def worker():
+        for i in range(50):
+            queue.submit(calls.append, i)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert calls == []
+    app.call_from_thread.assert_called_once_with(queue._schedule_flush)
+
+    queue.flush()
+    assert calls == list(range(50))
+
+    # The next operation starts a new batch
+    queue.submit(calls.append, 50)
+    assert app.call_from_thread.call_count == 2
+
+
+def test_follow_end_scrolls_once_per_flush():
+    container = MagicMock()
+    container.is_vertical_scroll_end = True
+    queue = RenderQueue(MagicMock(), container, MagicMock())
+
+    for _ in range(5):
+        queue.submit(queue.follow_end)
+    queue.flush()
+
+    container.scroll_end.assert_called_once_with(animate=False)
+
+
+async def test_flush_mounts_appended_widgets_together():
+    app = RenderQueueTestApp()
+    async with app.run_test() as pilot:
+        scroll_view = app.scroll_view
+        transcript = scroll_view.transcript
+        queue = RenderQueue(app, scroll_view, transcript)
+        mount_all = MagicMock(wraps=scroll_view.mount_all)
+        scroll_view.mount_all = mount_all  # type: ignore[method-assign]
+
+        def worker():
+            for i in range(10):
+                cell = make_cell(i)
+                queue.submit(transcript.append, cell, partial(make_cell, i))
+                if i == 5:
+                    queue.submit(transcript.update_collapsible, cell, "Updated", "")
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        while thread.is_alive():
+            await pilot.pause()
+        thread.join()
+        await pilot.pause(0.1)
+        await pilot.pause()
+
+        titles = [str(c.title) for c in scroll_view.query(Collapsible)]
+        assert len(transcript) == 10
+        assert titles[5] == "Updated"
+        assert titles[-1] == "Cell 9"
+        assert mount_all.call_count <= 2
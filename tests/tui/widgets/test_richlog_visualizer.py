@@ -868,6 +868,18 @@ class TestSubVisualizerCreation:
 
         assert sub_vis._container is visualizer._container
         assert sub_vis._app is visualizer._app
+        assert sub_vis._transcript is visualizer._transcript
+        assert sub_vis._render_queue is visualizer._render_queue
+
+    def test_scrollable_content_transcript_is_used(self):
+        """Visualizers of a ScrollableContent share its transcript."""
+        from openhands_cli.tui.widgets.main_display import ScrollableContent
+
+        container = ScrollableContent()
+        visualizer = ConversationVisualizer(container, App())  # type: ignore[arg-type]
+
+        assert visualizer._transcript is container.transcript
+        assert visualizer._render_queue is container.render_queue
 
 
 class TestMessageEventDelegation:
@@ -999,10 +1011,8 @@ class TestThreadSafety:
         mock_func.assert_called_once_with("arg1")
         mock_visualizer._app.call_from_thread.assert_not_called()
 
-    def test_run_on_main_thread_via_call_from_thread_when_no_loop(
-        self, mock_visualizer
-    ):
-        """Test call via call_from_thread when on main thread but NO running loop."""
+    def test_run_on_main_thread_queued_when_no_loop(self, mock_visualizer):
+        """Test call is queued when on main thread but NO running loop."""
         import threading
         from unittest.mock import MagicMock
 
@@ -1013,25 +1023,66 @@ class TestThreadSafety:
         with patch("asyncio.get_running_loop", side_effect=RuntimeError("no loop")):
             mock_visualizer._run_on_main_thread(mock_func, "arg1")
 
-        # Should NOT be called directly
+        # Should NOT be called directly, only once the queue is flushed
         mock_func.assert_not_called()
-        # Should be called via app.call_from_thread
-        mock_visualizer._app.call_from_thread.assert_called_once_with(mock_func, "arg1")
+        mock_visualizer._app.call_from_thread.assert_called_once_with(
+            mock_visualizer._render_queue._schedule_flush
+        )
+        mock_visualizer._render_queue.flush()
+        mock_func.assert_called_once_with("arg1")
 
-    def test_run_on_main_thread_via_call_from_thread_when_wrong_thread(
-        self, mock_visualizer
-    ):
-        """Test call via call_from_thread when on a different thread."""
+    def test_run_on_main_thread_queued_when_wrong_thread(self, mock_visualizer):
+        """Test calls from a different thread are batched into one flush."""
         from unittest.mock import MagicMock
 
-        mock_func = MagicMock()
+        first, second = MagicMock(), MagicMock()
         # Set main thread ID to something different
         mock_visualizer._main_thread_id = -1
 
-        mock_visualizer._run_on_main_thread(mock_func, "arg1")
+        mock_visualizer._run_on_main_thread(first, "arg1")
+        mock_visualizer._run_on_main_thread(second, "arg2")
 
-        mock_func.assert_not_called()
-        mock_visualizer._app.call_from_thread.assert_called_once_with(mock_func, "arg1")
+        first.assert_not_called()
+        second.assert_not_called()
+        assert mock_visualizer._app.call_from_thread.call_count == 1
+
+        mock_visualizer._render_queue.flush()
+        first.assert_called_once_with("arg1")
+        second.assert_called_once_with("arg2")
+
+    def test_run_on_main_thread_flushes_queue_first(self, mock_visualizer):
+        """Test direct calls on the main thread run after queued operations."""
+        import threading
+
+        calls = []
+        mock_visualizer._main_thread_id = -1
+        mock_visualizer._run_on_main_thread(calls.append, "queued")
+
+        mock_visualizer._main_thread_id = threading.get_ident()
+        with patch("asyncio.get_running_loop"):
+            mock_visualizer._run_on_main_thread(calls.append, "direct")
+
+        assert calls == ["queued", "direct"]
+
+    def test_render_user_message_dismisses_feedback_after_queued_operations(
+        self, mock_visualizer
+    ):
+        """Test feedback widgets queued before a user message are dismissed."""
+        import threading
+
+        calls = []
+        mock_visualizer._main_thread_id = -1
+        mock_visualizer._run_on_main_thread(calls.append, "queued")
+
+        mock_visualizer._main_thread_id = threading.get_ident()
+        mock_visualizer._dismiss_pending_feedback_widgets = lambda: calls.append(
+            "dismiss"
+        )
+        mock_visualizer._render_message_widget = calls.append
+        with patch("asyncio.get_running_loop"):
+            mock_visualizer.render_user_message("hello")
+
+        assert calls == ["queued", "dismiss", "hello"]
 
     @pytest.mark.parametrize(
         ("role", "expected_prefix"),
@@ -1500,3 +1551,121 @@ class TestDefaultAgentPrefixBehavior:
         assert "(Code Reviewer Agent)" in title
         # Should contain the command
         assert "git diff" in title
+
+
+class TestTranscriptRebuild:
+    """Tests for the rebuild functions passed to the transcript."""
+
+    def test_action_widget_is_added_with_rebuild_function(self, mock_cli_settings):
+        """Rebuilding an action cell doesn't register the action again."""
+        from unittest.mock import MagicMock
+
+        from openhands_cli.tui.widgets.collapsible import Collapsible
+
+        visualizer = ConversationVisualizer(MagicMock(), MagicMock())
+        calls = []
+        visualizer._run_on_main_thread = (  # type: ignore[method-assign]
+            lambda func, *args: calls.append((func, args))
+        )
+
+        with mock_cli_settings(visualizer=visualizer):
+            visualizer.on_event(create_terminal_action_event("ls -la"))
+            func, (widget, build) = calls[0]
+            pending = dict(visualizer._pending_actions)
+            rebuilt = build()
+
+        assert func == visualizer._add_widget_to_ui
+        assert pending["call_1"][1] is widget
+        assert isinstance(rebuilt, Collapsible)
+        assert rebuilt is not widget
+        assert str(rebuilt.title) == str(widget.title)
+        assert visualizer._pending_actions == pending
+
+
+class ConversationStateTestApp(App):
+    """Minimal app hosting a ConversationContainer and its scroll view."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        from openhands_cli.tui.core.state import ConversationContainer
+
+        self.conversation_state = ConversationContainer()
+
+    def compose(self):
+        yield self.conversation_state
+
+
+class TestRenderQueueOrdering:
+    """Tests for queued UI operations versus conversation state updates."""
+
+    @staticmethod
+    async def run_in_worker(pilot, func) -> None:
+        import threading
+
+        thread = threading.Thread(target=func)
+        thread.start()
+        while thread.is_alive():
+            await pilot.pause()
+        thread.join()
+        await pilot.pause()
+
+    async def test_visualizers_share_the_scroll_view_queue(self):
+        app = ConversationStateTestApp()
+        async with app.run_test():
+            scroll_view = app.conversation_state.scroll_view
+            visualizer = ConversationVisualizer(scroll_view, app)  # type: ignore[arg-type]
+            other = ConversationVisualizer(scroll_view, app)  # type: ignore[arg-type]
+
+            assert visualizer._render_queue is scroll_view.render_queue
+            assert other._render_queue is scroll_view.render_queue
+
+    async def test_state_update_runs_after_queued_operations(self):
+        import uuid
+
+        app = ConversationStateTestApp()
+        async with app.run_test() as pilot:
+            state = app.conversation_state
+            state.conversation_id = uuid.uuid4()
+            visualizer = ConversationVisualizer(
+                state.scroll_view,
+                app,  # type: ignore[arg-type]
+                conversation_id=state.conversation_id,
+            )
+            seen = []
+
+            def worker():
+                visualizer._run_on_main_thread(
+                    lambda: seen.append(state.conversation_title)
+                )
+                state.set_conversation_title("Updated")
+
+            await self.run_in_worker(pilot, worker)
+
+            assert seen == [None]
+            assert state.conversation_title == "Updated"
+
+    async def test_operations_of_previous_conversation_are_dropped(self):
+        import uuid
+
+        app = ConversationStateTestApp()
+        async with app.run_test() as pilot:
+            state = app.conversation_state
+            old_id, new_id = uuid.uuid4(), uuid.uuid4()
+            state.conversation_id = old_id
+            visualizer = ConversationVisualizer(
+                state.scroll_view,
+                app,  # type: ignore[arg-type]
+                conversation_id=old_id,
+            )
+            calls = []
+
+            def worker():
+                visualizer._run_on_main_thread(calls.append, "before")
+                state.set_conversation_id(new_id)
+                visualizer._run_on_main_thread(calls.append, "after")
+
+            await self.run_in_worker(pilot, worker)
+            visualizer._render_queue.flush()
+
+            assert calls == ["before"]
+            assert state.conversation_id == new_id
@@ -0,0 +1,222 @@
+"""Tests for the virtualized conversation transcript."""
+
+import uuid
+from functools import partial
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.pilot import Pilot
+from textual.widgets import Static
+
+from openhands_cli.tui.widgets import transcript as transcript_module
+from openhands_cli.tui.widgets.collapsible import (
+    Collapsible,
+    CollapsibleNavigationMixin,
+    CollapsibleTitle,
+)
+from openhands_cli.tui.widgets.main_display import ScrollableContent
+from openhands_cli.tui.widgets.transcript import Transcript, TranscriptSpacer
+
+
+# Lower mount limit so tests need fewer widgets to exercise virtualization.
+MAX_MOUNTED = 40
+CELL_COUNT = 150
+
+
+@pytest.fixture(autouse=True)
+def small_window(monkeypatch):
+    monkeypatch.setattr(transcript_module, "MAX_MOUNTED_ENTRIES", MAX_MOUNTED)
+
+
+class TranscriptTestApp(CollapsibleNavigationMixin, App):
+    """App with a ScrollableContent, as used by the conversation view."""
+
+    def compose(self) -> ComposeResult:
+        yield ScrollableContent(id="scroll_view")
+
+    @property
+    def scroll_view(self) -> ScrollableContent:
+        return self.query_one("#scroll_view", ScrollableContent)
+
+    @property
+    def transcript(self) -> Transcript:
+        return self.scroll_view.transcript
+
+
+def make_cell(i: int) -> Collapsible:
+    return Collapsible(f"Content {i}", title=f"Cell {i}", collapsed=True)
+
+
+def cell_titles(app: TranscriptTestApp) -> list[str]:
+    return [str(c.title) for c in app.scroll_view.query(Collapsible)]
+
+
+async def settle(pilot: Pilot, rounds: int = 5) -> None:
+    for _ in range(rounds):
+        await pilot.pause()
+
+
+async def append_cells(pilot: Pilot, app: TranscriptTestApp, count: int) -> list:
+    """Append cells like the visualizer does, following the end."""
+    cells = []
+    for i in range(count):
+        cell = make_cell(i)
+        cells.append(cell)
+        app.transcript.append(cell, partial(make_cell, i))
+        if app.scroll_view.is_vertical_scroll_end:
+            app.scroll_view.scroll_end(animate=False)
+        if i % 20 == 0:
+            await pilot.pause()
+    await settle(pilot)
+    return cells
+
+
+async def test_short_transcript_keeps_every_widget_mounted():
+    app = TranscriptTestApp()
+    async with app.run_test() as pilot:
+        await append_cells(pilot, app, 30)
+
+        assert app.transcript.mounted_count == 30
+        assert len(cell_titles(app)) == 30
+        assert not app.scroll_view.query(TranscriptSpacer)
+
+
+async def test_long_transcript_mounts_only_entries_near_viewport():
+    app = TranscriptTestApp()
+    async with app.run_test() as pilot:
+        await append_cells(pilot, app, CELL_COUNT)
+
+        titles = cell_titles(app)
+        assert len(app.transcript) == CELL_COUNT
+        assert app.transcript.mounted_count <= MAX_MOUNTED
+        assert len(titles) == app.transcript.mounted_count
+        assert titles[-1] == f"Cell {CELL_COUNT - 1}"
+        assert app.scroll_view.is_vertical_scroll_end
+
+
+async def test_scrolling_rebuilds_unmounted_entries():
+    app = TranscriptTestApp()
+    async with app.run_test() as pilot:
+        await append_cells(pilot, app, CELL_COUNT)
+        assert "Cell 0" not in cell_titles(app)
+
+        app.scroll_view.scroll_home(animate=False)
+        await settle(pilot)
+
+        titles = cell_titles(app)
+        assert titles[0] == "Cell 0"
+        assert f"Cell {CELL_COUNT - 1}" not in titles
+        assert app.transcript.mounted_count <= MAX_MOUNTED
+
+
+async def test_collapse_state_and_updates_survive_unmounting():
+    app = TranscriptTestApp()
+    async with app.run_test() as pilot:
+        first = make_cell(0)
+        app.transcript.append(first, partial(make_cell, 0))
+        await pilot.pause()
+        first.collapsed = False
+
+        await append_cells(pilot, app, CELL_COUNT)
+        assert not first.is_attached
+        app.transcript.update_collapsible(first, "Updated", "New content")
+
+        app.scroll_view.scroll_home(animate=False)
+        await settle(pilot)
+
+        rebuilt = app.scroll_view.query(Collapsible).first()
+        assert rebuilt is not first
+        assert str(rebuilt.title) == "Updated"
+        assert rebuilt.collapsed is False
+
+
+async def test_toggling_unmounted_cells():
+    app = TranscriptTestApp()
+    async with app.run_test() as pilot:
+        await append_cells(pilot, app, CELL_COUNT)
+        assert not app.transcript.any_unmounted_expanded()
+
+        app.transcript.set_unmounted_collapsed(False)
+        assert app.transcript.any_unmounted_expanded()
+
+        app.scroll_view.scroll_home(animate=False)
+        await settle(pilot)
+        assert app.scroll_view.query(Collapsible).first().collapsed is False
+
+
+async def test_navigation_reveals_unmounted_cells():
+    app = TranscriptTestApp()
+    async with app.run_test() as pilot:
+        await append_cells(pilot, app, CELL_COUNT)
+        first_mounted = app.scroll_view.query(Collapsible).first()
+        index = int(str(first_mounted.title).split()[-1])
+        assert index > 0
+
+        first_mounted.query_one(CollapsibleTitle).focus()
+        await pilot.pause()
+        await pilot.press("up")
+        await settle(pilot)
+
+        focused = app.focused
+        assert isinstance(focused, CollapsibleTitle)
+        assert str(focused.label) == f"Cell {index - 1}"
+
+
+async def test_attached_widgets_stay_after_their_entry():
+    app = TranscriptTestApp()
+    async with app.run_test() as pilot:
+        app.transcript.append(make_cell(-1), partial(make_cell, -1))
+        pinned = Static("Pinned\n" * 5)
+        app.transcript.attach(pinned)
+        await pilot.pause()
+        pinned_height = pinned.virtual_region_with_margin.height
+
+        await append_cells(pilot, app, CELL_COUNT)
+        assert pinned.is_attached
+        assert not pinned.display
+        top_spacer = app.scroll_view.query_one(TranscriptSpacer)
+        assert top_spacer.styles.height is not None
+        assert top_spacer.styles.height.value >= pinned_height
+
+        app.scroll_view.scroll_home(animate=False)
+        await settle(pilot)
+
+        assert pinned.display
+        children = list(app.scroll_view.children)
+        first = app.scroll_view.query(Collapsible).first()
+        assert str(first.title) == "Cell -1"
+        assert children.index(pinned) == children.index(first) + 1
+
+
+async def test_clearing_conversation_resets_transcript():
+    app = TranscriptTestApp()
+    async with app.run_test() as pilot:
+        await append_cells(pilot, app, CELL_COUNT)
+        scroll_view = app.scroll_view
+        scroll_view.conversation_id = uuid.uuid4()
+        await pilot.pause()
+        scroll_view.conversation_id = None
+        await settle(pilot)
+
+        assert len(app.transcript) == 0
+        assert not scroll_view.query(Collapsible)
+
+
+async def test_large_deferred_batch_mounts_only_the_end():
+    app = TranscriptTestApp()
+    async with app.run_test() as pilot:
+        with app.transcript.deferred():
+            for i in range(CELL_COUNT):
+                app.transcript.append(make_cell(i), partial(make_cell, i))
+            assert not app.scroll_view.query(Collapsible)
+        app.scroll_view.scroll_end(animate=False)
+        await settle(pilot)
+
+        titles = cell_titles(app)
+        assert len(app.transcript) == CELL_COUNT
+        assert app.transcript.mounted_count <= MAX_MOUNTED
+        assert titles[-1] == f"Cell {CELL_COUNT - 1}"
+
+        app.scroll_view.scroll_home(animate=False)
+        await settle(pilot)
+        assert cell_titles(app)[0] == "Cell 0"
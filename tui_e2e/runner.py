@@ -6,6 +6,7 @@ from collections.abc import Callable
 from .models import TestResult, TestSummary
 from .test_acp import test_acp_executable
 from .test_experimental_ui import test_experimental_ui
+from .test_startup_time import test_startup_time
 from .test_version import test_version
 
 
@@ -17,6 +18,7 @@ def run_all_tui_e2e() -> TestSummary:
     # Define all tests
     tests: list[Callable[[], TestResult]] = [
         test_version,
+        test_startup_time,
         test_experimental_ui,
         test_acp_executable,
     ]
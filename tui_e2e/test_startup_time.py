@@ -0,0 +1,61 @@
+"""E2E test for the startup time of the lightweight commands."""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from .models import TestResult
+
+
+BENCHMARK_SCRIPT = Path("scripts/bench_startup.py")
+
+
+def test_startup_time() -> TestResult:
+    """Check that lightweight commands of the executable start within budget."""
+    test_name = "startup_time"
+    start_time = time.time()
+
+    exe_path = Path("dist/openhands")
+    if not exe_path.exists():
+        exe_path = Path("dist/openhands.exe")
+        if not exe_path.exists():
+            return TestResult(
+                test_name=test_name,
+                success=False,
+                total_time_seconds=time.time() - start_time,
+                error_message="Binary executable not found!",
+            )
+
+    try:
+        result = subprocess.run(
+            [sys.executable, str(BENCHMARK_SCRIPT), "--binary", str(exe_path)],
+            capture_output=True,
+            text=True,
+            timeout=600,
+        )
+    except subprocess.TimeoutExpired:
+        return TestResult(
+            test_name=test_name,
+            success=False,
+            total_time_seconds=time.time() - start_time,
+            error_message="Startup benchmark timed out",
+        )
+
+    total_time = time.time() - start_time
+    output = result.stdout + result.stderr
+    if result.returncode != 0:
+        return TestResult(
+            test_name=test_name,
+            success=False,
+            total_time_seconds=total_time,
+            error_message="Lightweight commands are over their startup budget!",
+            output_preview=output,
+        )
+
+    return TestResult(
+        test_name=test_name,
+        success=True,
+        total_time_seconds=total_time,
+        metadata={"benchmark": output.strip()},
+    )